@@ -0,0 +1 @@
+NAMES = {'icecream/images/home_48.png': 'icecream/images/home_48-5a532cacf05663710e73c4be3552182c4937c734.png', 'icecream/images/quick_16.png': 'icecream/images/quick_16-408c643a7b3590d9ff9b93535db06bcca247065f.png', 'icecream/images/config_16.png': 'icecream/images/config_16-6f9b9ec5dddd70adc3a4b8392c58f6a30202a114.png', 'icecream/images/document_doc_22.png': 'icecream/images/document_doc_22-b84db809c5c95d9625d684848a5d1b15379b7fba.png', 'icecream/images/poll_12.png': 'icecream/images/poll_12-5db69044a9a1a8e0c6bd9eadb6259e7924e958cd.png', 'icecream/images/document_doc_12.png': 'icecream/images/document_doc_12-c6995878b229c4bba9daa8c0c35db89cb1b111db.png', 'icecream/images/todo_16.png': 'icecream/images/todo_16-de58807964bd3fedb57d05af5f675076b5b5f56d.png', 'icecream/images/document_odt_12.png': 'icecream/images/document_odt_12-0f9ab35b4a1f44a4f5bec61c5916e7f2df68e081.png', 'icecream/images/quick_22.png': 'icecream/images/quick_22-7eafd07257f3ba43460b883b95a7cc83502026c7.png', 'icecream/images/wall_16.png': 'icecream/images/wall_16-a166395e0b276b7b7f150b8307d2d71bfd6b191d.png', 'icecream/images/ok_16.png': 'icecream/images/ok_16-a702ba1717c438312ec124cc04759d043c49c040.png', 'icecream/images/delete_22.png': 'icecream/images/delete_22-884b0d012a62c121367cf3484a1d3e213cdbd2dc.png', 'icecream/images/wall_22.png': 'icecream/images/wall_22-091cd5f04da7579e2e5a47257996286f3dc24584.png', 'icecream/images/report_32.png': 'icecream/images/report_32-b5e8fcb3b54ca9551c33aa9ccfc452b6592c9237.png', 'icecream/images/remove_32.png': 'icecream/images/remove_32-13a5c3bed5e87c314cdc4703e889e09833d45592.png', 'icecream/images/edit_22.png': 'icecream/images/edit_22-a3c3ac332d4db693865219b40eebcef60c24f29e.png', 'icecream/images/refresh_32.png': 'icecream/images/refresh_32-5e7ea1abeee4ad9f294e2c54718b80501ebfb258.png', 'icecream/images/money_info_32.png': 'icecream/images/money_info_32-f9596c7e474f897f126e08d08af0ba12747c9f3d.png', 'icecream/images/project_48.png': 'icecream/images/project_48-8847cf7a7a0d628875a9fe9222f1605e8bf3a797.png', 'icecream/images/recurrent_doc_32.png': 'icecream/images/recurrent_doc_32-cf9b10cd24855f5710ebd255e2b74cb39d97f2cf.png', 'icecream/images/config_12.png': 'icecream/images/config_12-dc12859d8f0cd95f97c90828b023731d3cf52835.png', 'icecream/images/view_less_16.png': 'icecream/images/view_less_16-76950f59118c70d96111f3fcb86cbd7108325f7e.png', 'icecream/images/calendar_48.png': 'icecream/images/calendar_48-86986098758c59dc3939c70e9b23c3c4465c7c76.png', 'icecream/images/product_12.png': 'icecream/images/product_12-37e626654b4e53efce053b6f2ee288f7c4b612a4.png', 'icecream/images/phone_16.png': 'icecream/images/phone_16-eb468ae2606ded0bcb600f611c143bcc1f390e01.png', 'icecream/images/project_22.png': 'icecream/images/project_22-c589397363c924d11a3f12aaa21adc2562e0946d.png', 'icecream/images/action_32.png': 'icecream/images/action_32-2dd13f1bd5a3444788d356fa5d228e40f03ad535.png', 'icecream/images/invoice_32.png': 'icecream/images/invoice_32-fdeff74a4d2950b5708bf3d72e3d8217d548c770.png', 'icecream/images/opportunity_32.png': 'icecream/images/opportunity_32-7d6ce73e76de360b60be5af542e38c1b37cbf7d1.png', 'icecream/images/wall_32.png': 'icecream/images/wall_32-7ab6bd6b2bd9c5753800345c846a78c4bcb93cae.png', 'icecream/images/document_csv_32.png': 'icecream/images/document_csv_32-408e722f1101c72ebe7edeec8651ddaec4a71036.png', 'icecream/images/home_16.png': 'icecream/images/home_16-45aa2bd18d6ac93d48eabf1edadd7092ae816c1d.png', 'icecream/images/info_48.png': 'icecream/images/info_48-7c43bee56b4038aad4afb9fa6b1e600cdf792e60.png', 'icecream/images/link_16.png': 'icecream/images/link_16-df6c5130a463b280b7100c32becd50201c326b03.png', 'icecream/images/filter_12.png': 'icecream/images/filter_12-70b0ff8f7821c8ba976e40bdfc125940246514eb.png', 'icecream/images/document_12.png': 'icecream/images/document_12-431dca40bb18e2bb76643a3f3a3cb005493f699c.png', 'icecream/images/refresh_16.png': 'icecream/images/refresh_16-21bd6edf508d99285057d0dca52360de892101d6.png', 'icecream/images/listview_22.png': 'icecream/images/listview_22-58069a9b81b853ee63f42f19b0c429ffcbe73ab9.png', 'icecream/images/invoice_22.png': 'icecream/images/invoice_22-e772929ba662133a22e7b6fa84054413c8ac0fb2.png', 'icecream/images/organisation_22.png': 'icecream/images/organisation_22-db475af1ccaffceabf4134db47cba395c02df739.png', 'icecream/images/merge_48.png': 'icecream/images/merge_48-0972034c5db74b3b3e420fc7921da42ad0fda3e2.png', 'icecream/images/merge_22.png': 'icecream/images/merge_22-35177ec083c754ddd15a5fa795415323f1e1f53b.png', 'icecream/images/message_48.png': 'icecream/images/message_48-809123d16becee9e191004589ee79a577ba425c3.png', 'icecream/images/calendar_ical_32.png': 'icecream/images/calendar_ical_32-cb65ef836a67d9db99fc9a5c7f6223ce04412f67.png', 'icecream/images/next_16.png': 'icecream/images/next_16-d9bb9b3d04529ee648e0668965ef88b9aa450cc8.png', 'icecream/images/info_32.png': 'icecream/images/info_32-c9ad30bcb4700e668271a4d2c87251eaf29f841c.png', 'icecream/images/previous_12.png': 'icecream/images/previous_12-f8f8a85c50d06949f93b28047033e20194cabea4.png', 'icecream/images/view_22.png': 'icecream/images/view_22-4fc03b1928c3ac658eae937a0de2314b2aabe680.png', 'icecream/images/restore_16.png': 'icecream/images/restore_16-e4fef87a4fa09f8e852cdfc8aef0a70dd25dfa02.png', 'icecream/images/creme_22.png': 'icecream/images/creme_22-1a3285631bc5d8c919abf9291592eafff524181d.png', 'icecream/images/event_22.png': 'icecream/images/event_22-531a961e08ec11a8f21738e66839583ba4ae2da1.png', 'icecream/images/memo_22.png': 'icecream/images/memo_22-5307e56d668334a517c0238ba5a7a359d2563749.png', 'icecream/images/email_22.png': 'icecream/images/email_22-7879754c8ca6db9b65897381fc88e2194c523675.png', 'icecream/images/todo_22.png': 'icecream/images/todo_22-a4af72e3bf2403ca5f23123b932c434170ccfe1c.png', 'icecream/images/pin_22.png': 'icecream/images/pin_22-01a4c539f9d7440de5104472246723827a1a512e.png', 'icecream/images/creme_30.png': 'icecream/images/creme_30-f46fc2af3969b80f7624f055a030fe8f35d99a6f.png', 'icecream/images/product_22.png': 'icecream/images/product_22-fa703176bdee248e445f307a23f50c5b0f923627.png', 'icecream/images/search_12.png': 'icecream/images/search_12-e82ef64d458bf475adb000bb8d04dec4602b62f1.png', 'icecream/images/calendar_ical_22.png': 'icecream/images/calendar_ical_22-e5fdc8701c23563dfb63e077de7cab0221f6c408.png', 'icecream/images/poll_32.png': 'icecream/images/poll_32-5db69044a9a1a8e0c6bd9eadb6259e7924e958cd.png', 'icecream/images/graph_22.png': 'icecream/images/graph_22-0c02c2694491fdbcfc8b598ca2990525582d56af.png', 'icecream/images/pin_12.png': 'icecream/images/pin_12-60199ce50b42afcd4999b9a7774226d94e5134a2.png', 'icecream/images/phone_12.png': 'icecream/images/phone_12-15d4ef091d2862dc56ee66c992ed057ffdad4112.png', 'icecream/images/poll_16.png': 'icecream/images/poll_16-d43119a9a2aa816b75d906252cc269983918ecdf.png', 'icecream/images/document_16.png': 'icecream/images/document_16-faa54b9ef5e26d33f9b94f6324c55779fc093097.png', 'icecream/images/add_32.png': 'icecream/images/add_32-5a6da8dea52eb67d9df8101f17f0fe1dd74c1271.png', 'icecream/images/clone_32.png': 'icecream/images/clone_32-7ff1d296b43372ec3809711790f593a617a3b668.png', 'icecream/images/restore_22.png': 'icecream/images/restore_22-137bc0d24f1de76f996bdc6cf4f9bb5709182cbb.png', 'icecream/images/add_16.png': 'icecream/images/add_16-b5dbb300b9836861659cf51ede438093b686ea1b.png', 'icecream/images/invoice_48.png': 'icecream/images/invoice_48-be1032b9b2a9c005999fb55ffdde873b44a7e181.png', 'icecream/images/ok_48.png': 'icecream/images/ok_48-c003a02cba7c86b16f1fdacce45f87d01419dfc9.png', 'icecream/images/opportunity_22.png': 'icecream/images/opportunity_22-34ff63c1cdba71c2239dfa45c3f9511893b102aa.png', 'icecream/images/product_48.png': 'icecream/images/product_48-0ab43a807b8525481d0d4a8d9539afa49c33574a.png', 'icecream/images/link_32.png': 'icecream/images/link_32-401b83fe0dca8064aff697e82ee4d8d3b32b61d0.png', 'icecream/images/header_filter_32.png': 'icecream/images/header_filter_32-0e6cdb4d9d6f440789f6a4eaee3e45383f5e68f6.png', 'icecream/images/property_12.png': 'icecream/images/property_12-78dd5f0b9ff03fa7763c5ac7a2198361e7a61727.png', 'icecream/images/refresh_22.png': 'icecream/images/refresh_22-b3181b140041fe64828a4026dddcb0b11ace74a9.png', 'icecream/images/batch_process_12.png': 'icecream/images/batch_process_12-2a6a63ea2a1beb14e90defad877839a38e212b7b.png', 'icecream/images/action_not_in_time_48.png': 'icecream/images/action_not_in_time_48-715948df258f010e7d04f970c358906e51b2b8d8.png', 'icecream/images/report_48.png': 'icecream/images/report_48-9ad2869322ab38292906d08db27b03128d595d4d.png', 'icecream/images/document_doc_32.png': 'icecream/images/document_doc_32-7fea7a22dba11a3293a94f900327583be22c2007.png', 'icecream/images/message_16.png': 'icecream/images/message_16-bb30dc27830d44ac67dcd73d6270e6ec74205a0f.png', 'icecream/images/sync_48.png': 'icecream/images/sync_48-a2927c73a997c13ad8cc360f2f8f4327e2ccb4f3.png', 'icecream/images/icon_calendar.gif': 'icecream/images/icon_calendar-ed6237b0991b02bbdf84dd6a9e89cd61a704e07b.gif', 'icecream/images/property_16.png': 'icecream/images/property_16-ed9e46980fd3ed4383b0307cf43daf6b1bb996c5.png', 'icecream/images/previous_22.png': 'icecream/images/previous_22-073fc5f1d446d4ce3fa8085e76802587de779aaf.png', 'icecream/images/service_32.png': 'icecream/images/service_32-667e2607d743d134030ed95225e27d82c0846280.png', 'icecream/images/config_32.png': 'icecream/images/config_32-5d737e1e9a035a4d5e98f5de8f8e77872a234433.png', 'icecream/images/graph_32.png': 'icecream/images/graph_32-2e3c0b06b72eef3b9d5c3168331b61f702c54a29.png', 'icecream/images/phone_22.png': 'icecream/images/phone_22-59bc10f236d9f38e10cf76dfc514ca1e15a9a741.png', 'icecream/images/task_48.png': 'icecream/images/task_48-de00054a209d8231c917e4353edd584e68a7faf7.png', 'icecream/images/calendar_ical_16.png': 'icecream/images/calendar_ical_16-5ead91ec8da0502494d36c844bf0c5c16aa7063f.png', 'icecream/images/add_12.png': 'icecream/images/add_12-a602703290853f54b08e26122014a08607a5fa36.png', 'icecream/images/home_22.png': 'icecream/images/home_22-51f7bf720a57f9cc12269e2c4b6df8ec14329976.png', 'icecream/images/history_22.png': 'icecream/images/history_22-2bd2595e76585cfdc95caaae2c271057938d8ca2.png', 'icecream/images/info_12.png': 'icecream/images/info_12-15711aa99508c904a5d121927efbe12aac5048ed.png', 'icecream/images/contact_48.png': 'icecream/images/contact_48-51cef30217625bae1b28a915529be384bdf28758.png', 'icecream/images/security_22.png': 'icecream/images/security_22-c1fe1f6ff7abf47c1b2934953a4cac07b5563499.png', 'icecream/images/image_48.png': 'icecream/images/image_48-13d55d0ba0c75a3710070a09da8fdf87560b83af.png', 'icecream/images/service_22.png': 'icecream/images/service_22-acdb5c1a650fb7ec4153f61323736450c1d9a346.png', 'icecream/images/view_more_22.png': 'icecream/images/view_more_22-ceb002cbc1ceacca7128ef936056f6ef31d04e92.png', 'icecream/images/invoice_16.png': 'icecream/images/invoice_16-5b076a04d3672526916222afc6f1a3cc96f3bbad.png', 'icecream/images/message_32.png': 'icecream/images/message_32-03e6b6688939338ee45bf11c71a638ce9206cee8.png', 'icecream/images/phone_sync_16.png': 'icecream/images/phone_sync_16-99fac02038085a1f91f795938f47adeea0704294.png', 'icecream/images/next_48.png': 'icecream/images/next_48-dc0a1279a575fc6d6becaffaee243b240263b1c7.png', 'icecream/images/image_12.png': 'icecream/images/image_12-f3ab2209ce4850e41bdeeef29ee5665313da0413.png', 'icecream/images/delete_12.png': 'icecream/images/delete_12-c900e2e3cca27cfcc03dc0cff3453b6ecaa87ce9.png', 'icecream/images/relations_12.png': 'icecream/images/relations_12-329d51303c0d23e5c8e4ba1e3cca827faf873609.png', 'icecream/images/opportunity_12.png': 'icecream/images/opportunity_12-53522f9c089a315586e7b0a6696aa01cdd84058d.png', 'icecream/images/spam_16.png': 'icecream/images/spam_16-6db304d149d466fc594d24ecad3aed5663bb01d2.png', 'icecream/images/search_48.png': 'icecream/images/search_48-73223e3b503f1edff50df06a71bbaf85a084e9b3.png', 'icecream/images/view_32.png': 'icecream/images/view_32-95e9ef60ef7cc304a0eb2647fca397b6bf781681.png', 'icecream/images/action_12.png': 'icecream/images/action_12-ae0d7c9fa1b4c877f106776137b705cad7675e16.png', 'icecream/images/creme_16.png': 'icecream/images/creme_16-c28bf3f2229af9df9ec9c16e58fa6b7a0f6b929d.png', 'icecream/images/download_22.png': 'icecream/images/download_22-a0a9f18a397a4b878a89afffae786923199ecf61.png', 'icecream/images/task_16.png': 'icecream/images/task_16-206b1076b099fd624beed619387df530cce68f21.png', 'icecream/images/unlink_12.png': 'icecream/images/unlink_12-a601a6f5bf36dc2d842f45bebacb5400925c9a29.png', 'icecream/images/money_info_48.png': 'icecream/images/money_info_48-e6d34b37d4165a2e710872dbf47413780a5f3e1d.png', 'icecream/images/relations_22.png': 'icecream/images/relations_22-96c4ec52c92cc243fe272039622e260af592d0ba.png', 'icecream/images/meeting_48.png': 'icecream/images/meeting_48-c4254320ba9aab60fb80bdf41b3d9488a8237c93.png', 'icecream/images/email_16.png': 'icecream/images/email_16-970248905c18d15947cadecf9bc49c987a4277b8.png', 'icecream/images/info_16.png': 'icecream/images/info_16-83b6e96c68b845ad2d22b59d8bafaf3aadb9efad.png', 'icecream/images/wall_48.png': 'icecream/images/wall_48-39fa10ade15c1f35c4135a82b867277544b3aade.png', 'icecream/images/ticket_48.png': 'icecream/images/ticket_48-94fa058f4355049240b609dd9dac62620846e8bb.png', 'icecream/images/property_32.png': 'icecream/images/property_32-1ce57c103182511a7849b4ce906c26afaedc2907.png', 'icecream/images/phone_sync_22.png': 'icecream/images/phone_sync_22-78ee66b6b62caf2d3711b5295b851b360cb5ef25.png', 'icecream/images/recurrent_doc_22.png': 'icecream/images/recurrent_doc_22-ef83b12440a480a52894d8ba2c28e23bf1cb47c0.png', 'icecream/images/home_32.png': 'icecream/images/home_32-93d735bdbaacf059d3b446a09aba5c8329e991b2.png', 'icecream/images/sms_22.png': 'icecream/images/sms_22-9583054656ea64c0c0de744a9903aafa95089d6e.png', 'icecream/images/edit_16.png': 'icecream/images/edit_16-e9f265e2ab77d295e1c704c37d393a2ed860e3c2.png', 'icecream/images/filter_48.png': 'icecream/images/filter_48-845cdbdfed95a5703f57fd58df8dfae39e599ffb.png', 'icecream/images/project_32.png': 'icecream/images/project_32-25e2bd0371aff3d000939bb2cbe6c8e27065d8da.png', 'icecream/images/web_12.png': 'icecream/images/web_12-584a8f09e2a72435b9bc432712e8744e1c89cb3f.png', 'icecream/images/ticket_16.png': 'icecream/images/ticket_16-456e88f84f75566f8a6f067bcd2501954beaa5ab.png', 'icecream/images/recurrent_doc_48.png': 'icecream/images/recurrent_doc_48-552b059301d2078a5d34bd4e0e115ba0a55fcdeb.png', 'icecream/images/view_less_12.png': 'icecream/images/view_less_12-90ce8344fb16115290898eb6adbee42344ad94a3.png', 'icecream/images/document_odt_32.png': 'icecream/images/document_odt_32-0067bc29cd2e6bffdefb38c6c9340bad56451ea4.png', 'icecream/images/refresh_12.png': 'icecream/images/refresh_12-e9d6e74335bb25edcdbdc5aa949d73bc8e7b9660.png', 'icecream/images/security_16.png': 'icecream/images/security_16-33f9667098f72e8505c359c40f091a6e22be88a4.png', 'icecream/images/graph_16.png': 'icecream/images/graph_16-3032e23baa0f3ef58cfb8bc61afef8e2aa7dba29.png', 'icecream/images/header_filter_16.png': 'icecream/images/header_filter_16-3fcda0ff03ee66a109496f1a5fc6fe3a7ee589e2.png', 'icecream/images/filter_32.png': 'icecream/images/filter_32-bab2773ea2647a6a5b153ce600e7777ccdfdd4e2.png', 'icecream/images/security_12.png': 'icecream/images/security_12-760de5007fdc6dd1848bde1ce1788cdd2fab8e26.png', 'icecream/images/email_48.png': 'icecream/images/email_48-65614b82f1c1f883428efd0c32d23d210acac9a4.png', 'icecream/images/graph_48.png': 'icecream/images/graph_48-4d8224d45c045219761666a612c433ad84276c74.png', 'icecream/images/message_12.png': 'icecream/images/message_12-d6a948de5d5b46e6c6292207d741eccf221d3faa.png', 'icecream/images/batch_process_32.png': 'icecream/images/batch_process_32-bc1e76b079d230312e78ae0da8dfafe1568b25f6.png', 'icecream/images/clone_16.png': 'icecream/images/clone_16-b99ff49194078de3a22a87dd3d6068776dbb2ad8.png', 'icecream/images/action_16.png': 'icecream/images/action_16-8f25a6c18ebea567b4f24da8431d76c7ea643bde.png', 'icecream/images/action_48.png': 'icecream/images/action_48-0d106e934ef27fa3254b83e69d9611b43a1b6da5.png', 'icecream/images/next_12.png': 'icecream/images/next_12-f1e008f67f50d36fb5a02cdbfec6ef10dff5f756.png', 'icecream/images/filter_16.png': 'icecream/images/filter_16-bd99819c6fd1c827be3f648a3cad977cc7265448.png', 'icecream/images/phone_sync_48.png': 'icecream/images/phone_sync_48-3e028feadef12321c6ddc66eef299a15a08cebc4.png', 'icecream/images/todo_32.png': 'icecream/images/todo_32-0a877edd0aa0c7292830302abf71eea1af887d8e.png', 'icecream/images/calendar_ical_48.png': 'icecream/images/calendar_ical_48-8dffb3aa0abe5101037a86866235f1c9cde39be9.png', 'icecream/images/pin_16.png': 'icecream/images/pin_16-d306617d64e8e37980fd5c41d9257b788f97c1d3.png', 'icecream/images/security_48.png': 'icecream/images/security_48-79fa572834d7b0a72dad6b3c38616d195a943d91.png', 'icecream/images/add_22.png': 'icecream/images/add_22-65bfd1b92f99b165e2245700819ff67ec9454706.png', 'icecream/images/task_22.png': 'icecream/images/task_22-38a3821463429fbab2ba4801ae189421a2b9c81e.png', 'icecream/images/unlink_48.png': 'icecream/images/unlink_48-6d96fe448c23d6f1ea687d97fb7c16bd36ecffc7.png', 'icecream/images/view_16.png': 'icecream/images/view_16-a035d4b0efacde9dc01aa26dab7bffd5bda764e5.png', 'icecream/images/history_16.png': 'icecream/images/history_16-9a294a4c29fef66fe8f12bf14da20ec3c7890eea.png', 'icecream/images/event_12.png': 'icecream/images/event_12-f93dfdcad086fa0087b211ee8c4df51c4f405cb3.png', 'icecream/images/merge_32.png': 'icecream/images/merge_32-3fdf583f7a5e675c7d58c133699a8fc9f920ccdc.png', 'icecream/images/project_16.png': 'icecream/images/project_16-5b788edd6194555a3d36d29408242866269a303e.png', 'icecream/images/info_22.png': 'icecream/images/info_22-053277c2f0ec52d18cd7033b3c60ee3ee00d7ad9.png', 'icecream/images/quick_12.png': 'icecream/images/quick_12-52518d391e2a96dc5523b0e9094149632d1637c7.png', 'icecream/images/document_csv_22.png': 'icecream/images/document_csv_22-25cd5d0649408a81617ec2c7dba867bf9d70dd87.png', 'icecream/images/spam_32.png': 'icecream/images/spam_32-33595611970b50a87c816d9b3e99c4472ea4b8e3.png', 'icecream/images/document_32.png': 'icecream/images/document_32-48a2d1c7dcc6acc52788cb829b071c7d11c2076d.png', 'icecream/images/search_16.png': 'icecream/images/search_16-d40fdf183ff9ac18b9590bb84cef08f2e594792b.png', 'icecream/images/header_filter_48.png': 'icecream/images/header_filter_48-91b4879fe6e36e84b1a8abe46abd432a6a8df890.png', 'icecream/images/wall_12.png': 'icecream/images/wall_12-29817747ca52f8527e190530fdd7545aba297607.png', 'icecream/images/image_32.png': 'icecream/images/image_32-0b0ca2a2405c0ae56f5b5c6662297b8bdeea58f1.png', 'icecream/images/todo_48.png': 'icecream/images/todo_48-edeae6cd06aaff7194bf8cafbb4e169ca1a2e4d5.png', 'icecream/images/document_odt_22.png': 'icecream/images/document_odt_22-178668a7f74f8c99c5474ce687ecc221f5e2b4ae.png', 'icecream/images/history_12.png': 'icecream/images/history_12-9be075379645e8b61f3ccba28d10fc99794204b3.png', 'icecream/images/restore_48.png': 'icecream/images/restore_48-0a88d028c82858696bda548a855d191097a32232.png', 'icecream/images/previous_32.png': 'icecream/images/previous_32-9bdf6eafbfeb97b9ce094c9d410edd769911c75a.png', 'icecream/images/service_12.png': 'icecream/images/service_12-37c00a11ece0915cdca7b730e0a0f58745108e7e.png', 'icecream/images/commercial_22.png': 'icecream/images/commercial_22-7e1e51aa627f8b9b775272ce8db5cd176d0bec31.png', 'icecream/images/history_48.png': 'icecream/images/history_48-926c701ec9f33c167a2a6e81a0e4596e40b6b49c.png', 'icecream/images/commercial_32.png': 'icecream/images/commercial_32-8353103fb039b4307b4cf233476fded2bd51a878.png', 'icecream/images/action_not_in_time_22.png': 'icecream/images/action_not_in_time_22-e5164287e92a6a4ab9d4a6dcc17324b1227d9b23.png', 'icecream/images/calendar_16.png': 'icecream/images/calendar_16-3607f1755c97f53ff3d628afbc2bf4d500cc1adb.png', 'icecream/images/product_16.png': 'icecream/images/product_16-1e4ac09244164afe16a392c65180be10182be1d1.png', 'icecream/images/calendar_32.png': 'icecream/images/calendar_32-9c8f1032f08c0ca38a41e76683b1eb33dd120306.png', 'icecream/images/clone_12.png': 'icecream/images/clone_12-d3b5ffd00e73da4c3e236a1f328d3983e13edba1.png', 'icecream/images/header_filter_22.png': 'icecream/images/header_filter_22-c064b0d70b1a6b3bdc305faa86ad54b7e60e7dfe.png', 'icecream/images/service_48.png': 'icecream/images/service_48-c393cf2bcbf1e8435f29dc9484bcebf5c8eef11f.png', 'icecream/images/sync_22.png': 'icecream/images/sync_22-70c25402ce73485ad905290f2c6dc50403716a1c.png', 'icecream/images/cancel_16.png': 'icecream/images/cancel_16-bf26ad67765d3f86693f12e020026e405aea1015.png', 'icecream/images/event_16.png': 'icecream/images/event_16-0d135e619c18919314eed9c4b6751548bff651c1.png', 'icecream/images/view_more_48.png': 'icecream/images/view_more_48-4715aba4102b44c147ae2648235ffeae7b4fc6a3.png', 'icecream/images/history_32.png': 'icecream/images/history_32-48f0c201185c01b5bfc7d1ade44e7db2b2d017e4.png', 'icecream/images/next_22.png': 'icecream/images/next_22-019172e1fcd16c3a98b44aed804ca44102de19a5.png', 'icecream/images/batch_process_22.png': 'icecream/images/batch_process_22-d7fbb27a182f3aa739d9c5c0880d2d1232c6ef84.png', 'icecream/images/ticket_22.png': 'icecream/images/ticket_22-7df7b8d9696fca7d66508179523f449890ba52d2.png', 'icecream/images/action_not_in_time_16.png': 'icecream/images/action_not_in_time_16-9892da5822bd57cbb9921e560691afda29d5bb90.png', 'icecream/images/document_csv_16.png': 'icecream/images/document_csv_16-38600f9270f87f7eba462b27a563876db9346dba.png', 'icecream/images/delete_16.png': 'icecream/images/delete_16-2fb3968673e5d510b5ba8106e58b16c5f409e117.png', 'icecream/images/memo_32.png': 'icecream/images/memo_32-c1fec499c7109af3ce6ca2d6bb8a9850bbfd641d.png', 'icecream/images/unlink_32.png': 'icecream/images/unlink_32-ebcab411e83cc3ac7ad21f231375db7c42fd07ea.png', 'icecream/images/delete_48.png': 'icecream/images/delete_48-66e1607b89e21d1cfe4295acb72291f388daf460.png', 'icecream/images/event_32.png': 'icecream/images/event_32-195f9750968c2a11390892c933e71f737acef85b.png', 'icecream/images/organisation_32.png': 'icecream/images/organisation_32-93468a5b3763010ed6d4716054fac604a637a440.png', 'icecream/images/config_22.png': 'icecream/images/config_22-7233921512bb99600d381a6e46217a8724e3c72a.png', 'icecream/images/restore_32.png': 'icecream/images/restore_32-1713efe718bdfb4057c93836994b2c290c65fb18.png', 'icecream/images/batch_process_48.png': 'icecream/images/batch_process_48-2567a90561ca63784373a2a36015d9920cd44bca.png', 'icecream/images/ok_32.png': 'icecream/images/ok_32-82b91fd4d1305b21ffeef27ed1c50c67a4fd53fe.png', 'icecream/images/meeting_16.png': 'icecream/images/meeting_16-c2f8d14db1bff9816118f706ee3cea696c8dc26d.png', 'icecream/images/todo_12.png': 'icecream/images/todo_12-558b1c73857a0ca248f3a821ed3680a0e58765ac.png', 'icecream/images/previous_16.png': 'icecream/images/previous_16-a79228ce5a11644b58b42c120f887d31b1b0d71c.png', 'icecream/images/recurrent_doc_12.png': 'icecream/images/recurrent_doc_12-1b59812a2ddcdf2e067dda83f8d5ddb5b66d8477.png', 'icecream/images/report_22.png': 'icecream/images/report_22-19107b7ca8f289808839e6219d0bd17db48ce43e.png', 'icecream/images/alert_48.png': 'icecream/images/alert_48-337e406695e85483a40809742d19591ffcf398d9.png', 'icecream/images/memo_48.png': 'icecream/images/memo_48-5a5382e8e4b73f935e7d2cf3a2b9599806d3e649.png', 'icecream/images/task_32.png': 'icecream/images/task_32-0eac062640cada12c0506ec60e4796e789e3aaf5.png', 'icecream/images/creme_256.png': 'icecream/images/creme_256-0784a542ab59a63a92ca3355595e8fbafd82da71.png', 'icecream/images/product_32.png': 'icecream/images/product_32-06224b5e20ee3a61637d80c76fe73ce65d4d8bb7.png', 'icecream/images/ok_22.png': 'icecream/images/ok_22-ad46f44978eca0cca46ac1364eae17a71ebdf502.png', 'icecream/images/image_16.png': 'icecream/images/image_16-50825a9ef53cb4dca9b230996e17cadd426d762a.png', 'icecream/images/security_32.png': 'icecream/images/security_32-781f2cf7da95eab8fd885b28cd1a856de2b00a0f.png', 'icecream/images/money_info_22.png': 'icecream/images/money_info_22-07ed7334d58ca963518beda8fad3de0bfeb40645.png', 'icecream/images/view_12.png': 'icecream/images/view_12-7e9b1c74c773228e9d3bcfa562ce430a2d8379a6.png', 'icecream/images/delete_32.png': 'icecream/images/delete_32-5d658bb5ec301acdca89631471e3fe3ccfbcf2a0.png', 'icecream/images/relations_48.png': 'icecream/images/relations_48-7b5f91ea036f7bade2d1df937a7ddef9ee07e5e3.png', 'icecream/images/quick_48.png': 'icecream/images/quick_48-840642d84aabb7c543c09014b0e19f294c079e1c.png', 'icecream/images/meeting_32.png': 'icecream/images/meeting_32-f7afcdce322a30f9cb872c0e7070a5e30bc97611.png', 'icecream/images/view_less_32.png': 'icecream/images/view_less_32-cad41a599de9d8f43cd1ac3e6454ee607a33fabc.png', 'icecream/images/poll_22.png': 'icecream/images/poll_22-ebf7d0e3eace236bc3c8a9caab83af008e3469d1.png', 'icecream/images/organisation_12.png': 'icecream/images/organisation_12-4be0769e643a7d62dc805671f5c0231b672742d9.png', 'icecream/images/service_16.png': 'icecream/images/service_16-db8fc62194851e97bacf27525c374d7e7ef32709.png', 'icecream/images/cancel_22.png': 'icecream/images/cancel_22-095fecf9265b39349bdbad5761c3c56fa2642587.png', 'icecream/images/pin_48.png': 'icecream/images/pin_48-484ad4f0fca7857fac3e5bb24cbdeef7a3cb4caf.png', 'icecream/images/document_csv_12.png': 'icecream/images/document_csv_12-2bf34f3642f3d625ca4133e9767721e617c5584f.png', 'icecream/images/view_more_16.png': 'icecream/images/view_more_16-1a4629b8797ccbbce7514d2d3957e21edd9ab308.png', 'icecream/images/remove_16.png': 'icecream/images/remove_16-e09b8494f080ac1aa59af13f3488aa1b7a4bcabf.png', 'icecream/images/unlink_22.png': 'icecream/images/unlink_22-9e8f5fab09fc2d3f528f3f6a1f91f8edb93277dd.png', 'icecream/images/merge_12.png': 'icecream/images/merge_12-28961cb7bd5b2d6701b6021043634df037453c71.png', 'icecream/images/alert_22.png': 'icecream/images/alert_22-b9b9b0abbb861e32bbba92231a1a594cf4b0a075.png', 'icecream/images/remove_12.png': 'icecream/images/remove_12-84ceb65bf597f5a51a03c9ac6b87a76a1bcc3998.png', 'icecream/images/relations_16.png': 'icecream/images/relations_16-9fbb55d2623a6dae64cd3e1d3398180a76aaf3bc.png', 'icecream/images/ok_12.png': 'icecream/images/ok_12-fe9d3477f784efd21f7963bfa40c5c5a209f6395.png', 'icecream/images/message_22.png': 'icecream/images/message_22-a6741b830e28e2e39e96b7a4934aca110599606d.png', 'icecream/images/web_22.png': 'icecream/images/web_22-50a14e98a48d59f30ea8be5d06e4dc9002dd6213.png', 'icecream/images/alert_16.png': 'icecream/images/alert_16-46cdf91afe8fdd0b2ab4b18454be25eb1a3e2d89.png', 'icecream/images/next_32.png': 'icecream/images/next_32-bed9136e7447a83fcd2a613d204eea75775e2eb9.png', 'icecream/images/link_22.png': 'icecream/images/link_22-5516e4a85f6ae1db90184755d1efd9811ee12549.png', 'icecream/images/meeting_12.png': 'icecream/images/meeting_12-8e4566e4c3a34fcebf4cf4a5fc533c9d4672d2e4.png', 'icecream/images/commercial_48.png': 'icecream/images/commercial_48-adb96ea8b56f09f0167cad700e0bb8f58c8c4241.png', 'icecream/images/report_12.png': 'icecream/images/report_12-cbe3a0f83132afd5a470d41c01ef88f20da49c3b.png', 'icecream/images/add_48.png': 'icecream/images/add_48-9d8a48d036add307d8d89657a2f1c80d1656f9e2.png', 'icecream/images/money_info_16.png': 'icecream/images/money_info_16-514a981ed452c93b9b1223d31a11ad7dabd2632c.png', 'icecream/images/task_12.png': 'icecream/images/task_12-a44bd476f3cc9020fa4bdbe0fc2977d4346189f8.png', 'icecream/images/ticket_12.png': 'icecream/images/ticket_12-caa91330388d1048e4dccd360dbd690d8bca6d98.png', 'icecream/images/sms_12.png': 'icecream/images/sms_12-c6a5b8353773dfb6684a3b3502ff67092054b587.png', 'icecream/images/view_more_12.png': 'icecream/images/view_more_12-c8359b225c73ce314415d8afc03891865915b94b.png', 'icecream/images/graph_12.png': 'icecream/images/graph_12-c636cca698440ddff62c54277cdd7283621e2d19.png', 'icecream/images/phone_sync_12.png': 'icecream/images/phone_sync_12-fbadad1c26726ea64c4f15a3375f157d42dc062c.png', 'icecream/images/sync_32.png': 'icecream/images/sync_32-4a69e79c3bddd5048e57003e5170bd972feed967.png', 'icecream/images/action_22.png': 'icecream/images/action_22-8ef2607a1295bd797e750f65793189a7aa7ef90f.png', 'icecream/images/calendar_22.png': 'icecream/images/calendar_22-2fbd3ec04e8d022015f9ebe5e6320e15f982bdf9.png', 'icecream/images/document_22.png': 'icecream/images/document_22-a18f03309427bb137b54b5b4ff4bb614b9c20536.png', 'icecream/images/memo_16.png': 'icecream/images/memo_16-56ca35466b930164759f886e45a23464289646e5.png', 'icecream/images/previous_48.png': 'icecream/images/previous_48-37e1695a0d7dd3fc986f0def192620419b0e4b5d.png', 'icecream/images/opportunity_16.png': 'icecream/images/opportunity_16-699113acade6d67b1ec2d49ff50fdd64632ddc14.png', 'icecream/images/spam_48.png': 'icecream/images/spam_48-91141ad65e9c9e1a03cf83198d6e2d2248fe33eb.png', 'icecream/images/memo_12.png': 'icecream/images/memo_12-419909bec0cf7b176f6b51ef21e9bd3238446372.png', 'icecream/images/money_info_12.png': 'icecream/images/money_info_12-d255ee077cd2996e8c7ad582d62a00d2d85d0321.png', 'icecream/images/document_odt_16.png': 'icecream/images/document_odt_16-b8e6985f6d4110b5dc35f357e21b75e6ff829b3e.png', 'icecream/images/pin_32.png': 'icecream/images/pin_32-17ba42926d1c12bc322bea723b9b69ba71828ce1.png', 'icecream/images/sync_12.png': 'icecream/images/sync_12-a791eff3bc0c1ce3e930d3837b5ed7267976a9dc.png', 'icecream/images/remove_48.png': 'icecream/images/remove_48-6fbc177f0f01f7844a978e4f346a7f31f30d45ac.png', 'icecream/images/remove_22.png': 'icecream/images/remove_22-75899deb5f871d9deb5bf40216dc9274c38a32a5.png', 'icecream/images/link_12.png': 'icecream/images/link_12-db2376b31a646ea9a7b80c19e7cf91ad02db5a3d.png', 'icecream/images/web_48.png': 'icecream/images/web_48-a5bbb05a17fb48847c3aabc60a7ebda7fe40fd21.png', 'icecream/images/web_32.png': 'icecream/images/web_32-4c54dff6df4d09497704f917d083ebe9a3a873ac.png', 'icecream/images/merge_16.png': 'icecream/images/merge_16-6541d24fedb6e35056ed31a10c59e2f90f6b9a35.png', 'icecream/images/unlink_16.png': 'icecream/images/unlink_16-1a0a7e279fa0158f543329b3659f0cd46d7c3f05.png', 'icecream/images/contact_22.png': 'icecream/images/contact_22-7a2e471facc2312eabcb4dc4f10d8838904e2362.png', 'icecream/images/filter_22.png': 'icecream/images/filter_22-0514e6d88390a5f3835a89b203d362e41cc80e8a.png', 'icecream/images/cancel_12.png': 'icecream/images/cancel_12-52bed05f244f3655e70512fc029485fbd59bb6f1.png', 'icecream/images/download_32.png': 'icecream/images/download_32-1ac2c22a92a81291c67edd5727e393bcffa3cbe1.png', 'icecream/images/download_16.png': 'icecream/images/download_16-d1a838ad67b471268569330a9a0c2768e0d92acc.png', 'icecream/images/phone_48.png': 'icecream/images/phone_48-b29b1610d2ecf39295fe43ee2cc99b7227517d1b.png', 'icecream/images/restore_12.png': 'icecream/images/restore_12-7a255fe446a8a81efa640e735ae5c43b6f2eea24.png', 'icecream/images/batch_process_16.png': 'icecream/images/batch_process_16-017abf40fa63e7059293747a2450271e16bde834.png', 'icecream/images/refresh_48.png': 'icecream/images/refresh_48-519898202c77f9da1aa0212479cbade66f4cdc5f.png', 'icecream/images/download_12.png': 'icecream/images/download_12-82482a5c0af7a4c7e832216b7886fae1255f7286.png', 'icecream/images/event_48.png': 'icecream/images/event_48-3ca62e666a4d43eb96c550d2abcb8819892b6331.png', 'icecream/images/alert_32.png': 'icecream/images/alert_32-979b557fb245a14b7b4eec6920e02be8d39b0d7d.png', 'icecream/images/calendar_ical_12.png': 'icecream/images/calendar_ical_12-67902284428392f7fc91a3e101a605d16bd25007.png', 'icecream/images/view_less_22.png': 'icecream/images/view_less_22-c0b5c428105ae6dc20f9f59dcadf2becece3245c.png', 'icecream/images/search_22.png': 'icecream/images/search_22-8ce68c86d109ea8592fa8925d659f58367bbd34b.png', 'icecream/images/config_48.png': 'icecream/images/config_48-95cca768bdb46fcf83fd8a32bd2e3cd44d9132e8.png', 'icecream/images/document_odt_48.png': 'icecream/images/document_odt_48-c238d299f983bde3306bfcec00409088257c933b.png', 'icecream/images/image_22.png': 'icecream/images/image_22-4b77694f704112f11b8107c4221e40a7fffeabe0.png', 'icecream/images/view_less_48.png': 'icecream/images/view_less_48-753b0c14b54579d43c9c3b21f9d62bb28621e900.png', 'icecream/images/alert_12.png': 'icecream/images/alert_12-46e5f75a49e2118d90f52b1fef659c50a4f35f50.png', 'icecream/images/listview_12.png': 'icecream/images/listview_12-11cb7eb6c48f0a1ab7a5ae161d9b93ab4c28a127.png', 'icecream/images/report_16.png': 'icecream/images/report_16-06330c4f20670e18278d55989d3662ac9b555a84.png', 'icecream/images/wait.gif': 'icecream/images/wait-ea87c0883361a773d485428852b88e36291a63b2.gif', 'icecream/images/cancel_32.png': 'icecream/images/cancel_32-669d29f4578e9cf986848c89d48c4ec751562a38.png', 'icecream/images/spam_22.png': 'icecream/images/spam_22-6af282b5a05d4a98af231f1c62cd65f4c9ff377e.png', 'icecream/images/download_48.png': 'icecream/images/download_48-49206c60cc9d9c1f3c8de695aa12d0ef199fd479.png', 'icecream/images/poll_48.png': 'icecream/images/poll_48-9ef80aa4654d3cb9192bc0a242d5765ab21c19d9.png', 'icecream/images/contact_12.png': 'icecream/images/contact_12-88c53f0749c9601e5f921549c365432b8bba0df3.png', 'icecream/images/listview_16.png': 'icecream/images/listview_16-e470722a825664685d1ad0209766b4fbdb324ad3.png', 'icecream/images/edit_48.png': 'icecream/images/edit_48-a14dd86de6b56cc5efa0940a44c3c65f7d7525b7.png', 'icecream/images/document_csv_48.png': 'icecream/images/document_csv_48-8ba41113228a9b15eebfacef958cd28df6950192.png', 'icecream/images/contact_32.png': 'icecream/images/contact_32-f9cb5ea3432b7106b7315ea40b6ffeb35aa48734.png', 'icecream/images/contact_16.png': 'icecream/images/contact_16-e64c8b9b409b960b8cbce71880e0a5262f3566ed.png', 'icecream/images/commercial_12.png': 'icecream/images/commercial_12-5049704558c3644cf472ea8acfdfdf7b9c3fdb4e.png', 'icecream/images/relations_32.png': 'icecream/images/relations_32-5ace0c8ef13d436568de6a7fdbdbb3b1b0bee06c.png', 'icecream/images/document_doc_16.png': 'icecream/images/document_doc_16-85df927eb5e767b3ac59a2191931be04b9bb1eb7.png', 'icecream/images/image_64.png': 'icecream/images/image_64-7b644fb82928f60654fee1d3a63a52065ce1af20.png', 'icecream/images/quick_32.png': 'icecream/images/quick_32-244d8b46c983174fb305a7e031e02f7db5c0ac05.png', 'icecream/images/meeting_22.png': 'icecream/images/meeting_22-5e915e38c16536f3b48759387f164e3ee9006342.png', 'icecream/images/property_22.png': 'icecream/images/property_22-54e3d222686505bbd5f5514ede2932f3ba7ea7da.png', 'icecream/images/invoice_12.png': 'icecream/images/invoice_12-e80f837df34aef571456c90d424d4dfdd95ba8cc.png', 'icecream/images/edit_12.png': 'icecream/images/edit_12-f566c920058140dcf6ae8472419c30a181dc4694.png', 'icecream/images/icon_clock.gif': 'icecream/images/icon_clock-3d4b6ef357f73a58adc190597fab176e9144a886.gif', 'icecream/images/email_32.png': 'icecream/images/email_32-243581976ef69fc375f20d4c873ac7437bc3741d.png', 'icecream/images/organisation_48.png': 'icecream/images/organisation_48-7417365b36ea3580de4c9e1b1ebfb0e81a7486d4.png', 'icecream/images/email_12.png': 'icecream/images/email_12-e0f98198f4a9a1c8fcfc691062865b406feea8a0.png', 'icecream/images/small_down_arrow_16.png': 'icecream/images/small_down_arrow_16-122c5e94208cc75c456408502fae67dd6d4826ac.png', 'icecream/images/listview_48.png': 'icecream/images/listview_48-2fa3d7c321727eb3e23858bad4e8768650523d02.png', 'icecream/images/clone_48.png': 'icecream/images/clone_48-5c19cadc456fa439a8b8b0f435bb00a818bcc68d.png', 'icecream/images/cancel_48.png': 'icecream/images/cancel_48-03409847694327735a79a38d5bed212030bc508e.png', 'icecream/images/sms_48.png': 'icecream/images/sms_48-dfd4b4b96a7282d6c6b2b59df973d656f12fa147.png', 'icecream/images/view_48.png': 'icecream/images/view_48-df25167a9f3fac096db336b380813642b140379e.png', 'icecream/images/search_32.png': 'icecream/images/search_32-a2231278ff7794b20e261b5715088576ad73be6b.png', 'icecream/images/edit_32.png': 'icecream/images/edit_32-43d33e9b8445b14ab36fbac0fc4322393230219b.png', 'icecream/images/opportunity_48.png': 'icecream/images/opportunity_48-aa178656869f626f1dce14999957ff99fb89096e.png', 'icecream/images/sms_16.png': 'icecream/images/sms_16-5115508f2ff6cca80c2ddb76aa06ae810e2b4b0a.png', 'icecream/images/web_16.png': 'icecream/images/web_16-643401ce245c1a788d98d3d560317911c97c7dd2.png', 'icecream/images/document_48.png': 'icecream/images/document_48-2d95cad7dc5ab8a2765a86bf849c746a679dad74.png', 'icecream/images/property_48.png': 'icecream/images/property_48-5b84b0f19a4035ad368d09d8efa24e94453a9ec3.png', 'icecream/images/view_more_32.png': 'icecream/images/view_more_32-2b686041e1c1bc22f6112160c107774141b30061.png', 'icecream/images/clone_22.png': 'icecream/images/clone_22-31c97ec5eb682e795b18bde860fd60a7c472efb3.png', 'icecream/images/document_doc_48.png': 'icecream/images/document_doc_48-1748d7f0275a82fb9647e977189bac2a74e9401f.png', 'icecream/images/small_up_arrow_16.png': 'icecream/images/small_up_arrow_16-c9371f06c4bccd09573a6a5ef767bbfffc5620f0.png', 'icecream/images/header_filter_12.png': 'icecream/images/header_filter_12-bc9896b64010706bb0682ca009cfd6118759ed27.png', 'icecream/images/link_48.png': 'icecream/images/link_48-20f3faf6bd4537eb46d5184913ca925ada712dcf.png', 'icecream/images/phone_32.png': 'icecream/images/phone_32-251e6628c7303a0e6f3d2951c42982165fef215c.png', 'icecream/images/phone_sync_32.png': 'icecream/images/phone_sync_32-77b72c7042fac4f0f546ed2430a786c2813acb56.png', 'icecream/images/recurrent_doc_16.png': 'icecream/images/recurrent_doc_16-b0ee48411ca4aa4d936cc005636e2b7814c95d34.png', 'icecream/images/calendar_12.png': 'icecream/images/calendar_12-f698bf8ceb93af356320857659805e3b0c6bb671.png', 'icecream/images/project_12.png': 'icecream/images/project_12-1cc5b33e1e4fe98ad6589b76d37f2614b00a4162.png', 'icecream/images/home_12.png': 'icecream/images/home_12-599e80fcc5aad89a945328517777e22452b18635.png', 'icecream/images/sms_32.png': 'icecream/images/sms_32-d488fe7b145014255ba75a0b43ed6ca2737330d1.png', 'icecream/images/listview_32.png': 'icecream/images/listview_32-8ac408a9715e25837d63ee3e72e121313922e3c8.png', 'icecream/images/organisation_16.png': 'icecream/images/organisation_16-2c1273b469dbc0dcf24b786410d9c7241e190a68.png', 'icecream/images/spam_12.png': 'icecream/images/spam_12-f32496f8aca40d4f8b31466a757c186e585eb073.png', 'icecream/images/ticket_32.png': 'icecream/images/ticket_32-11a2657fbbfd3a2d53df591ccc8170bf5b6c8347.png', 'icecream/images/sync_16.png': 'icecream/images/sync_16-71f089d3585891cc96575b9cdcf0a1d5af093e06.png', 'icecream/images/commercial_16.png': 'icecream/images/commercial_16-e52b351402695712c24ff8609ac546a3d664376d.png', 'common/images/creme_logo.png': 'common/images/creme_logo-4fe0267e9e08af3cdc8aebb29cb7e727d94a08a8.png', 'common/images/400_200.png': 'common/images/400_200-0219d972d6f793e1f0465ad1720f3253a0273511.png', 'common/images/creme_200.png': 'common/images/creme_200-2ea1afc1dd23bca69cea536016d85de2f15aa3bf.png', 'common/images/500_200.png': 'common/images/500_200-d182255205c633442c9afce70f3b564d6ff4ac77.png', 'common/images/favicon.ico': 'common/images/favicon-e41be60abc5ebb842ee87b442a71345c5a720ded.ico', 'common/images/403_200.png': 'common/images/403_200-6bdf8990633eac7cd457daacb3ea880d590b6447.png', 'common/images/creme_powered.png': 'common/images/creme_powered-4a2f27f51f5044a4f9ebb707c1c28d01dfcb42dd.png', 'common/images/409_200.png': 'common/images/409_200-b1f0449cffa91409d3bce809419f6a74b74e5f8b.png', 'common/images/creme-pattern.png': 'common/images/creme-pattern-d7695a38c535a482b5b2b8d31640920c82582ade.png', 'common/images/creme_header.png': 'common/images/creme_header-89f38244fa391230f9cadf013f0651824adfdb2c.png', 'common/images/404_200.png': 'common/images/404_200-324fc2463870ecaf39c2533f60499754660f9f14.png', 'common/images/logos/hybird.png': 'common/images/logos/hybird-5b7471f9b68e4801d1bd968dae10e75732532de0.png', 'common/images/fulbert/409_texture.png': 'common/images/fulbert/409_texture-91bad4bc633739432f4745deb241b38172c3f3c9.png', 'common/images/fulbert/404_texture.png': 'common/images/fulbert/404_texture-ca6a122e65bd2630fb4d8845f9fdb849d4cd497f.png', 'common/images/fulbert/500_texture.png': 'common/images/fulbert/500_texture-1436920f0c48d44fad3327f6fd4a3889117332e1.png', 'common/images/fulbert/403_texture.png': 'common/images/fulbert/403_texture-50bfa88d70dff9aaae11edf1d82c5ba1cb3dc8c7.png', 'common/images/fulbert/400_texture.png': 'common/images/fulbert/400_texture-0fe76a9198b1e8a4e2bfff3fd5d4fddf88295784.png', 'common/fonts/OpenSans-Regular.ttf': 'common/fonts/OpenSans-Regular-3564ed0b5363df5cf277c16e0c6bedc5a682217f.ttf', 'common/fonts/OpenSans-Regular-400.woff': 'common/fonts/OpenSans-Regular-400-f570b2fe0688332cf8c4a9127db25433d9a1ebaa.woff', 'common/fonts/OpenSans-Bold-700.woff': 'common/fonts/OpenSans-Bold-700-48e4bfa29b019ee7f1f5a4215be15af87ad52dbd.woff', 'common/fonts/OpenSans-Semibold-600.woff': 'common/fonts/OpenSans-Semibold-600-8d05328abaf7121ef858219e1e642b98597c9144.woff', 'common/fonts/OpenSans-Bold.ttf': 'common/fonts/OpenSans-Bold-c1691e8168b2596af8a00162bac60dbe605e9e36.ttf', 'common/fonts/OpenSans-Semibold.ttf': 'common/fonts/OpenSans-Semibold-f1ee7a9c6d13ee2d642a806c09e737275e613792.ttf', 'chantilly/images/contact_64.png': 'chantilly/images/contact_64-dfdc4ebba9e3698e6abd67a32d40ea9a17108d06.png', 'chantilly/images/home_48.png': 'chantilly/images/home_48-a866310d1da899d910227304dde353e55cb7761d.png', 'chantilly/images/web_64.png': 'chantilly/images/web_64-5adde8b8a43f61ea168056d7937d1580cb9c7b78.png', 'chantilly/images/quick_16.png': 'chantilly/images/quick_16-d001bd78a593a9e5d870cc55b9594da2d035dd9c.png', 'chantilly/images/config_16.png': 'chantilly/images/config_16-a5c683503933cd2dcbdc19f1100425fb1342e730.png', 'chantilly/images/document_doc_22.png': 'chantilly/images/document_doc_22-726cf9f0fd5b00164ca4256b82b898a3dcd13222.png', 'chantilly/images/todo_16.png': 'chantilly/images/todo_16-8d74953ce6f2947d2d74ac7cd74a43b8238586ab.png', 'chantilly/images/spam_64.png': 'chantilly/images/spam_64-4a18cffb7c8e070b91bc8b0c2fd8a9f29f4d8add.png', 'chantilly/images/view_more_64.png': 'chantilly/images/view_more_64-d8da469813effdb96b426864467c0ac9a07d91c6.png', 'chantilly/images/ok_64.png': 'chantilly/images/ok_64-c4ca168ed0fcadc66661f2d19abcfb41db1f3c86.png', 'chantilly/images/quick_22.png': 'chantilly/images/quick_22-8441a4cf5d0717d3464b67b4dbb5b95e79d9575f.png', 'chantilly/images/wall_16.png': 'chantilly/images/wall_16-272c8189cc30ac891dcded8ecec58e46974bc4ff.png', 'chantilly/images/ok_16.png': 'chantilly/images/ok_16-6e2ec2242249bf71c271ea548bb1a77c103a494a.png', 'chantilly/images/delete_22.png': 'chantilly/images/delete_22-af34eaafd717e78c015548b4cf2ab0269ac0a783.png', 'chantilly/images/wall_22.png': 'chantilly/images/wall_22-5a84d6ddad2347586c72370d5e9517c46eec8cab.png', 'chantilly/images/report_32.png': 'chantilly/images/report_32-74ad7c2d2d7272269764008d0545ab97ff13ec50.png', 'chantilly/images/remove_32.png': 'chantilly/images/remove_32-42928567366525aecda5e16347cb968a8b2230df.png', 'chantilly/images/edit_22.png': 'chantilly/images/edit_22-576061417045357750b474fd547889862bf0e783.png', 'chantilly/images/meeting_64.png': 'chantilly/images/meeting_64-a948cd2655602b6eafd09f138124a065506cffa2.png', 'chantilly/images/refresh_32.png': 'chantilly/images/refresh_32-3c22a57057c42fcf9e3dc7713dfb74c678529a03.png', 'chantilly/images/money_info_32.png': 'chantilly/images/money_info_32-263a3f8e51fd1d4e57644346711f83363497d55e.png', 'chantilly/images/project_48.png': 'chantilly/images/project_48-93e968db40098deabdf5cdb6fcdba11175e7b2db.png', 'chantilly/images/recurrent_doc_32.png': 'chantilly/images/recurrent_doc_32-8720c4dae85bb23a232cd6ca129c65e6d3f1226f.png', 'chantilly/images/view_less_16.png': 'chantilly/images/view_less_16-643b25ee306a4f1c8df20c3f25ac29826182c980.png', 'chantilly/images/calendar_48.png': 'chantilly/images/calendar_48-2e32f5e2618961b3ce270189e7edf157fc6ff28b.png', 'chantilly/images/download_64.png': 'chantilly/images/download_64-1f3831983868c1270a9d2c65db679c7607cf8530.png', 'chantilly/images/document_64.png': 'chantilly/images/document_64-fb74212fd62ef30ff8ddc5482a999d3b7d00cab5.png', 'chantilly/images/next_64.png': 'chantilly/images/next_64-52e8a9bd08c064dbc07c13935e20bd468016821c.png', 'chantilly/images/phone_16.png': 'chantilly/images/phone_16-c73816b8f2e9f3121eaadaf7c76a3af9c74978da.png', 'chantilly/images/project_22.png': 'chantilly/images/project_22-53137b8502f3edccde48f981deb902ef0d03c49a.png', 'chantilly/images/previous_64.png': 'chantilly/images/previous_64-1d56d794ff51089dd7d21acfde9232b7f1c63f0f.png', 'chantilly/images/action_32.png': 'chantilly/images/action_32-9501463a51f474c1be7d2a19318a1f68361cc013.png', 'chantilly/images/invoice_32.png': 'chantilly/images/invoice_32-02e8d47dc7a341e32d7df1bcdf74c75e71f7a9c4.png', 'chantilly/images/opportunity_32.png': 'chantilly/images/opportunity_32-27dfcc52dee45363413ac9b1d567a51b9970e99a.png', 'chantilly/images/wall_32.png': 'chantilly/images/wall_32-b58a570e63c4fc498ba9f425701c6551f4e669c0.png', 'chantilly/images/document_csv_32.png': 'chantilly/images/document_csv_32-3ca4540712dc8035960d02a550445aaba56a3847.png', 'chantilly/images/home_16.png': 'chantilly/images/home_16-97763a7d11268eb24d3914e40cf1d8a123606ce8.png', 'chantilly/images/info_48.png': 'chantilly/images/info_48-1363c67002496c364af7f9cfd3ac6ca4b320361a.png', 'chantilly/images/link_16.png': 'chantilly/images/link_16-875ac305a8d31585698a756e183a1f13f38ec126.png', 'chantilly/images/refresh_16.png': 'chantilly/images/refresh_16-3b080ed422eaa5c91983efb28d3035423fb066c4.png', 'chantilly/images/listview_22.png': 'chantilly/images/listview_22-f14e3b7a88e757596d16997e61ec966210967b26.png', 'chantilly/images/invoice_22.png': 'chantilly/images/invoice_22-0c2befc97bf5859bf48975d038fe6d681136056c.png', 'chantilly/images/organisation_22.png': 'chantilly/images/organisation_22-8b3dad40e0a5c571ca46defcb7214de1c05d4676.png', 'chantilly/images/merge_48.png': 'chantilly/images/merge_48-0220b50cabfcf2e50dfeed4085f8a1ad5e9de80b.png', 'chantilly/images/graph_64.png': 'chantilly/images/graph_64-ea3f6382ccf290e145e8b9a8fac90e1a29b9c68f.png', 'chantilly/images/message_64.png': 'chantilly/images/message_64-d9a826f0bcc4f4665265206fd80a82c45edf0a44.png', 'chantilly/images/merge_22.png': 'chantilly/images/merge_22-fe091e50773fc89232c1584f9a188dc78c24fdd2.png', 'chantilly/images/message_48.png': 'chantilly/images/message_48-3a7609ea76a13fe455e43f4ee5ebaaae83212d78.png', 'chantilly/images/calendar_ical_32.png': 'chantilly/images/calendar_ical_32-89849797ff758aed0258eaf6e770202c94cd9cb2.png', 'chantilly/images/next_16.png': 'chantilly/images/next_16-30ba8d1af0aab7d710513549dd72799dd3539150.png', 'chantilly/images/view_22.png': 'chantilly/images/view_22-8e97b7a858a0956d9f0d58415a4eec92224e6def.png', 'chantilly/images/restore_16.png': 'chantilly/images/restore_16-5f32f2efaf95ec7b6ee019f4635b476d652e8221.png', 'chantilly/images/creme_22.png': 'chantilly/images/creme_22-1a3285631bc5d8c919abf9291592eafff524181d.png', 'chantilly/images/event_22.png': 'chantilly/images/event_22-e6aed90819a82d57d31ac1828aa7287de94f31a2.png', 'chantilly/images/memo_64.png': 'chantilly/images/memo_64-98cbeac24c9438c74376c1ee30fe585a7ea027e5.png', 'chantilly/images/memo_22.png': 'chantilly/images/memo_22-b019c708c64ebbd0b37d5af18fdef2c1c853f1bd.png', 'chantilly/images/email_22.png': 'chantilly/images/email_22-3b2fbe10aac52393e393b9d63b1984c9396d55a7.png', 'chantilly/images/todo_22.png': 'chantilly/images/todo_22-ff0da01c723ab629b3651a06419881656fad0f44.png', 'chantilly/images/pin_22.png': 'chantilly/images/pin_22-439577b0e8b7aa1ac9c3347489bbef272e677471.png', 'chantilly/images/creme_30.png': 'chantilly/images/creme_30-f46fc2af3969b80f7624f055a030fe8f35d99a6f.png', 'chantilly/images/product_22.png': 'chantilly/images/product_22-8d7297e3af19f5b3e76d58df32e075f2a002e050.png', 'chantilly/images/calendar_ical_22.png': 'chantilly/images/calendar_ical_22-275493b2ab7c6b7ebb8181aa871725b0646c09af.png', 'chantilly/images/poll_32.png': 'chantilly/images/poll_32-0d5517d008bd610074061dbfef41380f817dccb9.png', 'chantilly/images/graph_22.png': 'chantilly/images/graph_22-8f057d6141bec6328732655a7f3e44dee1f08110.png', 'chantilly/images/remove_64.png': 'chantilly/images/remove_64-17bbd2ba6552f452eb0a10c8dd4c7e48cc638a58.png', 'chantilly/images/document_doc_64.png': 'chantilly/images/document_doc_64-9ba289753f789dcc65558b964b448ec6585431e1.png', 'chantilly/images/sms_64.png': 'chantilly/images/sms_64-fb9d6302069420c5192acf0cbaa1c580ed7602dc.png', 'chantilly/images/poll_16.png': 'chantilly/images/poll_16-35592cd8f92b1f7512f283656b6c3d59f1bcb832.png', 'chantilly/images/document_16.png': 'chantilly/images/document_16-fb675e6e0db1d0d01ac5ed9b9f400a5fabc0f00c.png', 'chantilly/images/add_32.png': 'chantilly/images/add_32-a52d8fb211eefc3057b012832e83297074a5ad39.png', 'chantilly/images/clone_32.png': 'chantilly/images/clone_32-730c4ed5a9395b03d6fdb7ab48102c0b15ed6d40.png', 'chantilly/images/relations_64.png': 'chantilly/images/relations_64-bb72b524729d87481c2b9685eb378ff5a1cbd549.png', 'chantilly/images/document_odt_64.png': 'chantilly/images/document_odt_64-e8e1daab58cbc3d27c4ae630d3bfd09b2ca27a6b.png', 'chantilly/images/restore_22.png': 'chantilly/images/restore_22-60413fcdadbaa75982b25587de0975461d033a8e.png', 'chantilly/images/add_16.png': 'chantilly/images/add_16-016b555f618bcc7aa421967f4e1277c38a97284d.png', 'chantilly/images/invoice_48.png': 'chantilly/images/invoice_48-072dc274d0d3c7f9b6722e0d29d67680d06adad0.png', 'chantilly/images/merge_64.png': 'chantilly/images/merge_64-3b18fcee62274020d48ffbf9df3559f81284e6a5.png', 'chantilly/images/ok_48.png': 'chantilly/images/ok_48-16b3ca6937bff5201557ce3a72dc14323904ded5.png', 'chantilly/images/ticket_64.png': 'chantilly/images/ticket_64-53906f93b02b022f1a615d919a9bcd9de68e3f9a.png', 'chantilly/images/event_64.png': 'chantilly/images/event_64-af6f4e84f568f9a9c665b544610988b8086672e4.png', 'chantilly/images/opportunity_22.png': 'chantilly/images/opportunity_22-9b10bf9f452a7a4bb16ecb35ac879b94672837ac.png', 'chantilly/images/product_48.png': 'chantilly/images/product_48-2964c029c2fe3a91700962597199b9b4879213a6.png', 'chantilly/images/link_32.png': 'chantilly/images/link_32-0caa1cdb83d42996ce38255f2f9f39545a3a8342.png', 'chantilly/images/header_filter_32.png': 'chantilly/images/header_filter_32-1def304ed469e404bad1a120dccb2b3b75888072.png', 'chantilly/images/refresh_22.png': 'chantilly/images/refresh_22-a914ad110903d17848ec97d42e3c83d770b9a413.png', 'chantilly/images/action_not_in_time_48.png': 'chantilly/images/action_not_in_time_48-6cbb255c009801f46af97853f76b0c6441dd98ea.png', 'chantilly/images/report_48.png': 'chantilly/images/report_48-8b930390ba2b5294c82b9276fdcd4f6df6e56a04.png', 'chantilly/images/document_doc_32.png': 'chantilly/images/document_doc_32-24ce07467050058b9f935b0053d96a9074b29cf6.png', 'chantilly/images/organisation_64.png': 'chantilly/images/organisation_64-d2c46027ec8d1af7dc0d229d1ad72ac54e923499.png', 'chantilly/images/message_16.png': 'chantilly/images/message_16-a3804828cd05b38943db31d5491bbfd514c7c25e.png', 'chantilly/images/sync_48.png': 'chantilly/images/sync_48-bb1585e8040aee47213646c1ee01d1eb74285add.png', 'chantilly/images/icon_calendar.gif': 'chantilly/images/icon_calendar-ed6237b0991b02bbdf84dd6a9e89cd61a704e07b.gif', 'chantilly/images/property_16.png': 'chantilly/images/property_16-41ff39e0d56f5d41daee1de0670862ba7ed0002f.png', 'chantilly/images/previous_22.png': 'chantilly/images/previous_22-5148553957f6ada88f260b5f5c00c9bda7244752.png', 'chantilly/images/service_32.png': 'chantilly/images/service_32-9d94b1634f2f8cec508782cd3dd59d9a7e2b3e8b.png', 'chantilly/images/config_32.png': 'chantilly/images/config_32-48c691a8c9967236290b2de2f4e1bc261a69ad1b.png', 'chantilly/images/graph_32.png': 'chantilly/images/graph_32-144c35213f0aeacec8116266bb73f32646a613d5.png', 'chantilly/images/phone_22.png': 'chantilly/images/phone_22-43ef1702641d82b63c70f51a012a9cac9d72079b.png', 'chantilly/images/task_48.png': 'chantilly/images/task_48-a32872ef09040d1ac0f834218bc6c532e0e8ced3.png', 'chantilly/images/calendar_ical_16.png': 'chantilly/images/calendar_ical_16-388bcfe3013d5a526c2b2b75c844c1aa0a8c8dd8.png', 'chantilly/images/home_22.png': 'chantilly/images/home_22-f24ae3c479b716d74a6780a5b3a3e95e25e7b175.png', 'chantilly/images/opportunity_64.png': 'chantilly/images/opportunity_64-368409d919233abd713b8ad7411a1480d65bac73.png', 'chantilly/images/refresh_64.png': 'chantilly/images/refresh_64-e9380279bb46b2191076fd3d2f90a7602a6c4263.png', 'chantilly/images/restore_64.png': 'chantilly/images/restore_64-03105e714304d252684e6679cdf16327de68ad6e.png', 'chantilly/images/history_22.png': 'chantilly/images/history_22-a014ced9ef3cf1e964dc5219ed920dcb384da9c3.png', 'chantilly/images/contact_48.png': 'chantilly/images/contact_48-1b4081848a57039bb8869d18fa82a4b9d4e4d295.png', 'chantilly/images/security_22.png': 'chantilly/images/security_22-7923e010e23bceba4a935e55f0ac75ff08bc01e4.png', 'chantilly/images/image_48.png': 'chantilly/images/image_48-0b201f6432cd6ce0a8e459682a017950ebf0168d.png', 'chantilly/images/service_22.png': 'chantilly/images/service_22-348d768c856932e40df3357136516c8329f52de0.png', 'chantilly/images/view_more_22.png': 'chantilly/images/view_more_22-e55b48b7e59b3571aab56d7ed7ba77a328eff66c.png', 'chantilly/images/invoice_16.png': 'chantilly/images/invoice_16-91219ef65923e889c0bd271deb8dfccea1190b78.png', 'chantilly/images/message_32.png': 'chantilly/images/message_32-58f62be3b4d97e14b946e4d095a3e396200e255f.png', 'chantilly/images/phone_sync_16.png': 'chantilly/images/phone_sync_16-56fcff62a300c321946027e4fd1db13214cde182.png', 'chantilly/images/next_48.png': 'chantilly/images/next_48-1831f366bca7086df162d88092b4284b89a3189a.png', 'chantilly/images/spam_16.png': 'chantilly/images/spam_16-c098a38d6c31e3bdfdab168cb89fbadab177f72c.png', 'chantilly/images/search_48.png': 'chantilly/images/search_48-b412cceb06fbfc663392776691eb03c3b82dabcc.png', 'chantilly/images/view_32.png': 'chantilly/images/view_32-f5eaaa0e170b935967bad35f3a4ab7036f8c484d.png', 'chantilly/images/download_22.png': 'chantilly/images/download_22-52d5dad51f44efacad338e34525d0f0d12dca3a0.png', 'chantilly/images/task_16.png': 'chantilly/images/task_16-ce1f3dda3d5b6839f3884db430d2f6655ef4ad82.png', 'chantilly/images/view_64.png': 'chantilly/images/view_64-727b336f9d4379c513b008e3d6d2100d7f32c2d7.png', 'chantilly/images/money_info_48.png': 'chantilly/images/money_info_48-3c198a7a9e4983585acefb3b353557ea45769702.png', 'chantilly/images/relations_22.png': 'chantilly/images/relations_22-245012ad45393dc05cadd1fc54584a7afffef9b7.png', 'chantilly/images/meeting_48.png': 'chantilly/images/meeting_48-a12b7b3fe2a295585254cdf72027a2bc70cacb6c.png', 'chantilly/images/email_16.png': 'chantilly/images/email_16-1e010e32030ec7b1925d2d8a926b2b7dcca78081.png', 'chantilly/images/security_64.png': 'chantilly/images/security_64-e6acb03b07f97c7f3fbd65c843a25a828552bbcc.png', 'chantilly/images/info_16.png': 'chantilly/images/info_16-6adc17cff4d2eb66a2611ccff6af85cd56b84fe5.png', 'chantilly/images/wall_48.png': 'chantilly/images/wall_48-e291eb51f1c02d0592ae56420f0826387aa70f0c.png', 'chantilly/images/ticket_48.png': 'chantilly/images/ticket_48-03863f24183063477ac7f83a6fe915543bde9464.png', 'chantilly/images/property_32.png': 'chantilly/images/property_32-71f194da5947cceb6113a2ca1097b21a795ac985.png', 'chantilly/images/phone_sync_22.png': 'chantilly/images/phone_sync_22-382e3eeab73f82003b96808a12067e75429fc7c5.png', 'chantilly/images/todo_64.png': 'chantilly/images/todo_64-40d6d4baa175e46ed1e234ae1d8ea3459204e057.png', 'chantilly/images/recurrent_doc_22.png': 'chantilly/images/recurrent_doc_22-db21cde37b213dc2d13759f6a5357d1a709e6be1.png', 'chantilly/images/unlink_64.png': 'chantilly/images/unlink_64-a3698d94389d1e0c311753c1e191d399250743e9.png', 'chantilly/images/home_32.png': 'chantilly/images/home_32-5f6282a56fad79cdbda68b74a329877ebb7117b2.png', 'chantilly/images/sms_22.png': 'chantilly/images/sms_22-6dc0124e3d82983b63454fdb561afcb78e174de6.png', 'chantilly/images/edit_16.png': 'chantilly/images/edit_16-cf06014212a471e1f45a088f2f7a5a6ad0c92882.png', 'chantilly/images/filter_48.png': 'chantilly/images/filter_48-6c8a938ef0b9e095df45c4ffda2cfe063156ee13.png', 'chantilly/images/project_32.png': 'chantilly/images/project_32-1bd5931038765b9e07bcdcc3503c53edc353bbfe.png', 'chantilly/images/batch_process_64.png': 'chantilly/images/batch_process_64-d6fc16ee6164675e2ef1e41d667d5150706fc058.png', 'chantilly/images/ticket_16.png': 'chantilly/images/ticket_16-915c80bc2a31a1c0f50fe31b7590f4c019d48f2b.png', 'chantilly/images/recurrent_doc_48.png': 'chantilly/images/recurrent_doc_48-82bead73a1040d52a0348de3fe23dd47e84eb4ad.png', 'chantilly/images/document_odt_32.png': 'chantilly/images/document_odt_32-60b9f129a8d33ec4bf2a12c37c297edf82df6308.png', 'chantilly/images/security_16.png': 'chantilly/images/security_16-226a051834b9a5a46d50978e78fbc7d47cdbca6b.png', 'chantilly/images/graph_16.png': 'chantilly/images/graph_16-38a62d6513545acfceaab37dc3b18ff60911a77b.png', 'chantilly/images/header_filter_16.png': 'chantilly/images/header_filter_16-40fbca6dc7f7842894c5df1faae09af1e619ca40.png', 'chantilly/images/filter_32.png': 'chantilly/images/filter_32-929bd1a5e820d9c91a419ded524531ca88d538eb.png', 'chantilly/images/quick_64.png': 'chantilly/images/quick_64-34b5279139f8aa5199dc42adef08e2632d8bb960.png', 'chantilly/images/email_48.png': 'chantilly/images/email_48-60a03e282d783839655739f9311b4fed46ba9909.png', 'chantilly/images/graph_48.png': 'chantilly/images/graph_48-9a8d762b204258c90fa61e4e7e9f220401a9eb2c.png', 'chantilly/images/batch_process_32.png': 'chantilly/images/batch_process_32-c3e6ae68061d40eb433c0b10a2d63382c5163100.png', 'chantilly/images/home_64.png': 'chantilly/images/home_64-b190950605c5ba7389b6744b6e8e6708fe2a923d.png', 'chantilly/images/wall_64.png': 'chantilly/images/wall_64-929329647a118604b4904c53b3721728722b2c9d.png', 'chantilly/images/action_16.png': 'chantilly/images/action_16-d679ff61ad492fb3380e998aef1f64a502e44230.png', 'chantilly/images/action_48.png': 'chantilly/images/action_48-268025029386286029047974b775e0aa96292965.png', 'chantilly/images/filter_16.png': 'chantilly/images/filter_16-e5427d8f0e6c6ea14167cc74140323a2a69c7504.png', 'chantilly/images/phone_sync_48.png': 'chantilly/images/phone_sync_48-55dd5bee797f460456e9afb6714b9e916ab97fc4.png', 'chantilly/images/todo_32.png': 'chantilly/images/todo_32-a6f1e36b8f60c0e76126906ebeb9e6b8bfecaa51.png', 'chantilly/images/calendar_ical_48.png': 'chantilly/images/calendar_ical_48-d10b0cb6a4e77021c016930f47ec01e2242d91bd.png', 'chantilly/images/pin_16.png': 'chantilly/images/pin_16-4e93eb4101c6eb5948fd88a89c39ff40fcae416b.png', 'chantilly/images/security_48.png': 'chantilly/images/security_48-cc74a493194340d9fe062249ac5c95808c51a7bd.png', 'chantilly/images/add_22.png': 'chantilly/images/add_22-a0ae9e4832ace6a9e0cd8f7e54d7d6d6375262e2.png', 'chantilly/images/task_22.png': 'chantilly/images/task_22-9c719e490d97c655e1452190643c40d8ab1b0c26.png', 'chantilly/images/unlink_48.png': 'chantilly/images/unlink_48-5de601d6dfa2ba7384965ab27a79b1e160d7b8ac.png', 'chantilly/images/view_16.png': 'chantilly/images/view_16-fce3b950dbaba1c2b3d40d4099b5cb573ad90c6a.png', 'chantilly/images/history_16.png': 'chantilly/images/history_16-b053740c8dbe41d0d2259b4d93d3a694f8d1c14f.png', 'chantilly/images/merge_32.png': 'chantilly/images/merge_32-a62e7f8b952ca4890747087071f5ffdff07433fd.png', 'chantilly/images/project_16.png': 'chantilly/images/project_16-fd7c49a40dfa95048f24ce806adbcc1ba1a1843e.png', 'chantilly/images/header_filter_64.png': 'chantilly/images/header_filter_64-f1549a78b60a26eb2751f24c01512f9e20df7236.png', 'chantilly/images/info_22.png': 'chantilly/images/info_22-5da36759ced056123cb5412250433ba32e35a1bb.png', 'chantilly/images/link_64.png': 'chantilly/images/link_64-ebac6b62b554bda93e6b493d11e14de2ed6178ef.png', 'chantilly/images/document_csv_22.png': 'chantilly/images/document_csv_22-bdf8c130b097d1c248ea39b44948d607af5656d4.png', 'chantilly/images/calendar_ical_64.png': 'chantilly/images/calendar_ical_64-2cb0022712ec09d49f56eab24031b17c3f581997.png', 'chantilly/images/spam_32.png': 'chantilly/images/spam_32-f6c8627deb2c5c047194a8a02fb44fc7728fefcf.png', 'chantilly/images/money_info_64.png': 'chantilly/images/money_info_64-6d9b1df74b3565bf4c67c6a58a43e6e8c36726d8.png', 'chantilly/images/document_32.png': 'chantilly/images/document_32-6e76cfb550ec9d65fd133af11234ec997cd11867.png', 'chantilly/images/search_16.png': 'chantilly/images/search_16-436c0a61d449870bb6b37b44e74354cb2a2970c9.png', 'chantilly/images/header_filter_48.png': 'chantilly/images/header_filter_48-d47994f0eab3a6f8816c2fe2d613d833c6df87a1.png', 'chantilly/images/property_64.png': 'chantilly/images/property_64-b843b54c7d76c6eec262d41cc13b8e6c8c9b6b24.png', 'chantilly/images/image_32.png': 'chantilly/images/image_32-0924b44060f69df1fb21123346870949b60fd624.png', 'chantilly/images/todo_48.png': 'chantilly/images/todo_48-1bcde475af1707f2ffdec116ead37ac773526caa.png', 'chantilly/images/document_odt_22.png': 'chantilly/images/document_odt_22-aac22689aafef0d6130544e05fa969740f6e0327.png', 'chantilly/images/restore_48.png': 'chantilly/images/restore_48-b86f9605459e0dd8c7e6f3fbce08a0bc75657996.png', 'chantilly/images/previous_32.png': 'chantilly/images/previous_32-5f7ab51688039689997d8187db5efd887025d80c.png', 'chantilly/images/commercial_22.png': 'chantilly/images/commercial_22-4c1cac3deb3c05efda3aacf4992d09924a0592fa.png', 'chantilly/images/project_64.png': 'chantilly/images/project_64-888b95f8142931ff4c2f9668c6fae40f02c4cb0b.png', 'chantilly/images/history_48.png': 'chantilly/images/history_48-937966eedf25e5fe898001a31fa0107adf1d8e04.png', 'chantilly/images/commercial_32.png': 'chantilly/images/commercial_32-c6d02346384d9dfb539f24686f70eba79d964653.png', 'chantilly/images/calendar_16.png': 'chantilly/images/calendar_16-758eb5098ee1dce735562f41b0da9800e0d14921.png', 'chantilly/images/product_16.png': 'chantilly/images/product_16-c5567bf11b0b0a6fa1d1b72f93521cd0a8ab0032.png', 'chantilly/images/calendar_32.png': 'chantilly/images/calendar_32-b3c476cf6d562ffbe3745b29a09d4ec46aaa5dfb.png', 'chantilly/images/clone_64.png': 'chantilly/images/clone_64-c79aaf5da9a6904f6b30cb21fe9db14660a7d44a.png', 'chantilly/images/header_filter_22.png': 'chantilly/images/header_filter_22-3cc5209c02d33c3e7207638f6bf3b086f99288fd.png', 'chantilly/images/delete_64.png': 'chantilly/images/delete_64-0390c75b53d550cd708abc3fc1e5d2fb3c7bf39c.png', 'chantilly/images/service_48.png': 'chantilly/images/service_48-855341fa9e5e490d79a8673b46e935e728d360c2.png', 'chantilly/images/sync_22.png': 'chantilly/images/sync_22-3a6b4fb2bfabc8efe92318895e53ff306be85aaa.png', 'chantilly/images/sync_64.png': 'chantilly/images/sync_64-26eb5f81cafd0705c03b51b937ce0c257bea0b4e.png', 'chantilly/images/cancel_16.png': 'chantilly/images/cancel_16-725b31210b21d293018c8b6174a83cdc05b30b22.png', 'chantilly/images/event_16.png': 'chantilly/images/event_16-abcfa8fe5fd8df9572420dd94b223048dbfb3bf4.png', 'chantilly/images/phone_64.png': 'chantilly/images/phone_64-19277bd4b53bd5cd44e6330422a71c706226c48d.png', 'chantilly/images/view_more_48.png': 'chantilly/images/view_more_48-b2908e0e2802f5ff77450d2f79194e4c348057f7.png', 'chantilly/images/report_64.png': 'chantilly/images/report_64-df529c2de6147ad3575d9f4d323cc98b31ffb5ca.png', 'chantilly/images/calendar_64.png': 'chantilly/images/calendar_64-acf3144d7600731546daff67a31254afcc8efd5d.png', 'chantilly/images/history_32.png': 'chantilly/images/history_32-364170c03244194a1d6f1848552c649b76249026.png', 'chantilly/images/next_22.png': 'chantilly/images/next_22-4467b1b5f7ecb91e9eac20f79b8e4b7586e8437b.png', 'chantilly/images/batch_process_22.png': 'chantilly/images/batch_process_22-9a8212211bf325d29470ed5b21c5331968d68ce7.png', 'chantilly/images/ticket_22.png': 'chantilly/images/ticket_22-6b59291735760d7912ef681c6d78d1a5a1da70ed.png', 'chantilly/images/document_csv_16.png': 'chantilly/images/document_csv_16-a421cb4682e4d8ceabfd2723fba71f838b672c0f.png', 'chantilly/images/delete_16.png': 'chantilly/images/delete_16-51d69f637c05b513b5c369b52793528b2d431861.png', 'chantilly/images/memo_32.png': 'chantilly/images/memo_32-918b86efe836a7d72464ec773975891119b29f9d.png', 'chantilly/images/unlink_32.png': 'chantilly/images/unlink_32-3c146e1c4e5c4a1f3bb97a9e44f3f0b9cd4edd73.png', 'chantilly/images/delete_48.png': 'chantilly/images/delete_48-faa77685fe47bbf7b2eefecac9cabc860220e115.png', 'chantilly/images/event_32.png': 'chantilly/images/event_32-cd8f7c0e0ccc111ddfb2c69e82f38aea2510fd17.png', 'chantilly/images/organisation_32.png': 'chantilly/images/organisation_32-c104ed85961d7e6c10db71cca0d977a2791f045e.png', 'chantilly/images/config_22.png': 'chantilly/images/config_22-b6746d34cf5a5b8aa90143c05f89333c6a64d61e.png', 'chantilly/images/restore_32.png': 'chantilly/images/restore_32-af223788949c2293e8c50895b49776399efa5f33.png', 'chantilly/images/batch_process_48.png': 'chantilly/images/batch_process_48-ae63cda751e553474d58e094626d57904e7b81e4.png', 'chantilly/images/ok_32.png': 'chantilly/images/ok_32-94410dacd8375e864b5bd9744dd851780fcf1160.png', 'chantilly/images/meeting_16.png': 'chantilly/images/meeting_16-798a29cb5ebef7340f76ba7c97ff13c1aac357ae.png', 'chantilly/images/phone_sync_64.png': 'chantilly/images/phone_sync_64-782f44f0224ad9f56f9ae8368416851bbacedb62.png', 'chantilly/images/previous_16.png': 'chantilly/images/previous_16-ad6e2e994aa85082a7e0250c40e1cad141e0e970.png', 'chantilly/images/poll_64.png': 'chantilly/images/poll_64-718af82f19316daa3e94675681f194c9ee785126.png', 'chantilly/images/report_22.png': 'chantilly/images/report_22-a7b282c114e8d56f9695960e4840e9f37a7ba14e.png', 'chantilly/images/alert_48.png': 'chantilly/images/alert_48-aaa2bba89d4259338a27115245c744ebfb3911b5.png', 'chantilly/images/memo_48.png': 'chantilly/images/memo_48-804a9a787c17ee1eb16d415ba59b670520640ce6.png', 'chantilly/images/task_32.png': 'chantilly/images/task_32-78301bd3bd2249b6d08ddad8d997c64d009d62d0.png', 'chantilly/images/creme_256.png': 'chantilly/images/creme_256-0784a542ab59a63a92ca3355595e8fbafd82da71.png', 'chantilly/images/product_32.png': 'chantilly/images/product_32-adaa11ab39d86fc4d5e1ce4c83e6c8cbd251c39b.png', 'chantilly/images/ok_22.png': 'chantilly/images/ok_22-49849aaad817da1c1529578f63a6378dbf011cc2.png', 'chantilly/images/image_16.png': 'chantilly/images/image_16-f8ec2ec8107cc86f082d6285700a875ac024633c.png', 'chantilly/images/security_32.png': 'chantilly/images/security_32-d3946923883ded66004af934d6375d81e9dbce83.png', 'chantilly/images/money_info_22.png': 'chantilly/images/money_info_22-614f2dc1577a04683e21c52cb5d642c98110c8ef.png', 'chantilly/images/delete_32.png': 'chantilly/images/delete_32-76e50555ee76f871173ceaca756f2b08b041279f.png', 'chantilly/images/history_64.png': 'chantilly/images/history_64-0237a43a461e8d08bc8ee10c716796c88553978f.png', 'chantilly/images/relations_48.png': 'chantilly/images/relations_48-cd8ff3b3dfe064440bbd123cae4dbe7ae209eb94.png', 'chantilly/images/quick_48.png': 'chantilly/images/quick_48-0df6cc192e80a53600d87e2805333c6da1977d2d.png', 'chantilly/images/meeting_32.png': 'chantilly/images/meeting_32-b9dd337dc8251e2c1e95e4ce1492673537b0f710.png', 'chantilly/images/view_less_32.png': 'chantilly/images/view_less_32-abc707bd39ff316206db00a2b42af3326e8444c3.png', 'chantilly/images/poll_22.png': 'chantilly/images/poll_22-88a227d29f8cc5882ad29afa64621a74fd46bd7c.png', 'chantilly/images/infos_64.png': 'chantilly/images/infos_64-8fb9a478620ee943a8793357f0a71b5d64a04402.png', 'chantilly/images/email_64.png': 'chantilly/images/email_64-893d1cd6ef5a38216544ab30295d018979e5323e.png', 'chantilly/images/document_csv_64.png': 'chantilly/images/document_csv_64-6785970ef79a26b33f037ea700dca0eb0eb9d765.png', 'chantilly/images/filter_64.png': 'chantilly/images/filter_64-18d049e44d28f961f4add7a81a986f906042935a.png', 'chantilly/images/service_16.png': 'chantilly/images/service_16-7c525edc1efae96c79698e545b624095e48852c6.png', 'chantilly/images/cancel_22.png': 'chantilly/images/cancel_22-63b8a105616b0198ea0d905050eb9f407e77d120.png', 'chantilly/images/pin_48.png': 'chantilly/images/pin_48-8f4b86c793449b072f63321e83498d3b27f60e27.png', 'chantilly/images/view_more_16.png': 'chantilly/images/view_more_16-9ccf3fef3dd210201e7ff95169891a1cf40736e1.png', 'chantilly/images/cancel_64.png': 'chantilly/images/cancel_64-16503ced2aedc934798e413c0ef02472008257fd.png', 'chantilly/images/invoice_64.png': 'chantilly/images/invoice_64-f3acb951cd032004c4d50fa483cdd46aa11a4985.png', 'chantilly/images/remove_16.png': 'chantilly/images/remove_16-821a04aa042593ae5facbdd399c40b1aee15fe21.png', 'chantilly/images/unlink_22.png': 'chantilly/images/unlink_22-a3aa169b4321fcdac4980b4e0425721917353d66.png', 'chantilly/images/service_64.png': 'chantilly/images/service_64-3bf225bc17be827414b21f3ba205dbbc3a1eb09d.png', 'chantilly/images/alert_22.png': 'chantilly/images/alert_22-f47ccf31b1a952dc2e6658feab9affaeb261d3fb.png', 'chantilly/images/relations_16.png': 'chantilly/images/relations_16-a3a536216f43782cf4f7245e6a7e7d5c4f2fe76b.png', 'chantilly/images/message_22.png': 'chantilly/images/message_22-e8abb853f09fc6dda5208d17d87e9d70741c2dcf.png', 'chantilly/images/search_64.png': 'chantilly/images/search_64-e16477e29d890c728d2b5a99aee7615a7a2d59b1.png', 'chantilly/images/web_22.png': 'chantilly/images/web_22-9cf4e7facd14013f3877dffc3ee4877258177e82.png', 'chantilly/images/alert_16.png': 'chantilly/images/alert_16-ceeb71db00116bbb8cba4d03b2ceb2f34bda04cd.png', 'chantilly/images/next_32.png': 'chantilly/images/next_32-876a8eefad20d1776f69adc9ad060e0eb08ac606.png', 'chantilly/images/link_22.png': 'chantilly/images/link_22-5c909896962be803e42afd55f71b5f42dd596da4.png', 'chantilly/images/commercial_48.png': 'chantilly/images/commercial_48-99bbc37b09784e5d3f4d57bb775964da72810a38.png', 'chantilly/images/add_48.png': 'chantilly/images/add_48-ecb1344bde491e1d67162a9156d69732c48089b8.png', 'chantilly/images/money_info_16.png': 'chantilly/images/money_info_16-27174cc58f2c3cc8b443d9a0b281d9c2e8771b48.png', 'chantilly/images/alert_64.png': 'chantilly/images/alert_64-369c272eb49ab7ba823223ed053e8c7f22bb698d.png', 'chantilly/images/edit_64.png': 'chantilly/images/edit_64-f0f9e46a98a68d5a591bf43e7187c35cf00c6575.png', 'chantilly/images/sync_32.png': 'chantilly/images/sync_32-8d9fb8eeacbd768e35b0306942a7a3781f74b37b.png', 'chantilly/images/action_22.png': 'chantilly/images/action_22-480c86dc90eb226ab2adf0f0935c3f377c4cf342.png', 'chantilly/images/calendar_22.png': 'chantilly/images/calendar_22-cd891c7c210e2e4637c7add6c291d244dd521a00.png', 'chantilly/images/document_22.png': 'chantilly/images/document_22-63ac4f90b5fd3bd853c3d003a7d6a34b1ee56926.png', 'chantilly/images/config_64.png': 'chantilly/images/config_64-fc10c2c61b34ae01c9eb32569821e6cdabeffcfe.png', 'chantilly/images/memo_16.png': 'chantilly/images/memo_16-01def361f25d7be6fc78f95f9effcb2eabc3a95f.png', 'chantilly/images/previous_48.png': 'chantilly/images/previous_48-9933d0158f97ac53e26815f5e64f285032aff1a1.png', 'chantilly/images/opportunity_16.png': 'chantilly/images/opportunity_16-35320e81f2e6da3d89066687abd70757653df935.png', 'chantilly/images/product_64.png': 'chantilly/images/product_64-c4a848dcef1f3efa2bd3ba938cbcfd13b5bef33c.png', 'chantilly/images/spam_48.png': 'chantilly/images/spam_48-68036061b5464b656bd408f4ad6787c606e33475.png', 'chantilly/images/document_odt_16.png': 'chantilly/images/document_odt_16-750898208c2120bb8a852a34fb08c275e97c0f36.png', 'chantilly/images/pin_32.png': 'chantilly/images/pin_32-49bffc2c945e5904c8539e83bb03bcf3c2f1c054.png', 'chantilly/images/remove_48.png': 'chantilly/images/remove_48-697dedd05833935a2d5337b752e3986c7b5dd064.png', 'chantilly/images/remove_22.png': 'chantilly/images/remove_22-c6d0f40020334afc35c8e602218ca742c151712c.png', 'chantilly/images/web_48.png': 'chantilly/images/web_48-9a41807a126cec487cdec93a6a597328604884b0.png', 'chantilly/images/web_32.png': 'chantilly/images/web_32-1b8f166d3dfa97c16b1030afba1adf23179ca2c3.png', 'chantilly/images/merge_16.png': 'chantilly/images/merge_16-1dbf87cf4764d07750d6bb6d7885900b437ad5be.png', 'chantilly/images/recurrent_doc_64.png': 'chantilly/images/recurrent_doc_64-7b00156dfc7a717f1828ad9b66303d6f1bc13d34.png', 'chantilly/images/unlink_16.png': 'chantilly/images/unlink_16-4d4c07cf18eeddc6a56ff2638fd17611f6432430.png', 'chantilly/images/contact_22.png': 'chantilly/images/contact_22-c7c87af1c15c3e1fe044e286917726414e27a408.png', 'chantilly/images/filter_22.png': 'chantilly/images/filter_22-8ea8c55f064a291bcb625f8829d544d3c4d8497a.png', 'chantilly/images/download_32.png': 'chantilly/images/download_32-29debc7bcebec31923e6708ecdf784374606d60f.png', 'chantilly/images/download_16.png': 'chantilly/images/download_16-5f10fa1a8075281b12205108abe42bcdc686218d.png', 'chantilly/images/phone_48.png': 'chantilly/images/phone_48-22e91f21f730e5fb96fdc756d99cfffe89395b18.png', 'chantilly/images/action_64.png': 'chantilly/images/action_64-4b1d20e2841293b5558548bc3a90161b79b95f11.png', 'chantilly/images/batch_process_16.png': 'chantilly/images/batch_process_16-602b3548f0bd916fb7bad6a44a899ccb331b8aa3.png', 'chantilly/images/refresh_48.png': 'chantilly/images/refresh_48-6f540e927d91f7b82950ba4805500e85ed2939ed.png', 'chantilly/images/event_48.png': 'chantilly/images/event_48-f995dbd9613107317aeaf4323c156407aba96895.png', 'chantilly/images/alert_32.png': 'chantilly/images/alert_32-32fc2417face28890142a10f0d279e511b29a518.png', 'chantilly/images/view_less_22.png': 'chantilly/images/view_less_22-7945002d540671683d2b0e0e4d7203b81d75e6b8.png', 'chantilly/images/search_22.png': 'chantilly/images/search_22-de5818bff72cf3bea171b56c380883f93c3ca11e.png', 'chantilly/images/config_48.png': 'chantilly/images/config_48-1f53b2c22dd3bf5754f8fe7821584420becef123.png', 'chantilly/images/pin_64.png': 'chantilly/images/pin_64-a677baf88310fd92f4268e248459ccfc1b5c487f.png', 'chantilly/images/document_odt_48.png': 'chantilly/images/document_odt_48-8f2463d02603b5f2f2e8ebe6c061884d6af14e6c.png', 'chantilly/images/image_22.png': 'chantilly/images/image_22-3218215ff1894fa214672d72bd544763eeea9d08.png', 'chantilly/images/infos_32.png': 'chantilly/images/infos_32-ce8c46f619f52f2d1bf0c5b022fc805781a84df6.png', 'chantilly/images/view_less_48.png': 'chantilly/images/view_less_48-2161a63a31dc4073ef876f296f194ac2e5a31487.png', 'chantilly/images/report_16.png': 'chantilly/images/report_16-4d90ce58d8da5e0a0dd8627919eccbe54cc31713.png', 'chantilly/images/wait.gif': 'chantilly/images/wait-ea87c0883361a773d485428852b88e36291a63b2.gif', 'chantilly/images/cancel_32.png': 'chantilly/images/cancel_32-c1b45796ed3ad037019d00cb9576555df02da353.png', 'chantilly/images/spam_22.png': 'chantilly/images/spam_22-a4fb791b664c8565063f3185d7c4a6cb01691ad6.png', 'chantilly/images/download_48.png': 'chantilly/images/download_48-29a2b6f85528e36aad5294e2ee2b45a122b97136.png', 'chantilly/images/poll_48.png': 'chantilly/images/poll_48-c2cdfd0e7729022da41bc51196a6601db4325c25.png', 'chantilly/images/listview_16.png': 'chantilly/images/listview_16-05e9d2196e9f3abb5f4776ea13e2066dc884004f.png', 'chantilly/images/edit_48.png': 'chantilly/images/edit_48-15c6b1de969197914ab824aa7ba30a4c1444ad2a.png', 'chantilly/images/listview_64.png': 'chantilly/images/listview_64-ac1763ff6732a05ffa64f4fcea6785ddef62865b.png', 'chantilly/images/document_csv_48.png': 'chantilly/images/document_csv_48-e884e1242c170a7aa452718d0bcd9c3c1fc6308c.png', 'chantilly/images/contact_32.png': 'chantilly/images/contact_32-0a3feface244ffe2bb640a004faf557fcdf5f4de.png', 'chantilly/images/contact_16.png': 'chantilly/images/contact_16-40ba49bfece96f7104d2602e8af94ca16a41bb1e.png', 'chantilly/images/relations_32.png': 'chantilly/images/relations_32-f2d59b5c058c326d7fa9b9ba6b822993b5202e31.png', 'chantilly/images/document_doc_16.png': 'chantilly/images/document_doc_16-6f9e32100d7b7500a23533e73cf09dc72cab345f.png', 'chantilly/images/image_64.png': 'chantilly/images/image_64-721c7b06ef3ce3e9aa9d9a308bbc8ac1f7cf4bef.png', 'chantilly/images/quick_32.png': 'chantilly/images/quick_32-b03d78cfeef86ba1b621cd505360702bf1d5756a.png', 'chantilly/images/task_64.png': 'chantilly/images/task_64-c7f843b0edc5651e03421fcea02a30e915702dc2.png', 'chantilly/images/meeting_22.png': 'chantilly/images/meeting_22-79837069f01b56f2e24584f7369df0311545775e.png', 'chantilly/images/property_22.png': 'chantilly/images/property_22-d9561dcfc53ac6e3853ba90f1edcf9cb995f3efc.png', 'chantilly/images/view_less_64.png': 'chantilly/images/view_less_64-cb273bdc3e52b9adb708847d999379151ff6fb83.png', 'chantilly/images/icon_clock.gif': 'chantilly/images/icon_clock-3d4b6ef357f73a58adc190597fab176e9144a886.gif', 'chantilly/images/email_32.png': 'chantilly/images/email_32-e6d7b950865bbb0cb4cc32cf11b265bd4c9684ca.png', 'chantilly/images/organisation_48.png': 'chantilly/images/organisation_48-1261d00561b8af4e56791f4cbe4db814b0bbb6b7.png', 'chantilly/images/small_down_arrow_16.png': 'chantilly/images/small_down_arrow_16-79ccebdf455e62daba66027d5b5dca56e0989d14.png', 'chantilly/images/listview_48.png': 'chantilly/images/listview_48-21f9d784b5e732d2469b84267bf9a10ea6626bea.png', 'chantilly/images/clone_48.png': 'chantilly/images/clone_48-f5b9e457e37316d471d6443be66626d4ebcf1ea8.png', 'chantilly/images/cancel_48.png': 'chantilly/images/cancel_48-36361c62b96e4772cff321f8616b6231aff8ed05.png', 'chantilly/images/add_64.png': 'chantilly/images/add_64-36e14d368783b93ac2ae8e9a6c44e16f8b6b0a01.png', 'chantilly/images/sms_48.png': 'chantilly/images/sms_48-97ad9905794f1e3c16db7b6c81daa42d89e401c2.png', 'chantilly/images/view_48.png': 'chantilly/images/view_48-72228584bfdf177c7bdd1eb21fda801d841d3336.png', 'chantilly/images/search_32.png': 'chantilly/images/search_32-eb62e01a1c645770574595a537824a060f105972.png', 'chantilly/images/edit_32.png': 'chantilly/images/edit_32-e2db2061978f69a84cd194483b27c0b0fdf07b2a.png', 'chantilly/images/opportunity_48.png': 'chantilly/images/opportunity_48-a2fafe565b4fcf353d06df592ab38bc36d3b0999.png', 'chantilly/images/sms_16.png': 'chantilly/images/sms_16-615b7e4a4d1ed98846778550ace7972f04796f22.png', 'chantilly/images/commercial_64.png': 'chantilly/images/commercial_64-d0893310f781ddd875b6b34ceb4ce84a18b4e773.png', 'chantilly/images/web_16.png': 'chantilly/images/web_16-e91e2cd7b57cf5cb8d2a3438c5e16e5433c825d9.png', 'chantilly/images/document_48.png': 'chantilly/images/document_48-26bd632482768822cd931ccf7ee7f8d88a5c3861.png', 'chantilly/images/property_48.png': 'chantilly/images/property_48-211eb23c7aa04a979c72fa91c6921713c19ce09d.png', 'chantilly/images/view_more_32.png': 'chantilly/images/view_more_32-d49eb6efdfc39ece4b3a77758ee9d5d6a96755f8.png', 'chantilly/images/clone_22.png': 'chantilly/images/clone_22-68f5a79d24b4b9a50edb5525f36a4e2e98985a1e.png', 'chantilly/images/document_doc_48.png': 'chantilly/images/document_doc_48-6abdb5eac942316a77985702b9223bba410ae2fa.png', 'chantilly/images/small_up_arrow_16.png': 'chantilly/images/small_up_arrow_16-f9e4dec83d6b91ba9bd553fc4295cdbbf88c16eb.png', 'chantilly/images/link_48.png': 'chantilly/images/link_48-7bc2b42567924123531a268ee047a06ccf57090a.png', 'chantilly/images/phone_32.png': 'chantilly/images/phone_32-28e18a90f2ea865975a12a54e986362fb2aa6bdd.png', 'chantilly/images/phone_sync_32.png': 'chantilly/images/phone_sync_32-8d83aa40521f6c468a0c867eb3e98d751fac9d0b.png', 'chantilly/images/recurrent_doc_16.png': 'chantilly/images/recurrent_doc_16-760a5bd33ccca9083eed6595e5327ce136c2039c.png', 'chantilly/images/sms_32.png': 'chantilly/images/sms_32-5526eecf3b4f96b397f0291df4cb2299838de832.png', 'chantilly/images/listview_32.png': 'chantilly/images/listview_32-3f12b5a17a13806631294b05b51fc5098c9a1803.png', 'chantilly/images/organisation_16.png': 'chantilly/images/organisation_16-fdb7cab9d8b5ac5db9773c8ef691582e6d160123.png', 'chantilly/images/ticket_32.png': 'chantilly/images/ticket_32-eb2bd086aba53d4f4c4bdcb29378755317209d09.png', 'chantilly/images/sync_16.png': 'chantilly/images/sync_16-76d73692848e2f3eb82e5a336a9bc8f707de9018.png', 'chantilly/images/commercial_16.png': 'chantilly/images/commercial_16-f94c4a63ddd66b7a8b1629be58d27588d1f62ce0.png', 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-icons_2e83ff_256x240.png': 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-icons_2e83ff_256x240-af6008353d9a2305e5d259fa2bdb386af303989c.png', 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-bg_glass_95_fef1ec_1x400.png': 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-bg_glass_95_fef1ec_1x400-e3ab1440d938b9acd512f2c76885f8ce3a360f31.png', 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-bg_glass_75_b4d2df_1x400.png': 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-bg_glass_75_b4d2df_1x400-642384b49341427190bef71a40935e09d6bebd49.png', 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-bg_glass_65_ffffff_1x400.png': 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-bg_glass_65_ffffff_1x400-f44b551c1a46095f01e415cf777c772675b8d3a5.png', 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-bg_glass_65_f6fcff_1x400.png': 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-bg_glass_65_f6fcff_1x400-9f3572e7303e9cf7751ff6f1593411e174c4d2d4.png', 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-icons_454545_256x240.png': 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-icons_454545_256x240-00e4f026ff6a9e00f95f249d857d8cd5a584f266.png', 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-bg_glass_75_f7d6d2_1x400.png': 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-bg_glass_75_f7d6d2_1x400-663e05365433224706b7761cb0228a95bc8cd05a.png', 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-icons_888888_256x240.png': 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-icons_888888_256x240-ffb3d9cfd842bf9e23f126a9dcf6546a7dfc5701.png', 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-bg_flat_75_f6fcff_40x100.png': 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-bg_flat_75_f6fcff_40x100-75b3241172cc2954fc48c73d16de5219125ce97a.png', 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-bg_inset-soft_75_aaf0a2_1x100.png': 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-bg_inset-soft_75_aaf0a2_1x100-e9764d40d1771e538dec52c5f76dcdb06b4cb044.png', 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-bg_glass_75_89bfd7_1x400.png': 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-bg_glass_75_89bfd7_1x400-595c2836b54f67c0e62eb679a516ad5286144734.png', 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-bg_flat_0_aaaaaa_40x100.png': 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-bg_flat_0_aaaaaa_40x100-da1c9bf45bd3644c2ddffcd4f631108d80e6a6f2.png', 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-bg_glass_55_fbf9ee_1x400.png': 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-bg_glass_55_fbf9ee_1x400-4966153f5260cc8b5b9ea3afd5bd6b0dee5bc7b1.png', 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-bg_inset-soft_95_fef1ec_1x100.png': 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-bg_inset-soft_95_fef1ec_1x100-68a0605f609aef52d5dcdb5b3730a22175dc133b.png', 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-icons_cd0a0a_256x240.png': 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-icons_cd0a0a_256x240-81c93136c68e35251a00b02f696ad68bdcae580e.png', 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-icons_222222_256x240.png': 'icecream/creme_core/css/jquery-css/creme-theme/images/ui-icons_222222_256x240-1f12bac718a6275823d9805cbe6bf6818838aa8c.png', 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-icons_2e83ff_256x240.png': 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-icons_2e83ff_256x240-5c0800291a8dc41ae915d9fe6d42f96c67035a23.png', 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-bg_glass_95_fef1ec_1x400.png': 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-bg_glass_95_fef1ec_1x400-6140799c338f9fa5ccce4fb29346512806462a60.png', 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-bg_glass_75_b4d2df_1x400.png': 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-bg_glass_75_b4d2df_1x400-642384b49341427190bef71a40935e09d6bebd49.png', 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-bg_glass_65_f6fcff_1x400.png': 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-bg_glass_65_f6fcff_1x400-9f3572e7303e9cf7751ff6f1593411e174c4d2d4.png', 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-icons_454545_256x240.png': 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-icons_454545_256x240-1ab19df782d0b8491fc21c1edf7b20941624dd34.png', 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-bg_glass_75_f7d6d2_1x400.png': 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-bg_glass_75_f7d6d2_1x400-389838ad5488376d5c83f89cc32cf722d49056d5.png', 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-icons_888888_256x240.png': 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-icons_888888_256x240-488af2c51acd097e9136d4dd1f0850168e8de760.png', 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-bg_flat_75_f6fcff_40x100.png': 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-bg_flat_75_f6fcff_40x100-75b3241172cc2954fc48c73d16de5219125ce97a.png', 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-bg_inset-soft_75_aaf0a2_1x100.png': 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-bg_inset-soft_75_aaf0a2_1x100-e9764d40d1771e538dec52c5f76dcdb06b4cb044.png', 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-bg_glass_75_89bfd7_1x400.png': 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-bg_glass_75_89bfd7_1x400-595c2836b54f67c0e62eb679a516ad5286144734.png', 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-bg_inset-soft_75_fdd5d1_1x100.png': 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-bg_inset-soft_75_fdd5d1_1x100-8146484b679f7d0faa8f0afe44a059b9e13040ed.png', 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-bg_flat_0_aaaaaa_40x100.png': 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-bg_flat_0_aaaaaa_40x100-da1c9bf45bd3644c2ddffcd4f631108d80e6a6f2.png', 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-bg_glass_55_fbf9ee_1x400.png': 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-bg_glass_55_fbf9ee_1x400-4966153f5260cc8b5b9ea3afd5bd6b0dee5bc7b1.png', 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-bg_inset-soft_95_fef1ec_1x100.png': 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-bg_inset-soft_95_fef1ec_1x100-68a0605f609aef52d5dcdb5b3730a22175dc133b.png', 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-icons_cd0a0a_256x240.png': 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-icons_cd0a0a_256x240-cc0d1cda69297dd503da85738976ff8ae5e2c0f5.png', 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-icons_222222_256x240.png': 'chantilly/creme_core/css/jquery-css/creme-theme/images/ui-icons_222222_256x240-d6dee0eaf76929c4e06b2f2bc3058bdad1d0a1fc.png', 'billing/sample_xhtml2pdf.png': 'billing/sample_xhtml2pdf-e2d8c86922c8ff938c211e4571fd93f6b00df57d.png', 'billing/sample_weasyprint.png': 'billing/sample_weasyprint-1589205e2d4da93586bb577cec1a7eb2e74f31e7.png', 'billing/sample_latex.png': 'billing/sample_latex-f961cce58c7f7041f9006f91ef8e1e7483cd4d3d.png', 'icecream/geolocation/images/layers.png': 'icecream/geolocation/images/layers-c9e7528e491a39232ba24a2706c6c739d6fb0f06.png', 'icecream/geolocation/images/marker-icon-red.png': 'icecream/geolocation/images/marker-icon-red-67849cbf2b520172860fd9fbfb16346e76d343db.png', 'icecream/geolocation/images/marker-icon-red-2x.png': 'icecream/geolocation/images/marker-icon-red-2x-e8824a795c3c583f676df128c61e4727cde5117c.png', 'icecream/geolocation/images/layers-2x.png': 'icecream/geolocation/images/layers-2x-152a162333e46d24f9d89f566312fc0c64011dee.png', 'icecream/geolocation/images/marker-icon-2x.png': 'icecream/geolocation/images/marker-icon-2x-cf3a536596b1f58e0ac805404183c8e6d6bdacb5.png', 'icecream/geolocation/images/marker-shadow.png': 'icecream/geolocation/images/marker-shadow-7b6a8df63930381e96604e705168d0527d6b82bc.png', 'icecream/geolocation/images/marker-icon.png': 'icecream/geolocation/images/marker-icon-60a90bcbb2b42b7ddb4556db94eb7c1084b0e5da.png', 'chantilly/geolocation/images/layers.png': 'chantilly/geolocation/images/layers-c9e7528e491a39232ba24a2706c6c739d6fb0f06.png', 'chantilly/geolocation/images/marker-icon-red.png': 'chantilly/geolocation/images/marker-icon-red-67849cbf2b520172860fd9fbfb16346e76d343db.png', 'chantilly/geolocation/images/marker-icon-red-2x.png': 'chantilly/geolocation/images/marker-icon-red-2x-e8824a795c3c583f676df128c61e4727cde5117c.png', 'chantilly/geolocation/images/layers-2x.png': 'chantilly/geolocation/images/layers-2x-152a162333e46d24f9d89f566312fc0c64011dee.png', 'chantilly/geolocation/images/marker-icon-2x.png': 'chantilly/geolocation/images/marker-icon-2x-cf3a536596b1f58e0ac805404183c8e6d6bdacb5.png', 'chantilly/geolocation/images/marker-shadow.png': 'chantilly/geolocation/images/marker-shadow-7b6a8df63930381e96604e705168d0527d6b82bc.png', 'chantilly/geolocation/images/marker-icon.png': 'chantilly/geolocation/images/marker-icon-60a90bcbb2b42b7ddb4556db94eb7c1084b0e5da.png', 'l10n.js?language=en': 'l10n--en-2cd679ba9a5679bb6251be680849b18bb862ce46.js', 'l10n.js?language=fr': 'l10n--fr-c9134f367d7037e83112dad61bd5a029246816d2.js', 'lib.js': 'lib-62205c3483bf107d4d9abd1751c0128847bd0837.js', 'main.js': 'main-a370791371f26098ff2d2b6f24b868dd80fbabf1.js', 'icecreammain.css': 'icecreammain-c47718c32686d56c340bf4d8ba41902075358ff2.css', 'chantillymain.css': 'chantillymain-19f7fae5cf51aa39220413997259a4ca2903b24b.css'}
\ No newline at end of file
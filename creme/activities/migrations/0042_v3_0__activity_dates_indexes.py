@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('activities', '0041_v3_0__minions_disabled'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='activity',
+            index=models.Index(fields=['start', 'end'], name='activities__activity__start'),
+        ),
+        migrations.AddIndex(
+            model_name='activity',
+            index=models.Index(fields=['end', 'start'], name='activities__activity__end'),
+        ),
+    ]
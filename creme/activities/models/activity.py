@@ -130,6 +130,13 @@ class AbstractActivity(CremeEntity):
         verbose_name = _('Activity')
         verbose_name_plural = _('Activities')
         ordering = ('-start',)
+        indexes = [
+            # NB: used by the queries on a period (calendar view); there is
+            #     one index for each part of the condition
+            #     "start in [period] OR (end > period.start AND start < period.end)"
+            models.Index(fields=['start', 'end'], name='activities__activity__start'),
+            models.Index(fields=['end', 'start'], name='activities__activity__end'),
+        ]
 
     @classmethod
     # def get_creation_title(cls, type_id):
@@ -1,4 +1,4 @@
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from functools import partial
 
 from django.core.exceptions import ValidationError
@@ -17,6 +17,8 @@ from ..utils import (
     ICalEncoder,
     ZoneinfoToVtimezone,
     check_activity_collisions,
+    find_free_slot,
+    get_activities_collisions,
     get_last_day_of_a_month,
 )
 from .base import Activity, Contact, _ActivitiesTestCase, skipIfCustomActivity
@@ -192,6 +194,143 @@ class UtilsTestCase(_ActivitiesTestCase):
             busy=False, participants=[c1, c2],
         )
 
+    def _create_planning(self):
+        user = self.get_root_user()
+
+        sub_type = self._get_sub_type(constants.UUID_SUBTYPE_MEETING_MEETING)
+        create_activity = partial(
+            Activity.objects.create,
+            user=user, type_id=sub_type.type_id, sub_type=sub_type, busy=True,
+        )
+        create_dt = partial(self.create_datetime, year=2010, month=10, day=1)
+        act1 = create_activity(
+            title='Meeting #1',
+            start=create_dt(hour=9), end=create_dt(hour=10),
+        )
+        act2 = create_activity(
+            title='Meeting #2',
+            start=create_dt(hour=10, minute=30), end=create_dt(hour=12),
+        )
+        act3 = create_activity(
+            title='Meeting #3', busy=False,
+            start=create_dt(hour=14), end=create_dt(hour=15),
+        )
+        act4 = create_activity(
+            title='Meeting #4', is_deleted=True,
+            start=create_dt(hour=16), end=create_dt(hour=17),
+        )
+
+        create_contact = partial(Contact.objects.create, user=user)
+        c1 = create_contact(first_name='Spike', last_name='Spiegel')
+        c2 = create_contact(first_name='Jet',   last_name='Black')
+        c3 = create_contact(first_name='Faye',  last_name='Valentine')
+
+        create_rel = partial(
+            Relation.objects.create, type_id=constants.REL_SUB_PART_2_ACTIVITY, user=user,
+        )
+        create_rel(subject_entity=c1, object_entity=act1)
+        create_rel(subject_entity=c1, object_entity=act3)
+        create_rel(subject_entity=c1, object_entity=act4)
+        create_rel(subject_entity=c2, object_entity=act1)
+        create_rel(subject_entity=c2, object_entity=act2)
+
+        return [act1, act2, act3, act4], [c1, c2, c3]
+
+    @skipIfCustomContact
+    def test_get_activities_collisions(self):
+        (act1, act2, act3, act4), (c1, c2, c3) = self._create_planning()
+        create_dt = partial(self.create_datetime, year=2010, month=10, day=1)
+
+        slots = [
+            (create_dt(hour=9, minute=30), create_dt(hour=11)),
+            (create_dt(hour=12),           create_dt(hour=13)),
+            (None,                         None),
+            (create_dt(hour=14, minute=30), create_dt(hour=16, minute=30)),
+        ]
+
+        with self.assertNumQueries(1):
+            collisions = get_activities_collisions(slots, [c1.id, c2.id, c3.id])
+
+        self.assertEqual(4, len(collisions))
+        self.assertCountEqual(
+            [(c1.id, act1), (c2.id, act1), (c2.id, act2)], collisions[0],
+        )
+        self.assertTupleEqual((c2.id, act2), collisions[0][0])  # Ordered by start
+        self.assertListEqual([], collisions[1])
+        self.assertListEqual([], collisions[2])
+        self.assertListEqual([(c1.id, act3)], collisions[3])
+
+        # Not busy
+        collisions = get_activities_collisions(slots, [c1.id, c2.id], busy=False)
+        self.assertListEqual([], collisions[3])
+
+        # Excluded activities
+        collisions = get_activities_collisions(
+            slots, [c1.id, c2.id], exclude_activity_ids=[act1.id, None],
+        )
+        self.assertListEqual([(c2.id, act2)], collisions[0])
+
+        with self.assertNumQueries(0):
+            self.assertListEqual([[]], get_activities_collisions(slots[:1], []))
+
+    @skipIfCustomContact
+    def test_check_activity_collisions__queries(self):
+        (act1, __, __, __), participants = self._create_planning()
+        create_dt = partial(self.create_datetime, year=2010, month=10, day=1)
+
+        with self.assertNumQueries(1):
+            collisions = check_activity_collisions(
+                create_dt(hour=9, minute=30), create_dt(hour=10, minute=45), participants,
+            )
+
+        self.assertEqual(2, len(collisions))
+        self.assertIn(str(participants[0]), collisions[0])
+        self.assertIn(str(act1), collisions[0])
+        self.assertIn(str(participants[1]), collisions[1])
+
+    @skipIfCustomContact
+    def test_find_free_slot(self):
+        __, (c1, c2, c3) = self._create_planning()
+        create_dt = partial(self.create_datetime, year=2010, month=10, day=1)
+
+        with self.assertNumQueries(1):
+            slot = find_free_slot(
+                [c1.id, c2.id], duration=timedelta(minutes=30), after=create_dt(hour=9),
+            )
+        self.assertTupleEqual((create_dt(hour=10), create_dt(hour=10, minute=30)), slot)
+
+        self.assertTupleEqual(
+            (create_dt(hour=12), create_dt(hour=13)),
+            find_free_slot([c1.id, c2.id], duration=timedelta(hours=1), after=create_dt(hour=9)),
+        )
+        self.assertTupleEqual(
+            (create_dt(hour=15), create_dt(hour=17)),
+            find_free_slot(
+                [c1.id, c2.id], duration=timedelta(hours=2), after=create_dt(hour=13),
+            ),
+        )
+        # Not busy => "Meeting #3" is ignored
+        self.assertTupleEqual(
+            (create_dt(hour=13), create_dt(hour=15)),
+            find_free_slot(
+                [c1.id, c2.id], duration=timedelta(hours=2), after=create_dt(hour=13), busy=False,
+            ),
+        )
+        self.assertTupleEqual(
+            (create_dt(hour=9), create_dt(hour=11)),
+            find_free_slot([c3.id], duration=timedelta(hours=2), after=create_dt(hour=9)),
+        )
+
+        # Limit
+        self.assertIsNone(find_free_slot(
+            [c1.id, c2.id],
+            duration=timedelta(hours=1),
+            after=create_dt(hour=9), until=create_dt(hour=12, minute=30),
+        ))
+
+        with self.assertRaises(ValueError):
+            find_free_slot([c1.id], duration=timedelta(), after=create_dt(hour=9))
+
 
 @skipIfCustomActivity
 class ICalEncoderTestCase(_ActivitiesTestCase):
@@ -231,7 +231,7 @@ class ActivityMiscViewsTestCase(BrickTestCaseMixin, _ActivitiesTestCase):
         self.assertEqual('text/calendar', response['Content-Type'])
         self.assertEqual('attachment; filename="Calendar.ics"', response['Content-Disposition'])
 
-        content = force_str(response.content)
+        content = force_str(b''.join(response.streaming_content))
         self.assertStartsWith(
             content,
             'BEGIN:VCALENDAR\n'
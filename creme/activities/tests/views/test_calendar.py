@@ -4,6 +4,7 @@ from unittest.mock import patch
 
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.sessions.models import Session
+from django.core.cache import caches
 from django.test.utils import override_settings
 from django.urls import reverse
 from django.utils.html import escape
@@ -16,6 +17,7 @@ from parameterized import parameterized
 from creme.activities import constants
 from creme.activities.bricks import CalendarsBrick
 from creme.activities.models import Calendar, CalendarConfigItem
+from creme.activities.views.calendar import ActivitiesData
 from creme.creme_core.creme_jobs import deletor_type
 from creme.creme_core.models import DeletionCommand, Job, Relation
 from creme.creme_core.tests.base import CremeTestCase
@@ -607,6 +609,127 @@ class CalendarPageViewsTestCase(_ActivitiesTestCase):
             [(d['id'], d['calendar']) for d in response.json()],
         )
 
+    @skipIfCustomActivity
+    @override_settings(SHARED_CACHE_ALIAS='default', SHARED_CACHE_TIMEOUT=60)
+    def test_activities_data__sync(self):
+        caches['default'].clear()
+        user = self.login_as_root_and_get()
+        cal1 = Calendar.objects.get_default_calendar(user)
+        cal2 = Calendar.objects.create(user=user, name='Cal #2', is_custom=True)
+
+        create_dt = self.create_datetime
+        start = create_dt(year=2013, month=3, day=1)
+        end   = create_dt(year=2013, month=3, day=31, hour=23, minute=59)
+
+        sub_type = self._get_sub_type(constants.UUID_SUBTYPE_MEETING_MEETING)
+        create = partial(
+            Activity.objects.create,
+            user=user, type_id=sub_type.type_id, sub_type=sub_type,
+        )
+        act1 = create(
+            title='Act#1', start=start + timedelta(days=1), end=start + timedelta(days=2),
+        )
+        act2 = create(
+            title='Act#2', start=start + timedelta(days=3), end=start + timedelta(days=4),
+        )
+        act3 = create(
+            title='Act#3', start=start + timedelta(days=5), end=start + timedelta(days=6),
+        )
+        act1.calendars.set([cal1, cal2])
+        act2.calendars.set([cal1])
+        act3.calendars.set([cal2])
+
+        def get_data(since):
+            return self.assertGET200(
+                reverse('activities__calendars_activities'),
+                data={
+                    'calendar_id': [cal1.id, cal2.id],
+                    'start': start.isoformat(),
+                    'end': end.isoformat(),
+                    'since': since,
+                },
+            ).json()
+
+        # First call => all the entries
+        data1 = get_data('')
+        self.assertTrue(data1['full'])
+        self.assertListEqual([], data1['deleted'])
+        self.assertCountEqual(
+            [(act1.id, cal1.id), (act1.id, cal2.id), (act2.id, cal1.id), (act3.id, cal2.id)],
+            [(d['id'], d['calendar']) for d in data1['activities']],
+        )
+        token1 = data1['token']
+        self.assertTrue(token1)
+
+        # No change
+        data2 = get_data(token1)
+        self.assertDictEqual(
+            {'token': token1, 'full': False, 'activities': [], 'deleted': []}, data2,
+        )
+
+        # Changes
+        act1.title = 'Act#1 (edited)'
+        act1.save()
+        act2.trash()
+        act3.calendars.set([cal1])
+
+        data3 = get_data(token1)
+        self.assertFalse(data3['full'])
+        self.assertNotEqual(token1, data3['token'])
+        self.assertCountEqual(
+            [
+                (act1.id, cal1.id, 'Act#1 (edited)'),
+                (act1.id, cal2.id, 'Act#1 (edited)'),
+                (act3.id, cal1.id, 'Act#3'),
+            ],
+            [(d['id'], d['calendar'], d['title']) for d in data3['activities']],
+        )
+        self.assertListEqual(
+            sorted([
+                {'id': act2.id, 'calendar': cal1.id},
+                {'id': act3.id, 'calendar': cal2.id},
+            ], key=lambda d: (d['id'], d['calendar'])),
+            data3['deleted'],
+        )
+
+        # Unknown token => all the entries
+        data4 = get_data('unknown')
+        self.assertTrue(data4['full'])
+        self.assertEqual(3, len(data4['activities']))
+        self.assertEqual(data3['token'], data4['token'])
+
+    @skipIfCustomActivity
+    @override_settings(SHARED_CACHE_ALIAS='default', SHARED_CACHE_TIMEOUT=60)
+    def test_activities_data__shared_cache(self):
+        caches['default'].clear()
+        user = self.login_as_root_and_get()
+        cal = Calendar.objects.get_default_calendar(user)
+
+        start = self.create_datetime(year=2013, month=3, day=1)
+        sub_type = self._get_sub_type(constants.UUID_SUBTYPE_MEETING_MEETING)
+        act = Activity.objects.create(
+            user=user, title='Act#1', type_id=sub_type.type_id, sub_type=sub_type,
+            start=start + timedelta(days=1), end=start + timedelta(days=2),
+        )
+        act.calendars.set([cal])
+
+        def get_titles():
+            response = self._get_cal_activities([cal], start=start.isoformat())
+            return [d['title'] for d in response.json()]
+
+        self.assertListEqual(['Act#1'], get_titles())
+
+        # The data are not computed again
+        with patch.object(
+            ActivitiesData, 'build_activities_data', side_effect=AssertionError,
+        ):
+            self.assertListEqual(['Act#1'], get_titles())
+
+        # Invalidation
+        act.title = 'Act#1 (edited)'
+        act.save()
+        self.assertListEqual(['Act#1 (edited)'], get_titles())
+
     @override_settings(ACTIVITIES_DEFAULT_CALENDAR_IS_PUBLIC=False)
     def test_selected_calendars_in_session(self):
         user = self.login_as_root_and_get()
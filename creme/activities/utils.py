@@ -16,11 +16,17 @@
 #    along with this program.  If not, see <http://www.gnu.org/licenses/>.
 ################################################################################
 
+from __future__ import annotations
+
 import collections
 import logging
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import datetime, timedelta
+from itertools import chain
+from typing import TYPE_CHECKING
 
-from django.db.models import Q, QuerySet
+from django.conf import settings
+from django.db.models import F, Max, Min, Q, QuerySet
 from django.utils.timezone import (
     get_current_timezone,
     localtime,
@@ -29,16 +35,35 @@ from django.utils.timezone import (
 )
 from django.utils.translation import gettext as _
 
-from creme.creme_core.models import Relation, SettingValue
+from creme.creme_core.core.shared_cache import shared_cache
+from creme.creme_core.models import SettingValue
 from creme.creme_core.utils.dates import to_utc
 
 from . import get_activity_model
 # from .constants import FLOATING_TIME, NARROW
-from .constants import REL_SUB_PART_2_ACTIVITY
+from .constants import REL_OBJ_PART_2_ACTIVITY
 from .setting_keys import auto_subjects_key
 
+if TYPE_CHECKING:
+    from .models import AbstractActivity
+
 logger = logging.getLogger(__name__)
 
+# Models used to build the data of the calendar view (see
+# 'views.calendar.ActivitiesData'), which are stored in the shared cache.
+calendar_feed_models = (
+    settings.ACTIVITIES_ACTIVITY_MODEL,
+    'activities.Calendar',
+    'activities.ActivityType',
+    'activities.ActivitySubType',
+    'activities.Status',
+    # Credentials
+    settings.AUTH_USER_MODEL,
+    'creme_core.UserRole',
+    'creme_core.SetCredentials',
+)
+shared_cache.register(*calendar_feed_models)
+
 
 def get_last_day_of_a_month(date):
     for day in (31, 30, 29, 28):
@@ -57,50 +82,150 @@ def get_current_utc_offset():
     return int(tz.utcoffset(now()).total_seconds() / 60)
 
 
+def _colliding_activities(participant_ids: Iterable[int],
+                          *,
+                          busy: bool = True,
+                          exclude_activity_ids: Iterable[int] = (),
+                          ) -> QuerySet:
+    # NB: the relationships are retrieved from the side of the activities,
+    #     so the ID of the participant can be annotated.
+    Activity = get_activity_model()
+
+    return Activity.objects.filter(
+        is_deleted=False,
+        floating_type__in=(
+            Activity.FloatingType.NARROW,
+            Activity.FloatingType.FLOATING_TIME,
+        ),
+        relations__type=REL_OBJ_PART_2_ACTIVITY,
+        relations__object_entity__in=participant_ids,
+        **({} if busy else {'busy': True})
+    ).exclude(
+        id__in=[act_id for act_id in exclude_activity_ids if act_id is not None],
+    )
+
+
+def get_activities_collisions(slots: Sequence[tuple[datetime, datetime]],
+                              participant_ids: Iterable[int],
+                              *,
+                              busy: bool = True,
+                              exclude_activity_ids: Iterable[int] = (),
+                              ) -> list[list[tuple[int, AbstractActivity]]]:
+    """Find the activities which collide with several periods, for several
+    participants, with only one query.
+    @param slots: Periods (start, end) to check ; the periods without start
+           are ignored.
+    @param participant_ids: IDs of the participants (Contacts).
+    @param busy: Is the new activity busy? If <False>, only the busy
+           activities are colliding.
+    @param exclude_activity_ids: IDs of activities to ignore (like the edited one).
+    @return: A list with an item for each slot (same order) ; each item is a
+             list of tuples (participant_id, colliding_activity), ordered by
+             descending start of the activities.
+    """
+    slots = [*slots]
+    participant_ids = {*participant_ids}
+    collisions = [[] for __ in slots]
+
+    periods_q = Q()
+    for start, end in slots:
+        if start:
+            periods_q |= Q(start__lt=end, end__gt=start)
+
+    if not participant_ids or not periods_q:
+        return collisions
+
+    activities = _colliding_activities(
+        participant_ids, busy=busy, exclude_activity_ids=exclude_activity_ids,
+    ).filter(periods_q).annotate(
+        participant_id=F('relations__object_entity'),
+    ).order_by('-start', 'id')
+
+    for activity in activities:
+        act_start = activity.start
+        act_end = activity.end
+        item = (activity.participant_id, activity)
+
+        for slot_collisions, (start, end) in zip(collisions, slots):
+            if start and act_start < end and act_end > start:
+                slot_collisions.append(item)
+
+    return collisions
+
+
+def find_free_slot(participant_ids: Iterable[int],
+                   *,
+                   duration: timedelta,
+                   after: datetime,
+                   until: datetime | None = None,
+                   busy: bool = True,
+                   exclude_activity_ids: Iterable[int] = (),
+                   chunk_size: int = 500,
+                   ) -> tuple[datetime, datetime] | None:
+    """Find the first period where none of the participants has a colliding
+    activity (see get_activities_collisions()).
+    The activities of all the participants are retrieved with one query,
+    ordered by start, & read by chunks until a free period is found.
+    @param participant_ids: IDs of the participants (Contacts).
+    @param duration: Duration of the period.
+    @param after: The period cannot start before this date.
+    @param until: The period cannot end after this date ; <None> means "no limit".
+    @param busy: See get_activities_collisions().
+    @param exclude_activity_ids: See get_activities_collisions().
+    @param chunk_size: Number of activities retrieved per query.
+    @return: A tuple (start, end), or <None> if no period has been found.
+    """
+    if duration <= timedelta():
+        raise ValueError(f'find_free_slot(): the duration must be positive ({duration})')
+
+    activities = _colliding_activities(
+        participant_ids, busy=busy, exclude_activity_ids=exclude_activity_ids,
+    ).filter(end__gt=after)
+    if until is not None:
+        activities = activities.filter(start__lt=until)
+
+    start = after
+    for act_start, act_end in activities.order_by('start').values_list(
+        'start', 'end',
+    ).iterator(chunk_size=chunk_size):
+        if act_start >= start + duration:
+            break
+
+        start = max(start, act_end)
+
+    end = start + duration
+
+    return None if until is not None and end > until else (start, end)
+
+
 def check_activity_collisions(
         activity_start,
         activity_end,
         participants,
         busy=True,
         exclude_activity_id=None):
+    """Check the collisions of a period for some participants.
+    @return: A list of error messages (one for each colliding participant).
+    """
     if not activity_start:
         return
 
-    collision_test = ~(Q(end__lte=activity_start) | Q(start__gte=activity_end))
+    participants = [*participants]
+
+    # The latest colliding activity for each participant
+    colliding_activities = {}
+    for participant_id, activity in get_activities_collisions(
+        [(activity_start, activity_end)],
+        [participant.id for participant in participants],
+        busy=busy,
+        exclude_activity_ids=[exclude_activity_id],
+    )[0]:
+        colliding_activities.setdefault(participant_id, activity)
+
     collisions = []
 
     for participant in participants:
-        # Find activities of participant
-        activity_req = Relation.objects.filter(
-            subject_entity=participant.id, type=REL_SUB_PART_2_ACTIVITY,
-        )
-
-        # Exclude current activity if asked
-        if exclude_activity_id is not None:
-            activity_req = activity_req.exclude(object_entity=exclude_activity_id)
-
-        # Get id of activities of participant
-        activity_ids = activity_req.values_list('object_entity__id', flat=True)
-
-        # Do collision request
-        # TODO: can be done with less queries ?
-        #           Activity.objects.filter(
-        #               relations__object_entity=participant.id,
-        #               relations__object_entity__type=REL_OBJ_PART_2_ACTIVITY,
-        #           ).filter(collision_test)
-        busy_args = {} if busy else {'busy': True}
-        # TODO: test is_deleted=True
-        Activity = get_activity_model()
-        colliding_activity = Activity.objects.filter(
-            collision_test,
-            is_deleted=False,
-            pk__in=activity_ids,
-            floating_type__in=(
-                Activity.FloatingType.NARROW,
-                Activity.FloatingType.FLOATING_TIME,
-            ),
-            **busy_args
-        ).first()
+        colliding_activity = colliding_activities.get(participant.id)
 
         if colliding_activity is not None:
             collision_start = max(
@@ -129,6 +254,21 @@ def is_auto_orga_subject_enabled():
     return SettingValue.objects.get_4_key(auto_subjects_key, default=False).value
 
 
+def stream_activities(activities: QuerySet,
+                      *,
+                      prefetched_fields=(),
+                      chunk_size: int = 500,
+                      ) -> Iterator:
+    """Iterate on some activities by chunks, so the whole set of instances is
+    never loaded in memory (calendar view, iCalendar export...).
+    @param activities: Queryset on Activity.
+    @param prefetched_fields: Arguments for prefetch_related() ; the related
+           instances are retrieved for each chunk.
+    @param chunk_size: Number of activities retrieved per query.
+    """
+    return activities.prefetch_related(*prefetched_fields).iterator(chunk_size=chunk_size)
+
+
 class ICalEncoder:
     """Generates RFC5545 iCalendar files (extension .ics).
     See https://www.rfc-editor.org/rfc/rfc5545
@@ -182,33 +322,48 @@ END:VEVENT"""
 
     def encode(self, activities: QuerySet) -> str:
         """Return a normalized iCalendar string."""
+        return ''.join(self.iter_encode(activities))
+
+    def _iter_vevents(self, activities: QuerySet, tz) -> Iterator[str]:
+        separator = ''
+
+        for activity in stream_activities(
+            activities, prefetched_fields=self.prefetched_fields,
+        ):
+            yield separator
+            yield self.encode_activity(activity, tz)
+            separator = '\n'
+
+    def iter_encode(self, activities: QuerySet) -> Iterator[str]:
+        """Get the pieces of a normalized iCalendar string (see encode()) ;
+        the activities are retrieved by chunks, so it can be used by a
+        streamed response.
+        NB: the header is built immediately, so the current time zone is used
+            even if the pieces are consumed later.
+        """
         tz = get_current_timezone()
-        activities = activities.prefetch_related(*self.prefetched_fields)
-        start_year = min(
-            (a.start.date().year for a in activities if a.start),
-            default=2000,
-        )
-        end_year = max(
-            (a.end.date().year for a in activities if a.end),
-            default=start_year + 10,
-        )
+        bounds = activities.aggregate(min_start=Min('start'), max_end=Max('end'))
+        min_start = bounds['min_start']
+        max_end = bounds['max_end']
+        start_year = min_start.year if min_start else 2000
+        end_year = max_end.year if max_end else start_year + 10
 
-        return """BEGIN:VCALENDAR
+        header = """BEGIN:VCALENDAR
 VERSION:2.0
 PRODID:{product_id}
 CALSCALE:GREGORIAN
 {vtimezone}
-{vevents}
-END:VCALENDAR""".format(
+""".format(
             product_id=self.product_id,
             vtimezone=ZoneinfoToVtimezone.generate_vtimezone(
                 timezone=tz,
                 date_from=datetime(year=start_year, month=1, day=1),
                 date_to=datetime(year=end_year, month=12, day=31),
             ),
-            vevents='\n'.join(self.encode_activity(a, tz) for a in activities),
         )
 
+        return chain([header], self._iter_vevents(activities, tz), ['\nEND:VCALENDAR'])
+
 
 ################################################################################
 # PUBLIC DOMAIN
@@ -22,7 +22,7 @@ from typing import override
 
 from django.db.models import Q
 from django.forms.forms import BaseForm
-from django.http import Http404, HttpResponse
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
@@ -343,8 +343,8 @@ class ICalExport(generic.CheckedView):
         return self.encoder_class()
 
     def get(self, request, *args, **kwargs):
-        return HttpResponse(
-            self.get_encoder().encode(
+        return StreamingHttpResponse(
+            self.get_encoder().iter_encode(
                 activities=EntityCredentials.filter(
                     queryset=self.get_activities(), user=request.user,
                 ),
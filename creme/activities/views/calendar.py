@@ -21,6 +21,8 @@ from collections import defaultdict
 from copy import copy
 from datetime import datetime, timedelta
 from functools import partial
+from hashlib import md5
+from json import dumps as json_dump
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
@@ -31,8 +33,13 @@ from django.http import HttpResponse
 from django.shortcuts import get_object_or_404, render
 from django.urls import reverse
 from django.utils.decorators import method_decorator
-from django.utils.timezone import get_current_timezone, make_naive, now
-from django.utils.translation import gettext
+from django.utils.timezone import (
+    get_current_timezone,
+    get_current_timezone_name,
+    make_naive,
+    now,
+)
+from django.utils.translation import get_language, gettext
 from django.utils.translation import gettext_lazy as _
 
 from creme.creme_config.views.base import (
@@ -41,6 +48,7 @@ from creme.creme_config.views.base import (
     ConfigModelEdition,
 )
 from creme.creme_core.core.exceptions import ConflictError
+from creme.creme_core.core.shared_cache import shared_cache
 from creme.creme_core.http import CremeJsonResponse
 from creme.creme_core.models import DeletionCommand, EntityCredentials, Job
 from creme.creme_core.utils import bool_from_str_extended, get_from_POST_or_404
@@ -53,9 +61,11 @@ from ..forms import calendar as calendar_forms
 from ..forms import config as config_forms
 from ..models import Calendar, CalendarConfigItem
 from ..utils import (
+    calendar_feed_models,
     check_activity_collisions,
     get_current_utc_offset,
     get_last_day_of_a_month,
+    stream_activities,
 )
 
 logger = logging.getLogger(__name__)
@@ -229,18 +239,40 @@ class CalendarsMixin:
 
 
 class ActivitiesData(CalendarsMixin, generic.CheckedView):
+    """Data of the activities displayed by the calendar view.
+
+    The data of a user/period/set of calendars are stored in the shared cache
+    (see 'utils.calendar_feed_models' for the models which invalidate them).
+
+    An incremental synchronisation is available with the GET argument "since"
+    (see get_sync_data()).
+    """
     response_class = CremeJsonResponse
     start_arg = 'start'
     end_arg = 'end'
+    since_arg = 'since'
 
     # Example of possible format (NB: "activity" is passed in the context)
     # label = '[{activity.status}] {activity.title}'
     label = '{activity.title}'
     calendar_ids_session_key = CalendarView.calendar_ids_session_key
 
+    # Duration (in seconds) of the data in the shared cache ;
+    # <None> means the setting "SHARED_CACHE_TIMEOUT" is used.
+    cache_timeout: int | None = None
+    # Duration (in seconds) of the states of the incremental synchronisation
+    sync_timeout = 3600
+    sync_key_fmt = 'activities-calendar_sync-{user_id}-{token}'.format
+
     def get(self, request, *args, **kwargs):
+        data = self.get_activities_data(request)
+
+        token = request.GET.get(self.since_arg)
+        if token is not None:
+            data = self.get_sync_data(request, entries=data, token=token)
+
         return self.response_class(
-            self.get_activities_data(request),
+            data,
             safe=False,  # Result is not a dictionary
         )
 
@@ -288,46 +320,153 @@ class ActivitiesData(CalendarsMixin, generic.CheckedView):
     @staticmethod
     def _get_one_activity_per_calendar(activities):
         for activity in activities:
-            # "concerned_calendars" is added by get_activities_data()
+            # "concerned_calendars" is added by build_activities_data()
             for calendar in activity.concerned_calendars:
                 copied = copy(activity)
                 copied.calendar = calendar
                 yield copied
 
-    def get_activities_data(self, request):
-        user = request.user
-
-        calendar_ids = [cal.id for cal in self.get_calendars(request)]
-        self.save_calendar_ids(request, calendar_ids)
-
-        start = self.get_start(request)
-        end   = self.get_end(request=request, start=start)
+    def build_activities_data(self, *, user, calendar_ids, start, end) -> list[dict]:
+        "Build the data of the activities (see get_activities_data())."
+        calendars_field = Activity._meta.get_field('calendars')
 
         # TODO: label when no calendar related to the participant of an unavailability
         activities = EntityCredentials.filter(
             user,
-            Activity.objects
-                    .filter(is_deleted=False)
-                    .filter(self.get_date_q(start=start, end=end))
-                    .filter(calendars__in=calendar_ids)
-                    .distinct()
-            # NB: we already filter by calendars ; maybe a future Django version
-            #     will allow us to annotate the calendar ID directly
-            #     (distinct() would have to be removed of course)
-                    .prefetch_related(Prefetch(
-                        'calendars',
-                        queryset=Calendar.objects.filter(id__in=calendar_ids),
-                        to_attr='concerned_calendars',
-                    ))
+            Activity.objects.filter(
+                self.get_date_q(start=start, end=end),
+                is_deleted=False,
+                # NB: a sub-query avoids a DISTINCT on the activities
+                id__in=calendars_field.remote_field.through._default_manager.filter(
+                    **{f'{calendars_field.m2m_reverse_field_name()}__in': calendar_ids}
+                ).values(f'{calendars_field.m2m_field_name()}_id'),
+            ),
         )
 
         activity_2_dict = partial(self._activity_2_dict, user=user)
 
         return [
             activity_2_dict(activity=a)
-            for a in self._get_one_activity_per_calendar(activities)
+            for a in self._get_one_activity_per_calendar(stream_activities(
+                activities,
+                prefetched_fields=[
+                    'type',
+                    Prefetch(
+                        'calendars',
+                        queryset=Calendar.objects.filter(id__in=calendar_ids),
+                        to_attr='concerned_calendars',
+                    ),
+                ],
+            ))
         ]
 
+    def get_activities_data(self, request) -> list[dict]:
+        user = request.user
+
+        calendar_ids = [cal.id for cal in self.get_calendars(request)]
+        self.save_calendar_ids(request, calendar_ids)
+
+        start = self.get_start(request)
+        end   = self.get_end(request=request, start=start)
+
+        if not calendar_ids:
+            return []
+
+        key = md5(
+            json_dump(
+                [
+                    type(self).__name__,
+                    user.id,
+                    calendar_ids,
+                    start.isoformat(),
+                    end.isoformat(),
+                    get_language(),
+                    get_current_timezone_name(),
+                ],
+            ).encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+
+        return shared_cache.get_or_compute(
+            key=f'activities-calendar_feed-{key}',
+            models=calendar_feed_models,
+            compute=lambda: self.build_activities_data(
+                user=user, calendar_ids=calendar_ids, start=start, end=end,
+            ),
+            timeout=self.cache_timeout,
+        )
+
+    @staticmethod
+    def _fingerprint(data) -> str:
+        return md5(
+            json_dump(data, sort_keys=True, default=str).encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+
+    def get_sync_data(self, request, *, entries: list[dict], token: str) -> dict:
+        """Get the changes of the data since a previous request.
+
+        A state of the data (i.e. a fingerprint of each entry) is stored in the
+        cache ; it's identified by a token, which is returned. When this token
+        is given to the next request, only the entries which have been created
+        or modified are returned, with the entries which have been removed
+        (deleted activities, activities moved to another period/calendar...).
+        If the state related to the given token is not found (empty or unknown
+        token, expired state, shared cache disabled...), all the entries are
+        returned.
+        @param entries: See get_activities_data().
+        @param token: Token of the previous state (can be empty).
+        @return: A dictionary with the keys:
+                 - "token": token of the new state.
+                 - "full": <True> if all the entries are returned.
+                 - "activities": the new & modified entries.
+                 - "deleted": the removed entries, as dictionaries
+                   {"id": activity_id, "calendar": calendar_id}.
+        """
+        fingerprint = self._fingerprint
+        state = {(entry['id'], entry['calendar']): fingerprint(entry) for entry in entries}
+        new_token = fingerprint(sorted(state.items()))
+
+        user_id = request.user.id
+        cache = shared_cache.cache
+        previous_state = None
+
+        if cache is not None:
+            # NB: the token is used in a key of the cache => we check its format
+            if len(token) == len(new_token) and token.isascii() and token.isalnum():
+                previous_state = cache.get(self.sync_key_fmt(user_id=user_id, token=token))
+
+            cache.set(
+                self.sync_key_fmt(user_id=user_id, token=new_token),
+                state,
+                timeout=self.sync_timeout,
+            )
+
+        if previous_state is None:
+            return {
+                'token': new_token,
+                'full': True,
+                'activities': entries,
+                'deleted': [],
+            }
+
+        changed_entries = []
+        for entry in entries:
+            entry_key = (entry['id'], entry['calendar'])
+
+            if previous_state.get(entry_key) != state[entry_key]:
+                changed_entries.append(entry)
+
+        return {
+            'token': new_token,
+            'full': False,
+            'activities': changed_entries,
+            'deleted': [
+                {'id': activity_id, 'calendar': calendar_id}
+                for activity_id, calendar_id in sorted(previous_state.keys() - state.keys())
+            ],
+        }
+
     @staticmethod
     def get_date_q(start, end):
         return Q(start__range=(start, end)) | Q(end__gt=start, start__lt=end)
@@ -59,108 +59,60 @@ class TodosSearchField(lv_form.ListViewSearchField):
         ) if value else Q()
 
 
-class _CachedFunctionField(FunctionField):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._cache = defaultdict(list)
+class _AssistantsFunctionField(FunctionField):
+    result_type = FunctionFieldResultsList
 
+    def _get_values(self, entity_ids: list[int]):
+        "@return: Iterable of tuples (value, entity_id), in the display order."
+        raise NotImplementedError
 
-class AlertsField(_CachedFunctionField):
-    name = 'assistants-get_alerts'
-    verbose_name = _('Active alerts')
-    result_type = FunctionFieldResultsList
-    search_field_builder = AlertsSearchField
+    def bulk_evaluate(self, entities, user):
+        if not user.has_perm_to_access('assistants'):
+            return {
+                entity.id: FunctionFieldResultsList([
+                    FunctionFieldResult(gettext('Forbidden app')),
+                ]) for entity in entities
+            }
 
-    def __call__(self, entity, user):
-        cache = self._cache
-        e_id = entity.id
-        cached = cache.get(e_id)
+        values = defaultdict(list)
+        for value, e_id in self._get_values([e.id for e in entities]):
+            values[e_id].append(value)
 
-        if cached is None:
-            cached = cache[e_id] = [
-                *Alert.objects
-                      .filter(entity_id=e_id, is_validated=False)
-                      .order_by('trigger_date')
-                      .values_list('title', flat=True)
-            ] if user.has_perm_to_access('assistants') else [gettext('Forbidden app')]
+        return {
+            entity.id: FunctionFieldResultsList(
+                FunctionFieldResult(value) for value in values[entity.id]
+            ) for entity in entities
+        }
 
-        return FunctionFieldResultsList(
-            FunctionFieldResult(title) for title in cached
-        )
 
-    def populate_entities(self, entities, user):
-        if user.has_perm_to_access('assistants'):
-            cache = self._cache
+class AlertsField(_AssistantsFunctionField):
+    name = 'assistants-get_alerts'
+    verbose_name = _('Active alerts')
+    search_field_builder = AlertsSearchField
 
-            for title, e_id in Alert.objects.filter(
-                entity_id__in=[e.id for e in entities if e.id not in cache],
-                is_validated=False,
-            ).order_by('trigger_date').values_list('title', 'entity_id'):
-                cache[e_id].append(title)
+    def _get_values(self, entity_ids):
+        return Alert.objects.filter(
+            entity_id__in=entity_ids, is_validated=False,
+        ).order_by('trigger_date').values_list('title', 'entity_id')
 
 
-class MemosField(_CachedFunctionField):
+class MemosField(_AssistantsFunctionField):
     name = 'assistants-get_memos'
     verbose_name = _('Memos')
-    result_type = FunctionFieldResultsList
     search_field_builder = MemosSearchField
 
-    def __call__(self, entity, user):
-        cache = self._cache
-        e_id = entity.id
-        cached = cache.get(e_id)
-
-        if cached is None:
-            cached = cache[e_id] = [
-                *Memo.objects
-                     .filter(entity_id=entity.id)
-                     .order_by('-creation_date')
-                     .values_list('content', flat=True)
-            ] if user.has_perm_to_access('assistants') else [gettext('Forbidden app')]
-
-        return FunctionFieldResultsList(
-            FunctionFieldResult(content) for content in cached
-        )
+    def _get_values(self, entity_ids):
+        return Memo.objects.filter(
+            entity_id__in=entity_ids,
+        ).order_by('-creation_date').values_list('content', 'entity_id')
 
-    def populate_entities(self, entities, user):
-        if user.has_perm_to_access('assistants'):
-            cache = self._cache
 
-            for content, e_id in Memo.objects.filter(
-                entity_id__in=[e.id for e in entities if e.id not in cache],
-            ).order_by('-creation_date').values_list('content', 'entity_id'):
-                cache[e_id].append(content)
-
-
-class TodosField(_CachedFunctionField):
+class TodosField(_AssistantsFunctionField):
     name = 'assistants-get_todos'
     verbose_name = _('Active Todos')
-    result_type = FunctionFieldResultsList
     search_field_builder = TodosSearchField
 
-    def __call__(self, entity, user):
-        cache = self._cache
-        e_id = entity.id
-        cached = cache.get(e_id)
-
-        if cached is None:
-            cached = cache[e_id] = [
-                *ToDo.objects
-                     .filter(entity_id=entity.id, is_ok=False)
-                     .order_by('-creation_date')
-                     .values_list('title', flat=True)
-            ] if user.has_perm_to_access('assistants') else [gettext('Forbidden app')]
-
-        return FunctionFieldResultsList(
-            FunctionFieldResult(title) for title in cached
-        )
-
-    def populate_entities(self, entities, user):
-        if user.has_perm_to_access('assistants'):
-            cache = self._cache
-
-            for title, e_id in ToDo.objects.filter(
-                entity_id__in=[e.id for e in entities if e.id not in cache],
-                is_ok=False,
-            ).order_by('-creation_date').values_list('title', 'entity_id'):
-                cache[e_id].append(title)
+    def _get_values(self, entity_ids):
+        return ToDo.objects.filter(
+            entity_id__in=entity_ids, is_ok=False,
+        ).order_by('-creation_date').values_list('title', 'entity_id')
@@ -213,30 +213,29 @@ def get_total_won_quote_this_year_multi(entities, user):
 class _BaseTotalFunctionField(FunctionField):
     result_type = FunctionFieldDecimal  # Useful to get the right CSS class in list-view
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._cache = defaultdict(dict)
-
-    def __call__(self, entity, user):
-        e_cache = self._cache[entity.id]
-        total = e_cache.get(user.id)
-
-        if total is None:
-            total = e_cache[user.id] = self.single_func()(entity, user)
-
-        return (
-            FunctionFieldDecimal(total)
-            if isinstance(total, Decimal) else
-            FunctionFieldResult(total)
-        )
-
-    def populate_entities(self, entities, user):
-        cache = self._cache
-        user_id = user.id
+    # NB: the totals depend on the bills, their statuses & their relationships,
+    #     the managed Organisations & the credentials of the user.
+    results_cache_ttl = 60
+    results_cache_models = (
+        Invoice, Quote, 'billing.InvoiceStatus', 'billing.QuoteStatus',
+        Organisation, Relation, FieldsConfig,
+        'creme_core.SetCredentials', 'creme_core.UserRole',
+    )
 
-        # TODO: only populate entities which are not already populated
-        for entity, total in self.multi_func()(entities, user):
-            cache[entity.id][user_id] = total
+    def bulk_evaluate(self, entities, user):
+        if len(entities) == 1:
+            single_func = self.single_func()
+            totals = [(entity, single_func(entity, user)) for entity in entities]
+        else:
+            totals = self.multi_func()(entities, user)
+
+        return {
+            entity.id: (
+                FunctionFieldDecimal(total)
+                if isinstance(total, Decimal) else
+                FunctionFieldResult(total)
+            ) for entity, total in totals
+        }
 
     @classmethod
     def single_func(cls):
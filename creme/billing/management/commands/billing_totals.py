@@ -0,0 +1,122 @@
+################################################################################
+#    Creme is a free/open-source Customer Relationship Management software
+#    Copyright (C) 2026  Hybird
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.transaction import atomic
+
+from creme import billing
+from creme.billing.models import Base
+
+
+class Command(BaseCommand):
+    help = (
+        'Check the totals (with & without VAT) stored in the billing documents, '
+        'by computing them from the lines & the credit notes. '
+        'Use the option --repair to fix the invalid totals.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--repair', action='store_true', dest='repair', default=False,
+            help='Save the computed totals when they are different from the stored ones.',
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, dest='chunk_size', default=500,
+            help='Number of documents retrieved by query [default: %(default)s].',
+        )
+
+    @staticmethod
+    def get_models() -> list[type[Base]]:
+        # NB: the credit notes are fixed before the invoices, because the totals
+        #     of the invoices depend on them.
+        return [
+            billing.get_credit_note_model(),
+            billing.get_invoice_model(),
+            billing.get_quote_model(),
+            billing.get_sales_order_model(),
+            billing.get_template_base_model(),
+        ]
+
+    def check_model(self, model: type[Base], *, chunk_size: int, repair: bool) -> tuple[int, int]:
+        """Check the totals of all the documents of a model (by chunks).
+        @return: A tuple (number of documents, number of invalid documents).
+        """
+        verbosity = self.verbosity
+        count = invalid_count = 0
+        last_id = 0
+        queryset = model.objects.order_by('id').only('discount', 'total_no_vat', 'total_vat')
+
+        while True:
+            documents = [*queryset.filter(id__gt=last_id)[:chunk_size]]
+            if not documents:
+                break
+
+            last_id = documents[-1].id
+            count += len(documents)
+
+            # NB: 2 queries for the whole chunk (lines' values & credit notes)
+            Base.populate_lines_totals(documents)
+            Base.populate_credit_notes(documents)
+
+            invalid_documents = []
+            for document in documents:
+                total_no_vat = document._get_total()
+                total_vat = document._get_total_with_tax()
+
+                if document.total_no_vat != total_no_vat or document.total_vat != total_vat:
+                    if verbosity >= 2:
+                        self.stdout.write(
+                            f'{model._meta.label} id={document.id}: '
+                            f'stored=({document.total_no_vat}, {document.total_vat}) '
+                            f'computed=({total_no_vat}, {total_vat})'
+                        )
+
+                    document.total_no_vat = total_no_vat
+                    document.total_vat = total_vat
+                    invalid_documents.append(document)
+
+            invalid_count += len(invalid_documents)
+
+            if repair and invalid_documents:
+                # NB: the documents are not saved (no history, no signal...).
+                with atomic():
+                    model.objects.bulk_update(
+                        invalid_documents, fields=('total_no_vat', 'total_vat'),
+                    )
+
+        return count, invalid_count
+
+    def handle(self, **options):
+        self.verbosity = verbosity = options.get('verbosity')
+        repair = options.get('repair')
+        chunk_size = options.get('chunk_size')
+
+        if chunk_size < 1:
+            raise CommandError('The size of chunks must be a positive integer.')
+
+        for model in self.get_models():
+            count, invalid_count = self.check_model(
+                model, chunk_size=chunk_size, repair=repair,
+            )
+
+            if verbosity:
+                self.stdout.write(
+                    f'{model._meta.label}: {count} document(s) checked, '
+                    f'{invalid_count} with invalid totals'
+                    f'{" (repaired)" if repair and invalid_count else ""}.'
+                )
@@ -19,8 +19,11 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
+from collections.abc import Sequence
 # import warnings
 # from datetime import date
+from decimal import Decimal
 from functools import partial
 
 from django.conf import settings
@@ -150,6 +153,10 @@ class Base(CremeEntity):
     _target = None
     _target_rel = None
     _creditnotes_cache = None
+    _lines_totals_cache = None
+
+    # Modification of the totals of the lines (see add_totals_delta()).
+    _totals_delta = None
 
     class Meta:
         abstract = True
@@ -195,6 +202,7 @@ class Base(CremeEntity):
     def invalidate_cache(self):
         self._lines_cache.clear()
         self._creditnotes_cache = None
+        self._lines_totals_cache = None
 
     @property
     def source(self):
@@ -273,25 +281,82 @@ class Base(CremeEntity):
         for line_cls in line_registry:
             yield from self.get_lines(line_cls)
 
+    @staticmethod
+    def populate_lines_totals(documents: Sequence[Base]) -> None:
+        """Compute the totals of the lines of several documents, with one query
+        (the lines are not instantiated) ; the totals are stored in the cache
+        of each document (see _get_lines_totals()).
+        NB: the prices are computed in Python (like Line.get_price_*() do) in
+            order to get exactly the same results (rounding of Decimals).
+        """
+        from ..core.line import line_registry
+
+        docs_per_id = {doc.id: doc for doc in documents if doc.id}
+        totals = {doc_id: [DEFAULT_DECIMAL, DEFAULT_DECIMAL] for doc_id in docs_per_id}
+        querysets = [
+            line_cls._default_manager.filter(
+                relations__type=REL_OBJ_HAS_LINE,
+                relations__object_entity__in=[*docs_per_id.keys()],
+            ).order_by().values_list('relations__object_entity', *Line.price_fields)
+            for line_cls in line_registry
+        ]
+
+        if docs_per_id and querysets:
+            for doc_id, *values in querysets[0].union(
+                *querysets[1:], all=True,
+            ).order_by():
+                doc_totals = totals[doc_id]
+                no_vat, vat = Line.compute_prices(
+                    values, document_discount=docs_per_id[doc_id].discount,
+                )
+                doc_totals[0] += no_vat
+                doc_totals[1] += vat
+
+        for doc in documents:
+            doc._lines_totals_cache = tuple(
+                totals.get(doc.id, (DEFAULT_DECIMAL, DEFAULT_DECIMAL))
+            )
+
+    @staticmethod
+    def populate_credit_notes(documents: Sequence[Base]) -> None:
+        "Retrieve the credit notes of several documents, with a minimal number of queries."
+        credit_notes = defaultdict(list)
+        docs_ids = [doc.id for doc in documents if doc.id]
+
+        if docs_ids:
+            for rel in Relation.objects.filter(
+                subject_entity__in=docs_ids, type=REL_OBJ_CREDIT_NOTE_APPLIED,
+            ).prefetch_related('real_object'):
+                credit_note = rel.real_object
+                if not credit_note.is_deleted:
+                    credit_notes[rel.subject_entity_id].append(credit_note)
+
+        for doc in documents:
+            doc._creditnotes_cache = credit_notes[doc.id]
+
+    def _get_lines_totals(self) -> tuple[Decimal, Decimal]:
+        "@return: Tuple (total exclusive of tax, total inclusive of tax) of the lines."
+        totals = self._lines_totals_cache
+
+        if totals is None:
+            self.populate_lines_totals([self])
+            totals = self._lines_totals_cache
+
+        return totals
+
     def _get_lines_total_n_creditnotes_total(self):
         creditnotes_total = sum(
             credit_note.total_no_vat for credit_note in self.get_credit_notes()
         )
-        lines_total = sum(
-            line.get_price_exclusive_of_tax(self) for line in self.iter_all_lines()
-        )
 
-        return lines_total, creditnotes_total
+        return self._get_lines_totals()[0], creditnotes_total
 
     def _get_lines_total_n_creditnotes_total_with_tax(self):
         creditnotes_total = sum(
             credit_note.total_vat for credit_note in self.get_credit_notes()
         )
-        lines_total_with_tax = sum(
-            line.get_price_inclusive_of_tax(self) for line in self.iter_all_lines()
-        )
 
-        return lines_total_with_tax, creditnotes_total
+        return self._get_lines_totals()[1], creditnotes_total
 
     def _get_total(self):
         lines_total, creditnotes_total = self._get_lines_total_n_creditnotes_total()
@@ -346,8 +411,58 @@ class Base(CremeEntity):
                     organisation=source.id,
                 ).order_by('-is_default').first()
 
+    def add_totals_delta(self, no_vat: Decimal, vat: Decimal) -> None:
+        """Notify a modification of the totals of the lines (a line has been
+        created, modified or deleted) ; the next call to save() updates the
+        totals of the document incrementally (i.e. without retrieving all the lines).
+        @param no_vat: Modification of the total exclusive of tax.
+        @param vat: Modification of the total inclusive of tax.
+        """
+        delta = self._totals_delta
+        self._totals_delta = (no_vat, vat) if delta is None else (
+            delta[0] + no_vat, delta[1] + vat,
+        )
+
+    def _get_totals_from_delta(self, delta: tuple[Decimal, Decimal]) -> tuple | None:
+        """Compute the new totals from the stored ones & a modification of the
+        totals of the lines.
+        @return: A tuple (total exclusive of tax, total inclusive of tax), or
+                 <None> if the totals must be computed from all the lines.
+        NB: the stored totals contain the credit notes & are clamped (see
+            _get_total() & Invoice._get_total()) ; when the old & the new
+            totals are strictly positive, they are not clamped, so the
+            modification can be applied directly.
+        """
+        stored = type(self)._default_manager.select_for_update().filter(
+            pk=self.pk,
+        ).values('discount', 'total_no_vat', 'total_vat').first()
+
+        # NB: the global discount modifies the prices of all the lines
+        if stored is None or stored['discount'] != self.discount:
+            return None
+
+        old_totals = (stored['total_no_vat'], stored['total_vat'])
+        if None in old_totals:
+            return None
+
+        new_totals = (old_totals[0] + delta[0], old_totals[1] + delta[1])
+        if min(*old_totals, *new_totals) <= 0:
+            return None
+
+        return new_totals
+
     def _update_totals(self):
         "Hint: facilitate the modification by extending/external apps."
+        delta = self._totals_delta
+        self._totals_delta = None
+
+        if delta is not None:
+            totals = self._get_totals_from_delta(delta)
+
+            if totals is not None:
+                self.total_no_vat, self.total_vat = totals
+                return
+
         self.total_vat = self._get_total_with_tax()
         self.total_no_vat = self._get_total()
 
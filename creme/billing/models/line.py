@@ -16,7 +16,11 @@
 #    along with this program.  If not, see <http://www.gnu.org/licenses/>.
 ################################################################################
 
+from __future__ import annotations
+
 import logging
+from collections.abc import Sequence
+from decimal import Decimal
 from functools import partial
 
 from django.core.exceptions import ValidationError
@@ -83,6 +87,10 @@ class Line(CremeEntity):
 
     creation_label = _('Create a line')
 
+    # Fields (can be used with QuerySet.values_list()) needed to compute the
+    # prices without instance (see compute_prices()).
+    price_fields = ('quantity', 'unit_price', 'discount', 'discount_unit', 'vat_value__value')
+
     _related_document = False
     _related_item = None
 
@@ -149,28 +157,88 @@ class Line(CremeEntity):
         return round_decimal(self.quantity * self.unit_price, mode=ROUND_POLICY)
 
     def get_price_exclusive_of_tax(self, document=None):
-        line_discount   = self.discount
-        unit_price_line = self.unit_price
-        discount_unit   = self.discount_unit
-        Discount = self.Discount
+        document = document if document else self.related_document
+
+        return self.compute_price_exclusive_of_tax(
+            quantity=self.quantity,
+            unit_price=self.unit_price,
+            discount=self.discount,
+            discount_unit=self.discount_unit,
+            document_discount=document.discount if document else None,
+        )
+
+    @classmethod
+    def compute_price_exclusive_of_tax(cls, *,
+                                       quantity,
+                                       unit_price,
+                                       discount,
+                                       discount_unit,
+                                       document_discount=None,
+                                       ):
+        """Compute the price (exclusive of tax) of a line from raw values
+        (i.e. without instance of Line, see 'price_fields').
+        @param document_discount: Global discount (percentage) of the related document.
+        """
+        Discount = cls.Discount
 
         if discount_unit == Discount.PERCENT:
-            total_after_first_discount = self.quantity * (
-                unit_price_line - (unit_price_line * line_discount / 100)
+            total_after_first_discount = quantity * (
+                unit_price - (unit_price * discount / 100)
             )
         elif discount_unit == Discount.LINE_AMOUNT:
-            total_after_first_discount = self.quantity * unit_price_line - line_discount
+            total_after_first_discount = quantity * unit_price - discount
         else:  # ITEM_AMOUNT
-            total_after_first_discount = self.quantity * (unit_price_line - line_discount)
+            total_after_first_discount = quantity * (unit_price - discount)
 
-        document     = document if document else self.related_document
-        doc_discount = document.discount if document else None
         total_exclusive_of_tax = total_after_first_discount
-        if doc_discount:
-            total_exclusive_of_tax -= total_after_first_discount * doc_discount / 100
+        if document_discount:
+            total_exclusive_of_tax -= total_after_first_discount * document_discount / 100
 
         return round_decimal(total_exclusive_of_tax, mode=ROUND_POLICY)
 
+    def get_prices(self, document) -> tuple[Decimal, Decimal]:
+        """Compute the prices of the line.
+        @return: Tuple (price exclusive of tax, price inclusive of tax).
+        """
+        # NB: the values which have not been saved/loaded can be strings, integers...
+        get_field = self._meta.get_field
+
+        return self.compute_prices(
+            (
+                *(
+                    get_field(fname).to_python(getattr(self, fname))
+                    for fname in ('quantity', 'unit_price', 'discount', 'discount_unit')
+                ),
+                self.vat_value.value,
+            ),
+            document_discount=document.discount if document else None,
+        )
+
+    @classmethod
+    def compute_prices(cls,
+                       values: Sequence,
+                       document_discount: Decimal | None = None,
+                       ) -> tuple[Decimal, Decimal]:
+        """Compute the prices of a line from the raw values retrieved from the
+        DataBase.
+        @param values: Sequence of values corresponding to 'price_fields'.
+        @param document_discount: Global discount (percentage) of the related document.
+        @return: Tuple (price exclusive of tax, price inclusive of tax).
+        """
+        quantity, unit_price, discount, discount_unit, vat = values
+        total_ht = cls.compute_price_exclusive_of_tax(
+            quantity=quantity,
+            unit_price=unit_price,
+            discount=discount,
+            discount_unit=discount_unit,
+            document_discount=document_discount,
+        )
+
+        return (
+            total_ht,
+            round_decimal(total_ht + (total_ht * vat / 100), mode=ROUND_POLICY),
+        )
+
     def get_related_entity(self):  # For generic views & delete
         return self.related_document
 
@@ -222,6 +290,8 @@ class Line(CremeEntity):
 
     @atomic
     def save(self, *args, **kwargs):
+        old_values = None
+
         if not self.pk:  # Creation
             assert self._related_document, 'Line.related_document is required'
             assert bool(self._related_item) ^ bool(self.on_the_fly_item), \
@@ -245,8 +315,25 @@ class Line(CremeEntity):
                     object_entity=self._related_item,
                 )
         else:
+            old_values = type(self)._default_manager.filter(
+                pk=self.pk,
+            ).values_list(*self.price_fields).first()
+
             super().save(*args, **kwargs)
 
+        # NB: the totals of the document are updated incrementally (see
+        #     Base.add_totals_delta()), so the other lines are not retrieved.
+        document = self.related_document
+        new_prices = self.get_prices(document)
+
+        if old_values is None:
+            document.add_totals_delta(*new_prices)
+        else:
+            old_prices = self.compute_prices(old_values, document_discount=document.discount)
+            document.add_totals_delta(
+                new_prices[0] - old_prices[0], new_prices[1] - old_prices[1],
+            )
+
         # TODO: problem, if several lines are added/edited at once, lots of
         #  useless queries (workflow engine ??)
-        self.related_document.save()  # Update totals
+        document.save()  # Update totals
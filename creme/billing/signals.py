@@ -1,6 +1,6 @@
 ################################################################################
 #    Creme is a free/open-source Customer Relationship Management software
-#    Copyright (C) 2015-2025  Hybird
+#    Copyright (C) 2015-2026  Hybird
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU Affero General Public License as published by
@@ -19,6 +19,7 @@
 from collections import defaultdict
 
 from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ObjectDoesNotExist
 from django.db.models import signals
 from django.db.transaction import atomic
 from django.dispatch import receiver
@@ -187,4 +188,15 @@ def manage_line_deletion(sender, instance, **kwargs):
         # NB: see billing.models.base.Base._pre_delete() for this ugly hack
         and not getattr(instance, '_avoid_billing_total_update', False)
     ):
-        instance.subject_entity.get_real_entity().save()
+        document = instance.subject_entity.get_real_entity()
+
+        try:
+            line = instance.object_entity.get_real_entity()
+        except ObjectDoesNotExist:
+            # The totals are computed from the remaining lines
+            pass
+        else:
+            no_vat, vat = line.get_prices(document)
+            document.add_totals_delta(-no_vat, -vat)
+
+        document.save()
@@ -384,6 +384,70 @@ class InvoiceTestCase(BrickTestCaseMixin, _BillingTestCase):
             inc_total_node.text,
         )
 
+    def test_totals__incremental(self):
+        user = self.login_as_root_and_get()
+        invoice = self.create_invoice_n_orgas(user=user, name='Invoice001')[0]
+
+        create_line = partial(
+            ProductLine.objects.create,
+            user=user, related_document=invoice,
+            vat_value=Vat.objects.get_or_create(value=Decimal('10.00'))[0],
+        )
+        line1 = create_line(on_the_fly_item='Product #1', quantity=2, unit_price=Decimal('10'))
+        line2 = create_line(on_the_fly_item='Product #2', quantity=1, unit_price=Decimal('5'))
+
+        invoice = self.refresh(invoice)
+        self.assertEqual(Decimal('25.00'), invoice.total_no_vat)
+        self.assertEqual(Decimal('27.50'), invoice.total_vat)
+
+        # The stored totals are updated (the other lines are not used)
+        Invoice.objects.filter(id=invoice.id).update(
+            total_no_vat=Decimal('100.00'), total_vat=Decimal('110.00'),
+        )
+        line1 = self.refresh(line1)
+        line1.quantity = 3
+        line1.save()
+
+        invoice = self.refresh(invoice)
+        self.assertEqual(Decimal('110.00'), invoice.total_no_vat)
+        self.assertEqual(Decimal('121.00'), invoice.total_vat)
+
+        # Not incremental => all the lines are used
+        invoice.discount = Decimal('10')
+        invoice.save()
+
+        invoice = self.refresh(invoice)
+        self.assertEqual(Decimal('31.50'), invoice.total_no_vat)
+        self.assertEqual(Decimal('34.65'), invoice.total_vat)
+
+        # Deletion
+        line2.delete()
+        invoice = self.refresh(invoice)
+        self.assertEqual(Decimal('27.00'), invoice.total_no_vat)
+        self.assertEqual(Decimal('29.70'), invoice.total_vat)
+
+    def test_totals__lines_query(self):
+        user = self.login_as_root_and_get()
+        invoice = self.create_invoice_n_orgas(user=user, name='Invoice001')[0]
+
+        kwargs = {'user': user, 'related_document': invoice, 'vat_value': Vat.objects.default()}
+        ProductLine.objects.create(
+            on_the_fly_item='Flyyy product', quantity=3, unit_price=Decimal('5'), **kwargs
+        )
+        ServiceLine.objects.create(
+            on_the_fly_item='Flyyy service', quantity=2, unit_price=Decimal('10'), **kwargs
+        )
+
+        invoice = self.refresh(invoice)
+        expected = invoice.total_no_vat
+        self.assertEqual(Decimal('35.00'), expected)
+
+        # One query for all the classes of line
+        with self.assertNumQueries(1):
+            self.assertTupleEqual(
+                (expected, invoice.total_vat), invoice._get_lines_totals(),
+            )
+
     @skipIfCustomAddress
     @skipIfCustomProductLine
     @skipIfCustomServiceLine
@@ -0,0 +1,74 @@
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from creme.creme_core.models import Vat
+
+from ..management.commands.billing_totals import Command as TotalsCommand
+from .base import (
+    Invoice,
+    ProductLine,
+    _BillingTestCase,
+    skipIfCustomInvoice,
+    skipIfCustomProductLine,
+)
+
+
+@skipIfCustomInvoice
+@skipIfCustomProductLine
+class BillingTotalsCommandTestCase(_BillingTestCase):
+    def _create_invoice(self, user, name, unit_price):
+        invoice = self.create_invoice_n_orgas(user=user, name=name)[0]
+        ProductLine.objects.create(
+            user=user, related_document=invoice,
+            on_the_fly_item='Flyyy product', quantity=2, unit_price=Decimal(unit_price),
+            vat_value=Vat.objects.get_or_create(value=Decimal('10.00'))[0],
+        )
+
+        return self.refresh(invoice)
+
+    def test_check(self):
+        user = self.login_as_root_and_get()
+        invoice1 = self._create_invoice(user, 'Invoice #1', '10')
+        invoice2 = self._create_invoice(user, 'Invoice #2', '50')
+        self.assertEqual(Decimal('20.00'), invoice1.total_no_vat)
+        self.assertEqual(Decimal('22.00'), invoice1.total_vat)
+
+        Invoice.objects.filter(id=invoice2.id).update(
+            total_no_vat=Decimal('12.00'), total_vat=Decimal('13.00'),
+        )
+
+        stdout = StringIO()
+        call_command(TotalsCommand(), verbosity=2, stdout=stdout, chunk_size=1)
+        messages = stdout.getvalue()
+        self.assertIn(
+            f'billing.Invoice id={invoice2.id}: stored=(12.00, 13.00) computed=(100.00, 110.00)',
+            messages,
+        )
+        self.assertIn('billing.Invoice: 2 document(s) checked, 1 with invalid totals.', messages)
+        self.assertNotIn(f'id={invoice1.id}:', messages)
+
+        # Not repaired
+        self.assertEqual(Decimal('12.00'), self.refresh(invoice2).total_no_vat)
+
+    def test_repair(self):
+        user = self.login_as_root_and_get()
+        invoice = self._create_invoice(user, 'Invoice #1', '10')
+        Invoice.objects.filter(id=invoice.id).update(total_no_vat=0, total_vat=0)
+
+        stdout = StringIO()
+        call_command(TotalsCommand(), '--repair', verbosity=1, stdout=stdout)
+        self.assertIn(
+            'billing.Invoice: 1 document(s) checked, 1 with invalid totals (repaired).',
+            stdout.getvalue(),
+        )
+
+        invoice = self.refresh(invoice)
+        self.assertEqual(Decimal('20.00'), invoice.total_no_vat)
+        self.assertEqual(Decimal('22.00'), invoice.total_vat)
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(CommandError):
+            call_command(TotalsCommand(), verbosity=0, chunk_size=0)
@@ -555,6 +555,7 @@ class CremeCoreConfig(CremeAppConfig):
             bricks.RecentEntitiesBrick,
             bricks.PinnedEntitiesBrick,
             bricks.StatisticsBrick,
+            bricks.InstrumentationBrick,
         ).register(
             brick_registry.Tag.STATIC,
 
@@ -711,6 +712,8 @@ class CremeCoreConfig(CremeAppConfig):
             content_cls=core_notif.UpgradeAnnouncement,
         ).register_content(
             content_cls=core_notif.MassImportDoneContent,
+        ).register_content(
+            content_cls=core_notif.MassExportDoneContent,
         )
 
     def register_creme_config(self, config_registry: 'ConfigRegistry'):
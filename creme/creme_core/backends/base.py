@@ -16,6 +16,8 @@
 #    along with this program.  If not, see <http://www.gnu.org/licenses/>.
 ################################################################################
 
+from collections.abc import Iterable
+
 from django.http.response import HttpResponseBase
 
 
@@ -56,8 +58,44 @@ class ExportBackend:
     verbose_name: str = 'OVERRIDE ME'
     help_text: str = 'OVERRIDE ME'
 
+    # If True, the method build_streaming_response() is implemented; the rows
+    # are written while the response is sent (instead of building the whole
+    # document in memory before).
+    streamable: bool = False
+
     response: HttpResponseBase
 
+    def build_streaming_response(self, rows: Iterable[list], filename: str, user):
+        """Build a response which writes the rows lazily, so big documents can be
+        exported with a constant memory.
+        Only used if the attribute "streamable" is True.
+        @param rows: Iterable of rows (lists of strings).
+        @param filename: file name.
+        @param user: owner of the file ;
+              instance of <django.contrib.auth.get_user_model()>.
+        @return: An instance of <django.http.StreamingHttpResponse>.
+        """
+        raise NotImplementedError
+
+    def write_file(self, rows: Iterable[list], filename: str, user):
+        """Writes the rows in a file of the MEDIA directory (it is used by the
+        job which exports in background).
+        The default implementation uses the methods writerow() & save(), which
+        must set the attribute "fileref".
+        @param rows: Iterable of rows (lists of strings).
+        @param filename: file name.
+        @param user: owner of the file ;
+              instance of <django.contrib.auth.get_user_model()>.
+        @return: An instance of <creme_core.models.FileRef>.
+        """
+        writerow = self.writerow
+        for row in rows:
+            writerow(row)
+
+        self.save(filename, user)
+
+        return self.fileref
+
     def writerow(self, row):
         """Appends a row.
         @param row: the row list.
@@ -17,33 +17,79 @@
 ################################################################################
 
 import csv
+from os.path import basename, join
 
-from django.http import HttpResponse
+from django.conf import settings
+from django.http import HttpResponse, StreamingHttpResponse
 from django.template.defaultfilters import slugify
+from django.utils.translation import gettext
 from django.utils.translation import gettext_lazy as _
 
+from ..models import FileRef
+from ..utils.file_handling import FileCreator
 from .base import ExportBackend
 
 
+class _Echo:
+    """Pseudo-buffer which just returns the written value (see the Django's
+    documentation about StreamingHttpResponse).
+    """
+    def write(self, value):
+        return value
+
+
 class CSVExportBackend(ExportBackend):
     id = 'csv'
     verbose_name = _("CSV File (delimiter: ',')")
     delimiter: str = ','
     help_text = ''
+    streamable = True
+    dir_parts = ('csv',)  # Sub-directory under settings.MEDIA_ROOT (see write_file())
 
     def __init__(self):
         self.response = HttpResponse(content_type='text/csv')
-        self.writer = csv.writer(
-            self.response,
-            quoting=csv.QUOTE_ALL,
-            delimiter=self.delimiter,
+        self.writer = self._build_writer(self.response)
+
+    def _build_writer(self, output):
+        return csv.writer(output, quoting=csv.QUOTE_ALL, delimiter=self.delimiter)
+
+    def _build_filename(self, filename):
+        return f'{slugify(filename)}.csv'
+
+    def build_streaming_response(self, rows, filename, user):
+        writerow = self._build_writer(_Echo()).writerow
+        response = StreamingHttpResponse(
+            (writerow(row) for row in rows), content_type='text/csv',
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="{self._build_filename(filename)}"'
+        )
+
+        return response
+
+    def write_file(self, rows, filename, user):
+        name = self._build_filename(filename)
+        path = FileCreator(
+            dir_path=join(settings.MEDIA_ROOT, *self.dir_parts), name=name,
+        ).create()
+
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            self._build_writer(f).writerows(rows)
+
+        return FileRef.objects.create(
+            user=user,
+            basename=name,
+            filedata='{}/{}'.format('/'.join(self.dir_parts), basename(path)),
+            description=gettext('Mass export'),
         )
 
     def writerow(self, row):
         return self.writer.writerow(row)
 
     def save(self, filename, user):
-        self.response['Content-Disposition'] = f'attachment; filename="{slugify(filename)}.csv"'
+        self.response['Content-Disposition'] = (
+            f'attachment; filename="{self._build_filename(filename)}"'
+        )
 
 
 class SemiCSVExportBackend(CSVExportBackend):
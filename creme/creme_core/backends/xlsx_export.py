@@ -39,7 +39,11 @@ class XLSXExportBackend(ExportBackend):
     def __init__(self):
         super().__init__()
         self.dir_path = join(settings.MEDIA_ROOT, *self.dir_parts)
-        self._workbook = Workbook()
+        # NB: the write-only mode writes the rows in a temporary file as soon as
+        #     they are appended, so the memory usage does not grow with the
+        #     number of rows.
+        self._workbook = wb = Workbook(write_only=True)
+        self._sheet = wb.create_sheet()
 
     def save(self, filename, user):
         name = f'{slugify(filename)}.{self.id}'
@@ -53,8 +57,9 @@ class XLSXExportBackend(ExportBackend):
             ),
             description=gettext('Mass export'),  # TODO: possibility to pass the name?
         )
+        self.fileref = fileref
         self.response = HttpResponseRedirect(fileref.get_download_absolute_url())
         self._workbook.save(path)
 
     def writerow(self, row):
-        self._workbook.active.append(row)
+        self._sheet.append(row)
@@ -25,7 +25,7 @@ from django.contrib.contenttypes.models import ContentType
 from django.db.models import Model, Q
 from django.utils.translation import gettext_lazy as _
 
-from .core import notification
+from .core import instrumentation, notification
 from .core.entity_cell import EntityCellCustomField
 from .creme_jobs.base import JobType
 from .gui import button_menu, statistics
@@ -35,6 +35,7 @@ from .models import (
     ButtonMenuItem,
     CremeEntity,
     CremeProperty,
+    CremePropertyType,
     CustomField,
     Imprint,
     Job,
@@ -135,6 +136,9 @@ class ButtonsBrick(Brick):
 class PropertiesBrick(QuerysetBrick):
     id = QuerysetBrick.generate_id('creme_core', 'properties')
     dependencies = (CremeProperty,)
+    cache_html = True
+    cache_dependencies = (CremePropertyType,)
+    independent = True
     verbose_name = _('Properties')
     description = _(
         'Displays the Properties attached to the current entity. '
@@ -258,10 +262,15 @@ class RelationsBrick(QuerysetBrick):
         if excluded_rtype_ids:
             relations = relations.exclude(type__in=excluded_rtype_ids)
 
-        return self._render(self.get_template_context(
+        btc = self.get_template_context(
             context, relations,
             excluded_rtype_ids=excluded_rtype_ids,
-        ))
+        )
+        context['user'].get_perms_map(
+            relation.real_object for relation in btc['page'].object_list
+        )
+
+        return self._render(btc)
 
 
 # class CustomFieldsBrick(SimpleBrick):
@@ -309,6 +318,11 @@ class HistoryBrick(QuerysetBrick):
     read_only = True
     order_by = '-id'  # faster than '-date'
     template_name = 'creme_core/bricks/history.html'
+    independent = True
+
+    # NB: the history can be very large (home page)
+    seek_pagination = True
+    max_count = 1000
 
     history_registry = html_history_registry
 
@@ -339,6 +353,8 @@ class HistoryBrick(QuerysetBrick):
 
     @staticmethod
     def _populate_perms(hlines, user):
+        user.get_perms_map(hline.entity for hline in hlines if hline.entity is not None)
+
         for hline in hlines:
             # NB: we cannot know the owner of the entity if it has been deleted.
             #     So its representation (line.entity_repr) & its modifications
@@ -444,6 +460,9 @@ class ImprintsBrick(QuerysetBrick):
     read_only = True
     order_by = '-id'  # faster than '-date'
     template_name = 'creme_core/bricks/imprints.html'
+    independent = True
+    seek_pagination = True
+    max_count = 1000
 
     # def detailview_display(self, context):
     #     can_view = context['user'].is_superuser
@@ -495,7 +514,9 @@ class TrashBrick(QuerysetBrick):
             CremeEntity.objects.filter(is_deleted=True),
             display_header_button=settings.ENTITIES_DELETION_ALLOWED,
         )
-        CremeEntity.populate_real_entities(btc['page'].object_list)
+        entities = btc['page'].object_list
+        CremeEntity.populate_real_entities(entities)
+        context['user'].get_perms_map(entities)
 
         return self._render(btc)
 
@@ -575,6 +596,41 @@ class StatisticsBrick(Brick):
     #     return self._render(self.get_template_context(context))
 
 
+class InstrumentationBrick(Brick):
+    id = Brick.generate_id('creme_core', 'instrumentation')
+    verbose_name = _('Performance metrics')
+    description = _(
+        'Displays the slowest operations (rendering of blocks, evaluation of '
+        'function fields, compilation of filters…) measured since the start '
+        'of the server process.\n'
+        'Hint: only staff users can view this data, & the instrumentation must '
+        'be enabled by the administrator.\n'
+        'App: Core'
+    )
+    read_only = True
+    template_name = 'creme_core/bricks/instrumentation.html'
+
+    metrics_registry = instrumentation.metrics_registry
+    max_items = 20
+
+    def render(self, context):
+        # NB: the metrics are only displayed to staff users (debugging purpose).
+        return self._render(self.get_template_context(
+            context,
+            enabled=settings.INSTRUMENTATION_ENABLED,
+            metrics=[
+                {
+                    'category': category,
+                    'name': name,
+                    'count': metric.count,
+                    'duration': metric.duration * 1000 / metric.count,
+                    'queries': metric.queries / metric.count,
+                }
+                for (category, name), metric in self.metrics_registry.slowest(self.max_items)
+            ] if context['user'].is_staff else [],
+        ))
+
+
 class JobsBrick(QuerysetBrick):
     id = QuerysetBrick.generate_id('creme_core', 'jobs')
     verbose_name = _('Jobs')
@@ -582,6 +638,7 @@ class JobsBrick(QuerysetBrick):
     template_name = 'creme_core/bricks/jobs-all.html'
     configurable = False
     page_size = 50
+    seek_pagination = True
     # permission = None
 
     def _jobs_qs(self, context):
@@ -36,7 +36,7 @@ from ..gui.actions import ActionRegistry
 from ..gui.view_tag import ViewTag
 from ..models import CremeEntity, CustomField, FieldsConfig, RelationType
 from ..models import fields as core_fields
-from ..utils.collections import ClassKeyedMap
+from ..utils.collections import ClassKeyedMap, OrderedSet
 from ..utils.db import populate_related
 from ..utils.html import render_limited_list
 from ..utils.meta import FieldInfo
@@ -48,6 +48,7 @@ from .function_field import (
     FunctionFieldResultsList,
     function_field_registry,
 )
+from .instrumentation import measure
 
 # TODO: rename EntityCell to [Model]Cell ?
 #       rename 'entity' argument to 'instance'.
@@ -77,6 +78,130 @@ FIELDS_DATA_TYPES = ClassKeyedMap([
 ])
 
 
+class PrefetchPlan:
+    """Data to retrieve for a group of entities, in order to render some cells
+    (e.g. the columns of a list-view, the cells of a custom brick) without
+    performing queries for each entity.
+
+    The needs of all the cells are merged, so each kind of data is retrieved
+    once (e.g. the Relations needed by the relationships-cells & the function
+    fields are retrieved with one query ; the ForeignKeys of all the regular
+    fields are retrieved with one query per related model).
+
+    Usage:
+        plan = PrefetchPlan.build(cells)
+        plan.execute(entities, user)
+
+    The cells which cannot be prefetched (i.e. they perform queries for each
+    entity) are logged (once per process).
+    """
+    # Keys (model, cell's key) of the cells which have been logged
+    _logged_per_row_cells: set[tuple[type[Model], str]] = set()
+
+    def __init__(self) -> None:
+        self.field_names: OrderedSet[str] = OrderedSet()
+        self.custom_fields: dict[int, CustomField] = {}
+        self.relation_type_ids: OrderedSet[str] = OrderedSet()
+        self.properties = False
+        self.function_fields: list[FunctionField] = []
+        # Cells which have no specific support (see EntityCell.add_to_prefetch_plan())
+        self.cell_groups: DefaultDict[type[EntityCell], list[EntityCell]] = defaultdict(list)
+        self.per_row_cells: list[EntityCell] = []
+
+    @classmethod
+    def build(cls, cells: Iterable[EntityCell]) -> PrefetchPlan:
+        plan = cls()
+
+        for cell in cells:
+            cell.add_to_prefetch_plan(plan)
+
+        return plan
+
+    def add_fields(self, *field_names: str) -> PrefetchPlan:
+        """Add the names of fields (e.g. "image__categories"); the ForeignKeys
+        (& the first level of ManyToManyFields) are retrieved.
+        """
+        self.field_names |= field_names
+        return self
+
+    def add_custom_fields(self, *custom_fields: CustomField) -> PrefetchPlan:
+        for cfield in custom_fields:
+            self.custom_fields[cfield.id] = cfield
+
+        return self
+
+    def add_relation_types(self, *rtype_ids: str) -> PrefetchPlan:
+        "The Relations (with these types) & the related entities are retrieved."
+        self.relation_type_ids |= rtype_ids
+        return self
+
+    def add_properties(self) -> PrefetchPlan:
+        self.properties = True
+        return self
+
+    def add_function_field(self, func_field: FunctionField) -> PrefetchPlan:
+        """The method 'populate_entities()' of the function field is called
+        (or its bulk evaluator if the method is not overridden).
+        """
+        if all(ffield.name != func_field.name for ffield in self.function_fields):
+            self.function_fields.append(func_field)
+
+        return self
+
+    def add_cell(self, cell: EntityCell) -> PrefetchPlan:
+        "The static method 'populate_entities()' of the cell's class is called."
+        self.cell_groups[type(cell)].append(cell)
+        return self
+
+    def add_per_row_cell(self, cell: EntityCell) -> PrefetchPlan:
+        "Declare a cell which performs queries for each rendered entity."
+        self.per_row_cells.append(cell)
+
+        log_key = (cell.model, cell.key)
+        logged = self._logged_per_row_cells
+        if log_key not in logged:
+            logged.add(log_key)
+            logger.warning(
+                'PrefetchPlan: the cell "%s" (model=%s) cannot be prefetched; '
+                'queries are performed for each rendered entity.',
+                cell.key, cell.model.__name__,
+            )
+
+        return self
+
+    def execute(self, entities: Collection[CremeEntity], user) -> None:
+        """Fill the caches of the entities.
+        @param entities: Instances of CremeEntities (or subclass), with the same model.
+        @param user: Instance of <contrib.auth.get_user_model()>.
+        """
+        if not entities:
+            return
+
+        if self.field_names:
+            populate_related(entities, [*self.field_names])
+
+        if self.custom_fields:
+            CremeEntity.populate_custom_values(entities, [*self.custom_fields.values()])
+
+        if self.relation_type_ids:
+            CremeEntity.populate_relations(entities, [*self.relation_type_ids])
+
+        if self.properties:
+            CremeEntity.populate_properties(entities)
+
+        for func_field in self.function_fields:
+            with measure('function_field', func_field.name):
+                # NB: the default implementation of populate_entities() would
+                #     retrieve again the data declared by "prefetch_*".
+                if type(func_field).populate_entities is FunctionField.populate_entities:
+                    func_field.evaluate_entities(entities, user)
+                else:
+                    func_field.populate_entities(entities, user)
+
+        for cell_cls, cells in self.cell_groups.items():
+            cell_cls.populate_entities(cells, entities, user)
+
+
 class EntityCell:
     """Represents a value accessor; it's a kind of super field. It can
     retrieve a value stored in entities (of the same type).
@@ -206,19 +331,21 @@ class EntityCell:
                                 ) -> None:
         """Fill caches of CremeEntity objects with grouped SQL queries, & so
         avoid multiple queries when rendering the cells.
-        The given cells are grouped by types, and then the method
-        'populate_entities()' of each used type is called.
+        The needs of the given cells are merged (see PrefetchPlan).
         @param cells: Instances of (subclasses of) EntityCell.
         @param entities: Instances of CremeEntities (or subclass).
         @param user: Instance of <contrib.auth.get_user_model()>.
         """
-        cell_groups: DefaultDict[type[EntityCell], list[EntityCell]] = defaultdict(list)
-
-        for cell in cells:
-            cell_groups[cell.__class__].append(cell)
+        PrefetchPlan.build(cells).execute(entities, user)
 
-        for cell_cls, cell_group in cell_groups.items():
-            cell_cls.populate_entities(cell_group, entities, user)
+    def add_to_prefetch_plan(self, plan: PrefetchPlan) -> None:
+        """Declare the data needed to render this cell for several entities
+        without additional queries ; see PrefetchPlan.
+        The default implementation uses the static method 'populate_entities()'
+        of the class (if it's overridden).
+        """
+        if type(self).populate_entities is not EntityCell.populate_entities:
+            plan.add_cell(self)
 
     @staticmethod
     def populate_entities(cells: Iterable[EntityCell],
@@ -520,6 +647,16 @@ class EntityCellRegularField(EntityCell):
     def populate_entities(cells, entities, user):
         populate_related(entities, [cell.value for cell in cells])
 
+    def add_to_prefetch_plan(self, plan):
+        # NB: the ForeignKeys are retrieved, but populate_related() only
+        #     manages the ManyToManyFields of first level.
+        plan.add_fields(self.value)
+
+        if any(
+            isinstance(field, models.ManyToManyField) for field in self._field_info[1:]
+        ):
+            plan.add_per_row_cell(self)
+
     def render(self, entity, user, tag):
         printer = self._printers.get(tag)
 
@@ -679,6 +816,9 @@ class EntityCellCustomField(EntityCell):
             [cell.custom_field for cell in cells],
         )  # NB: not itervalues()
 
+    def add_to_prefetch_plan(self, plan):
+        plan.add_custom_fields(self.custom_field)
+
     @property
     def description(self):
         return self._customfield.description
@@ -748,10 +888,32 @@ class EntityCellFunctionField(EntityCell):
     @staticmethod
     def populate_entities(cells, entities, user):
         for cell in cells:
-            cell.function_field.populate_entities(entities, user)
+            func_field = cell.function_field
+
+            with measure('function_field', func_field.name):
+                func_field.populate_entities(entities, user)
+
+    def add_to_prefetch_plan(self, plan):
+        func_field = self.function_field
+        plan.add_fields(*func_field.prefetch_fields)
+        plan.add_relation_types(*func_field.prefetch_relation_types)
+
+        if func_field.prefetch_properties:
+            plan.add_properties()
+
+        if (
+            func_field.has_bulk_evaluator
+            or type(func_field).populate_entities is not FunctionField.populate_entities
+        ):
+            plan.add_function_field(func_field)
+        elif func_field.per_entity_queries:
+            plan.add_per_row_cell(self)
 
     def render(self, entity, user, tag):
-        return self.function_field(entity, user).render(tag)
+        func_field = self.function_field
+
+        with measure('function_field', func_field.name):
+            return func_field(entity, user).render(tag)
 
     @cached_property
     def title(self):
@@ -816,6 +978,9 @@ class EntityCellRelation(EntityCell):
             [cell.relation_type.id for cell in cells]
         )
 
+    def add_to_prefetch_plan(self, plan):
+        plan.add_relation_types(self.relation_type.id)
+
     def render(self, entity, user, tag):
         if tag in {ViewTag.HTML_DETAIL, ViewTag.HTML_LIST, ViewTag.HTML_FORM}:
             from ..templatetags.creme_widgets import widget_entity_hyperlink
@@ -19,6 +19,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from datetime import datetime
 from decimal import Decimal
 from functools import partial
@@ -93,6 +94,11 @@ class FilterConditionHandler:
     class ValueError(Exception):
         pass
 
+    # <True> means the Q instances built by get_q() contain sub-queries which
+    # retrieve IDs, & which can be replaced by the list of IDs (see the setting
+    # FILTERS_MATERIALIZED_IDS_MAX).
+    materializable: bool = False
+
     _model: type[CremeEntity]
     _subfilter: EntityFilter | None | bool
 
@@ -128,6 +134,14 @@ class FilterConditionHandler:
         """
         raise NotImplementedError
 
+    def populate(self, *, entities: Sequence[CremeEntity], user) -> None:
+        """Retrieve with a few queries the data used by accept() for several
+        entities (e.g. their relationships), in order to avoid some queries
+        per entity.
+        Override me.
+        """
+        pass
+
     @property
     def applicable_on_entity_base(self) -> bool:
         """Can this handler be applied on CremeEntity (QuerySet or simple instance)?
@@ -1008,6 +1022,7 @@ class CustomFieldConditionHandler(OperatorConditionHandlerMixin,
     """
     # type_id = 20
     type_id = 'custom_field'
+    materializable = True
 
     def __init__(self, *,
                  efilter_type,
@@ -1031,6 +1046,11 @@ class CustomFieldConditionHandler(OperatorConditionHandlerMixin,
         self._values = values
         self._verbose_values = None  # Cache for values in description()
 
+    def populate(self, *, entities, user):
+        cfield = self.custom_field
+        if cfield:
+            CremeEntity.populate_custom_values(entities, [cfield])
+
     def accept(self, *, entity, user):
         operator = self.get_operator(self._operator_id)
         values = self._values
@@ -1314,6 +1334,7 @@ class DateCustomFieldConditionHandler(DateFieldHandlerMixin,
     """Filter entities by using one of their date CustomFields."""
     # type_id = 21
     type_id = 'custom_date'
+    materializable = True
 
     def __init__(self, *,
                  efilter_type, model=None,
@@ -1334,6 +1355,11 @@ class DateCustomFieldConditionHandler(DateFieldHandlerMixin,
         )
         DateFieldHandlerMixin.__init__(self, **kwargs)
 
+    def populate(self, *, entities, user):
+        cfield = self.custom_field
+        if cfield:
+            CremeEntity.populate_custom_values(entities, [cfield])
+
     def accept(self, *, entity, user):
         cfvalue = entity.get_custom_value(self.custom_field)
 
@@ -1513,10 +1539,14 @@ class RelationConditionHandler(BaseRelationConditionHandler):
             self._entity = None
             self._ct_key = ctype.natural_key() if isinstance(ctype, ContentType) else ctype
 
+    def populate(self, *, entities, user):
+        # NB: accept() does not use the real object entities
+        CremeEntity.populate_relations(entities, [self._rtype_id], real_obj_entities=False)
+
     def accept(self, *, entity, user):
         # NB: we use get_relations() in order to get a cached result, & so avoid
-        #     additional queries when calling several times this method.
-        # TODO: add a system to populate relations when checking several entities
+        #     additional queries when calling several times this method
+        #     (see populate() too).
         relations = entity.get_relations(relation_type_id=self._rtype_id)
 
         if self._entity_uuid:
@@ -1725,6 +1755,7 @@ class RelationSubFilterConditionHandler(BaseRelationConditionHandler):
     """
     # type_id = 11
     type_id = 'related_subfilter'
+    materializable = True
 
     # NB: True == exclude
     DESCRIPTION_FORMATS = {
@@ -1916,11 +1947,14 @@ class PropertyConditionHandler(FilterConditionHandler):
 
         self._exclude = exclude
 
+    def populate(self, *, entities, user):
+        CremeEntity.populate_properties(entities)
+
     def accept(self, *, entity, user):
         ptype_uuid = self._ptype_uuid
         # NB: we use get_properties() in order to get a cached result, & so avoid
-        #     additional queries when calling several times this method.
-        # TODO: add a system to populate properties when checking several entities
+        #     additional queries when calling several times this method
+        #     (see populate() too).
         accepted = any(prop.type.uuid == ptype_uuid for prop in entity.get_properties())
 
         return not accepted if self._exclude else accepted
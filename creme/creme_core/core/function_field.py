@@ -18,7 +18,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Iterator
+from collections.abc import Iterable, Iterator, Sequence
 from typing import TYPE_CHECKING, Self
 
 from django.conf import settings
@@ -29,10 +29,12 @@ from django.utils.html import escape, format_html
 from ..gui.view_tag import ViewTag
 from ..utils.collections import InheritedDataChain
 from ..utils.html import render_limited_list
+from .shared_cache import shared_cache
 
 if TYPE_CHECKING:
     from ..forms.listview import ListViewSearchField
     from ..gui.listview.search import AbstractListViewSearchFieldRegistry
+    from ..models import CremeEntity
     from .sorter import AbstractCellSorter
 
 
@@ -145,15 +147,124 @@ class FunctionField:
     # <None> means no sorting.
     sorter_class: type[AbstractCellSorter] | None = None
 
+    # Data retrieved for all the entities before they are rendered (list-views,
+    # custom bricks...) ; the needs of the different cells are merged (see
+    # 'creme_core.core.entity_cell.PrefetchPlan').
+    #  - Names of fields (ForeignKeys, ManyToManyFields), like "user__role".
+    prefetch_fields: Sequence[str] = ()
+    #  - IDs of RelationTypes (the Relations & the related entities are retrieved).
+    prefetch_relation_types: Sequence[str] = ()
+    #  - The CremeProperties of the entities.
+    prefetch_properties: bool = False
+
+    # <False> means that no query is performed to compute the value of an
+    # entity, once the data declared above have been retrieved.
+    # If it's <True> & the method populate_entities() is not overridden (& there
+    # is no bulk evaluator), the prefetch-plan logs a warning.
+    per_entity_queries: bool = True
+
+    # The results computed by bulk_evaluate() are cached by the instance of
+    # FunctionField (per user). If "results_cache_ttl" is not 0, they are stored in the shared
+    # cache too (see 'creme_core.core.shared_cache') during this number of
+    # seconds ; they are invalidated when an instance of one of the models
+    # "results_cache_models" (classes or labels like "app_label.ModelName")
+    # is saved/deleted (these models are registered by FunctionFieldRegistry).
+    results_cache_ttl: int = 0
+    results_cache_models: Sequence[type[Model] | str] = ()
+
     def __call__(self, entity, user) -> FunctionFieldResult:
         """"@return An instance of FunctionFieldResult object
         (so you can call render() on the result).
         """
+        if self.has_bulk_evaluator:
+            return self.evaluate_entities([entity], user)[entity.id]
+
         return self.result_type(getattr(entity, self.name)())
 
+    @property
+    def has_bulk_evaluator(self) -> bool:
+        return type(self).bulk_evaluate is not FunctionField.bulk_evaluate
+
+    def bulk_evaluate(self,
+                      entities: Sequence[CremeEntity],
+                      user,
+                      ) -> dict[int, FunctionFieldResult]:
+        """Compute the results of several entities with a few queries.
+        Override this method to give a bulk evaluator to your FunctionField ;
+        it's used by __call__() & populate_entities() (through evaluate_entities(),
+        which manages the cache of results).
+        @param entities: Instances of CremeEntity.
+        @param user: Instance of <contrib.auth.get_user_model()>.
+        @return: A dictionary {entity_id: result} ; all the entities must be present.
+        """
+        raise NotImplementedError
+
+    def evaluate_entities(self,
+                          entities: Iterable[CremeEntity],
+                          user,
+                          ) -> dict[int, FunctionFieldResult]:
+        """Get the results of several entities with the bulk evaluator ; the
+        results which are already cached are not computed again.
+        @param entities: Instances of CremeEntity.
+        @param user: Instance of <contrib.auth.get_user_model()>.
+        @return: A dictionary {entity_id: result}.
+        """
+        entities = {entity.id: entity for entity in entities}
+        # NB: the cache is stored in the instance (like the caches of the
+        #     cells' data), so a fresh FunctionField computes fresh results.
+        cached_results = self.__dict__.setdefault(
+            '_results_cache', {},
+        ).setdefault(user.id, {})
+        missing = [
+            entity for entity_id, entity in entities.items()
+            if entity_id not in cached_results
+        ]
+
+        if missing:
+            if self.results_cache_ttl and shared_cache.enabled:
+                key_fmt = f'function_field-{self.name}-{user.id}-{{}}'.format
+                missing_per_key = {key_fmt(entity.id): entity for entity in missing}
+                bulk_evaluate = self.bulk_evaluate
+
+                def compute(keys):
+                    results = bulk_evaluate([missing_per_key[key] for key in keys], user)
+                    return {key: results[missing_per_key[key].id] for key in keys}
+
+                cached_results.update(
+                    (missing_per_key[key].id, result)
+                    for key, result in shared_cache.get_many_or_compute(
+                        keys=missing_per_key.keys(),
+                        models=self.results_cache_models,
+                        compute=compute,
+                        timeout=self.results_cache_ttl,
+                    ).items()
+                )
+            else:
+                cached_results.update(self.bulk_evaluate(missing, user))
+
+        return {entity_id: cached_results[entity_id] for entity_id in entities}
+
     def populate_entities(self, entities, user):
-        """Optimisation used for list-views ; see HeaderFilter."""
-        pass
+        """Optimisation used for list-views ; see HeaderFilter.
+        The default implementation retrieves the data declared by the
+        attributes "prefetch_*", & computes the results with the bulk evaluator
+        (if the FunctionField has one).
+        """
+        from ..models import CremeEntity
+        from ..utils.db import populate_related
+
+        if entities:
+            if self.prefetch_fields:
+                populate_related(entities, self.prefetch_fields)
+
+            if self.prefetch_relation_types:
+                CremeEntity.populate_relations(entities, self.prefetch_relation_types)
+
+            if self.prefetch_properties:
+                CremeEntity.populate_properties(entities)
+
+            if self.has_bulk_evaluator:
+                self.evaluate_entities(entities, user)
 
 
 class FunctionFieldResultsList(FunctionFieldResult):
@@ -242,6 +353,9 @@ class FunctionFieldRegistry:
                     f"Duplicated FunctionField's name: {ff_cls.name}"
                 )
 
+            if ff_cls.results_cache_ttl:
+                shared_cache.register(*ff_cls.results_cache_models)
+
         return self
 
     # TODO: accept FunctionField names too ?
@@ -18,8 +18,15 @@
 
 from contextlib import ContextDecorator
 
+from django.db import connection
+
 from ..global_info import get_per_request_cache
-from ..models.history import HISTORY_ENABLED_CACHE_KEY, is_history_enabled
+from ..models.history import (
+    HISTORY_BUFFER_CACHE_KEY,
+    HISTORY_ENABLED_CACHE_KEY,
+    HistoryLineBuffer,
+    is_history_enabled,
+)
 
 
 def do_toggle_history(*, enabled: bool) -> None:
@@ -63,3 +70,55 @@ class toggle_history(ContextDecorator):
         do_toggle_history(enabled=self.initial)
 
         return False  # Exceptions are not captured
+
+
+class buffered_history(ContextDecorator):
+    """ Decorator and context manager which collects the new lines of history,
+    & inserts them with a few queries (bulk insertion) at the exit of the block.
+    It's useful when many entities are created/modified (e.g. mass import).
+
+    Usages:
+
+    @atomic
+    @buffered_history()
+    def do_something():
+        do()
+
+    or
+
+    with atomic(), buffered_history():
+        do_something()
+
+    Notice that:
+      - the block should be in a transaction, so the lines are inserted with
+        the entities (if an exception is raised, the buffered lines are dropped).
+      - the lines related to Relations are not buffered (their ID is needed).
+      - nothing is buffered if the DB backend cannot retrieve the IDs of the
+        instances created by a bulk insertion (e.g. MySQL) ; the lines are
+        saved one by one as usual.
+      - nested blocks use the buffer of the outer block.
+    """
+    def __enter__(self):
+        cache = get_per_request_cache()
+        self.buffer = None
+
+        if (
+            HISTORY_BUFFER_CACHE_KEY not in cache
+            and connection.features.can_return_rows_from_bulk_insert
+        ):
+            self.buffer = cache[HISTORY_BUFFER_CACHE_KEY] = HistoryLineBuffer()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        buffer = self.buffer
+
+        if buffer is not None:
+            get_per_request_cache().pop(HISTORY_BUFFER_CACHE_KEY, None)
+
+            if exc_type is None:
+                buffer.flush()
+            else:
+                buffer.clear()
+
+        return False  # Exceptions are not captured
@@ -0,0 +1,247 @@
+################################################################################
+#    Creme is a free/open-source Customer Relationship Management software
+#    Copyright (C) 2026  Hybird
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+
+"""Instrumentation of the expensive operations (rendering of bricks,
+evaluation of function fields, compilation of filters, execution of Workflows).
+
+When the setting "INSTRUMENTATION_ENABLED" is True, the middleware
+'creme_core.middleware.instrumentation.InstrumentationMiddleware' creates a
+Recorder for each request ; for each measured operation, the recorder collects
+the wall time, & the number/duration of the SQL queries. The metrics are:
+  - sent in the HTTP header "Server-Timing" (see the developer tools of your
+    browser).
+  - aggregated for the current process (see 'metrics_registry'), & exposed in
+    the text format of Prometheus by the view "creme_core__instrumentation_metrics"
+    & by the brick 'creme_core.bricks.InstrumentationBrick' (staff users only).
+
+Notice that:
+  - the measures are inclusive (e.g. the duration of a brick contains the
+    durations of the function fields it renders).
+  - only the queries performed by the thread of the request (with the default
+    DataBase) are counted.
+  - when there is no recorder (instrumentation disabled, jobs...), measure()
+    just costs a look-up in the per-request cache.
+
+Usage:
+    from creme.creme_core.core.instrumentation import measure
+
+    with measure('my_category', 'my_operation'):
+        [...]
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from threading import Lock
+from time import perf_counter
+
+from ..global_info import get_per_request_cache
+
+
+class Metric:
+    "Counters related to an operation."
+    __slots__ = ('count', 'duration', 'queries', 'queries_duration')
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0  # In seconds
+        self.queries = 0
+        self.queries_duration = 0.0  # In seconds
+
+    def __repr__(self):
+        return (
+            f'Metric(count={self.count}, duration={self.duration}, '
+            f'queries={self.queries}, queries_duration={self.queries_duration})'
+        )
+
+    def add(self, *,
+            count: int = 1,
+            duration: float,
+            queries: int = 0,
+            queries_duration: float = 0.0,
+            ) -> None:
+        self.count += count
+        self.duration += duration
+        self.queries += queries
+        self.queries_duration += queries_duration
+
+    def merge(self, other: Metric) -> None:
+        self.add(
+            count=other.count,
+            duration=other.duration,
+            queries=other.queries,
+            queries_duration=other.queries_duration,
+        )
+
+
+class Recorder:
+    """Collect the metrics of the operations performed during a request."""
+    request_cache_key = 'creme_core-instrumentation_recorder'
+
+    def __init__(self):
+        # Keys are tuples (category, name)
+        self.metrics: dict[tuple[str, str], Metric] = {}
+        self.queries = 0
+        self.queries_duration = 0.0
+        # NB: some bricks can be rendered by other threads
+        self._lock = Lock()
+
+    @classmethod
+    def get_current(cls) -> Recorder | None:
+        "Get the recorder of the current request (if it exists)."
+        return get_per_request_cache().get(cls.request_cache_key)
+
+    def install(self) -> Recorder:
+        "Use this recorder for the current request."
+        get_per_request_cache()[self.request_cache_key] = self
+        return self
+
+    def query_wrapper(self, execute, sql, params, many, context):
+        """Wrapper which counts the SQL queries.
+        Use it with 'django.db.connection.execute_wrapper()'.
+        """
+        start = perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.queries_duration += perf_counter() - start
+
+    def add(self, category: str, name: str, **kwargs) -> None:
+        "See Metric.add() for the keyword arguments."
+        with self._lock:
+            metric = self.metrics.get((category, name))
+            if metric is None:
+                self.metrics[(category, name)] = metric = Metric()
+
+            metric.add(**kwargs)
+
+    @contextmanager
+    def measure(self, category: str, name: str) -> Iterator[None]:
+        queries = self.queries
+        queries_duration = self.queries_duration
+        start = perf_counter()
+
+        try:
+            yield
+        finally:
+            self.add(
+                category, name,
+                duration=perf_counter() - start,
+                queries=self.queries - queries,
+                queries_duration=self.queries_duration - queries_duration,
+            )
+
+
+def measure(category: str, name) -> AbstractContextManager:
+    """Context manager which measures an operation, if the current request is
+    instrumented (it does nothing in the other cases).
+    @param category: Type of operation (e.g. "brick").
+    @param name: Identifier of the operation (e.g. the brick's ID) ; it is
+           converted to string.
+    """
+    recorder = Recorder.get_current()
+
+    return nullcontext() if recorder is None else recorder.measure(category, str(name))
+
+
+class MetricsRegistry:
+    """Aggregation of the metrics of all the instrumented requests (for the
+    current process).
+    """
+    # NB: see https://prometheus.io/docs/instrumenting/exposition_formats/
+    prometheus_prefix = 'creme'
+
+    def __init__(self):
+        self._metrics: dict[tuple[str, str], Metric] = {}
+        self._lock = Lock()
+
+    def add_recorder(self, recorder: Recorder, *, view_name: str, duration: float) -> None:
+        """Aggregate the metrics of a request.
+        @param recorder: Recorder of the request.
+        @param view_name: Name of the view (the metric has the category "view").
+        @param duration: Duration of the whole request, in seconds.
+        """
+        view_metric = Metric()
+        view_metric.add(
+            duration=duration,
+            queries=recorder.queries,
+            queries_duration=recorder.queries_duration,
+        )
+
+        with self._lock:
+            metrics = self._metrics
+
+            for key, metric in [*recorder.metrics.items(), (('view', view_name), view_metric)]:
+                aggregated = metrics.get(key)
+                if aggregated is None:
+                    metrics[key] = aggregated = Metric()
+
+                aggregated.merge(metric)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._metrics.clear()
+
+    def items(self) -> list[tuple[tuple[str, str], Metric]]:
+        "Items (key, metric) ordered by key."
+        with self._lock:
+            return sorted(self._metrics.items(), key=lambda item: item[0])
+
+    def slowest(self, limit: int = 20) -> list[tuple[tuple[str, str], Metric]]:
+        "Items (key, metric) ordered by descending total duration."
+        return sorted(self.items(), key=lambda item: item[1].duration, reverse=True)[:limit]
+
+    @staticmethod
+    def _escape_label(value: str) -> str:
+        return value.replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+    def to_prometheus(self) -> str:
+        "Export the metrics in the text format of Prometheus."
+        items = self.items()
+        prefix = self.prometheus_prefix
+        escape = self._escape_label
+        lines = []
+
+        for suffix, help_text, attr_name in (
+            ('calls_total', 'Number of measured operations.', 'count'),
+            ('duration_seconds_total', 'Time spent in the operations.', 'duration'),
+            ('queries_total', 'Number of SQL queries performed by the operations.', 'queries'),
+            (
+                'queries_duration_seconds_total',
+                'Time spent in the SQL queries performed by the operations.',
+                'queries_duration',
+            ),
+        ):
+            metric_name = f'{prefix}_operation_{suffix}'
+            lines.append(f'# HELP {metric_name} {help_text}')
+            lines.append(f'# TYPE {metric_name} counter')
+            lines.extend(
+                f'{metric_name}{{category="{escape(category)}",name="{escape(name)}"}} '
+                f'{getattr(metric, attr_name)}'
+                for (category, name), metric in items
+            )
+
+        lines.append('')
+
+        return '\n'.join(lines)
+
+
+metrics_registry = MetricsRegistry()
@@ -74,3 +74,13 @@ else:
             __queue = broker_cls(setting=JOBMANAGER_BROKER)
 
         return __queue
+
+
+def reset_queue():
+    """Forget the current queue instance; the next call to get_queue() will
+    build a new one.
+    It's useful in forked processes, which must not share the connection (or
+    the server socket) of their parent.
+    """
+    global __queue
+    __queue = None
@@ -17,6 +17,7 @@
 ################################################################################
 
 import logging
+import multiprocessing
 from collections import deque
 from datetime import MAXYEAR, datetime, timedelta
 from heapq import heapify, heappop, heappush
@@ -24,22 +25,55 @@ from subprocess import Popen
 from typing import Deque
 
 from django.conf import settings
+from django.db import close_old_connections, connections
 from django.db.models import Q
 from django.utils.formats import date_format
 from django.utils.timezone import localtime, make_aware, now
+from django.utils.translation import gettext
 
 from creme.creme_core.creme_jobs.base import JobType
+from creme.creme_core.global_info import clear_global_info
 from creme.creme_core.models import Job
 from creme.creme_core.utils.system import (
+    disable_exit_handler,
     enable_exit_handler,
     python_subprocess,
 )
 
-from .queue import Command, get_queue
+from .queue import Command, get_queue, reset_queue
 
 logger = logging.getLogger(__name__)
 
 
+def _run_worker(job_ids) -> None:
+    """Main loop of a process of the workers' pool (see JobScheduler).
+    @param job_ids: Inter-process queue which gives the IDs of the jobs to run;
+           <None> stops the worker. Each worker has its own queue (a worker
+           which is killed while reading a shared queue would keep its lock).
+    """
+    from . import job_type_registry
+
+    # The handler of the scheduler is inherited by the forked process (the
+    # workers are replaced while the scheduler is running); it must not be
+    # run by the workers (it stops the other workers & destroys the queue).
+    disable_exit_handler()
+
+    # The connection to the broker is not shared with the scheduler
+    # (the END commands are sent by the worker).
+    reset_queue()
+
+    for job_id in iter(job_ids.get, None):
+        close_old_connections()
+
+        try:
+            job_type_registry(job_id)
+        except Exception:
+            logger.exception('JobScheduler: error in worker with the job id="%s"', job_id)
+        finally:
+            clear_global_info()
+            close_old_connections()
+
+
 # TODO: should we rely on a watch dog?
 class JobScheduler:
     """It should run within its own process (see 'creme_job_manager' command),
@@ -53,6 +87,15 @@ class JobScheduler:
         - User jobs are executed with a pool of processes, and its size is given
           by settings.MAX_USER_JOBS.
 
+    By default, each job is run in a new Python process (so Django is set up
+    for each job). If settings.JOB_MANAGER_WORKERS (or the argument "workers")
+    is not 0, a pool of workers is forked at starting; the user jobs are sent
+    to these warm processes, which avoids the cost of the setup for each job.
+    System jobs are still run in their own process, like the user jobs when
+    all the workers are busy.
+    The workers are supervised: a dead worker (e.g. killed by the OOM killer)
+    is replaced, & the job it was running is marked as failed.
+
     If the execution of a (pseudo-)periodic Job takes too long time (more than
     its period), the Job is scheduled to the next valid time, and not executed
     immediately (see _next_wakeup()).
@@ -89,11 +132,49 @@ class JobScheduler:
         def reaches_trials_limit(self) -> bool:
             return self.trials >= 100
 
-    def __init__(self) -> None:
-        self._max_user_jobs = settings.MAX_USER_JOBS
+    class _Worker:
+        """Process of the pool of workers (see _run_worker()); the scheduler
+        keeps the ID of the job it's running, & so knows which job has failed
+        if the process dies.
+        """
+        job_id: int | None
+
+        def __init__(self, context):
+            self.job_id = None
+            self.job_ids = job_ids = context.SimpleQueue()
+            self.process = process = context.Process(target=_run_worker, args=(job_ids,))
+
+            # NB: the forked processes must not share the connections of the parent
+            connections.close_all()
+            process.start()
+
+        def run(self, job_id: int) -> None:
+            self.job_id = job_id
+            self.job_ids.put(job_id)
+
+        def stop(self) -> None:
+            self.job_ids.put(None)
+
+    # Maximum duration (in seconds) between 2 checks of the workers
+    workers_check_period = 10
+
+    def __init__(self, workers: int | None = None) -> None:
+        """Constructor.
+        @param workers: Size of the pool of workers used to run the user jobs;
+               0 means "no pool" (one process per job). <None> means that
+               settings.JOB_MANAGER_WORKERS is used. The size is bounded by
+               settings.MAX_USER_JOBS.
+        """
+        self._max_user_jobs = max_user_jobs = settings.MAX_USER_JOBS
         self._queue = get_queue()
         self._procs: dict[int, Popen] = {}  # keys are Job IDs
 
+        if workers is None:
+            workers = settings.JOB_MANAGER_WORKERS
+        self._workers_count = min(max(workers, 0), max_user_jobs)
+        self._workers: list[JobScheduler._Worker] = []
+        self._workers_context = None
+
         # Heap, which elements are (wakeup_date, job_instance)
         #   => closer wakeup in the first element.
         # NB: "int" is Job ID
@@ -185,9 +266,77 @@ class JobScheduler:
                 user_job,
             )
 
+    def _start_workers(self) -> None:
+        count = self._workers_count
+        if not count:
+            return
+
+        try:
+            context = multiprocessing.get_context('fork')
+        except ValueError:
+            logger.warning(
+                'JobScheduler: the start method "fork" is not available on '
+                'your platform -> the pool of workers is disabled.'
+            )
+            return
+
+        self._workers_context = context
+        self._workers.extend(self._Worker(context) for __ in range(count))
+
+        logger.info('JobScheduler: %d worker(s) started', count)
+
+    def _check_workers(self) -> None:
+        "Replace the dead workers; the jobs they were running are marked as failed."
+        workers = self._workers
+
+        for i, worker in enumerate(workers):
+            process = worker.process
+            if process.is_alive():
+                continue
+
+            job_id = worker.job_id
+            logger.critical(
+                'JobScheduler: the worker pid=%s has died (exit code: %s) '
+                'while running the job id="%s" -> a new worker is started.',
+                process.pid, process.exitcode, job_id,
+            )
+
+            if job_id is not None:
+                self._running_userjob_ids.discard(job_id)
+                # NB: the job could have finished just before the worker's death
+                Job.objects.filter(id=job_id, status=Job.STATUS_WAIT).update(
+                    status=Job.STATUS_ERROR,
+                    error=gettext(
+                        'The process running the job has died (exit code: {code}).'
+                    ).format(code=process.exitcode),
+                )
+
+            workers[i] = self._Worker(self._workers_context)
+
+    def _stop_workers(self) -> None:
+        workers = self._workers
+        if not workers:
+            return
+
+        for worker in workers:
+            worker.stop()
+
+        # NB: the running jobs are finished before the workers stop
+        for worker in workers:
+            worker.process.join()
+
+        workers.clear()
+        self._workers_context = None
+
     def _start_job(self, job: Job):
         logger.info('JobScheduler: start %r', job)
 
+        if job.user:
+            for worker in self._workers:
+                if worker.job_id is None:
+                    worker.run(job.id)
+                    return
+
         self._procs[job.id] = python_subprocess(
             f'import django; '
             f'django.setup(); '
@@ -197,13 +346,23 @@ class JobScheduler:
 
     def _end_job(self, job: Job):
         logger.info('JobScheduler: end %r', job)
+
+        for worker in self._workers:
+            if worker.job_id == job.id:
+                worker.job_id = None
+                break
+
         proc = self._procs.pop(job.id, None)
         if proc is not None:
             proc.wait()  # TODO: use return code ??
 
     def _handle_kill(self, *args):
-        logger.info('Job manager stops: %d running job(s)', len(self._procs))
+        logger.info(
+            'Job manager stops: %d running job(s), %d worker(s)',
+            len(self._procs), len(self._workers),
+        )
         self._queue.destroy()
+        self._stop_workers()
         exit()
 
     def _handle_command_end(self, cmd: Command):
@@ -371,7 +530,11 @@ class JobScheduler:
         # TODO: all of this in a function wrapped by a try..except and a loop (+ sleep)
         #       which prevents network crashes ?
         # TODO: regularly use Popen.poll() to check if a child has crashed
-        #       (with a problem which is not a catchable) ?
+        #       (with a problem which is not a catchable) ? (it's done for the
+        #       workers, see _check_workers())
+        # NB: the workers are forked before the queue is served, so they do
+        #     not inherit the server's resources.
+        self._start_workers()
         self._queue.clear()
         self._retrieve_jobs()
 
@@ -412,9 +575,13 @@ class JobScheduler:
             else:
                 print('No user job at the moment.')
 
+            if self._workers:
+                print(f'Pool of workers for user jobs: {len(self._workers)} process(es).')
+
             print('\nQuit the server with CTRL-BREAK.')
 
         MAX_USER_JOBS = self._max_user_jobs
+        workers_check_period = self.workers_check_period
         get_handler = {
             Command.END:     self._handle_command_end,
             Command.PING:    self._handle_command_ping,
@@ -467,6 +634,10 @@ class JobScheduler:
                 # -- user-jobs are not periodic)
                 timeout = 0
 
+            if self._workers:
+                self._check_workers()
+                timeout = min(timeout or workers_check_period, workers_check_period)
+
             while len(running_userjob_ids) <= MAX_USER_JOBS and users_jobs:
                 job = users_jobs.pop()
                 self._start_job(job)
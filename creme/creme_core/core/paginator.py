@@ -30,11 +30,13 @@ from datetime import date, datetime
 from decimal import Decimal
 # from functools import lru_cache
 from functools import cache
+from json import loads as json_load
 from math import ceil
 
 from django.core.exceptions import ValidationError
-from django.core.paginator import InvalidPage
+from django.core.paginator import InvalidPage, Paginator
 from django.db.models import Model, Q, QuerySet
+from django.utils.functional import cached_property
 
 from creme.creme_core.utils.dates import DATE_ISO8601_FMT, DATETIME_ISO8601_FMT
 from creme.creme_core.utils.db import get_stable_ordering, populate_related
@@ -54,6 +56,91 @@ class LastPage(InvalidPage):
     pass
 
 
+# Counting ---------------------------------------------------------------------
+def count_objects(objects: QuerySet | Sequence, max_count: int | None = None) -> tuple[int, bool]:
+    """Count the objects, with an optional limit to avoid a full "COUNT(*)"
+    on huge tables.
+    @param objects: QuerySet or sequence.
+    @param max_count: Maximum number of objects which are counted (must be > 0);
+           <None> means no limit.
+    @return A tuple (count, estimated). When "estimated" is True, there are more
+            than "max_count" objects, & "count" is equal to "max_count".
+    """
+    if not isinstance(objects, QuerySet):
+        count = len(objects)
+    elif max_count is None:
+        count = objects.count()
+    else:
+        # NB: the slice is performed in a sub-query, so the DB stops counting
+        #     after "max_count + 1" rows.
+        count = objects[:max_count + 1].count()
+
+    if max_count is not None and count > max_count:
+        return max_count, True
+
+    return count, False
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator (with page numbers, like the one of Django) which does not
+    count all the objects when there are more than a given number of them.
+    In this case, the count (& so the number of pages) is only an estimation,
+    & the objects after the limit cannot be reached (excepted the ones which
+    complete the last page; this page is not cut at the limit).
+
+    Hint: use FlowPaginator when all the objects of a huge QuerySet must be
+          reachable (the pages far from the beginning are retrieved quickly too).
+    """
+    def __init__(self, object_list, per_page, *, max_count: int, **kwargs):
+        """Constructor.
+        @param object_list: QuerySet or sequence.
+        @param per_page: Maximum number of objects on each page.
+        @param max_count: Maximum number of objects which are counted.
+        @param kwargs: See django.core.paginator.Paginator.
+        """
+        super().__init__(object_list, per_page, **kwargs)
+        self.max_count = max_count
+        self.count_is_estimated = False
+
+    @cached_property
+    def count(self) -> int:
+        count, self.count_is_estimated = count_objects(
+            self.object_list, max_count=self.max_count,
+        )
+
+        return count
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+
+        # NB: when the count is estimated, there are other objects after the
+        #     limit; so we fill the last page instead of cutting it.
+        if not self.count_is_estimated and top + self.orphans >= self.count:
+            top = self.count
+
+        return self._get_page(self.object_list[bottom:top], number, self)
+
+
+def decode_page_info(raw_info: str | None) -> dict | None:
+    """Decode the page information which has been encoded in JSON, typically
+    by a template (see FlowPage.info() & the related methods).
+    @param raw_info: JSON string.
+    @return A dictionary which can be given to FlowPaginator.get_page(),
+            or None if the string is invalid (i.e. first page).
+    """
+    if not raw_info:
+        return None
+
+    try:
+        page_info = json_load(raw_info)
+    except ValueError:
+        return None
+
+    return page_info if isinstance(page_info, dict) else None
+
+
 # KeyMaker (internal) ----------------------------------------------------------
 # TODO: unit test
 class FlowKeyMaker:
@@ -149,7 +236,12 @@ class FlowPaginator:
     _key_maker: FlowKeyMaker
     _reverse_order: bool
 
-    def __init__(self, queryset: QuerySet, *, per_page: int, count: int = sys.maxsize):
+    def __init__(self,
+                 queryset: QuerySet, *,
+                 per_page: int,
+                 count: int = sys.maxsize,
+                 count_is_estimated: bool = False,
+                 ):
         """Constructor.
         @param queryset: QuerySet instance.
                Beware #1: lines must have always the same order when sub-set
@@ -164,6 +256,9 @@ class FlowPaginator:
                The default value _should_ be overridden with the correct value;
                it is only useful when a whole queryset is iterated with pages()
                (because count is not used).
+        @param count_is_estimated: Indicates that "count" is only a lower bound
+               of the total number of entities (see count_objects()) ; the
+               pagination still works, because the pages are retrieved by key.
         @raise ValueError:
             - If queryset ordering is invalid.
             - If per_page is invalid.
@@ -171,6 +266,7 @@ class FlowPaginator:
         """
         self.per_page = per_page
         self.count = count
+        self.count_is_estimated = count_is_estimated
 
         self._num_pages: int | None = None
         # self._attr_name: str = ''
@@ -381,7 +477,7 @@ class FlowPaginator:
         # methods in local contexts...
         # instances: Iterable[Model]
 
-        if move_type == 'first' or self.count <= per_page:
+        if move_type == 'first' or (self.count <= per_page and not self.count_is_estimated):
             instances = [*self._queryset[:per_page + 1]]
             next_item = None if len(instances) <= per_page else instances.pop()
             first_page = True
@@ -609,6 +705,18 @@ class FlowPage(Sequence):
 
         return offset
 
+    def first_page_info(self) -> dict:
+        """Returns a dictionary which can be given to FlowPaginator.page() to get the first page.
+        @see info()
+        """
+        return {'type': 'first'}
+
+    def last_page_info(self) -> dict:
+        """Returns a dictionary which can be given to FlowPaginator.page() to get the last page.
+        @see info()
+        """
+        return {'type': 'last', 'key': self._key}
+
     def next_page_info(self) -> dict | None:
         """Returns a dictionary which can be given to FlowPaginator.page() to get the next page.
 
@@ -17,13 +17,24 @@
 ################################################################################
 
 import logging
-from collections.abc import Iterable
+import re
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
 
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
 from django.db.models import Model
 from django.db.models.query import Q, QuerySet
+from django.db.transaction import atomic
 
 from ..core import entity_cell
-from ..models import CustomField, FieldsConfig, SearchConfigItem
+from ..models import (
+    CremeEntity,
+    CustomField,
+    FieldsConfig,
+    SearchConfigItem,
+    SearchToken,
+)
 from ..utils.string import smart_split
 
 logger = logging.getLogger(__name__)
@@ -66,12 +77,212 @@ def _q_for_customfield(cell, word):
             )
 
 
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def tokenize(value: str) -> list[str]:
+    """Split a string in lower-cased words, as they are stored in the search index.
+    >> tokenize('Linus Torvalds (linux-dev)')
+    ['linus', 'torvalds', 'linux', 'dev']
+    """
+    max_length = SearchIndexer.token_max_length
+
+    return [token[:max_length] for token in _TOKEN_RE.findall(value.lower())]
+
+
+class SearchIndexer:
+    """Fill the search index (see the model SearchToken) from the values of
+    entities' fields.
+
+    The indexed cells are the ones used by all the search configurations (see
+    SearchConfigItem) of a model; the Searcher then only uses the tokens
+    related to the cells of the user's configuration.
+
+    Notice that the values of the instances referenced by ForeignKeys
+    (e.g. "sector__title") are indexed when the entity is indexed; so
+    modifying the referenced instance itself does not update the index
+    (the command "creme_search_index" can rebuild it).
+    """
+    token_max_length: int = SearchToken._meta.get_field('token').max_length
+    chunk_size: int = 256
+
+    @staticmethod
+    def _regular_field_values(cell, entity):
+        value = cell.field_info.value_from(entity)
+
+        if value is None:
+            return ()
+
+        return value if isinstance(value, list) else (value,)
+
+    @staticmethod
+    def _custom_field_values(cell, entity):
+        cvalue = entity.get_custom_value(cell.custom_field)
+
+        return () if cvalue is None else (cvalue,)
+
+    CELL_VALUES_GETTERS = {
+        entity_cell.EntityCellRegularField.type_id: _regular_field_values,
+        entity_cell.EntityCellCustomField.type_id:  _custom_field_values,
+    }
+
+    def get_cells(self, model: type[CremeEntity]) -> list[entity_cell.EntityCell]:
+        "Get the cells to index for a model (all search configurations are merged)."
+        cells = {}
+
+        for sci in SearchConfigItem.objects.filter(
+            content_type=ContentType.objects.get_for_model(model),
+        ):
+            for cell in self.get_item_cells(sci):
+                cells.setdefault(cell.key, cell)
+
+        return [*cells.values()]
+
+    def get_item_cells(self, sci: SearchConfigItem) -> list[entity_cell.EntityCell]:
+        "Get the cells to index for a search configuration."
+        managed_types = self.CELL_VALUES_GETTERS
+
+        # NB: we use the hidden fields too (the FieldsConfig can change),
+        #     the Searcher ignores them.
+        return [
+            cell
+            for cell in (sci.refined_cells if sci.all_fields else sci.cells)
+            if cell.type_id in managed_types
+        ]
+
+    def iter_tokens(self,
+                    entity: CremeEntity,
+                    cells: Iterable[entity_cell.EntityCell],
+                    ) -> Iterator[SearchToken]:
+        "Generate the (not saved) SearchToken instances of an entity."
+        getters = self.CELL_VALUES_GETTERS
+        ctype_id = entity.entity_type_id
+
+        for cell in cells:
+            tokens = set()
+
+            for value in getters[cell.type_id](cell, entity):
+                tokens.update(tokenize(str(value)))
+
+            for token in tokens:
+                yield SearchToken(
+                    entity_ctype_id=ctype_id, entity_id=entity.id,
+                    cell_key=cell.key, token=token,
+                )
+
+    @atomic
+    def index(self,
+              entities: Iterable[CremeEntity],
+              cells: Iterable[entity_cell.EntityCell] | None = None,
+              ) -> None:
+        """Update the tokens of some entities.
+        @param entities: Instances of CremeEntity (real entities; several
+               models can be mixed).
+        @param cells: If given, only the tokens of these cells are updated
+               (the entities must have the same model); by default all the
+               cells of the search configuration are used.
+        """
+        entities_per_model = defaultdict(list)
+        for entity in entities:
+            entities_per_model[type(entity)].append(entity)
+
+        for model, model_entities in entities_per_model.items():
+            model_cells = self.get_cells(model) if cells is None else [*cells]
+
+            tokens_qs = SearchToken.objects.filter(
+                entity__in=[entity.id for entity in model_entities],
+            )
+            if cells is not None:
+                tokens_qs = tokens_qs.filter(cell_key__in=[cell.key for cell in model_cells])
+            tokens_qs.delete()
+
+            if not model_cells:
+                continue
+
+            custom_fields = [
+                cell.custom_field
+                for cell in model_cells
+                if cell.type_id == entity_cell.EntityCellCustomField.type_id
+            ]
+            if custom_fields:
+                CremeEntity.populate_custom_values(model_entities, custom_fields)
+
+            SearchToken.objects.bulk_create(
+                [
+                    token
+                    for entity in model_entities
+                    for token in self.iter_tokens(entity, model_cells)
+                ],
+                batch_size=self.chunk_size,
+            )
+
+    def rebuild(self,
+                model: type[CremeEntity],
+                cells: Iterable[entity_cell.EntityCell] | None = None,
+                ) -> int:
+        """Rebuild the tokens of all the entities of a model.
+        @param model: Class inheriting CremeEntity.
+        @param cells: If given, only the tokens of these cells are rebuilt.
+        @return: The number of indexed entities.
+        """
+        if cells is None:
+            cells = self.get_cells(model)
+
+            # NB: removes the tokens of the cells which are not used anymore too
+            SearchToken.objects.filter(
+                entity_ctype=ContentType.objects.get_for_model(model),
+            ).delete()
+        else:
+            cells = [*cells]
+
+        if not cells:
+            return 0
+
+        select_related = set()
+        for cell in cells:
+            if cell.type_id == entity_cell.EntityCellRegularField.type_id:
+                field_info = cell.field_info
+
+                if any(field.many_to_many for field in field_info):
+                    continue
+
+                if field_info[-1].is_relation:
+                    select_related.add(field_info.field_name)
+                elif len(field_info) > 1:
+                    select_related.add(field_info[:-1].field_name)
+
+        chunk_size = self.chunk_size
+        count = 0
+        last_id = 0
+
+        queryset = model.objects.order_by('id')
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+
+        # NB: we use a key-based pagination to get constant-time chunks.
+        while True:
+            entities = [*queryset.filter(id__gt=last_id)[:chunk_size]]
+            if not entities:
+                break
+
+            self.index(entities, cells=cells)
+            count += len(entities)
+            last_id = entities[-1].id
+
+        return count
+
+
 class Searcher:
     """Build QuerySets to search strings contained in instances of some given models.
 
     The search configuration (see the model SearchConfigItem) is used to know
     which fields to use.
     Hidden fields (see model FieldsConfig) are ignored.
+
+    When the search index is used (see the setting "SEARCH_INDEX_ENABLED"), the
+    searched words are compared to the beginning of the words stored in the index
+    (see SearchIndexer), instead of being searched with "LIKE" queries in the
+    fields; it's faster with big tables, but only beginnings of words are found.
     """
     CELL_TO_Q = {
         entity_cell.EntityCellRegularField.type_id:
@@ -80,13 +291,20 @@ class Searcher:
         entity_cell.EntityCellCustomField.type_id: _q_for_customfield,
     }
 
-    def __init__(self, models: Iterable[type[Model]], user):
+    def __init__(self,
+                 models: Iterable[type[Model]],
+                 user,
+                 use_index: bool | None = None,
+                 ):
         """Constructor.
 
         @param models: Iterable of classes inheriting <django.db.models.Model>.
         @param user: Instance of <django.contrib.auth.get_user_model()>.
+        @param use_index: Use the search index (see SearchToken)?
+               <None> means that the setting "SEARCH_INDEX_ENABLED" is used.
         """
         self.user = user
+        self.use_index = settings.SEARCH_INDEX_ENABLED if use_index is None else use_index
 
         search_map: dict[type[Model], list[entity_cell.EntityCell]] = {}
         models = [*models]  # Several iterations
@@ -127,6 +345,41 @@ class Searcher:
 
         return result_q
 
+    def _build_indexed_query(self, words, cells, model) -> Q:
+        """Build a Q which uses the search index (see SearchToken).
+        Each token of each word must start (at least) one token of one cell.
+        Words which contain no token (e.g. punctuation only) are searched
+        with the regular way (see _build_query()).
+
+        @param words: Searched strings.
+        @param cells: Sequence of <creme_core.core.entity_cell.EntityCell> objects.
+        @param model: Searched model.
+        @return: Instance of <django.db.models.query.Q>.
+        """
+        result_q = Q()
+        tokens_qs = SearchToken.objects.filter(
+            entity_ctype=ContentType.objects.get_for_model(model),
+            cell_key__in=[cell.key for cell in cells],
+        )
+        not_indexed_words = []
+
+        for word in words:
+            tokens = tokenize(word)
+
+            if not tokens:
+                not_indexed_words.append(word)
+                continue
+
+            for token in tokens:
+                result_q &= Q(
+                    pk__in=tokens_qs.filter(token__startswith=token).values('entity_id'),
+                )
+
+        if not_indexed_words:
+            result_q &= self._build_query(not_indexed_words, cells)
+
+        return result_q
+
     def get_cells(self, model: type[Model]) -> list[entity_cell.EntityCell]:
         """Get the list of EntityCells instances used to search in 'model'."""
         return self._search_map[model]
@@ -146,9 +399,14 @@ class Searcher:
 
         assert cells is not None  # search on a disabled model ?
 
+        if not cells:
+            return None
+
         strings = smart_split(searched)
 
+        if self.use_index:
+            # NB: sub-queries only, so no distinct() is needed
+            return model.objects.filter(self._build_indexed_query(strings, cells, model))
+
         # TODO: distinct() only if there is a JOIN...
-        return model.objects.filter(
-            self._build_query(strings, cells)
-        ).distinct() if cells else None
+        return model.objects.filter(self._build_query(strings, cells)).distinct()
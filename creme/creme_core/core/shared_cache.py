@@ -0,0 +1,294 @@
+################################################################################
+#    Creme is a free/open-source Customer Relationship Management software
+#    Copyright (C) 2026  Hybird
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+
+"""Cache shared between the processes running Creme (web servers, job manager...).
+
+The per-request cache (see 'creme_core.global_info.get_per_request_cache()')
+avoids to retrieve several times the same configuration instances during a
+request, but the next request has to retrieve them again. The SharedCache is a
+second layer which is built on the Django's cache framework (so the backend can
+be locmem, filesystem, redis...) & which is used to store these instances between
+the requests.
+
+Each cached value is related to some models; a generation counter is stored in
+the cache for each model, & is incremented when an instance of this model is
+saved or deleted. The generations are used to build the keys of the values, so
+the obsolete values are just never retrieved anymore (& expire).
+
+The SharedCache is disabled if the setting "SHARED_CACHE_ALIAS" is empty.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Hashable, Iterable
+from functools import wraps
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+from django.db import transaction
+from django.db.models import Model, signals
+from django.dispatch import receiver
+
+from ..global_info import get_global_info, get_per_request_cache
+
+logger = logging.getLogger(__name__)
+
+
+class SharedCache:
+    generation_key_fmt = 'creme_core-shared_gen-{}'.format
+    value_key_fmt = 'creme_core-shared-{key}-{generations}'.format
+    request_cache_key = 'creme_core-shared_generations'
+
+    _MISSING = object()
+
+    def __init__(self):
+        self._model_ids: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, model: type[Model] | str):
+        return self._model_id(model) in self._model_ids
+
+    @property
+    def cache(self) -> BaseCache | None:
+        alias = settings.SHARED_CACHE_ALIAS
+
+        return caches[alias] if alias else None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(settings.SHARED_CACHE_ALIAS)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        "Hits & misses counters (for the current process)."
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def register(self, *models: type[Model] | str) -> SharedCache:
+        """Register the models which can be used by cached values; the related
+        generation counters are incremented when instances are saved/deleted.
+        @param models: Model classes, or labels of models (like "app_label.ModelName").
+        """
+        self._model_ids.update(self._model_id(model) for model in models)
+        return self
+
+    @staticmethod
+    def _model_id(model: type[Model] | str) -> str:
+        return model.lower() if isinstance(model, str) else model._meta.label_lower
+
+    def _get_generations(self, models: Iterable[type[Model] | str]) -> list[int]:
+        model_ids = [self._model_id(model) for model in models]
+        key_fmt = self.generation_key_fmt
+
+        # NB: the generations are cached per-request, to avoid a round-trip
+        #     to the cache server for each value. Outside the requests (job
+        #     manager, commands...) the per-request cache is never reset, so
+        #     the generations are always re-read (the values computed by the
+        #     other processes would be ignored forever otherwise).
+        if not get_global_info('in_request'):
+            found = self.cache.get_many([key_fmt(model_id) for model_id in model_ids])
+            return [found.get(key_fmt(model_id), 0) for model_id in model_ids]
+
+        req_generations = get_per_request_cache().setdefault(self.request_cache_key, {})
+
+        missing_ids = [model_id for model_id in model_ids if model_id not in req_generations]
+        if missing_ids:
+            found = self.cache.get_many([key_fmt(model_id) for model_id in missing_ids])
+
+            for model_id in missing_ids:
+                req_generations[model_id] = found.get(key_fmt(model_id), 0)
+
+        return [req_generations[model_id] for model_id in model_ids]
+
+    def invalidate(self, model: type[Model] | str) -> None:
+        "Increment the generation related to a model (i.e. related values are obsolete)."
+        cache = self.cache
+        if cache is None:
+            return
+
+        model_id = self._model_id(model)
+        gen_key = self.generation_key_fmt(model_id)
+
+        try:
+            cache.incr(gen_key)
+        except ValueError:  # The key does not exist
+            if not cache.add(gen_key, 1, timeout=None):
+                cache.incr(gen_key)
+
+        get_per_request_cache().get(self.request_cache_key, {}).pop(model_id, None)
+
+    def get_or_compute(self, *,
+                       key: str,
+                       models: Iterable[type[Model] | str],
+                       compute: Callable[[], Any],
+                       timeout: int | None = None,
+                       ) -> Any:
+        """Get a value from the shared cache, or compute it (& store it).
+        @param key: Key identifying the value (the generations are added).
+        @param models: The models (classes or labels) used to compute the value.
+               They must have been registered.
+        @param compute: Function (without argument) which computes the value;
+               the value must be picklable.
+        @param timeout: Duration (in seconds) of the value in the cache ; by
+               default, the setting "SHARED_CACHE_TIMEOUT" is used.
+        @return: The value.
+        """
+        cache = self.cache
+        if cache is None:
+            return compute()
+
+        models = [*models]
+        assert all(model in self for model in models), \
+            f'All the models must be registered: {models}'
+
+        full_key = self.value_key_fmt(
+            key=key,
+            generations='-'.join(str(gen) for gen in self._get_generations(models)),
+        )
+        value = cache.get(full_key, self._MISSING)
+
+        if value is self._MISSING:
+            self.misses += 1
+            value = compute()
+            cache.set(
+                full_key, value,
+                timeout=settings.SHARED_CACHE_TIMEOUT if timeout is None else timeout,
+            )
+        else:
+            self.hits += 1
+
+        return value
+
+    def get_many_or_compute(self, *,
+                            keys: Iterable[str],
+                            models: Iterable[type[Model] | str],
+                            compute: Callable[[list[str]], dict[str, Any]],
+                            timeout: int | None = None,
+                            ) -> dict[str, Any]:
+        """Version of get_or_compute() for several values which are computed
+        together (e.g. values related to a group of entities).
+        @param keys: Keys identifying the values (the generations are added).
+        @param models: The models (classes or labels) used to compute the values.
+               They must have been registered.
+        @param compute: Function which takes the list of missing keys & returns
+               a dictionary {key: value} for them ; the values must be picklable.
+        @param timeout: Duration (in seconds) of the values in the cache ; by
+               default, the setting "SHARED_CACHE_TIMEOUT" is used.
+        @return: A dictionary {key: value}.
+        """
+        keys = [*keys]
+        cache = self.cache
+        if cache is None:
+            return compute(keys)
+
+        models = [*models]
+        assert all(model in self for model in models), \
+            f'All the models must be registered: {models}'
+
+        generations = '-'.join(str(gen) for gen in self._get_generations(models))
+        full_keys = {
+            key: self.value_key_fmt(key=key, generations=generations) for key in keys
+        }
+        found = cache.get_many([*full_keys.values()])
+
+        values = {}
+        missing_keys = []
+        for key, full_key in full_keys.items():
+            value = found.get(full_key, self._MISSING)
+
+            if value is self._MISSING:
+                missing_keys.append(key)
+            else:
+                values[key] = value
+
+        self.hits += len(values)
+
+        if missing_keys:
+            self.misses += len(missing_keys)
+            computed = compute(missing_keys)
+            cache.set_many(
+                {full_keys[key]: value for key, value in computed.items()},
+                timeout=settings.SHARED_CACHE_TIMEOUT if timeout is None else timeout,
+            )
+            values.update(computed)
+
+        return values
+
+
+shared_cache = SharedCache()
+
+
+def cached_shared(cache_key: Hashable, *, models: Iterable[type[Model] | str]):
+    """Decorator which caches the result in the per-request cache & in the shared cache.
+    See 'creme_core.global_info.cached_per_request()'.
+
+    @param cache_key: The key used to identify the result.
+    @param models: The models used to compute the result; labels of models
+           (like "app_label.ModelName") can be used when the classes are not
+           available yet.
+    """
+    models = [*models]
+    shared_cache.register(*models)
+
+    def _decorator(function):
+        @wraps(function)
+        def _aux(*args, **kwargs):
+            cache = get_per_request_cache()
+
+            try:
+                cached_value = cache[cache_key]
+            except KeyError:
+                cache[cache_key] = cached_value = shared_cache.get_or_compute(
+                    key=str(cache_key),
+                    models=models,
+                    compute=lambda: function(*args, **kwargs),
+                )
+
+            return cached_value
+
+        return _aux
+
+    return _decorator
+
+
+# Signal handlers --------------------------------------------------------------
+
+def _invalidate(model):
+    shared_cache.invalidate(model)
+
+    # NB: another process could have computed a value with the old data
+    #     (& the new generation) before the transaction is committed; so
+    #     we increment the generation again after the commit.
+    transaction.on_commit(lambda: shared_cache.invalidate(model))
+
+
+@receiver(signals.post_save,   dispatch_uid='creme_core-invalidate_shared_cache_save')
+@receiver(signals.post_delete, dispatch_uid='creme_core-invalidate_shared_cache_delete')
+def _invalidate_shared_cache(sender, **kwargs):
+    if sender in shared_cache:
+        _invalidate(sender)
+
+
+@receiver(signals.m2m_changed, dispatch_uid='creme_core-invalidate_shared_cache_m2m')
+def _invalidate_shared_cache_m2m(sender, instance, action, model, **kwargs):
+    if action.startswith('post_'):
+        for changed_model in (type(instance), model):
+            if changed_model in shared_cache:
+                _invalidate(changed_model)
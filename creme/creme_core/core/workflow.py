@@ -26,10 +26,11 @@ import enum
 import logging
 import re
 from collections.abc import Iterable, Iterator
+from time import perf_counter
 from typing import TYPE_CHECKING, Self
 
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Model, QuerySet, signals
+from django.db.models import Model, signals
 from django.dispatch import receiver
 from django.utils.html import format_html, format_html_join
 from django.utils.translation import gettext as _
@@ -48,6 +49,8 @@ from .entity_filter import (
     entity_filter_registries,
     operators,
 )
+from .instrumentation import measure
+from .shared_cache import shared_cache
 from .snapshot import Snapshot
 
 if TYPE_CHECKING:
@@ -102,6 +105,15 @@ class WorkflowEvent:
         """Is this event preventing another event to be inserted in the same queue."""
         return False
 
+    @property
+    def model(self) -> type[CremeEntity] | None:
+        """Model of the entity concerned by the event; it's used by the engine
+        to find quickly the Workflows which can be triggered (see
+        'WorkflowTrigger.event_model').
+        <None> means the model is unknown.
+        """
+        return None
+
 
 class _EntityEvent(WorkflowEvent):
     """Event representing the creation of a CremeEntity instance."""
@@ -118,6 +130,10 @@ class _EntityEvent(WorkflowEvent):
     def entity(self) -> CremeEntity:
         return self._entity
 
+    @property
+    def model(self):
+        return self._entity.entity_type.model_class()
+
 
 class EntityCreated(_EntityEvent):
     """Event representing the creation of a CremeEntity instance."""
@@ -147,6 +163,10 @@ class PropertyAdded(WorkflowEvent):
     def creme_property(self) -> CremeProperty:
         return self._property
 
+    @property
+    def model(self):
+        return self._property.creme_entity.entity_type.model_class()
+
 
 class RelationAdded(WorkflowEvent):
     """Event representing the creation of a Relation instance."""
@@ -159,6 +179,10 @@ class RelationAdded(WorkflowEvent):
     def __repr__(self):
         return f'RelationAdded(relation={self._relation!r})'
 
+    @property
+    def model(self):
+        return self._relation.subject_entity.entity_type.model_class()
+
     @property
     def relation(self) -> Relation:
         return self._relation
@@ -251,6 +275,16 @@ class WorkflowTrigger:
         """A localized human-friendly string used in the configuration brick."""
         raise NotImplementedError
 
+    @property
+    def event_model(self) -> type[CremeEntity] | None:
+        """Model of the entity concerned by the events which can activate this
+        trigger (see 'WorkflowEvent.model'); it's used by the engine to index
+        the Workflows.
+        <None> means "any model" (i.e. 'activate()' is called for all the
+        events with the right class).
+        """
+        return None
+
     @classmethod
     def from_dict(cls, data: dict) -> WorkflowTrigger:
         """Builds an instance from a dictionary (produced by the method 'to_dict()').
@@ -603,6 +637,30 @@ class WorkflowConditions:
 
         return all(accepted())
 
+    def populate(self, *, user: CremeUser | None, contexts: Iterable[dict]) -> None:
+        """Retrieve with a few queries the data used by 'accept()' for several
+        contexts (e.g. the relationships of the entities), in order to avoid
+        some queries per context.
+        @param user: Logged user.
+        @param contexts: Dictionaries generated by 'WorkflowTrigger.activate()'.
+        """
+        contexts = [*contexts]
+
+        for source_conditions in self._conditions_per_source:
+            conditions = source_conditions['conditions']
+
+            if conditions:
+                extract = source_conditions['entity'].extract
+                entities = [
+                    entity
+                    for entity in map(extract, contexts)
+                    if entity is not None
+                ]
+
+                if entities:
+                    for condition in conditions:
+                        condition.handler.populate(entities=entities, user=user)
+
     def add(self,
             source: WorkflowSource,
             conditions: Iterable[EntityFilterCondition],
@@ -1019,38 +1077,21 @@ class WorkflowEngine:
                 logger.debug('WorkflowEngine: inspecting %s events', len(events))
 
                 engine._is_executing_actions = True
-                workflows = engine._workflows
-
-                for event in events:
-                    for workflow in workflows:
-                        trigger = workflow.trigger
-                        ctxt = trigger.activate(event)
-
-                        if ctxt:
-                            logger.debug(
-                                'WorkflowEngine: trigger %s is activated (workflow id=%s), '
-                                'inspecting its conditions...',
-                                trigger, workflow.id,
-                            )
-
-                            if workflow.conditions.accept(
-                                user=self._user, context=ctxt,
-                                detect_change=trigger.conditions_detect_change,
-                                use_or=trigger.conditions_use_or,
-                            ):
-                                actions = workflow.actions
-                                logger.debug(
-                                    'WorkflowEngine: conditions are filled, executing %s actions',
-                                    len(actions),
-                                )
-
-                                for action in actions:
-                                    logger.debug('WorkflowEngine: execute %s', action)
-
-                                    try:
-                                        action.execute(context=ctxt, user=self._user)
-                                    except Exception:
-                                        logger.exception('Error in the Workflow engine')
+                user = self._user
+
+                # NB: the data used by the conditions are retrieved for all the
+                #     events before the actions are executed; so the conditions
+                #     do not see the changes made by the actions of the other
+                #     Workflows (like the events emitted by the actions are
+                #     ignored -- see below).
+                activations = engine._activate(events)
+
+                for workflow, contexts in engine._group_by_workflow(activations).items():
+                    workflow.conditions.populate(user=user, contexts=contexts)
+
+                for workflow, ctxt in activations:
+                    with measure('workflow', workflow.id):
+                        engine._execute(workflow=workflow, context=ctxt, user=user)
 
                 # NB: we ensure all the events emitted by the actions are dropped
                 #     So they won't trigger the engine during a potential other call.
@@ -1061,11 +1102,14 @@ class WorkflowEngine:
                 engine._is_executing_actions = False  # TODO: test
 
     cache_key = 'creme_core-workflow_engine'
+    index_cache_key = 'creme_core-workflows_index'
 
     _is_executing_actions = False
 
     _queue: WorkflowEventQueue
-    _workflows: QuerySet  # QuerySet[Workflow]
+    # Enabled workflows per event class & per model (see '_get_index()')
+    _index: dict | None = None
+    _stats: dict[int, dict]
 
     @classmethod
     def get_current(cls) -> WorkflowEngine:
@@ -1077,15 +1121,144 @@ class WorkflowEngine:
         cache_key = cls.cache_key
         wf = cache.get(cache_key)
         if wf is None:
-            from ..models import Workflow
-
             wf = cache[cache_key] = cls()
             wf._queue = WorkflowEventQueue()
-            # wf._workflows = Workflow.objects.filter(enabled=True)
-            wf._workflows = Workflow.objects.filter(disabled=None)
+            wf._stats = {}
 
         return wf
 
+    @staticmethod
+    def _build_index() -> dict:
+        from ..models import Workflow
+
+        index = {}
+
+        # for workflow in Workflow.objects.filter(enabled=True):
+        for workflow in Workflow.objects.filter(disabled=None):
+            # NB: we do not use the property "trigger" to keep the cached
+            #     instances raw (they are stored in the shared cache).
+            trigger = workflow_registry.build_trigger(workflow.json_trigger)
+
+            if not isinstance(trigger, BrokenTrigger):
+                index.setdefault(
+                    trigger.event_class, {}
+                ).setdefault(trigger.event_model, []).append(workflow)
+
+        return index
+
+    def _get_index(self) -> dict:
+        """Get the enabled Workflows indexed by event class & by model, i.e. a
+        dictionary like {event_class: {model_or_None: [workflows]}}.
+        The index is stored in the shared cache (so it's rebuilt only when a
+        Workflow is saved/deleted), & loaded once by engine.
+        """
+        index = self._index
+        if index is None:
+            from ..models import Workflow
+
+            self._index = index = shared_cache.get_or_compute(
+                key=self.index_cache_key,
+                models=[Workflow],
+                compute=self._build_index,
+            )
+
+        return index
+
+    def _get_workflows(self, event: WorkflowEvent) -> list:
+        "Get the Workflows which can be triggered by an event (ordered by ID)."
+        index = self._get_index()
+        workflows = []
+
+        for event_class in type(event).__mro__:
+            workflows_per_model = index.get(event_class)
+
+            if workflows_per_model:
+                workflows.extend(workflows_per_model.get(None, ()))
+
+                if any(model is not None for model in workflows_per_model):
+                    event_model = event.model
+
+                    if event_model is not None:
+                        workflows.extend(workflows_per_model.get(event_model, ()))
+
+        if len(workflows) > 1:
+            workflows.sort(key=lambda wf: wf.id)
+
+        return workflows
+
+    def _get_stats(self, workflow) -> dict:
+        stats = self._stats.get(workflow.id)
+        if stats is None:
+            self._stats[workflow.id] = stats = {
+                'activations': 0, 'executions': 0, 'duration': 0.0,
+            }
+
+        return stats
+
+    def _activate(self, events: Iterable[WorkflowEvent]) -> list[tuple]:
+        """Find the Workflows triggered by some events.
+        @return A list of tuples (workflow, context), ordered like the events
+                (& then by workflow).
+        """
+        activations = []
+
+        for event in events:
+            for workflow in self._get_workflows(event):
+                trigger = workflow.trigger
+                ctxt = trigger.activate(event)
+
+                if ctxt:
+                    logger.debug(
+                        'WorkflowEngine: trigger %s is activated (workflow id=%s)',
+                        trigger, workflow.id,
+                    )
+                    self._get_stats(workflow)['activations'] += 1
+                    activations.append((workflow, ctxt))
+
+        return activations
+
+    @staticmethod
+    def _group_by_workflow(activations: Iterable[tuple]) -> dict:
+        contexts_per_workflow = {}
+
+        for workflow, ctxt in activations:
+            contexts_per_workflow.setdefault(workflow, []).append(ctxt)
+
+        return contexts_per_workflow
+
+    def _execute(self, *, workflow, context: dict, user: CremeUser | None) -> None:
+        "Check the conditions of an activated Workflow, & execute its actions."
+        trigger = workflow.trigger
+        stats = self._get_stats(workflow)
+        start = perf_counter()
+
+        logger.debug(
+            'WorkflowEngine: inspecting the conditions of the workflow id=%s...',
+            workflow.id,
+        )
+
+        if workflow.conditions.accept(
+            user=user, context=context,
+            detect_change=trigger.conditions_detect_change,
+            use_or=trigger.conditions_use_or,
+        ):
+            actions = workflow.actions
+            logger.debug(
+                'WorkflowEngine: conditions are filled, executing %s actions',
+                len(actions),
+            )
+            stats['executions'] += 1
+
+            for action in actions:
+                logger.debug('WorkflowEngine: execute %s', action)
+
+                try:
+                    action.execute(context=context, user=user)
+                except Exception:
+                    logger.exception('Error in the Workflow engine')
+
+        stats['duration'] += perf_counter() - start
+
     def append_event(self, event: WorkflowEvent) -> Self:
         """Append a new event to the queue.
         See WorkflowEventQueue.append().
@@ -1098,6 +1271,17 @@ class WorkflowEngine:
     def is_executing_actions(self):
         return self._is_executing_actions
 
+    @property
+    def stats(self) -> dict[int, dict]:
+        """Counters per Workflow (the key is the ID) for this engine (i.e. for
+        the current request or job):
+         - "activations": number of times the trigger has been activated.
+         - "executions": number of times the conditions have been filled (so
+           the actions have been executed).
+         - "duration": time (in seconds) spent in the conditions & the actions.
+        """
+        return self._stats
+
     def run(self, user: CremeUser | None) -> _WorkflowEngineContextmanager:
         """Create a context manager which manages all events spawned dring its lifetime."""
         return self._WorkflowEngineContextmanager(self, user)
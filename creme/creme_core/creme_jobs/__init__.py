@@ -1,8 +1,11 @@
 from .batch_process import batch_process_type
 from .deletor import deletor_type
+from .history_archiver import history_archiver_type
+from .mass_export import mass_export_type
 from .mass_import import mass_import_type
 from .notification_emails_sender import notification_emails_sender_type
 from .reminder import reminder_type
+from .search_index_rebuilder import search_index_rebuilder_type
 from .session_cleaner import sessions_cleaner_type
 from .temp_files_cleaner import temp_files_cleaner_type
 from .trash_cleaner import trash_cleaner_type
@@ -13,7 +16,10 @@ jobs = (
     trash_cleaner_type,
     batch_process_type,
     mass_import_type,
+    mass_export_type,
     notification_emails_sender_type,
     reminder_type,
     sessions_cleaner_type,
+    history_archiver_type,
+    search_index_rebuilder_type,
 )
@@ -20,7 +20,8 @@ from __future__ import annotations
 
 import logging
 import warnings
-from datetime import datetime
+from datetime import datetime, timedelta
+from time import perf_counter
 from typing import TYPE_CHECKING, Any
 
 from django.apps import apps
@@ -31,6 +32,7 @@ from ..apps import CremeAppConfig
 from ..core.workflow import WorkflowEngine
 from ..gui.job import JobErrorsBrick
 from ..models import Job, JobResult
+from ..utils.system import max_rss
 
 if TYPE_CHECKING:
     from ..forms.job import JobForm
@@ -130,6 +132,7 @@ class JobType:
 
         status = Job.STATUS_OK
         error = None
+        start = perf_counter()
         try:
             self._execute(job)
         except Exception as e:
@@ -138,7 +141,11 @@ class JobType:
             status = Job.STATUS_ERROR
             error = str(e)
 
-        _update_job(status=status, error=error)
+        _update_job(
+            status=status, error=error,
+            last_duration=timedelta(seconds=perf_counter() - start),
+            last_max_rss=max_rss(),
+        )
 
         events = WorkflowEngine.get_current()._queue.pickup()
         if events:
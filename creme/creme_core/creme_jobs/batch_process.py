@@ -22,16 +22,25 @@ from functools import partial
 # TODO: move in function to do lazy loading ?
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
+from django.db import router
+from django.db.models import signals
 from django.db.transaction import atomic
+from django.utils.timezone import now
 from django.utils.translation import gettext
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import ngettext
 
 from ..core.batch_process import BatchAction
+from ..core.history import buffered_history
 from ..core.paginator import FlowPaginator
 from ..core.workflow import WorkflowEngine
 from ..gui.job import EntityJobErrorsBrick
-from ..models import EntityCredentials, EntityFilter, EntityJobResult
+from ..models import (
+    CremeEntity,
+    EntityCredentials,
+    EntityFilter,
+    EntityJobResult,
+)
 from ..models.utils import model_verbose_name
 from .base import JobProgress, JobType
 
@@ -42,6 +51,9 @@ class _BatchProcessType(JobType):
     id = JobType.generate_id('creme_core', 'batch_process')
     verbose_name = _('Batch process')
 
+    # Number of entities retrieved (& updated in the set-based mode) at once
+    page_size = 1024
+
     def _get_actions(self, model, job_data):
         for kwargs in job_data['actions']:
             yield BatchAction(model, **kwargs)
@@ -98,40 +110,132 @@ class _BatchProcessType(JobType):
 
         entities = EntityCredentials.filter(job.user, entities, EntityCredentials.CHANGE)
         paginator = FlowPaginator(
-            queryset=entities.order_by('id'), per_page=1024,
+            queryset=entities.order_by('id'), per_page=self.page_size,
         )
         actions = [*self._get_actions(model, job_data)]
+        process_page = (
+            self._process_page_in_bulk
+            if self._bulk_updatable(model) else
+            self._process_page
+        )
+
+        for entities_page in paginator.pages():
+            entity_ids = [
+                entity.id
+                for entity in entities_page.object_list
+                if entity.id not in already_processed
+            ]
+
+            if entity_ids:
+                process_page(job=job, model=model, actions=actions, entity_ids=entity_ids)
+
+    @staticmethod
+    def _bulk_updatable(model: type[CremeEntity]) -> bool:
+        """Can the entities be updated with bulk queries?
+        NB: the method save() is not called in the set-based mode ; some models
+            override it to compute some fields (e.g. the totals of billing
+            documents), so they are updated entity by entity.
+        """
+        return model.save is CremeEntity.save
+
+    def _process_page(self, *, job, model, actions, entity_ids):
+        "Update the entities one by one (one transaction per entity)."
         create_result = partial(EntityJobResult.objects.create, job=job)
         wf_engine = WorkflowEngine.get_current()
 
-        for entities_page in paginator.pages():
-            for entity in entities_page.object_list:
-                if entity.id in already_processed:
+        for entity_id in entity_ids:
+            changed = False
+
+            with atomic(), wf_engine.run(user=None):
+                try:
+                    final_entity = model.objects.select_for_update().get(id=entity_id)
+                except model.DoesNotExist:
                     continue
 
+                for action in actions:
+                    if action(final_entity):
+                        changed = True
+
+                if changed:
+                    try:
+                        final_entity.full_clean()
+                    except ValidationError as e:
+                        create_result(
+                            real_entity=final_entity,
+                            messages=self._humanize_validation_error(final_entity, e)
+                        )
+                    else:
+                        final_entity.save()
+                        create_result(real_entity=final_entity)
+
+    def _process_page_in_bulk(self, *, job, model, actions, entity_ids):
+        """Update the entities of a page with a few queries (one transaction
+        for the page): the entities are locked & modified in memory, then the
+        valid ones are written with a bulk query.
+        """
+        build_result = partial(EntityJobResult, job=job)
+        results = []
+        modified_entities = []
+
+        with atomic(), buffered_history(), WorkflowEngine.get_current().run(user=None):
+            for entity in model.objects.select_for_update().filter(
+                id__in=entity_ids,
+            ).order_by('id'):
                 changed = False
 
-                with atomic(), wf_engine.run(user=None):
+                for action in actions:
+                    if action(entity):
+                        changed = True
+
+                if changed:
                     try:
-                        final_entity = model.objects.select_for_update().get(id=entity.id)
-                    except model.DoesNotExist:
-                        continue
-
-                    for action in actions:
-                        if action(final_entity):
-                            changed = True
-
-                    if changed:
-                        try:
-                            final_entity.full_clean()
-                        except ValidationError as e:
-                            create_result(
-                                real_entity=final_entity,
-                                messages=self._humanize_validation_error(final_entity, e)
-                            )
-                        else:
-                            final_entity.save()
-                            create_result(real_entity=final_entity)
+                        entity.full_clean()
+                    except ValidationError as e:
+                        results.append(build_result(
+                            real_entity=entity,
+                            messages=self._humanize_validation_error(entity, e),
+                        ))
+                    else:
+                        modified_entities.append(entity)
+                        results.append(build_result(real_entity=entity))
+
+            self._bulk_save(
+                model=model,
+                entities=modified_entities,
+                field_names=[action.field_name for action in actions],
+            )
+            EntityJobResult.objects.bulk_create(results)
+
+    @staticmethod
+    def _bulk_save(*, model, entities, field_names):
+        """Write some modified entities with a bulk query.
+        The signals "pre_save" & "post_save" are sent like save() does, so the
+        lines of history & the events of Workflows are created as usual (in
+        batch, thanks to the history buffer & the Workflow engine's queue).
+        """
+        if not entities:
+            return
+
+        using = router.db_for_write(model)
+        update_fields = frozenset({'modified', 'header_filter_search_field', *field_names})
+        search_max_length = model._meta.get_field('header_filter_search_field').max_length
+        modified = now()
+
+        for entity in entities:
+            entity.header_filter_search_field = entity._search_field_value()[:search_max_length]
+            signals.pre_save.send(
+                sender=model, instance=entity,
+                raw=False, using=using, update_fields=update_fields,
+            )
+            entity.modified = modified
+
+        model._default_manager.using(using).bulk_update(entities, fields=update_fields)
+
+        for entity in entities:
+            signals.post_save.send(
+                sender=model, instance=entity, created=False,
+                raw=False, using=using, update_fields=update_fields,
+            )
 
     def progress(self, job):
         count = EntityJobResult.objects.filter(job=job).count()
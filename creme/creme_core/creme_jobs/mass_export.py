@@ -0,0 +1,86 @@
+################################################################################
+#    Creme is a free/open-source Customer Relationship Management software
+#    Copyright (C) 2026  Hybird
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+
+import logging
+
+from django.contrib.contenttypes.models import ContentType
+from django.http import HttpRequest, QueryDict
+from django.utils.translation import gettext
+from django.utils.translation import gettext_lazy as _
+
+from ..constants import UUID_CHANNEL_JOBS
+from ..models import Notification
+from ..models.utils import model_verbose_name_plural
+from ..notification import MassExportDoneContent
+from .base import JobType
+
+logger = logging.getLogger(__name__)
+
+
+class _MassExportType(JobType):
+    """Export a lot of entities in background (the view of mass-export creates
+    this kind of job when there are too many entities to export).
+    The job produces a file (FileRef) which the user can download.
+    """
+    id           = JobType.generate_id('creme_core', 'mass_export')
+    verbose_name = _('Mass export')
+
+    def _get_ctype(self, job_data):
+        return ContentType.objects.get_fresh_for_id(job_data['ctype'])
+
+    def _get_view_class(self):
+        # NB: lazy import to avoid an import cycle (the view creates the jobs)
+        from ..views.mass_export import MassExport
+
+        return MassExport
+
+    def _build_request(self, job):
+        request = HttpRequest()
+        request.method = 'GET'
+        request.GET = QueryDict(job.data['GET'])
+        request.user = job.user
+
+        return request
+
+    def _execute(self, job):
+        # NB: the view contains the logic of export (filtering, ordering...),
+        #     so we use it with the GET arguments of the original request.
+        view = self._get_view_class()()
+        view.setup(self._build_request(job))
+
+        Notification.objects.send(
+            channel=UUID_CHANNEL_JOBS,
+            users=[job.user],
+            content=MassExportDoneContent(instance=view.write_file()),
+        )
+
+    def get_description(self, job):
+        try:
+            desc = [
+                gettext('Export «{model}»').format(
+                    model=model_verbose_name_plural(self._get_ctype(job.data).model_class()),
+                ),
+            ]
+        except Exception:
+            logger.exception('Error in _MassExportType.get_description')
+            desc = ['?']
+
+        return desc
+
+
+mass_export_type = _MassExportType()
@@ -29,7 +29,7 @@ from creme.documents import get_document_model
 from ..constants import UUID_CHANNEL_JOBS
 from ..forms.mass_import import form_factory, get_header
 from ..gui.job import JobErrorsBrick
-from ..models import MassImportJobResult, Notification
+from ..models import Job, MassImportJobResult, Notification
 from ..models.utils import model_verbose_name
 from ..notification import MassImportDoneContent
 from ..utils.translation import smart_model_verbose_name
@@ -85,14 +85,20 @@ class _MassImportType(JobType):
 
     def progress(self, job):
         count = MassImportJobResult.objects.filter(job=job).count()
-        return JobProgress(
-            percentage=None,
-            label=ngettext(
-                '{count} line has been processed.',
-                '{count} lines have been processed.',
-                count
-            ).format(count=count)
-        )
+        label = ngettext(
+            '{count} line has been processed.',
+            '{count} lines have been processed.',
+            count
+        ).format(count=count)
+
+        # NB: the throughput is stored by ImportForm.process() after each chunk of lines
+        throughput = (job.data or {}).get('throughput')
+        if throughput is not None and job.status == Job.STATUS_WAIT:
+            label = gettext('{processed} ({throughput} lines/s)').format(
+                processed=label, throughput=throughput,
+            )
+
+        return JobProgress(percentage=None, label=label)
 
     @property
     def results_bricks(self):
@@ -0,0 +1,122 @@
+################################################################################
+#    Creme is a free/open-source Customer Relationship Management software
+#    Copyright (C) 2026  Hybird
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+
+import logging
+from collections.abc import Iterable
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.transaction import atomic, on_commit
+from django.utils.translation import gettext as _
+from django.utils.translation import gettext_lazy
+
+from ..models import CremeEntity, Job, JobResult
+from .base import JobType
+
+logger = logging.getLogger(__name__)
+
+
+class _SearchIndexRebuilderType(JobType):
+    """Rebuild the search index of the models whose search configuration has
+    been modified (see 'creme_core.core.search.SearchIndexer').
+    The IDs of the ContentTypes to rebuild are stored in the data of the job.
+    """
+    id           = JobType.generate_id('creme_core', 'search_index_rebuilder')
+    verbose_name = gettext_lazy('Rebuild the search index')
+    periodic     = JobType.PSEUDO_PERIODIC
+
+    @staticmethod
+    def _get_ctype_ids(job: Job) -> list[int]:
+        return (job.data or {}).get('ctypes') or []
+
+    def add_models(self, models: Iterable[type[CremeEntity]]) -> None:
+        """Ask the job to rebuild the index of some models ; the job is woken
+        up when the current transaction is committed.
+        """
+        ct_ids = {ContentType.objects.get_for_model(model).id for model in models}
+
+        def _add():
+            with atomic():
+                job = Job.objects.select_for_update().filter(type_id=self.id).first()
+
+                if job is None:
+                    logger.critical(
+                        'Job id="%s" does not exist ! Populate script has not been run correctly.',
+                        self.id,
+                    )
+                    return
+
+                # NB: we do not use save() to avoid a refreshing of the job
+                Job.objects.filter(id=job.id).update(
+                    data={
+                        **(job.data or {}),
+                        'ctypes': sorted({*self._get_ctype_ids(job), *ct_ids}),
+                    },
+                )
+
+            self.refresh_job()
+
+        if ct_ids:
+            on_commit(_add)
+
+    def _execute(self, job):
+        from ..core.search import SearchIndexer
+
+        with atomic():
+            job = Job.objects.select_for_update().get(id=job.id)
+            ct_ids = self._get_ctype_ids(job)
+            Job.objects.filter(id=job.id).update(data={**(job.data or {}), 'ctypes': []})
+
+        indexer = SearchIndexer()
+        get_ct = ContentType.objects.get_for_id
+
+        for ct_id in ct_ids:
+            model = get_ct(ct_id).model_class()
+
+            try:
+                count = indexer.rebuild(model)
+            except Exception as e:
+                logger.exception('Error when rebuilding the search index of %s', model)
+                JobResult.objects.create(
+                    job=job,
+                    messages=[
+                        _('The search index of «{}» cannot be rebuilt.').format(
+                            model._meta.verbose_name,
+                        ),
+                        _('Original error: {}').format(e),
+                    ],
+                )
+            else:
+                logger.info(
+                    '_SearchIndexRebuilderType: %s entities of %s have been indexed.',
+                    count, model,
+                )
+
+    def get_description(self, job):
+        return [
+            _(
+                'Rebuild the search index of the types of entity whose search '
+                'configuration has been modified'
+            ),
+        ]
+
+    # We have to implement it because it is a PSEUDO_PERIODIC JobType
+    def next_wakeup(self, job, now_value):
+        return now_value if self._get_ctype_ids(job) else None
+
+
+search_index_rebuilder_type = _SearchIndexRebuilderType()
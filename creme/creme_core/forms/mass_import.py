@@ -22,6 +22,7 @@ import logging
 from functools import partial
 from itertools import zip_longest
 from os.path import splitext
+from time import perf_counter
 from typing import TYPE_CHECKING, Iterable, Iterator, override
 
 from django import forms
@@ -29,7 +30,13 @@ from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.core.validators import EMPTY_VALUES
 from django.db import models
-from django.db.models import ManyToManyField, Model, prefetch_related_objects
+from django.db.models import (
+    F,
+    ManyToManyField,
+    Model,
+    QuerySet,
+    prefetch_related_objects,
+)
 from django.db.transaction import atomic
 from django.forms import widgets
 from django.forms.models import modelform_factory
@@ -45,6 +52,7 @@ from creme.documents import get_document_model
 
 from ..backends import import_backend_registry
 from ..core.field_tags import FieldTag
+from ..core.history import buffered_history
 from ..core.workflow import WorkflowEngine
 from ..gui.mass_import import import_form_registry
 from ..models import (
@@ -63,7 +71,9 @@ from ..models import (
     Relation,
     RelationType,
 )
+from ..models.history import get_history_buffer
 from ..models.utils import model_verbose_name
+from ..utils.chunktools import iter_as_chunk
 from ..utils.meta import ModelFieldEnumerator
 from ..utils.url import TemplateURLBuilder
 from . import fields as core_fields
@@ -173,10 +183,69 @@ class UploadForm(CremeForm):
 
 # Base Extractors (+ widget) ---------------------------------------------------
 
+def _column_values(lines: Iterable[Line], column_index: int) -> set[str]:
+    """Get the (not empty) values of a column for several lines.
+    NB: the lines which are too short are ignored (the extractors generate the
+        error of these lines).
+    """
+    if not column_index:  # 0 -> not in csv
+        return set()
+
+    return {
+        value
+        for line in lines
+        if len(line) >= column_index and (value := line[column_index - 1])
+    }
+
+
+def _map_instances(queryset: QuerySet, field_name: str, values: set[str]) -> dict[str, Model]:
+    """Retrieve with one query the instances which match some values & map
+    them by value.
+    The values matching several instances are ignored (the extractors retrieve
+    them again, & generate the expected error).
+    """
+    mapped = {}
+
+    if values:
+        ambiguous = set()
+
+        try:
+            instances = [
+                *queryset.filter(
+                    **{f'{field_name}__in': values}
+                ).annotate(mass_import_key=F(field_name)),
+            ]
+        except Exception as e:
+            # The extractors will generate the expected errors line by line
+            logger.info('Mass import: values cannot be retrieved by chunk (%s)', e)
+            instances = ()
+
+        for instance in instances:
+            key = str(instance.mass_import_key)
+
+            if key in mapped:
+                ambiguous.add(key)
+            else:
+                mapped[key] = instance
+
+        for key in ambiguous:
+            del mapped[key]
+
+    return mapped
+
+
 class BaseExtractor:
     def extract_value(self, line: Line, user) -> ExtractedTuple:
         raise NotImplementedError
 
+    def prefetch(self, lines: Sequence[Line], user) -> None:
+        """Retrieve with a few queries the data needed by extract_value() for
+        several lines (e.g. referenced instances) ; these data are cached until
+        the next call. The values which are not cached are retrieved line by line.
+        Override me.
+        """
+        pass
+
 
 class SingleColumnExtractor(BaseExtractor):
     def __init__(self, column_index: int):
@@ -216,6 +285,7 @@ class RegularFieldExtractor(SingleColumnExtractor):
         self._fk_model: type[Model] | None = None
         self._m2m: bool | None = None
         self._fk_form: type[CremeModelForm] | None = None
+        self._fk_cache: dict[str, Model] = {}
 
     def set_subfield_search(self,
                             subfield_search: str,
@@ -228,6 +298,16 @@ class RegularFieldExtractor(SingleColumnExtractor):
         self._m2m = multiple
         self._fk_form = creation_form_class
 
+    @override
+    def prefetch(self, lines, user):
+        # NB: the ManyToManyFields are not managed (several instances can be
+        #     retrieved for a value).
+        self._fk_cache = _map_instances(
+            queryset=self._fk_model.objects.all(),
+            field_name=self._subfield_search,
+            values=_column_values(lines, self._column_index),
+        ) if self._subfield_search and not self._m2m else {}
+
     def extract_value(self, line, user) -> ExtractedTuple:
         value = self._default_value
         err_msg = None
@@ -236,7 +316,9 @@ class RegularFieldExtractor(SingleColumnExtractor):
             line_value = line[self._column_index - 1]
 
             if line_value:
-                if self._subfield_search:
+                if (cached := self._fk_cache.get(line_value)) is not None:
+                    value = cached
+                elif self._subfield_search:
                     data = {self._subfield_search: line_value}
                     retriever = (
                         self._fk_model.objects.filter
@@ -567,12 +649,29 @@ class EntityExtractionCommand:
 class EntityExtractor(BaseExtractor):
     def __init__(self, extraction_cmds: list[EntityExtractionCommand]):
         self._commands = extraction_cmds
+        # Cached entities per command (see prefetch())
+        self._caches: list[dict[str, CremeEntity]] = [{} for __ in extraction_cmds]
 
     @property
     def commands(self) -> Iterator[EntityExtractionCommand]:
         yield from self._commands
 
-    def _extract_entity(self, line: Line, user, command: EntityExtractionCommand):
+    @override
+    def prefetch(self, lines, user):
+        self._caches = [
+            _map_instances(
+                queryset=cmd.model.objects.all(),
+                field_name=cmd.field_name,
+                values=_column_values(lines, cmd.column_index),
+            ) for cmd in self._commands
+        ]
+
+    def _extract_entity(self,
+                        line: Line,
+                        user,
+                        command: EntityExtractionCommand,
+                        cache: dict[str, CremeEntity] | None = None,
+                        ):
         index = command.column_index
 
         # TODO: manage credentials (linkable (& viewable ?))
@@ -583,6 +682,10 @@ class EntityExtractor(BaseExtractor):
         if not value:
             return None, None
 
+        # NB: the created entities are not cached, because the line can be rolled back.
+        if cache and (cached := cache.get(value)) is not None:
+            return cached, None
+
         model = command.model
         error_msg = None
         extracted = None
@@ -626,8 +729,8 @@ class EntityExtractor(BaseExtractor):
         err_msg = None
         error_parts = []
 
-        for cmd in self._commands:
-            extracted, error_part = extract_entity(cmd)
+        for cmd, cache in zip(self._commands, self._caches):
+            extracted, error_part = extract_entity(cmd, cache)
 
             if extracted is not None:
                 break
@@ -816,6 +919,7 @@ class RelationExtractor(SingleColumnExtractor):
         self._subfield_search = str(subfield_search)
         self._related_model = related_model
         self.create_if_unfound = create_if_unfound
+        self._entities_cache: dict[str, CremeEntity] = {}
 
     related_model = property(lambda self: self._related_model)
 
@@ -830,6 +934,29 @@ class RelationExtractor(SingleColumnExtractor):
     def subfield_search(self):
         return self._subfield_search
 
+    @override
+    def prefetch(self, lines, user):
+        self._entities_cache = cache = {}
+        values = _column_values(lines, self._column_index)
+        if not values:
+            return
+
+        field_name = self._subfield_search
+        qs = EntityCredentials.filter(
+            user, self._related_model.objects.filter(**{f'{field_name}__in': values}),
+        )
+        if not qs.ordered:
+            qs = qs.order_by('pk')
+
+        try:
+            entities = [*qs.annotate(mass_import_key=F(field_name))]
+        except Exception as e:
+            logger.info('Mass import: entities cannot be retrieved by chunk (%s)', e)
+        else:
+            # NB: like the method first() used by extract_value()
+            for entity in entities:
+                cache.setdefault(str(entity.mass_import_key), entity)
+
     # TODO: link credentials
     # TODO: constraint on properties for relationtypes (wait for cache in RelationType)
     def extract_value(self, line, user):
@@ -837,7 +964,9 @@ class RelationExtractor(SingleColumnExtractor):
         err_msg = None
         value = line[self._column_index - 1]
 
-        if value:
+        if value and (cached := self._entities_cache.get(value)) is not None:
+            object_entity = cached
+        elif value:
             data = {self._subfield_search: value}
             model = self._related_model
 
@@ -905,6 +1034,10 @@ class MultiRelationsExtractor:
         for extractor in self._extractors:
             yield extractor.extract_value(line, user)
 
+    def prefetch(self, lines, user):
+        for extractor in self._extractors:
+            extractor.prefetch(lines, user)
+
     def __iter__(self):
         return iter(self._extractors)
 
@@ -1358,6 +1491,8 @@ class CustomFieldExtractor(SingleColumnExtractor):
 
         self._custom_field = custom_field
         self._create_if_unfound = create_if_unfound
+        # Choices by lower-cased value (see prefetch())
+        self._enum_cache: dict[str, int] | None = None
 
         match self._custom_field.field_type:
             case CustomField.ENUM:
@@ -1367,6 +1502,18 @@ class CustomFieldExtractor(SingleColumnExtractor):
             case _:
                 self._manage_enum = None
 
+    @override
+    def prefetch(self, lines, user):
+        # NB: the choices are retrieved once for all the lines
+        if self._manage_enum and self._column_index and self._enum_cache is None:
+            qs = CustomFieldEnumValue.objects.filter(custom_field=self._custom_field)
+            if not qs.ordered:
+                qs = qs.order_by('pk')
+
+            self._enum_cache = cache = {}
+            for enum_id, enum_value in qs.values_list('id', 'value'):
+                cache.setdefault(enum_value.lower(), enum_id)
+
     def extract_value(self, line, user):
         value = self._default_value
         err_msg = None
@@ -1376,17 +1523,26 @@ class CustomFieldExtractor(SingleColumnExtractor):
 
             if line_value:
                 if self._manage_enum:
-                    enum_value = CustomFieldEnumValue.objects.filter(
-                        custom_field=self._custom_field,
-                        value__iexact=line_value,
-                    ).first()
+                    enum_cache = self._enum_cache
+                    enum_id = None if enum_cache is None else enum_cache.get(line_value.lower())
 
-                    if enum_value is not None:
+                    if enum_id is None:
+                        enum_value = CustomFieldEnumValue.objects.filter(
+                            custom_field=self._custom_field,
+                            value__iexact=line_value,
+                        ).first()
+
+                        if enum_value is not None:
+                            enum_id = enum_value.id
+
+                    if enum_id is not None:
                         return (
-                            self._manage_enum(enum_value.id),
+                            self._manage_enum(enum_id),
                             err_msg
                         )
                     elif self._create_if_unfound:
+                        # NB: the created instances are not cached, because
+                        #     the line can be rolled back.
                         # TODO: improve self._value_castor avoid the direct 'return' ?
                         return (
                             self._manage_enum(
@@ -1562,6 +1718,10 @@ class ImportForm(CremeModelForm):
     ]  # Overridden by factory
     header_dict: dict[str, int] = {}  # Idem
 
+    # Number of lines which are processed in a transaction; the referenced
+    # instances are retrieved by chunk too (see BaseExtractor.prefetch()).
+    chunk_size: int = 100
+
     blocks = FieldBlockManager(
         {
             'id': 'general',
@@ -1737,99 +1897,135 @@ class ImportForm(CremeModelForm):
             def is_empty_value(s):
                 return s is None or isinstance(s, str) and not s.strip()
 
-            for i, line in enumerate(filter(None, lines), start=1):
-                job_result = MassImportJobResult(job=job, line=line)
-
-                try:
-                    with atomic(), wf_engine.run(user=None):
-                        instance = model_class()
-
-                        # 'True' means: object has been updated, not created from scratch
-                        updated = False
-
-                        extr_values = []
-                        for fname, extractor in extractor_fields:
-                            extr_value, err_msg = extractor.extract_value(line=line, user=user)
+            processed_count = 0
+            start = perf_counter()
+
+            for chunk in iter_as_chunk(filter(None, lines), self.chunk_size):
+                self._prefetch(chunk)
+                job_results = []
+
+                # NB: one transaction per chunk (& one savepoint per line)
+                with atomic(), buffered_history():
+                    history_buffer = get_history_buffer()
+                    if history_buffer is not None:
+                        # The lines of history are inserted at the end of the
+                        # chunk ; the lines of a failed line are removed.
+                        history_buffer.size = None
+
+                    for line in chunk:
+                        job_result = MassImportJobResult(job=job, line=line)
+                        history_length = 0 if history_buffer is None else len(history_buffer)
+
+                        try:
+                            with atomic(), wf_engine.run(user=None):
+                                instance = model_class()
+
+                                # 'True' means: object has been updated, not created from scratch
+                                updated = False
+
+                                extr_values = []
+                                for fname, extractor in extractor_fields:
+                                    extr_value, err_msg = extractor.extract_value(
+                                        line=line, user=user,
+                                    )
+
+                                    # TODO: Extractor.extract_value() should return a
+                                    #       ExtractedTuple instead of a tuple
+                                    #       (an so we could remove the ugly following line...)
+                                    is_empty = not extractor._column_index or is_empty_value(
+                                        line[extractor._column_index - 1]
+                                    )
+                                    extr_values.append((fname, extr_value, is_empty))
+
+                                    append_error(err_msg)
+
+                                if key_fields:
+                                    # We avoid using exception within 'atomic' block
+                                    found = self._find_existing_instances(
+                                        model=model_class,
+                                        field_names=key_fields,
+                                        extracted_values=extr_values,
+                                    )[:2]
+
+                                    if found:
+                                        if len(found) == 1:
+                                            try:
+                                                instance = model_class.objects.select_for_update(
+                                                ).get(pk=found[0].pk)
+                                            except model_class.DoesNotExist:
+                                                # TODO: unit test
+                                                pass
+                                            else:
+                                                # TODO: unit test
+                                                job_result.real_entity = instance
+                                                job_result.updated = updated = True
+                                        else:
+                                            append_error(gettext(
+                                                'Several entities corresponding to the '
+                                                'search have been found. '
+                                                'So a new entity have been created '
+                                                'to avoid errors.'
+                                            ))
+
+                                for fname, cleaned_value in regular_fields:
+                                    setattr(instance, fname, cleaned_value)
+
+                                for fname, extr_value, is_empty in extr_values:
+                                    if updated and is_empty:
+                                        continue
+
+                                    setattr(instance, fname, extr_value)
+
+                                self._pre_instance_save(instance, line)
+
+                                instance.full_clean()
+                                instance.save()
+
+                                self._post_instance_save(instance, line, updated)
+
+                                job_result.real_entity = instance
+                                if self.import_errors:
+                                    job_result.messages = [*self.import_errors]
+                        except Exception as e:
+                            logger.exception('Exception in Mass importing')
+
+                            if history_buffer is not None:
+                                history_buffer.truncate(history_length)
+
+                            try:
+                                for messages in e.message_dict.values():
+                                    for message in messages:
+                                        append_error(str(message))
+                            except Exception:
+                                append_error(str(e))
+
+                            job_result.messages = [*self.import_errors]
+
+                        job_results.append(job_result)
+                        self.import_errors.clear()
+
+                    MassImportJobResult.objects.bulk_create(job_results)
+
+                processed_count += len(chunk)
+                self._update_throughput(
+                    job=job, throughput=processed_count / (perf_counter() - start),
+                )
 
-                            # TODO: Extractor.extract_value() should return a ExtractedTuple
-                            #       instead of a tuple
-                            #       (an so we could remove the ugly following line...)
-                            is_empty = not extractor._column_index or is_empty_value(
-                                line[extractor._column_index - 1]
-                            )
-                            extr_values.append((fname, extr_value, is_empty))
-
-                            append_error(err_msg)
-
-                        if key_fields:
-                            # We avoid using exception within 'atomic' block
-                            found = self._find_existing_instances(
-                                model=model_class,
-                                field_names=key_fields,
-                                extracted_values=extr_values,
-                            )[:2]
-
-                            if found:
-                                if len(found) == 1:
-                                    try:
-                                        instance = model_class.objects.select_for_update().get(
-                                            pk=found[0].pk,
-                                        )
-                                    except model_class.DoesNotExist:
-                                        # TODO: unit test
-                                        pass
-                                    else:
-                                        job_result.real_entity = instance  # TODO: unit test
-                                        job_result.updated = updated = True
-                                else:
-                                    append_error(gettext(
-                                        'Several entities corresponding to the '
-                                        'search have been found. '
-                                        'So a new entity have been created to avoid errors.'
-                                    ))
-
-                        for fname, cleaned_value in regular_fields:
-                            setattr(instance, fname, cleaned_value)
-
-                        for fname, extr_value, is_empty in extr_values:
-                            if updated and is_empty:
-                                continue
-
-                            setattr(instance, fname, extr_value)
-
-                        self._pre_instance_save(instance, line)
-
-                        instance.full_clean()
-                        instance.save()
-
-                        # self._post_instance_creation(instance, line, updated)
-                        self._post_instance_save(instance, line, updated)
-
-                        # for m2m in model_class._meta.many_to_many:
-                        #     extractor = get_cleaned(m2m.name)
-                        #     if extractor:
-                        #         extr_value, err_msg = extractor.extract_value(line, user)
-                        #         getattr(instance, m2m.name).set(extr_value)
-                        #         append_error(err_msg)
-
-                        job_result.real_entity = instance
-                        if self.import_errors:
-                            job_result.messages = self.import_errors
-                        job_result.save()
-                except Exception as e:
-                    logger.exception('Exception in Mass importing')
+    def _prefetch(self, lines: Sequence[Line]) -> None:
+        "Let the extractors retrieve the data needed by a chunk of lines."
+        user = self.user
 
-                    try:
-                        for messages in e.message_dict.values():
-                            for message in messages:
-                                append_error(str(message))
-                    except Exception:
-                        append_error(str(e))
+        for value in self.cleaned_data.values():
+            if isinstance(value, (BaseExtractor, MultiRelationsExtractor)):
+                value.prefetch(lines, user)
 
-                    job_result.messages = self.import_errors
-                    job_result.save()
+    @staticmethod
+    def _update_throughput(job: Job, throughput: float) -> None:
+        # NB: see _MassImportType.progress()
+        job.data['throughput'] = round(throughput, 1)
 
-                self.import_errors.clear()
+        # NB: we do not use save() to avoid a refreshing of the job
+        Job.objects.filter(id=job.id).update(data=job.data)
 
 
 class ImportForm4CremeEntity(ImportForm):
@@ -1977,15 +2173,14 @@ class ImportForm4CremeEntity(ImportForm):
             CustomFieldValue.save_values_for_entities(cfield, [instance], cvalue)
 
         # Properties -----
-        create_prop = partial(
-            CremeProperty.objects.create if not updated else
-            CremeProperty.objects.safe_get_or_create,
-            creme_entity=instance,
+        CremeProperty.objects.safe_multi_save(
+            [
+                CremeProperty(creme_entity=instance, type=prop_type)
+                for prop_type in cdata['property_types']
+            ],
+            check_existing=updated,
         )
 
-        for prop_type in cdata['property_types']:
-            create_prop(type=prop_type)
-
         # Relationships -----
         relations = []
 
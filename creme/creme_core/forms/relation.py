@@ -22,7 +22,7 @@ from django.forms import ModelMultipleChoiceField
 from django.utils.translation import gettext
 from django.utils.translation import gettext_lazy as _
 
-from ..models import CremeEntity, Relation, RelationType, SemiFixedRelationType
+from ..models import Relation, RelationType, SemiFixedRelationType
 from ..utils import entities_to_str
 from . import base
 from . import fields as core_fields
@@ -110,17 +110,7 @@ class _RelationsForm(base.CremeForm):
     # TODO: indicates all subjects with missing properties?
     # TODO: filter & display these invalid subjects (like non editable subjects)
     def _check_properties(self, rtypes):
-        subjects = self.subjects
-        CremeEntity.populate_properties(subjects)
-
-        for subject in subjects:
-            for rtype in rtypes:
-                Relation(
-                    # user=self.user,
-                    subject_entity=subject,
-                    type=rtype,
-                    # object_entity=...
-                ).clean_subject_entity()
+        Relation.clean_subject_entities(rtypes=rtypes, entities=self.subjects)
 
     def _check_loops(self, relations):
         subjects_ids = self.subjects_ids
@@ -175,7 +165,7 @@ class _RelationsForm(base.CremeForm):
     def save(self):
         user = self.user
 
-        Relation.objects.safe_multi_save(
+        Relation.objects.safe_bulk_create(
             Relation(
                 user=user,
                 subject_entity=subject,
@@ -25,7 +25,7 @@ from .core.function_field import (
     FunctionFieldResultsList,
 )
 from .forms.listview import BaseChoiceField
-from .models import CremeEntity, CremePropertyType
+from .models import CremePropertyType
 from .utils.unicode_collation import collator
 
 
@@ -53,6 +53,8 @@ class PropertiesField(FunctionField):
     verbose_name = _('Properties')
     result_type = FunctionFieldResultsList
     search_field_builder = PropertiesSearchField
+    prefetch_properties = True
+    per_entity_queries = False
 
     def __call__(self, entity, user):
         sort_key = collator.sort_key
@@ -68,7 +70,3 @@ class PropertiesField(FunctionField):
                 key=lambda t: sort_key(t[0]),
             )
         )
-
-    @classmethod
-    def populate_entities(cls, entities, user):
-        CremeEntity.populate_properties(entities)
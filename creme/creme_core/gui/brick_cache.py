@@ -0,0 +1,211 @@
+################################################################################
+#    Creme is a free/open-source Customer Relationship Management software
+#    Copyright (C) 2026  Hybird
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+
+"""Cache for the HTML of the bricks.
+
+The bricks which set their attribute "cache_html" to True are rendered once,
+& their HTML is stored in the shared cache (see 'creme_core.core.shared_cache').
+The key of a stored HTML is built with:
+  - the brick's ID, its state (BrickState) & its context (pagination...).
+  - the user (ID, role, teams, theme) & the language.
+  - the entity of the detail-view, with a stamp which is renewed each time
+    the entity is saved/deleted (or one of its ManyToManyFields changes).
+  - the generations of the models the brick depends on (i.e. "dependencies" &
+    "cache_dependencies"), so the HTML is rendered again when an instance of
+    these models is saved/deleted.
+
+The cache is used only if the shared cache is enabled.
+"""
+
+from __future__ import annotations
+
+import logging
+from hashlib import md5
+from json import dumps as json_dump
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+from django.db import transaction
+from django.db.models import signals
+from django.dispatch import receiver
+from django.utils.timezone import get_current_timezone_name
+from django.utils.translation import get_language
+
+from ..core.instrumentation import measure
+from ..core.shared_cache import shared_cache
+from ..global_info import get_per_request_cache
+from ..models import CremeEntity
+
+if TYPE_CHECKING:
+    from .bricks import Brick
+
+logger = logging.getLogger(__name__)
+
+
+class BrickHTMLCache:
+    html_key_fmt = 'creme_core-brick_html-{}'.format
+    entity_stamp_key_fmt = 'creme_core-brick_entity_stamp-{}'.format
+    request_cache_key = 'creme_core-brick_entity_stamps'
+
+    # Models used to compute the credentials, which are in all the keys
+    credentials_models = ('creme_core.UserRole', 'creme_core.SetCredentials')
+
+    def __init__(self):
+        shared_cache.register(*self.credentials_models)
+
+    @staticmethod
+    def brick_models(brick: Brick) -> list | None:
+        "Models related to the HTML of a brick; <None> means 'cannot be cached'."
+        dependencies = brick.dependencies
+        if isinstance(dependencies, str):  # Wildcard '*'
+            return None
+
+        return [*dependencies, *brick.cache_dependencies]
+
+    def register(self, brick: Brick | type[Brick]) -> None:
+        """Register the models related to a brick in the shared cache.
+        It must be done when the apps are loaded (i.e. in all the processes
+        which can modify the instances) ; the brick registry does it.
+        """
+        if brick.cache_html:
+            models = self.brick_models(brick)
+            if models:
+                shared_cache.register(*models)
+
+    def is_cacheable(self, brick: Brick) -> bool:
+        if not brick.cache_html or not shared_cache.enabled:
+            return False
+
+        models = self.brick_models(brick)
+        if models is None:
+            return False
+
+        # NB: a model which is not registered would not invalidate the HTML
+        return all(model in shared_cache for model in models)
+
+    def get_entity_stamp(self, entity_id: int) -> str:
+        stamps = get_per_request_cache().setdefault(self.request_cache_key, {})
+        stamp = stamps.get(entity_id)
+
+        if stamp is None:
+            cache = shared_cache.cache
+            key = self.entity_stamp_key_fmt(entity_id)
+            stamp = cache.get(key)
+
+            if stamp is None:
+                stamp = uuid4().hex
+
+                if not cache.add(key, stamp, timeout=None):
+                    stamp = cache.get(key, stamp)
+
+            stamps[entity_id] = stamp
+
+        return stamp
+
+    def invalidate_entity(self, entity_id: int) -> None:
+        "The stored HTML related to an entity becomes obsolete."
+        if shared_cache.enabled:
+            shared_cache.cache.delete(self.entity_stamp_key_fmt(entity_id))
+            get_per_request_cache().get(self.request_cache_key, {}).pop(entity_id, None)
+
+    def build_key(self, brick: Brick, context: dict) -> str:
+        user = context['user']
+        request = context['request']
+        brick_id = brick.id
+        base_url = request.GET.get('base_url', request.path)
+        entity = context.get('object')
+
+        try:
+            brick_context = request.session['brickcontexts_manager'][base_url][brick_id]
+        except KeyError:
+            brick_context = None
+
+        from .bricks import BrickManager
+
+        state = BrickManager.get(context).get_state(brick_id, user)
+
+        key_items = [
+            brick_id,
+            base_url,
+            sorted(
+                (k, v)
+                for k, v in request.GET.lists()
+                if k.startswith(f'{brick_id}_')
+            ),
+            brick_context,
+            brick.reloading_info,
+            [state.is_open, state.show_empty_fields, state.json_extra_data],
+            [
+                user.id, user.role_id, user.is_superuser, user.theme,
+                [team.id for team in user.teams],
+            ],
+            get_language(),
+            get_current_timezone_name(),
+            [
+                entity.id, self.get_entity_stamp(entity.id),
+            ] if isinstance(entity, CremeEntity) else None,
+            *brick.cache_key_items(context),
+        ]
+
+        return self.html_key_fmt(
+            md5(
+                json_dump(key_items, default=str).encode(),
+                usedforsecurity=False,
+            ).hexdigest()
+        )
+
+    def render(self, brick: Brick, context: dict) -> str:
+        """Get the HTML of a brick from the cache, or render it (& store it).
+        @param brick: Instance of Brick.
+        @param context: Context of the page (with 'request', 'user' etc...).
+        """
+        with measure('brick', brick.id):
+            if not self.is_cacheable(brick):
+                return brick.render(context)
+
+            return shared_cache.get_or_compute(
+                key=self.build_key(brick, context),
+                models=[*self.brick_models(brick), *self.credentials_models],
+                compute=lambda: brick.render(context),
+            )
+
+
+brick_html_cache = BrickHTMLCache()
+
+
+# Signal handlers --------------------------------------------------------------
+
+def _invalidate_entity(entity_id):
+    brick_html_cache.invalidate_entity(entity_id)
+
+    # NB: see 'creme_core.core.shared_cache._invalidate()'
+    transaction.on_commit(lambda: brick_html_cache.invalidate_entity(entity_id))
+
+
+@receiver(signals.post_save,   dispatch_uid='creme_core-invalidate_brick_html_save')
+@receiver(signals.post_delete, dispatch_uid='creme_core-invalidate_brick_html_delete')
+def _invalidate_brick_html(sender, instance, created=False, **kwargs):
+    # NB: there is no HTML related to a new entity
+    if not created and isinstance(instance, CremeEntity):
+        _invalidate_entity(instance.id)
+
+
+@receiver(signals.m2m_changed, dispatch_uid='creme_core-invalidate_brick_html_m2m')
+def _invalidate_brick_html_m2m(sender, instance, action, **kwargs):
+    if isinstance(instance, CremeEntity) and action.startswith('post_'):
+        _invalidate_entity(instance.id)
@@ -0,0 +1,195 @@
+################################################################################
+#    Creme is a free/open-source Customer Relationship Management software
+#    Copyright (C) 2026  Hybird
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+
+"""Rendering of the bricks of a page.
+
+By default, the bricks are rendered one after the other, so the time spent to
+build a page is the sum of the rendering times of its bricks. The bricks which
+are "independent" (see the attribute 'creme_core.gui.bricks.Brick.independent')
+can be:
+  - rendered concurrently by a pool of threads ; each thread uses its own
+    connection to the DataBase.
+  - deferred: a placeholder is rendered, & the browser retrieves the brick with
+    the reloading view of the page.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from enum import StrEnum
+
+from django.conf import settings
+from django.db import connections
+from django.template.loader import get_template
+from django.utils import timezone, translation
+
+from ..global_info import (
+    clear_global_info,
+    get_global_info,
+    get_per_request_cache,
+    set_global_info,
+)
+from .brick_cache import BrickHTMLCache, brick_html_cache
+from .bricks import Brick, BrickManager
+
+logger = logging.getLogger(__name__)
+
+
+class BricksRenderer:
+    """Render a sequence of bricks with a given mode (see the setting
+    "BRICKS_RENDERING_MODE").
+    The mode is used only for the bricks which are "independent" ; the other
+    ones are always rendered by the current thread, in order.
+    """
+    class Mode(StrEnum):
+        SEQUENTIAL = 'sequential'
+        CONCURRENT = 'concurrent'
+        DEFERRED   = 'deferred'
+
+    placeholder_template_name = 'creme_core/bricks/deferred.html'
+    thread_name_prefix = 'creme_bricks'
+
+    def __init__(self, html_cache: BrickHTMLCache = brick_html_cache):
+        self.html_cache = html_cache
+
+    @property
+    def max_workers(self) -> int:
+        return settings.BRICKS_RENDERING_WORKERS
+
+    def render_brick(self, brick: Brick, context: dict) -> str:
+        # NB: the context is copied in order to get a 'fresh' one for each
+        #     brick, & so avoid annoying side effects.
+        return self.html_cache.render(brick, {**context})
+
+    def render_placeholder(self, brick: Brick, context: dict) -> str:
+        """Render the HTML of a brick which is retrieved later by the browser
+        (with the reloading view).
+        """
+        return get_template(self.placeholder_template_name).render({
+            **context,
+            'brick_id': brick.id,
+            'html_id': brick.html_id,
+            'verbose_name': brick.verbose_name,
+            'description': brick.description,
+            'state': BrickManager.get(context).get_state(brick.id, context['user']),
+            # NB: no dependency => only the placeholder is reloaded
+            'dependencies': [],
+            'reloading_info': brick.reloading_info,
+            'read_only': True,
+        })
+
+    def _render_in_thread(self, brick: Brick, context: dict, global_info: dict,
+                          language: str | None, tz) -> str:
+        # NB: the per-request cache is shared with the thread of the request
+        #     (the operations on dictionaries are atomic).
+        set_global_info(**global_info)
+
+        try:
+            with translation.override(language), timezone.override(tz):
+                return self.render_brick(brick, context)
+        finally:
+            clear_global_info()
+            # The connections are per-thread; they would not be re-used.
+            connections.close_all()
+
+    def _render_concurrently(self, bricks: list[Brick], context: dict) -> list[str]:
+        independent_bricks = [brick for brick in bricks if brick.independent]
+        workers = min(self.max_workers, len(independent_bricks))
+
+        if workers < 2:
+            return self._render_sequentially(bricks, context)
+
+        # NB: the states of all the bricks are retrieved with one query by the
+        #     current thread (& so the manager is not modified by other threads).
+        manager = BrickManager.get(context)
+        user = context['user']
+        for brick in independent_bricks:
+            manager.get_state(brick.id, user)
+
+        thread_kwargs = {
+            'global_info': {
+                'user': get_global_info('user'),
+                'per_request_cache': get_per_request_cache(),
+            },
+            'language': translation.get_language(),
+            'tz': timezone.get_current_timezone(),
+        }
+
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=self.thread_name_prefix,
+        ) as executor:
+            futures = {
+                id(brick): executor.submit(
+                    self._render_in_thread, brick, context, **thread_kwargs
+                ) for brick in independent_bricks
+            }
+
+            # NB: the other bricks are rendered while the threads are working
+            renders = [
+                None if brick.independent else self.render_brick(brick, context)
+                for brick in bricks
+            ]
+
+            return [
+                futures[id(brick)].result() if render is None else render
+                for brick, render in zip(bricks, renders)
+            ]
+
+    def _render_deferred(self, bricks: list[Brick], context: dict) -> list[str]:
+        if not context.get('bricks_reload_url'):
+            logger.warning(
+                'BricksRenderer: no reloading URL in the context, the bricks are '
+                'not deferred.'
+            )
+            return self._render_sequentially(bricks, context)
+
+        return [
+            self.render_placeholder(brick, context)
+            if brick.independent else
+            self.render_brick(brick, context)
+            for brick in bricks
+        ]
+
+    def _render_sequentially(self, bricks: list[Brick], context: dict) -> list[str]:
+        return [self.render_brick(brick, context) for brick in bricks]
+
+    def render(self,
+               bricks: Iterable[Brick],
+               context: dict,
+               mode: Mode | str = Mode.SEQUENTIAL,
+               ) -> list[str]:
+        """Render some bricks.
+        @param bricks: Instances of Brick.
+        @param context: Context of the page (with 'request', 'user' etc...).
+        @param mode: See 'BricksRenderer.Mode'.
+        @return: The HTML of the bricks, in the same order.
+        """
+        bricks = [*bricks]
+
+        match self.Mode(mode):
+            case self.Mode.CONCURRENT:
+                return self._render_concurrently(bricks, context)
+            case self.Mode.DEFERRED:
+                return self._render_deferred(bricks, context)
+            case _:
+                return self._render_sequentially(bricks, context)
+
+
+bricks_renderer = BricksRenderer()
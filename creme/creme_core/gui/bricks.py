@@ -43,6 +43,13 @@ from ..core.entity_cell import (
 )
 from ..core.exceptions import ConflictError
 from ..core.field_tags import FieldTag
+from ..core.paginator import (
+    EstimatedCountPaginator,
+    FlowPage,
+    FlowPaginator,
+    count_objects,
+    decode_page_info,
+)
 from ..core.sorter import cell_sorter_registry
 from ..models import (
     BrickState,
@@ -55,6 +62,7 @@ from ..models import (
 )
 from ..utils.collections import OrderedSet
 from ..utils.meta import OrderedField
+from .brick_cache import brick_html_cache
 
 logger = logging.getLogger(__name__)
 BrickDependencies = Union[List[Type[Model]], Tuple[Type[Model], ...], Literal['*']]
@@ -136,6 +144,25 @@ class Brick:
     #   (but it is still reloaded when the dependant bricks are reloaded of course).
     read_only: bool = False
 
+    # 'True' means that the rendered HTML is stored in the shared cache (see
+    # 'creme_core.gui.brick_cache'), & so the brick is not rendered again
+    # while the related entity, its dependencies & the user do not change.
+    # BEWARE: the dependencies cannot be the wildcard '*', & the template
+    #         should not use data which are not in the cache key (e.g. CSRF
+    #         token, data shared with other bricks) -- see 'cache_key_items()'.
+    cache_html: bool = False
+
+    # Models which are displayed by the brick, but which are not edited by it
+    # (so they are not in "dependencies") ; used to invalidate the cached HTML.
+    cache_dependencies: Sequence[type[Model]] = ()
+
+    # 'True' means that the brick does not share mutable data with the other
+    # bricks of the page (e.g. it does not modify the context, or some
+    # attributes of other bricks) ; so it can be rendered by another thread,
+    # or be retrieved later by the browser with the reloading view
+    # (see 'creme_core.gui.brick_rendering' & the setting "BRICKS_RENDERING_MODE").
+    independent: bool = False
+
     template_name: str = 'OVERRIDE_ME.html'  # Used to render the brick of course
     context_class = _BrickContext  # Class of the instance which stores the context in the session.
 
@@ -213,6 +240,14 @@ class Brick:
     #     """
     #     return self._render(self.get_template_context(context))
 
+    def cache_key_items(self, context: dict) -> list:
+        """Additional items used to build the key of the cached HTML (see the
+        attribute "cache_html"). They must be serializable to JSON.
+        Override me if your brick uses some data which are not in the default
+        key (the entity, the user, the brick's state...).
+        """
+        return []
+
     def _iter_dependencies_info(self):
         for dep in self.dependencies:
             if isinstance(dep, type) and issubclass(dep, Model):
@@ -337,7 +372,8 @@ class _PaginatedBrickContext(_BrickContext):
     __slots__ = ('page',)
 
     def __init__(self) -> None:
-        self.page: int = 1
+        # NB: information of FlowPage with seek pagination (see QuerysetBrick)
+        self.page: int | dict = 1
 
     def __repr__(self):
         return f'<PaginatedBrickContext: page={self.page}>'
@@ -346,7 +382,8 @@ class _PaginatedBrickContext(_BrickContext):
         return {'page': self.page}
 
     def update(self, template_context) -> bool:
-        page = template_context['page'].number
+        page_obj = template_context['page']
+        page = page_obj.info() if isinstance(page_obj, FlowPage) else page_obj.number
 
         if self.page != page:
             modified = True
@@ -364,12 +401,22 @@ class PaginatedBrick(Brick):
     context_class = _PaginatedBrickContext
     page_size: int = settings.BLOCK_SIZE  # Number of items in the page
 
-    def _build_template_context(self, context, brick_id, brick_context, **extra_kwargs):
-        assert isinstance(brick_context, _PaginatedBrickContext)
+    # Maximum number of items which are counted; when there are more items,
+    # the count is estimated & the items after this limit are not reachable
+    # (see 'creme_core.core.paginator.EstimatedCountPaginator').
+    # <None> means that all the items are counted.
+    max_count: int | None = None
 
-        request = context['request']
-        objects = extra_kwargs.pop('objects')
+    def _build_paginator(self, objects) -> Paginator:
+        max_count = self.max_count
+
+        return Paginator(
+            objects, self.page_size,
+        ) if max_count is None else EstimatedCountPaginator(
+            objects, self.page_size, max_count=max_count,
+        )
 
+    def _build_page(self, *, request, brick_id, brick_context, objects):
         page_index = request.GET.get(f'{brick_id}_page')
         if page_index is not None:
             try:
@@ -383,18 +430,26 @@ class PaginatedBrick(Brick):
         else:
             page_index = brick_context.page
 
-        paginator = Paginator(objects, self.page_size)
+        paginator = self._build_paginator(objects)
 
         try:
-            page = paginator.page(page_index)
+            return paginator.page(page_index)
         except (EmptyPage, InvalidPage):
-            page = paginator.page(paginator.num_pages)
+            return paginator.page(paginator.num_pages)
+
+    def _build_template_context(self, context, brick_id, brick_context, **extra_kwargs):
+        assert isinstance(brick_context, _PaginatedBrickContext)
 
         return super()._build_template_context(
             context=context,
             brick_id=brick_id,
             brick_context=brick_context,
-            page=page,
+            page=self._build_page(
+                request=context['request'],
+                brick_id=brick_id,
+                brick_context=brick_context,
+                objects=extra_kwargs.pop('objects'),
+            ),
             **extra_kwargs
         )
 
@@ -453,6 +508,14 @@ class QuerysetBrick(PaginatedBrick):
     # (see the templatetags lib 'creme_bricks': {% brick_table_column_for_field %} &
     # {% brick_table_column_for_cell %}), you have to set this attribute.
     order_by: str = ''
+
+    # If True, the pages are retrieved by key (see 'creme_core.core.paginator.FlowPaginator')
+    # instead of using an OFFSET, so the pages far from the beginning are
+    # retrieved as quickly as the first ones; the pager only proposes the
+    # first/previous/next/last pages.
+    # Hint: use it with the attribute "max_count" for large tables.
+    seek_pagination: bool = False
+
     cell_sorter_registry = cell_sorter_registry
 
     def _is_order_valid(self, model: type[Model], order: str) -> bool:
@@ -469,6 +532,28 @@ class QuerysetBrick(PaginatedBrick):
 
         return True
 
+    def _build_page(self, *, request, brick_id, brick_context, objects):
+        if not self.seek_pagination:
+            return super()._build_page(
+                request=request, brick_id=brick_id,
+                brick_context=brick_context, objects=objects,
+            )
+
+        page_info = request.GET.get(f'{brick_id}_page')
+        if page_info is None:
+            # NB: a page number is ignored (i.e. first page)
+            page_info = brick_context.page
+        else:
+            page_info = decode_page_info(page_info)
+
+        count, estimated = count_objects(objects, max_count=self.max_count)
+
+        # NB: invalid information (e.g. the ordering has changed) => first page
+        return FlowPaginator(
+            queryset=objects, per_page=self.page_size,
+            count=count, count_is_estimated=estimated,
+        ).get_page(page_info)
+
     def _build_template_context(self, context, brick_id, brick_context, **extra_kwargs):
         assert isinstance(brick_context, _QuerysetBrickContext)
 
@@ -537,11 +622,13 @@ class EntityBrick(Brick):
 
     def get_template_context(self, context, **extra_kwargs):
         entity = context['object']
+        cells = self._get_cells(entity, context)
+        EntityCell.mixed_populate_entities(cells, [entity], context['user'])
 
         return super().get_template_context(
             context,
             title=self._get_title(entity, context),
-            cells=self._get_cells(entity, context),
+            cells=cells,
             **extra_kwargs
         )
 
@@ -710,11 +797,16 @@ class CustomBrick(Brick):
 
     def get_template_context(self, context, **extra_kwargs):
         config_item = self.config_item
+        cells = [*config_item.filtered_cells]
+
+        # NB: the relationships, custom-fields... of all the cells are
+        #     retrieved with a few queries.
+        EntityCell.mixed_populate_entities(cells, [context['object']], context['user'])
 
         return super().get_template_context(
             context,
             config_item=config_item,
-            cells=[*config_item.filtered_cells],
+            cells=cells,
             **extra_kwargs
         )
 
@@ -847,6 +939,8 @@ class BrickRegistry:
                 if setdefault(brick_id, brick_cls) is not brick_cls:
                     raise self.RegistrationError(f"Duplicated brick's ID: {brick_id}")
 
+                brick_html_cache.register(brick_cls)
+
         return self
 
     # TODO: factorise
@@ -23,8 +23,16 @@ class Command(BaseCommand):
     help = 'Run a pool of task workers (batch processing, CSV importing etc...).'
     args = ''
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers', '-w', dest='workers', type=int, default=None,
+            help='Size of the pool of pre-forked processes which run the user jobs '
+                 '(0 means one new process per job). '
+                 'Default: see the setting JOB_MANAGER_WORKERS.',
+        )
+
     def handle(self, *args, **options):
         verbosity = options.get('verbosity')
 
         from creme.creme_core.core.job import JobScheduler
-        JobScheduler().start(verbose=bool(verbosity))
+        JobScheduler(workers=options.get('workers')).start(verbose=bool(verbosity))
@@ -0,0 +1,57 @@
+################################################################################
+#    Creme is a free/open-source Customer Relationship Management software
+#    Copyright (C) 2026  Hybird
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+
+from django.core.management.base import BaseCommand, CommandError
+
+from creme.creme_core.core.search import SearchIndexer
+from creme.creme_core.registry import creme_registry
+
+
+class Command(BaseCommand):
+    help = (
+        'Rebuild the search index (used by the global search when the setting '
+        '"SEARCH_INDEX_ENABLED" is True).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'models', nargs='*',
+            help='Models to index, with the format "app_label.ModelName" '
+                 '(e.g. "persons.Contact"). By default, all the entity models are indexed.',
+        )
+
+    def handle(self, **options):
+        verbosity = options.get('verbosity')
+        models = [*creme_registry.iter_entity_models()]
+
+        model_ids = options.get('models')
+        if model_ids:
+            models_per_id = {model._meta.label_lower: model for model in models}
+
+            try:
+                models = [models_per_id[model_id.lower()] for model_id in model_ids]
+            except KeyError as e:
+                raise CommandError(f'Invalid model {e}; it must be an entity model.')
+
+        indexer = SearchIndexer()
+
+        for model in models:
+            count = indexer.rebuild(model)
+
+            if verbosity:
+                self.stdout.write(f'{model._meta.label}: {count} entities indexed.')
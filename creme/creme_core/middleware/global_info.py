@@ -29,7 +29,9 @@ from ..global_info import clear_global_info, set_global_info
 
 class GlobalInfoMiddleware(MiddlewareMixin):
     def process_request(self, request):
-        set_global_info(user=request.user, per_request_cache={})
+        # NB: 'in_request' indicates that the per-request cache is reset at the
+        #     end of the request (see 'creme_core.core.shared_cache').
+        set_global_info(user=request.user, per_request_cache={}, in_request=True)
 
     def process_response(self, request, response):
         clear_global_info()
@@ -0,0 +1,86 @@
+################################################################################
+#    Creme is a free/open-source Customer Relationship Management software
+#    Copyright (C) 2026  Hybird
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+
+from time import perf_counter
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from ..core.instrumentation import Recorder, metrics_registry
+
+
+class InstrumentationMiddleware:
+    """This Middleware measures the requests (see 'creme_core.core.instrumentation')
+    & adds a header "Server-Timing" to the responses.
+    It is not used if the setting "INSTRUMENTATION_ENABLED" is False.
+    BEWARE: it must be placed after 'GlobalInfoMiddleware'.
+    """
+    registry = metrics_registry
+    # Maximum number of operations in the header "Server-Timing" (the slowest ones)
+    server_timing_max_entries = 20
+
+    def __init__(self, get_response):
+        if not settings.INSTRUMENTATION_ENABLED:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+
+    def __call__(self, request):
+        recorder = Recorder().install()
+        start = perf_counter()
+
+        with connections[DEFAULT_DB_ALIAS].execute_wrapper(recorder.query_wrapper):
+            response = self.get_response(request)
+
+        duration = perf_counter() - start
+        match = request.resolver_match
+        self.registry.add_recorder(
+            recorder,
+            view_name=match.view_name if match else '',
+            duration=duration,
+        )
+        response['Server-Timing'] = self.build_server_timing(recorder, duration)
+
+        return response
+
+    @staticmethod
+    def _description(value: str) -> str:
+        return value.replace('\\', '').replace('"', '')
+
+    def build_server_timing(self, recorder: Recorder, duration: float) -> str:
+        "See https://developer.mozilla.org/en-US/docs/Web/HTTP/Reference/Headers/Server-Timing"
+        desc = self._description
+        entries = [
+            f'total;dur={duration * 1000:.1f}',
+            f'db;desc="{recorder.queries} queries";dur={recorder.queries_duration * 1000:.1f}',
+        ]
+        entries.extend(
+            f'{category}-{index};'
+            f'desc="{desc(name)} (x{metric.count}, {metric.queries} queries)";'
+            f'dur={metric.duration * 1000:.1f}'
+            for index, ((category, name), metric) in enumerate(
+                sorted(
+                    recorder.metrics.items(),
+                    key=lambda item: item[1].duration, reverse=True,
+                )[:self.server_timing_max_entries],
+                start=1,
+            )
+        )
+
+        return ', '.join(entries)
@@ -0,0 +1,47 @@
+from django.db import migrations, models
+
+import creme.creme_core.models.fields as core_fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('creme_core', '0205_v3_0__entityfilter_disabled'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchToken',
+            fields=[
+                (
+                    'id',
+                    models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name='ID',
+                    )
+                ),
+                (
+                    'entity_ctype',
+                    core_fields.EntityCTypeForeignKey(
+                        to='contenttypes.contenttype', related_name='+',
+                        on_delete=models.CASCADE, editable=False,
+                    )
+                ),
+                (
+                    'entity',
+                    models.ForeignKey(
+                        to='creme_core.cremeentity', related_name='+',
+                        on_delete=models.CASCADE, editable=False,
+                    )
+                ),
+                ('cell_key', models.CharField(max_length=100, editable=False)),
+                ('token', models.CharField(max_length=100, editable=False)),
+            ],
+            options={
+                'indexes': [
+                    models.Index(
+                        fields=['entity_ctype', 'token'],
+                        name='core__search_token__lookup',
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('creme_core', '0206_v3_0__search_tokens'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='last_duration',
+            field=models.DurationField(
+                editable=False, null=True, verbose_name='Duration of the last run',
+            ),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='last_max_rss',
+            field=models.PositiveBigIntegerField(
+                editable=False, null=True, verbose_name='Peak memory of the process',
+            ),
+        ),
+    ]
@@ -0,0 +1,54 @@
+from django.conf import settings
+from django.db import migrations, models
+
+import creme.creme_core.models.fields as core_fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('creme_core', '0207_v3_0__job_metrics'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedHistoryLine',
+            fields=[
+                ('id', models.PositiveIntegerField(primary_key=True, serialize=False)),
+                (
+                    'entity',
+                    models.ForeignKey(
+                        to='creme_core.cremeentity', null=True,
+                        on_delete=models.SET_NULL, related_name='+',
+                    )
+                ),
+                (
+                    'entity_ctype',
+                    core_fields.CTypeForeignKey(to='contenttypes.contenttype', related_name='+'),
+                ),
+                (
+                    'entity_owner',
+                    core_fields.CremeUserForeignKey(
+                        to=settings.AUTH_USER_MODEL, related_name='+',
+                    ),
+                ),
+                ('username', models.CharField(max_length=30)),
+                ('date', models.DateTimeField(verbose_name='Date')),
+                ('type', models.PositiveSmallIntegerField(verbose_name='Type')),
+                ('value', models.TextField(null=True)),
+                (
+                    'by_wf_engine',
+                    models.BooleanField(default=False, verbose_name='Action of Workflow engine'),
+                ),
+            ],
+            options={
+                'verbose_name': 'Archived line of history',
+                'verbose_name_plural': 'Archived lines of history',
+                'indexes': [
+                    models.Index(fields=['entity_id', '-id'], name='archived_hline__entity'),
+                ],
+                'ordering': ('id',),
+            },
+        ),
+    ]
@@ -27,7 +27,11 @@ from .entity_filter import EntityFilter, EntityFilterCondition  # NOQA
 from .fields_config import FieldsConfig  # NOQA
 from .file_ref import FileRef  # NOQA
 from .header_filter import HeaderFilter  # NOQA
-from .history import HistoryConfigItem, HistoryLine  # NOQA
+from .history import (  # NOQA
+    ArchivedHistoryLine,
+    HistoryConfigItem,
+    HistoryLine,
+)
 from .i18n import Language  # NOQA
 from .imprint import Imprint  # NOQA
 from .job import EntityJobResult, Job, JobResult, MassImportJobResult  # NOQA
@@ -42,7 +46,7 @@ from .notification import (  # NOQA
 from .pinned_entity import PinnedEntity  # NOQA
 from .populate import PopulatedApp  # NOQA
 from .relation import Relation, RelationType, SemiFixedRelationType  # NOQA
-from .search import SearchConfigItem  # NOQA
+from .search import SearchConfigItem, SearchToken  # NOQA
 from .setting_value import SettingValue  # NOQA
 from .vat import Vat  # NOQA
 from .version import Version  # NOQA
@@ -38,6 +38,7 @@ from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import PermissionDenied, ValidationError
 from django.db import models
 from django.db.models import Q, QuerySet
+from django.dispatch import receiver
 from django.utils.functional import partition
 from django.utils.timezone import now, zoneinfo
 from django.utils.translation import gettext
@@ -46,6 +47,8 @@ from django.utils.translation import gettext_lazy as _
 from ..auth import EntityCredentials
 from ..auth.special import SpecialPermission, special_perm_registry
 from ..core.setting_key import UserSettingValueManager
+from ..core.shared_cache import shared_cache
+from ..global_info import get_global_info, get_per_request_cache
 from ..utils.content_type import as_ctype, as_model
 from ..utils.unicode_collation import collator
 from . import fields as core_fields
@@ -65,6 +68,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Key of the per-request cache used by CremeUser.get_perms_map()
+PERMS_MAP_CACHE_KEY = 'creme_core-perms_map'
+
 
 class UserRoleManager(models.Manager):
     def get_by_portable_key(self, key: str) -> UserRole:
@@ -347,7 +353,11 @@ class UserRole(models.Model):
 
         if setcredentials is None:
             logger.debug('UserRole.get_credentials(): Cache MISS for id=%s', self.id)
-            self._setcredentials = setcredentials = [*self.credentials.all()]
+            self._setcredentials = setcredentials = shared_cache.get_or_compute(
+                key=f'creme_core-role_credentials-{self.id}',
+                models=[SetCredentials],
+                compute=lambda: [*self.credentials.all()],
+            )
         else:
             logger.debug('UserRole.get_credentials(): Cache HIT for id=%s', self.id)
 
@@ -364,6 +374,28 @@ class UserRole(models.Model):
 
         return perms
 
+    def get_perms_map(self, user, entities: Iterable[CremeEntity]) -> dict[int, int]:
+        """Batch version of get_perms().
+        @return: A dictionary with entities' IDs as keys, & permissions
+                 (integers with binary flags) as values.
+        """
+        is_app_allowed = self.is_app_allowed_or_administrable
+        perms_map = {}
+        allowed_entities = []
+
+        for entity in entities:
+            if is_app_allowed(entity.entity_type.model_class()._meta.app_label):
+                allowed_entities.append(entity)
+            else:
+                perms_map[entity.id] = EntityCredentials.NONE
+
+        if allowed_entities:
+            perms_map.update(SetCredentials.get_perms_map(
+                self._get_setcredentials(), user, allowed_entities,
+            ))
+
+        return perms_map
+
     # TODO: factorise
     def filter(self,
                user,
@@ -587,6 +619,75 @@ class SetCredentials(models.Model):
 
         return perms
 
+    @staticmethod
+    def get_perms_map(sc_sequence: Sequence[SetCredentials],
+                      user,
+                      entities: Iterable[CremeEntity],
+                      ) -> dict[int, int]:
+        """Batch version of get_perms(); the EntityFilters are applied with
+        one query per filter & per type of entity (instead of calling
+        EntityFilter.accept() on each entity).
+        Notice that the filters are so applied on the values stored in the
+        database (not on the values of the given instances).
+
+        @param sc_sequence: Sequence of SetCredentials instances.
+        @param entities: Instances of CremeEntity (the real entities are not needed).
+        @return: A dictionary with entities' IDs as keys, & permissions
+                 (integers with binary flags) as values.
+        """
+        NONE = EntityCredentials.NONE
+        owner_ids = {user.id, *(team.id for team in user.teams)}
+
+        entities_per_ctid: DefaultDict[int, list[CremeEntity]] = defaultdict(list)
+        for entity in entities:
+            entities_per_ctid[entity.entity_type_id].append(entity)
+
+        perms_map = {}
+
+        for ct_id, ct_entities in entities_per_ctid.items():
+            model = ContentType.objects.get_for_id(ct_id).model_class()
+            accepted_ids = {}  # Key: EntityFilter ID; values: IDs of accepted entities
+
+            def _get_accepted_ids(efilter):
+                ids = accepted_ids.get(efilter.id)
+
+                if ids is None:
+                    accepted_ids[efilter.id] = ids = {
+                        *efilter.filter(
+                            model._default_manager.filter(id__in=[e.id for e in ct_entities]),
+                            user=user,
+                        ).values_list('id', flat=True),
+                    }
+
+                return ids
+
+            def _get_perms(sc, entity):
+                if sc.ctype_id and sc.ctype_id != ct_id:
+                    return NONE
+
+                match sc.set_type:
+                    case SetCredentials.ESET_ALL:
+                        return sc.value
+                    case SetCredentials.ESET_OWN:
+                        return sc.value if entity.user_id in owner_ids else NONE
+                    case _:  # SetCredentials.ESET_FILTER
+                        return sc.value if entity.id in _get_accepted_ids(sc.efilter) else NONE
+
+            for entity in ct_entities:
+                perms = reduce(
+                    or_op,
+                    (_get_perms(sc, entity) for sc in sc_sequence if not sc.forbidden),
+                    NONE,
+                )
+
+                for sc in sc_sequence:
+                    if sc.forbidden:
+                        perms &= ~_get_perms(sc, entity)
+
+                perms_map[entity.id] = perms
+
+        return perms_map
+
     @classmethod
     def _can_do(cls,
                 sc_sequence: Sequence[SetCredentials],
@@ -1301,6 +1402,14 @@ class CremeUser(AbstractBaseUser):
         else:
             creds = creds_map.get(self.id)
 
+        if creds is None:
+            # NB: filled by get_perms_map()
+            creds = get_per_request_cache().get(PERMS_MAP_CACHE_KEY, {}).get(
+                (self.id, entity.id)
+            )
+            if creds is not None:
+                creds_map[self.id] = creds
+
         if creds is None:
             logger.debug(
                 'CremeUser._get_credentials(): Cache MISS for id=%s user=%s',
@@ -1315,6 +1424,56 @@ class CremeUser(AbstractBaseUser):
 
         return creds
 
+    def get_perms_map(self, entities: Iterable[CremeEntity]) -> dict[int, EntityCredentials]:
+        """Get the credentials of the user for several entities, with a constant
+        number of queries. Use it before calling the methods 'has_perm_to_*()'
+        on a collection of entities (e.g. in a brick): the credentials are
+        stored in the entities too, so these methods use them.
+
+        The result is cached during the current request (the cache is cleared
+        when an instance is saved/deleted).
+
+        @param entities: Instances of CremeEntity.
+        @return: A dictionary with entities' IDs as keys & instances of
+                 EntityCredentials as values.
+        """
+        user_id = self.id
+        perms_cache = get_per_request_cache().setdefault(PERMS_MAP_CACHE_KEY, {})
+        entities = [*entities]
+        creds_map = {}
+        missing_entities = []
+
+        for entity in entities:
+            creds = perms_cache.get((user_id, entity.id))
+
+            if creds is None:
+                creds = getattr(entity, '_credentials_map', {}).get(user_id)
+
+            if creds is None:
+                missing_entities.append(entity)
+            else:
+                creds_map[entity.id] = creds
+
+        if missing_entities:
+            logger.debug(
+                'CremeUser.get_perms_map(): Cache MISS for %s entities user=%s',
+                len(missing_entities), self,
+            )
+            new_creds = EntityCredentials.build_map(self, missing_entities)
+            creds_map.update(new_creds)
+            perms_cache.update(
+                ((user_id, e_id), creds) for e_id, creds in new_creds.items()
+            )
+
+        for entity in entities:
+            instance_map = getattr(entity, '_credentials_map', None)
+            if instance_map is None:
+                entity._credentials_map = instance_map = {}
+
+            instance_map[user_id] = creds_map[entity.id]
+
+        return creds_map
+
     def has_perm(self, perm: str, obj=None) -> bool:
         """
         Returns True if the user has the specified permission. This method
@@ -1722,3 +1881,19 @@ class Sandbox(models.Model):
     @type.setter
     def type(self, value: SandboxType):
         self.type_id = value.id
+
+
+shared_cache.register(SetCredentials)
+
+
+# NB: the credentials can depend on the fields of the entities, their
+#     relationships, the roles... so any modification clears the cache
+#     (modifications are rare in the requests which display many entities).
+@receiver(models.signals.post_save,   dispatch_uid='creme_core-clear_perms_map_cache')
+@receiver(models.signals.post_delete, dispatch_uid='creme_core-clear_perms_map_cache_del')
+@receiver(models.signals.m2m_changed, dispatch_uid='creme_core-clear_perms_map_cache_m2m')
+def _clear_perms_map_cache(sender, **kwargs):
+    cache = get_global_info('per_request_cache')
+
+    if cache:
+        cache.pop(PERMS_MAP_CACHE_KEY, None)
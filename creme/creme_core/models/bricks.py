@@ -35,6 +35,7 @@ from django.utils.translation import gettext_lazy as _
 
 from .. import setting_keys
 from ..constants import MODELBRICK_ID
+from ..core.shared_cache import shared_cache
 from ..utils.content_type import entity_ctypes
 from . import fields as core_fields
 from .auth import UserRole
@@ -892,3 +893,6 @@ class BrickState(CremeModel):
         # extra data you probably save() the field explicitly...)
         self.json_extra_data = self._extra_data
         super().save(**kwargs)
+
+
+shared_cache.register(BrickDetailviewLocation)
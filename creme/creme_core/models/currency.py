@@ -22,7 +22,7 @@ from django.db import models
 from django.db.transaction import atomic
 from django.utils.translation import gettext_lazy as _
 
-from ..global_info import cached_per_request
+from ..core.shared_cache import cached_shared
 from . import base
 
 logger = logging.getLogger(__name__)
@@ -30,7 +30,7 @@ logger = logging.getLogger(__name__)
 
 # TODO: factorise? (VAT etc...)
 class CurrencyManager(base.MinionManager):
-    @cached_per_request('creme_core-default_currency')
+    @cached_shared('creme_core-default_currency', models=['creme_core.Currency'])
     def default(self):
         return self.filter(is_default=True)[0]
 
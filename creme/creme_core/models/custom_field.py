@@ -31,6 +31,7 @@ from django.utils.timezone import localtime
 from django.utils.translation import gettext
 from django.utils.translation import gettext_lazy as _
 
+from ..core.shared_cache import shared_cache
 from ..core.value_maker import ValueMaker, value_maker_registry
 from ..global_info import get_per_request_cache
 from ..utils.content_type import as_ctype
@@ -61,7 +62,9 @@ class CustomFieldManager(models.Manager):
 
         cached_cfields = cache.get(key)
         if cached_cfields is None:
-            cached_cfields = cache[key] = [*self.filter(content_type=ct)]
+            cached_cfields = cache[key] = shared_cache.get_or_compute(
+                key=key, models=[self.model], compute=lambda: [*self.filter(content_type=ct)],
+            )
 
         return OrderedDict((cfield.id, cfield) for cfield in cached_cfields)
 
@@ -181,6 +184,9 @@ class CustomField(CremeModel):
         return cvalues_map
 
 
+shared_cache.register(CustomField)
+
+
 class CustomFieldValue(CremeModel):
     custom_field = models.ForeignKey(CustomField, on_delete=models.CASCADE)
     entity = models.ForeignKey(CremeEntity, on_delete=models.CASCADE)
@@ -327,6 +327,7 @@ class CremeEntity(CremeModel):
     @staticmethod
     def populate_relations(entities: Collection[CremeEntity],
                            relation_type_ids: Collection[str],
+                           real_obj_entities: bool = True,
                            ) -> None:
         from . import Relation
 
@@ -335,7 +336,10 @@ class CremeEntity(CremeModel):
         relations = Relation.objects.filter(
             subject_entity__in=[e.id for e in entities],
             type__in=relation_type_ids,
-        ).prefetch_related('real_object')
+        )
+
+        if real_obj_entities:
+            relations = relations.prefetch_related('real_object')
 
         # { Subject_Entity -> { RelationType ->[Relation list] } }
         relations_map: DefaultDict[int, DefaultDict[str, list]] = \
@@ -21,17 +21,19 @@ from __future__ import annotations
 import logging
 import warnings
 from collections.abc import Iterable, Iterator
-from copy import deepcopy
+from copy import copy, deepcopy
 from itertools import zip_longest
 from re import compile as compile_re
+from time import perf_counter
 from typing import TYPE_CHECKING, Literal, Type
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
-from django.core.exceptions import PermissionDenied
+from django.core.exceptions import EmptyResultSet, PermissionDenied
 from django.db import models
 from django.db.models import Q, QuerySet
-from django.db.models.signals import pre_delete
+from django.db.models.signals import post_delete, post_save, pre_delete
 from django.dispatch import receiver
 from django.utils.translation import gettext
 from django.utils.translation import gettext_lazy as _
@@ -44,7 +46,8 @@ from ..core.entity_filter import (
     entity_filter_registries,
 )
 from ..core.exceptions import ConflictError
-from ..global_info import get_global_info
+from ..core.instrumentation import measure
+from ..global_info import get_global_info, get_per_request_cache
 from ..setting_keys import global_filters_edition_key
 from ..utils.id_generator import generate_string_id_and_save
 from ..utils.model import update_model_instance
@@ -398,6 +401,9 @@ class EntityFilter(models.Model):  # TODO: CremeModel? MinionModel?
 
     efilter_registries = entity_filter_registries
 
+    # Key of the per-request cache used by get_q()
+    compiled_q_cache_key = 'creme_core-efilter_compiled_q'
+
     _errors_cache = None
     _conditions_cache = None
     _connected_filter_cache = None
@@ -1012,20 +1018,77 @@ class EntityFilter(models.Model):  # TODO: CremeModel? MinionModel?
         return self.registry.deletion_url(self)
 
     def get_q(self, user: CremeUser | None = None) -> Q:
-        query = Q()
-
+        """Get the Q instance corresponding to the conditions.
+        The result is cached (per request) for the saved filters; the cache is
+        cleared when a filter or a condition is saved/deleted.
+        @param user: Current user (used by some operands) ; the global user is
+               used by default.
+        """
         if user is None:
             user = get_global_info('user')
 
-        if self.use_or:
-            for condition in self.get_conditions():
-                query |= condition.get_q(user)
-        else:
-            for condition in self.get_conditions():
-                query &= condition.get_q(user)
+        if self._state.adding:  # Not saved
+            return self._compile_q(user)
+
+        # NB: the Q instances contain lazy sub-queries, so the result does not
+        #     depend on the data of the entities (except with materialized IDs).
+        compiled_cache = get_per_request_cache().setdefault(self.compiled_q_cache_key, {})
+        key = (self.id, self.modified, self.use_or, user.id if user else None)
+        query = compiled_cache.get(key)
+
+        if query is None:
+            compiled_cache[key] = query = self._compile_q(user)
 
         return query
 
+    def _compile_q(self, user: CremeUser | None) -> Q:
+        query = Q()
+        max_ids = settings.FILTERS_MATERIALIZED_IDS_MAX
+
+        with measure('entity_filter', self.id):
+            if self.use_or:
+                for condition in self.get_conditions():
+                    query |= condition.get_q(user, max_ids=max_ids)
+            else:
+                for condition in self.get_conditions():
+                    query &= condition.get_q(user, max_ids=max_ids)
+
+        return query
+
+    @classmethod
+    def clear_compiled_q_cache(cls) -> None:
+        "Clear the cache used by get_q()."
+        get_per_request_cache().pop(cls.compiled_q_cache_key, None)
+
+    def explain(self, user: CremeUser) -> dict:
+        """Get information about the query which filters the entities
+        (debugging purpose).
+        @param user: Current user.
+        @return: A dictionary with the keys:
+            - "sql": the SQL query (string) ; empty if the query cannot match anything.
+            - "compile_time": time to build the Q instance, in milliseconds
+              (the cache of get_q() is not used).
+            - "conditions": the number of valid conditions.
+        """
+        start = perf_counter()
+        query = self._compile_q(user)
+        compile_time = (perf_counter() - start) * 1000
+
+        qs = self.entity_type.model_class()._default_manager.filter(query)
+        if not self.entities_are_distinct:
+            qs = qs.distinct()
+
+        try:
+            sql = str(qs.query)
+        except EmptyResultSet:
+            sql = ''
+
+        return {
+            'sql': sql,
+            'compile_time': compile_time,
+            'conditions': len(self.get_conditions()),
+        }
+
     def _build_conditions_cache(self, conditions) -> None:
         checked_conds: list[EntityFilterCondition] = []
         append = checked_conds.append
@@ -1090,6 +1153,7 @@ class EntityFilter(models.Model):  # TODO: CremeModel? MinionModel?
             EntityFilterCondition.objects.filter(pk__in=conds2del).delete()
 
         self._build_conditions_cache(conditions)
+        self.clear_compiled_q_cache()
 
         return self
 
@@ -1253,8 +1317,21 @@ class EntityFilterCondition(models.Model):
 
         return handler.error
 
-    def get_q(self, user: CremeUser | None = None) -> Q:
-        return self.handler.get_q(user)
+    def get_q(self, user: CremeUser | None = None, max_ids: int = 0) -> Q:
+        """Get the Q instance corresponding to the condition.
+        @param user: Current user.
+        @param max_ids: If the handler is "materializable", the sub-queries
+               retrieving IDs are replaced by the list of IDs when there are
+               not more IDs than this value ("0" means no materialization).
+        """
+        handler = self.handler
+        query = handler.get_q(user)
+
+        return (
+            _materialize_q(query, max_ids=max_ids)
+            if max_ids and handler.materializable else
+            query
+        )
 
     def _get_subfilter_id(self) -> str | None:
         return self.handler.subfilter_id
@@ -1287,6 +1364,41 @@ class EntityFilterCondition(models.Model):
 # TODO: manage also deletion of:
 #  - instance linked with FK (Minion, User?...).
 #  - instance of CremeEntity used by Relation handlers.
+def _materialize_q(query: Q, max_ids: int) -> Q:
+    """Replace the sub-queries of a Q instance by the list of their results
+    (if there are not more than "max_ids" results).
+    """
+    children = []
+
+    for child in query.children:
+        if isinstance(child, Q):
+            child = _materialize_q(child, max_ids=max_ids)
+        else:
+            lookup, value = child
+
+            if isinstance(value, QuerySet):
+                ids = [*value[:max_ids + 1]]
+                if len(ids) <= max_ids:
+                    child = (lookup, ids)
+
+        children.append(child)
+
+    materialized = copy(query)
+    materialized.children = children
+
+    return materialized
+
+
+@receiver(post_save,   sender=EntityFilter,          dispatch_uid='creme_core-efilter_q_saved')
+@receiver(post_delete, sender=EntityFilter,          dispatch_uid='creme_core-efilter_q_deleted')
+@receiver(post_save,   sender=EntityFilterCondition, dispatch_uid='creme_core-efcond_q_saved')
+@receiver(post_delete, sender=EntityFilterCondition, dispatch_uid='creme_core-efcond_q_deleted')
+def _clear_compiled_q_cache(sender, **kwargs):
+    # NB: the filters are rarely modified, so we do not try to be smart
+    #     (sub-filters should be managed...)
+    EntityFilter.clear_compiled_q_cache()
+
+
 @receiver(pre_delete, dispatch_uid='creme_core-remove_related_filter_conditions')
 def _delete_related_efc(sender, instance, **kwargs):
     from ..core.entity_filter.condition_handler import all_handlers
@@ -33,6 +33,7 @@ from django.utils.translation import gettext
 from django.utils.translation import gettext_lazy as _
 
 from ..core.field_tags import FieldTag
+from ..core.shared_cache import shared_cache
 from ..global_info import get_per_request_cache
 from ..utils.meta import FieldInfo
 from .base import CremeModel
@@ -128,8 +129,8 @@ class FieldsConfigManager(models.Manager):
             else:
                 result[model] = fc
 
-        # Step 2: fill 'result' with configs in DB
-        for fc in self.filter(content_type__in=not_cached_ctypes):
+        # Step 2: fill 'result' with configs in DB (or in the shared cache)
+        for fc in self._get_stored_configs(not_cached_ctypes):
             ct = fc.content_type
             result[ct.model_class()] = cache[cache_key_fmt(ct.id)] = fc
 
@@ -144,6 +145,26 @@ class FieldsConfigManager(models.Manager):
 
         return result
 
+    def _get_stored_configs(self, ctypes: list[ContentType]) -> Iterable[FieldsConfig]:
+        if not ctypes:
+            return ()
+
+        if shared_cache.enabled:
+            # NB: there is at most one instance per model, so we cache them all
+            ct_ids = {ct.id for ct in ctypes}
+
+            return [
+                fc
+                for fc in shared_cache.get_or_compute(
+                    key='creme_core-fields_configs',
+                    models=[self.model],
+                    compute=lambda: [*self.all()],
+                )
+                if fc.content_type_id in ct_ids
+            ]
+
+        return self.filter(content_type__in=ctypes)
+
     def has_configurable_fields(self, model: type[Model]) -> bool:
         return any(self.configurable_fields(model))
 
@@ -519,3 +540,6 @@ class FieldsConfig(CremeModel):
 
     def natural_key(self):
         return self.content_type.natural_key()
+
+
+shared_cache.register(FieldsConfig)
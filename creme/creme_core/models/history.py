@@ -19,7 +19,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Collection, Container, Iterable, Iterator
+from collections.abc import Collection, Container, Iterable, Iterator, Sequence
 from datetime import date, datetime, time
 from decimal import Decimal
 from functools import partial
@@ -440,12 +440,12 @@ class _HLTEntityDeletion(_HistoryLineType):
 
     @classmethod
     def create_line(cls, entity: CremeEntity) -> None:
-        HistoryLine.objects.create(
+        HistoryLine(
             entity_ctype=entity.entity_type,
             entity_owner=entity.user,
             type=cls.type_id,
             value=HistoryLine._encode_attrs(entity),
-        )
+        )._save_new()
 
 
 @TYPES_MAP(TYPE_TRASH)
@@ -460,7 +460,7 @@ class _HLTEntityTrash(_HistoryLineType):
         if snapshot and any(
             diff.field_name == 'is_deleted' for diff in snapshot.compare(entity)
         ):
-            HistoryLine.objects.create(
+            HistoryLine(
                 entity=entity,
                 entity_ctype=entity.entity_type,
                 entity_owner=entity.user,
@@ -468,7 +468,7 @@ class _HLTEntityTrash(_HistoryLineType):
                 value=HistoryLine._encode_attrs(
                     entity, modifs=[entity.is_deleted],
                 ),
-            )
+            )._save_new()
 
 
 @TYPES_MAP(TYPE_RELATED)
@@ -484,16 +484,20 @@ class _HLTRelatedEntity(_HistoryLineType):
         ).select_related('object_entity')
 
         if relations:
+            related_line._unbuffer()  # We need its ID
+
             object_entities = [r.object_entity for r in relations]
-            create_line = partial(
-                HistoryLine._create_line_4_instance,
+            build_line = partial(
+                HistoryLine._build_line_4_instance,
                 ltype=cls.type_id, date=entity.modified, related_line_id=related_line.id,
             )
 
             CremeEntity.populate_real_entities(object_entities)  # Optimisation
 
-            for related_entity in object_entities:
-                create_line(related_entity.get_real_entity())
+            HistoryLine._save_new_lines([
+                build_line(related_entity.get_real_entity())
+                for related_entity in object_entities
+            ])
 
 
 @TYPES_MAP(TYPE_PROP_ADD)
@@ -534,7 +538,8 @@ class _HLTRelation(_HistoryLineType):
                       sym_cls: type[_HistoryLineType],
                       date=None,
                       ) -> None:
-        create_line = partial(HistoryLine._create_line_4_instance, date=date)
+        # NB: the lines reference each other, so they cannot be buffered.
+        create_line = partial(HistoryLine._create_line_4_instance, date=date, bufferable=False)
         hline     = create_line(relation.subject_entity, cls.type_id)
         hline_sym = create_line(
             relation.object_entity, sym_cls.type_id,
@@ -547,9 +552,60 @@ class _HLTRelation(_HistoryLineType):
         )
         hline.save()
 
+    @classmethod
+    def create_lines_in_bulk(cls, relations: Sequence[Relation]) -> None:
+        """Create the lines of several new Relations with 3 queries (instead
+        of 3 queries per Relation) ; see RelationManager.safe_bulk_create().
+        NB: the DB backend must be able to retrieve the IDs of the instances
+            created by a bulk insertion.
+        @param relations: Saved Relations, with their symmetrical instances.
+        """
+        if not relations or not is_history_enabled():
+            return
+
+        build_line = HistoryLine._build_line_4_instance
+        bulk_create = HistoryLine.objects.bulk_create
+        main_relations = [
+            relation if '-subject_' in relation.type_id else relation.symmetric_relation
+            for relation in relations
+        ]
+
+        # NB: the lines reference each other, so they cannot be buffered.
+        hlines = [
+            build_line(relation.subject_entity, cls.type_id, date=relation.created)
+            for relation in main_relations
+        ]
+        for hline in hlines:
+            hline._fill_context()
+
+        bulk_create(hlines)
+
+        sym_hlines = [
+            build_line(
+                relation.object_entity, _HLTSymRelation.type_id,
+                date=relation.created,
+                modifs=[relation.symmetric_relation.type_id],
+                related_line_id=hline.id,
+            ) for relation, hline in zip(main_relations, hlines)
+        ]
+        for hline in sym_hlines:
+            hline._fill_context()
+
+        bulk_create(sym_hlines)
+
+        for relation, hline, hline_sym in zip(main_relations, hlines, sym_hlines):
+            hline.value = HistoryLine._encode_attrs(
+                hline.entity,
+                modifs=[relation.type_id], related_line_id=hline_sym.id,
+            )
+            relation._hlines_created = relation.symmetric_relation._hlines_created = True
+
+        HistoryLine.objects.bulk_update(hlines, fields=['value'])
+
     @classmethod
     def create_lines(cls, relation: Relation, created: bool):
-        if not created:
+        # NB: the lines may have been created by create_lines_in_bulk()
+        if not created and not getattr(relation, '_hlines_created', False):
             cls._create_lines(
                 relation if '-subject_' in relation.type_id else relation.symmetric_relation,
                 _HLTSymRelation, relation.created,
@@ -715,6 +771,7 @@ class _HLTEntityExport(_HistoryLineType):
 
 
 HISTORY_ENABLED_CACHE_KEY = 'creme_core-history-enabled'
+HISTORY_BUFFER_CACHE_KEY = 'creme_core-history-buffer'
 
 
 def is_history_enabled() -> bool:
@@ -733,6 +790,71 @@ def is_history_enabled() -> bool:
     return True
 
 
+class HistoryLineBuffer:
+    """Collects the new HistoryLines, in order to insert them with a few
+    queries (see 'creme_core.core.history.buffered_history()').
+    """
+    # The lines are inserted when this number of lines is reached
+    # (None means the lines are only inserted by an explicit call to flush()).
+    size: int | None = 512
+
+    def __init__(self) -> None:
+        self._lines: list[HistoryLine] = []
+
+    def __len__(self):
+        return len(self._lines)
+
+    def add(self, hline: HistoryLine) -> None:
+        lines = self._lines
+        lines.append(hline)
+        hline._buffered = True
+
+        size = self.size
+        if size is not None and len(lines) >= size:
+            self.flush()
+
+    def remove(self, hline: HistoryLine) -> None:
+        self._lines.remove(hline)
+        hline._buffered = False
+
+    def clear(self) -> None:
+        self.truncate(0)
+
+    def truncate(self, length: int) -> None:
+        """Remove the lines which have been added after the buffer reached a
+        given length (e.g. the related savepoint has been rolled back).
+        """
+        lines = self._lines
+
+        for hline in lines[length:]:
+            hline._buffered = False
+
+        del lines[length:]
+
+    def flush(self) -> None:
+        "Insert the collected lines."
+        lines = self._lines
+
+        if lines:
+            self._lines = []
+            # NB: the entities deleted after the creation of their lines
+            #     (it emulates the "on_delete=SET_NULL").
+            deleted_ids = _get_deleted_entity_ids()
+
+            for hline in lines:
+                hline._buffered = False
+
+                if hline.entity_id in deleted_ids:
+                    hline.entity = None
+
+            HistoryLine.objects.bulk_create(lines)
+
+
+def get_history_buffer() -> HistoryLineBuffer | None:
+    "Get the current buffer of lines (see 'creme_core.core.history.buffered_history()')."
+    return get_per_request_cache().get(HISTORY_BUFFER_CACHE_KEY)
+
+
 class HistoryLine(Model):
     entity = models.ForeignKey(CremeEntity, null=True, on_delete=models.SET_NULL)
 
@@ -758,6 +880,7 @@ class HistoryLine(Model):
     _modifications: list | None = None
     _related_line_id: int | None = None
     _related_line: HistoryLine | bool | None = False
+    _buffered: bool = False
 
     class Meta:
         app_label = 'creme_core'
@@ -820,6 +943,36 @@ class HistoryLine(Model):
             if not progress:
                 break
 
+    @staticmethod
+    def archive_lines(line_qs, chunk_size: int = 1024) -> int:
+        """Move some HistoryLines to the table of ArchivedHistoryLine (the IDs
+        are kept, so the related lines can still be found).
+        The lines are moved by chunk (one transaction per chunk).
+        @param line_qs: QuerySet on HistoryLine.
+        @return: The number of archived lines.
+        """
+        fields = [
+            field.attname for field in HistoryLine._meta.concrete_fields
+        ]
+        count = 0
+
+        while True:
+            with atomic():
+                hlines = [*line_qs.order_by('id')[:chunk_size]]
+                if not hlines:
+                    break
+
+                ArchivedHistoryLine.objects.bulk_create([
+                    ArchivedHistoryLine(
+                        **{fname: getattr(hline, fname) for fname in fields}
+                    ) for hline in hlines
+                ])
+                HistoryLine.objects.filter(id__in=[hline.id for hline in hlines]).delete()
+
+            count += len(hlines)
+
+        return count
+
     @staticmethod
     def mark_as_reassigned(instance, old_reference, new_reference, field_name: str):
         """ Indicate to the history system that an instance has been modified
@@ -954,14 +1107,14 @@ class HistoryLine(Model):
         return self._related_line
 
     @classmethod
-    def _create_line_4_instance(cls,
-                                instance,
-                                ltype: int,
-                                date=None,
-                                modifs=(),
-                                related_line_id=None,
-                                ):
-        """Builder.
+    def _build_line_4_instance(cls,
+                               instance,
+                               ltype: int,
+                               date=None,
+                               modifs=(),
+                               related_line_id=None,
+                               ) -> HistoryLine:
+        """Build a line (not saved).
         @param ltype: See TYPE_*
         @param date: If not given, will be 'now'.
         @param modifs: List of tuples containing JSONifiable values.
@@ -982,7 +1135,72 @@ class HistoryLine(Model):
         if date:
             kwargs['date'] = date
 
-        return cls.objects.create(**kwargs)
+        return cls(**kwargs)
+
+    @classmethod
+    def _create_line_4_instance(cls,
+                                instance,
+                                ltype: int,
+                                date=None,
+                                modifs=(),
+                                related_line_id=None,
+                                bufferable: bool = True,
+                                ) -> HistoryLine:
+        """Builder ; see _build_line_4_instance() for the arguments.
+        @param bufferable: <False> means the line is inserted immediately,
+               even if a buffer is active (i.e. the ID is needed).
+        """
+        hline = cls._build_line_4_instance(
+            instance, ltype, date=date, modifs=modifs, related_line_id=related_line_id,
+        )
+
+        if bufferable:
+            hline._save_new()
+        else:
+            hline.save(force_insert=True)
+
+        return hline
+
+    @classmethod
+    def _save_new_lines(cls, hlines: list[HistoryLine]) -> None:
+        """Insert several new lines with a few queries ; they are collected by
+        the current buffer if there is one.
+        NB: the IDs may not be set (depends on the DB backend).
+        """
+        if hlines and is_history_enabled():
+            for hline in hlines:
+                hline._fill_context()
+
+            buffer = get_history_buffer()
+            if buffer is None:
+                cls.objects.bulk_create(hlines)
+            else:
+                for hline in hlines:
+                    buffer.add(hline)
+
+    def _save_new(self) -> None:
+        "Insert a new line, or add it to the current buffer if there is one."
+        buffer = get_history_buffer()
+
+        if buffer is None:
+            self.save(force_insert=True)
+        elif is_history_enabled():
+            self._fill_context()
+            buffer.add(self)
+
+    def _unbuffer(self) -> None:
+        "Insert immediately a line which is in a buffer (e.g. its ID is needed)."
+        if self._buffered:
+            get_history_buffer().remove(self)
+            self.save(force_insert=True)
+
+    def _fill_context(self) -> None:
+        from ..core.workflow import WorkflowEngine
+
+        user = get_global_info('user')
+        self.username = user.username if user else ''
+
+        self.by_wf_engine = WorkflowEngine.get_current().is_executing_actions
 
     def save(self, *args,
              force_insert=False, force_update=False, using=None, update_fields=None,
@@ -991,13 +1209,12 @@ class HistoryLine(Model):
             raise ValueError('Argument "update_fields" not managed.')
 
         if is_history_enabled():
-            from ..core.workflow import WorkflowEngine
-
             # if self.pk is None: TODO ?
-            user = get_global_info('user')
-            self.username = user.username if user else ''
+            self._fill_context()
 
-            self.by_wf_engine = WorkflowEngine.get_current().is_executing_actions
+            if self._buffered:
+                # The line will be inserted by the buffer with its current values.
+                return
 
             super().save(
                 *args,
@@ -1025,6 +1242,37 @@ class HistoryLine(Model):
         self.username = user.username if user else ''
 
 
+class ArchivedHistoryLine(Model):
+    """Old HistoryLines are moved in this table (see the job
+    "creme_core-history_archiver"), so the table of HistoryLine stays small
+    & the blocks of history stay fast.
+    The fields are the same as HistoryLine's ones (& the IDs are kept).
+    """
+    id = models.PositiveIntegerField(primary_key=True)
+    entity = models.ForeignKey(
+        CremeEntity, null=True, on_delete=models.SET_NULL, related_name='+',
+    )
+    entity_ctype = CTypeForeignKey(related_name='+')
+    entity_owner = CremeUserForeignKey(related_name='+')
+    username = models.CharField(max_length=30)
+    date = models.DateTimeField(_('Date'))
+    type = models.PositiveSmallIntegerField(_('Type'))  # See TYPE_*
+    value = models.TextField(null=True)
+    by_wf_engine = models.BooleanField(_('Action of Workflow engine'), default=False)
+
+    class Meta:
+        app_label = 'creme_core'
+        verbose_name = _('Archived line of history')
+        verbose_name_plural = _('Archived lines of history')
+        indexes = [
+            models.Index(fields=['entity_id', '-id'], name='archived_hline__entity'),
+        ]
+        ordering = ('id',)
+
+    def __str__(self):
+        return f'ArchivedHistoryLine(id={self.id}, type={self.type}, value={self.value})'
+
+
 # TODO: method of CremeEntity ??
 def _final_entity(entity) -> bool:
     "Is the instance an instance of a 'leaf' class."
@@ -1172,3 +1420,4 @@ def _handle_merge(sender, other_entity, **kwargs):
     # We do not want these lines to be re-assigned to the remaining entity.
     # TODO: should we clone/copy for TYPE_RELATED
     HistoryLine.objects.filter(entity=other_entity.id).update(entity=None)
+    ArchivedHistoryLine.objects.filter(entity=other_entity.id).update(entity=None)
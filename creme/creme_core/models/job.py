@@ -102,6 +102,17 @@ class Job(models.Model):
     periodicity = core_fields.DatePeriodField(_('Periodicity'), null=True)
     last_run = models.DateTimeField(_('Last run'), null=True, editable=False)
 
+    # Metrics of the last run (filled by JobType.execute()).
+    last_duration = models.DurationField(
+        _('Duration of the last run'), null=True, editable=False,
+    )
+    # In bytes; it's the high-water mark of the process which has run the job,
+    # not a value specific to the job: with the workers of the job manager
+    # (which run several jobs), it can be the peak of a previous job.
+    last_max_rss = models.PositiveBigIntegerField(
+        _('Peak memory of the process'), null=True, editable=False,
+    )
+
     # Number of errors of communication with the queue.
     ack_errors = models.PositiveIntegerField(default=0, editable=False)
 
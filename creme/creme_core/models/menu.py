@@ -21,6 +21,7 @@ from functools import partial
 from django.db import models
 from django.db.transaction import atomic
 
+from ..core.shared_cache import shared_cache
 from .auth import UserRole
 from .base import CremeModel
 
@@ -86,3 +87,6 @@ class MenuConfigItem(CremeModel):
                 order=item.order,
             )
             ids_translation[item.id] = cloned
+
+
+shared_cache.register(MenuConfigItem)
@@ -20,12 +20,15 @@ from __future__ import annotations
 
 import logging
 from collections import defaultdict
-from collections.abc import Iterable, Iterator
+from collections.abc import Iterable, Iterator, Sequence
+from functools import partial
+from itertools import batched
 from typing import Self
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError, models
+from django.db import IntegrityError, connections, models
+from django.db.models import signals
 from django.db.models.query_utils import Q
 from django.db.transaction import atomic
 from django.dispatch import receiver
@@ -731,6 +734,142 @@ class RelationManager(models.Manager):
 
     safe_multi_save.alters_data = True
 
+    def _exclude_existing(self, relations: list[Relation]) -> list[Relation]:
+        # NB: the query retrieves a superset of the existing Relations (one
+        #     "IN" per field instead of a huge "OR"), which is filtered in Python.
+        existing = {
+            *self.filter(
+                type__in={relation.type_id for relation in relations},
+                subject_entity__in={relation.subject_entity_id for relation in relations},
+                object_entity__in={relation.object_entity_id for relation in relations},
+            ).values_list('type', 'subject_entity', 'object_entity'),
+        }
+
+        return [
+            relation
+            for relation in relations
+            if (
+                relation.type_id, relation.subject_entity_id, relation.object_entity_id,
+            ) not in existing
+        ]
+
+    def _bulk_create_batch(self, relations: Sequence[Relation], sym_types: dict) -> None:
+        from .history import _HLTRelation
+
+        model = self.model
+        using = self.db
+        send_pre_save = partial(signals.pre_save.send, sender=model, raw=False, using=using)
+        send_post_save = partial(signals.post_save.send, sender=model, raw=False, using=using)
+
+        # NB: the signals are sent in the same order as Relation.save(), so the
+        #     receivers see the same states of instances.
+        for relation in relations:
+            if not relation.object_ctype_id:
+                relation.object_ctype = relation.object_entity.entity_type
+
+            send_pre_save(instance=relation, update_fields=None)
+
+        self.bulk_create(relations)
+
+        for relation in relations:
+            send_post_save(instance=relation, created=True, update_fields=None)
+
+        sym_relations = [
+            model(
+                user=relation.user,
+                type=sym_types[relation.type_id],
+                symmetric_relation=relation,
+                subject_entity=relation.object_entity,
+                real_object=relation.subject_entity,
+            ) for relation in relations
+        ]
+
+        for sym_relation in sym_relations:
+            send_pre_save(instance=sym_relation, update_fields=None)
+
+        self.bulk_create(sym_relations)
+
+        for sym_relation in sym_relations:
+            send_post_save(instance=sym_relation, created=True, update_fields=None)
+
+        update_fields = frozenset(['symmetric_relation'])
+        for relation, sym_relation in zip(relations, sym_relations):
+            relation.symmetric_relation = sym_relation
+            send_pre_save(instance=relation, update_fields=update_fields)
+
+        self.bulk_update(relations, fields=['symmetric_relation'])
+        _HLTRelation.create_lines_in_bulk(relations)
+
+        for relation in relations:
+            send_post_save(instance=relation, created=False, update_fields=update_fields)
+
+    def safe_bulk_create(self,
+                         relations: Iterable[Relation],
+                         check_existing: bool = True,
+                         batch_size: int = 500,
+                         ) -> int:
+        """Fast version of 'safe_multi_save()' for a large number of Relations
+        (e.g. a type of relationship added to thousands of entities) ; the
+        instances & their symmetrical instances are inserted with bulk queries.
+
+        The signals "pre_save" & "post_save" are sent like with Relation.save(),
+        so the history & the Workflows work as usual (the lines of history are
+        created with bulk queries too).
+
+        Notice that:
+          - the Relations should be built with their entities (not only their
+            IDs) to avoid queries (the entities are used by the history & by
+            the signal handlers).
+          - the constraints of the types are not checked ;
+            see 'Relation.clean_relations()'.
+          - if the DB backend cannot retrieve the IDs of the instances created
+            by a bulk insertion (e.g. MySQL), 'safe_multi_save()' is used.
+
+        @param relations: An iterable of Relations (not save yet).
+        @param check_existing: Perform a query to check existing Relations.
+               You can pass False for newly created instances in order to avoid a query.
+        @param batch_size: Number of Relations inserted by query.
+        @return: Number of Relations inserted in base.
+                 NB: the symmetrical instances are not counted.
+        """
+        if not connections[self.db].features.can_return_rows_from_bulk_insert:
+            return self.safe_multi_save(relations, check_existing=check_existing)
+
+        # Group the relations by their unique "signature" (type, subject, object)
+        unique_relations = [
+            *{
+                (
+                    relation.type_id,
+                    relation.subject_entity_id,
+                    relation.object_entity_id,
+                ): relation
+                for relation in relations
+            }.values(),
+        ]
+        if not unique_relations:
+            return 0
+
+        if check_existing:
+            unique_relations = self._exclude_existing(unique_relations)
+
+            if not unique_relations:
+                return 0
+
+        sym_types = {
+            rtype.id: rtype.symmetric_type
+            for rtype in RelationType.objects.filter(
+                id__in={relation.type_id for relation in unique_relations},
+            ).select_related('symmetric_type')
+        }
+
+        with atomic(using=self.db):
+            for batch in batched(unique_relations, batch_size):
+                self._bulk_create_batch(batch, sym_types)
+
+        return len(unique_relations)
+
+    safe_bulk_create.alters_data = True
+
 
 class RelationType(CremeModel):
     """Type of Relations.
@@ -1044,6 +1183,72 @@ class Relation(CremeModel):
         self._clean_subject_mandatory_properties(property_types=property_types)
         self._clean_subject_forbidden_properties(property_types=property_types)
 
+    @classmethod
+    def _clean_subjects(cls, pairs: list[tuple[str, CremeEntity]]) -> None:
+        rtypes = RelationType.objects.filter(
+            id__in={rtype_id for rtype_id, __ in pairs},
+        ).prefetch_related(
+            'subject_ctypes', 'subject_properties', 'subject_forbidden_properties',
+        ).in_bulk()
+
+        # NB: the properties are retrieved only if they are needed
+        constrained_ids = {
+            rtype_id
+            for rtype_id, rtype in rtypes.items()
+            if rtype.subject_properties.all() or rtype.subject_forbidden_properties.all()
+        }
+        if constrained_ids:
+            CremeEntity.populate_properties([
+                *{
+                    id(entity): entity
+                    for rtype_id, entity in pairs
+                    if rtype_id in constrained_ids and entity._properties is None
+                }.values()
+            ])
+
+        for rtype_id, entity in pairs:
+            cls(type=rtypes[rtype_id], subject_entity=entity).clean_subject_entity()
+
+    @classmethod
+    def clean_subject_entities(cls,
+                               rtypes: Iterable[RelationType],
+                               entities: Iterable[CremeEntity],
+                               ) -> None:
+        """Check that some entities can be the subjects of Relations with some
+        types (see clean_subject_entity()), with a few queries whatever the
+        numbers of entities & types.
+        @raise ValidationError: For the first invalid couple (entity, type).
+        """
+        rtype_ids = [rtype.id for rtype in rtypes]
+        pairs = [(rtype_id, entity) for entity in entities for rtype_id in rtype_ids]
+
+        if pairs:
+            cls._clean_subjects(pairs)
+
+    @classmethod
+    def clean_relations(cls, relations: Iterable[Relation]) -> None:
+        """Check the subjects & the objects of some Relations (not saved yet),
+        i.e. the constraints of their types & of the symmetrical types, with a
+        few queries whatever the number of Relations.
+        @raise ValidationError: For the first invalid Relation.
+        """
+        relations = [*relations]
+
+        if relations:
+            sym_type_ids = dict(
+                RelationType.objects.filter(
+                    id__in={relation.type_id for relation in relations},
+                ).values_list('id', 'symmetric_type_id')
+            )
+            cls._clean_subjects([
+                pair
+                for relation in relations
+                for pair in (
+                    (relation.type_id, relation.subject_entity),
+                    (sym_type_ids[relation.type_id], relation.object_entity),
+                )
+            ])
+
     def clean(self):
         self.clean_subject_entity()
 
@@ -24,16 +24,21 @@ from collections import defaultdict
 from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING, DefaultDict
 
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
+from django.db.models import signals
 from django.db.models.query_utils import Q
+from django.dispatch import receiver
 from django.utils.translation import gettext
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import pgettext_lazy
 
+from ..core.shared_cache import shared_cache
 from ..utils.meta import ModelFieldEnumerator
 from .auth import UserRole
 from .base import CremeModel
+from .custom_field import CustomFieldMultiEnum, CustomFieldValue
 from .entity import CremeEntity
 from .fields import DatePeriodField, EntityCTypeForeignKey
 
@@ -225,12 +230,19 @@ class SearchConfigItemManager(models.Manager):
 
             def filter_func(sci):
                 return sci.superuser
+
+            def candidate_func(sci):
+                return sci.role_id is None
         else:
             role = user.role
+            role_id = role.id if role else None
             role_query |= Q(role=role)
 
             def filter_func(sci):
-                return sci.role == role
+                return sci.role_id == role_id
+
+            def candidate_func(sci):
+                return sci.role_id is None or sci.role_id == role_id
 
 # TODO: use a similar way if superuser is a role
 #       (PG does not return a cool result if we do a ".order_by('role', 'superuser')")
@@ -247,8 +259,22 @@ class SearchConfigItemManager(models.Manager):
 #        for ctype in ctypes:
 #            yield sc_items.get(ctype) or SearchConfigItem(content_type=ctype)
         sc_items_per_ctid: DefaultDict[int, list] = defaultdict(list)
-        for sci in self.filter(content_type__in=ctypes).filter(role_query):
-            sc_items_per_ctid[sci.content_type_id].append(sci)
+
+        if shared_cache.enabled:
+            # NB: there are few instances, so we cache them all (one round-trip)
+            all_items = shared_cache.get_or_compute(
+                key='creme_core-search_configs',
+                models=[self.model],
+                compute=lambda: [*self.all()],
+            )
+            ct_ids = {ctype.id for ctype in ctypes}
+
+            for sci in all_items:
+                if sci.content_type_id in ct_ids and candidate_func(sci):
+                    sc_items_per_ctid[sci.content_type_id].append(sci)
+        else:
+            for sci in self.filter(content_type__in=ctypes).filter(role_query):
+                sc_items_per_ctid[sci.content_type_id].append(sci)
 
         for ctype in ctypes:
             sc_items = sc_items_per_ctid.get(ctype.id)
@@ -390,3 +416,107 @@ class SearchConfigItem(CremeModel):
             raise ValueError('"role" must be NULL if "superuser" is True')
 
         super().save(*args, **kwargs)
+
+
+class SearchToken(models.Model):
+    """Denormalized words of the fields used by the search.
+    Each instance stores a (lower-cased) word contained in the value of an
+    entity's cell; the search can so use an index instead of scanning the
+    tables of entities with "LIKE" queries.
+
+    It's filled by <creme_core.core.search.SearchIndexer>; see the setting
+    "SEARCH_INDEX_ENABLED" & the command "creme_search_index".
+    """
+    entity_ctype = EntityCTypeForeignKey(related_name='+', editable=False)
+    entity = models.ForeignKey(
+        CremeEntity, related_name='+', on_delete=models.CASCADE, editable=False,
+    )
+    # Key of the related EntityCell (see <EntityCell.key>)
+    cell_key = models.CharField(max_length=100, editable=False)
+    token = models.CharField(max_length=100, editable=False)
+
+    class Meta:
+        app_label = 'creme_core'
+        indexes = [
+            models.Index(
+                fields=['entity_ctype', 'token'],
+                name='core__search_token__lookup',
+            ),
+        ]
+
+    def __str__(self):
+        return f'SearchToken(entity_id={self.entity_id}, token="{self.token}")'
+
+
+shared_cache.register(SearchConfigItem)
+
+
+# Signal handlers (search index) -----------------------------------------------
+
+@receiver(signals.post_save, dispatch_uid='creme_core-update_search_index')
+def _update_search_index(sender, instance, **kwargs):
+    if not settings.SEARCH_INDEX_ENABLED:
+        return
+
+    if issubclass(sender, CremeEntity):
+        from ..core.search import SearchIndexer
+
+        SearchIndexer().index([instance])
+    elif issubclass(sender, CustomFieldValue):
+        _update_search_index_for_cvalue(instance)
+
+
+# NB: the index of the model is rebuilt by a job (it can take a long time).
+@receiver(
+    signals.post_save, sender=SearchConfigItem,
+    dispatch_uid='creme_core-rebuild_search_index',
+)
+@receiver(
+    signals.post_delete, sender=SearchConfigItem,
+    dispatch_uid='creme_core-rebuild_search_index_for_deletion',
+)
+def _rebuild_search_index(sender, instance, **kwargs):
+    if settings.SEARCH_INDEX_ENABLED:
+        from ..creme_jobs import search_index_rebuilder_type
+
+        search_index_rebuilder_type.add_models([instance.content_type.model_class()])
+
+
+def _update_search_index_for_cvalue(cvalue):
+    from ..core.entity_cell import EntityCellCustomField
+    from ..core.search import SearchIndexer
+
+    entity = cvalue.entity.get_real_entity()
+    indexer = SearchIndexer()
+    cell_key = EntityCellCustomField(cvalue.custom_field).key
+
+    for cell in indexer.get_cells(type(entity)):
+        if cell.key == cell_key:
+            indexer.index([entity], cells=[cell])
+            break
+
+
+@receiver(signals.post_delete, dispatch_uid='creme_core-update_search_index_for_deletion')
+def _update_search_index_for_deletion(sender, instance, **kwargs):
+    # NB: the tokens of deleted entities are removed by the ForeignKey (CASCADE).
+    #     We do not re-index the entity, because it could be deleted too.
+    if settings.SEARCH_INDEX_ENABLED and issubclass(sender, CustomFieldValue):
+        from ..core.entity_cell import EntityCellCustomField
+
+        SearchToken.objects.filter(
+            entity=instance.entity_id,
+            cell_key=f'{EntityCellCustomField.type_id}-{instance.custom_field_id}',
+        ).delete()
+
+
+@receiver(signals.m2m_changed, dispatch_uid='creme_core-update_search_index_for_m2m')
+def _update_search_index_for_m2m(sender, instance, action, reverse, **kwargs):
+    if not settings.SEARCH_INDEX_ENABLED or reverse or not action.startswith('post_'):
+        return
+
+    if isinstance(instance, CremeEntity):
+        from ..core.search import SearchIndexer
+
+        SearchIndexer().index([instance])
+    elif isinstance(instance, CustomFieldMultiEnum):
+        _update_search_index_for_cvalue(instance)
@@ -26,7 +26,7 @@ from django.utils.translation import gettext
 from django.utils.translation import gettext_lazy as _
 
 from ..constants import DEFAULT_VAT
-from ..global_info import cached_per_request
+from ..core.shared_cache import cached_shared
 from . import base
 from .fields import DecimalPercentField
 
@@ -34,7 +34,7 @@ logger = logging.getLogger(__name__)
 
 
 class VatManager(base.MinionManager):
-    @cached_per_request('creme_core-default_vat')
+    @cached_shared('creme_core-default_vat', models=['creme_core.Vat'])
     def default(self):
         return self.filter(is_default=True)[0]
 
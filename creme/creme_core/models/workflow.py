@@ -22,6 +22,7 @@ from uuid import uuid4
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from ..core.shared_cache import shared_cache
 from ..core.workflow import (
     WorkflowAction,
     WorkflowConditions,
@@ -150,3 +151,6 @@ class Workflow(CremeModel):
         self.extra_data['portablekeymigr'] = True
 
         super().save(**kwargs)
+
+
+shared_cache.register(Workflow)
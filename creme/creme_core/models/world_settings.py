@@ -16,16 +16,19 @@
 #    along with this program.  If not, see <http://www.gnu.org/licenses/>.
 ################################################################################
 
+from django.conf import settings
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
-from ..global_info import cached_per_request
+from ..core.shared_cache import cached_shared
 from .base import CremeModel
 from .manager import CremeEntityManager
 
 
 class WorldSettingsManager(CremeEntityManager):
-    @cached_per_request('creme_core-world_settings')
+    @cached_shared(
+        'creme_core-world_settings', models=[settings.CREME_CORE_WSETTINGS_MODEL],
+    )
     def instance(self):
         instance = self.first()
         if instance is None:
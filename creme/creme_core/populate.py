@@ -101,6 +101,17 @@ class Populator(BasePopulator):
         ),
         Job(type=creme_jobs.reminder_type),
         Job(type=creme_jobs.notification_emails_sender_type),
+        Job(type=creme_jobs.search_index_rebuilder_type),
+        Job(
+            type=creme_jobs.history_archiver_type,
+            periodicity=date_period_registry.get_period('days', 1),
+            data={
+                'delay': date_period_registry.get_period('years', 2).as_dict(),
+            },
+            # NB: the history is not archived by default (the old lines are
+            #     not displayed anymore).
+            enabled=False,
+        ),
     ]
     SANDBOXES = [
         Sandbox(
@@ -1074,6 +1074,11 @@ creme.bricks.BrickLauncher = creme.widget.declare('brick', {
 
         element.addClass('widget-ready');
         brick.trigger('ready', [options]);
+
+        // The content of a deferred brick is retrieved with the reloading view
+        if (element.is('[data-brick-deferred]')) {
+            brick.refresh();
+        }
     },
 
     _destroy: function(element) {
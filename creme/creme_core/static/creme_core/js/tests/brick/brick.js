@@ -759,6 +759,19 @@ QUnit.test('creme.bricks.Brick.refresh', function(assert) {
 });
 
 
+QUnit.test('creme.bricks.Brick.refresh (deferred)', function(assert) {
+    var element = $(
+        '<div class="brick ui-creme-widget" widget="brick" id="brick-creme_core-test" data-brick-id="creme_core-test" data-brick-deferred="true"></div>'
+    ).appendTo(this.qunitFixture());
+
+    creme.widget.create(element);
+
+    assert.deepEqual([
+        ['GET', {"brick_id": ["creme_core-test"], "extra_data": "{}"}]
+    ], this.mockBackendUrlCalls('mock/brick/all/reload'));
+});
+
+
 QUnit.test('creme.bricks.Brick.refresh (from pager)', function(assert) {
     var element = $(
         '<div class="brick ui-creme-widget" widget="brick" id="brick-creme_core-test" data-brick-id="creme_core-test"></div>'
@@ -21,6 +21,7 @@ import warnings
 
 from django.template import Library, TemplateSyntaxError
 from django.template.base import TextNode
+from django.template.loader import get_template
 from django.utils.html import format_html, format_html_join
 from django.utils.safestring import SafeData, mark_safe
 from django.utils.translation import gettext as _
@@ -28,8 +29,10 @@ from django.utils.translation import gettext_lazy
 
 from ..core import sorter
 from ..core.entity_cell import EntityCellRegularField
+from ..core.paginator import FlowPage
 # NB: do not import registries directly to facilitate unit tests
 from ..gui import bricks, bulk_update
+from ..gui.brick_rendering import BricksRenderer, bricks_renderer
 from ..gui.bricks import Brick, BrickManager
 from ..gui.pager import PagerContext
 from ..gui.view_tag import ViewTag
@@ -821,14 +824,20 @@ def brick_card_action_for_field(context, *, instance, field, user, **kwargs):
     )
 
 
-@register.inclusion_tag('creme_core/templatetags/bricks/pager.html')
+@register.simple_tag
 def brick_pager(page):
+    # NB: FlowPage are used by QuerysetBrick with seek pagination
+    if isinstance(page, FlowPage):
+        return get_template('creme_core/templatetags/bricks/pager-flow.html').render(
+            {'page': page}
+        )
+
     context = PagerContext(page)
-    return {
+    return get_template('creme_core/templatetags/bricks/pager.html').render({
         'links': context.links,
         'first': context.first,
         'last': context.last,
-    }
+    })
 
 
 @register.simple_tag(takes_context=True)
@@ -1064,10 +1073,16 @@ def brick_display(context, *bricks, **kwargs):
             pop_group(brick_or_seq.id)
             bricks_to_render.append(brick_or_seq)
 
+    # NB: the views which allow the concurrent/deferred rendering set the mode
+    #     (see 'creme_core.views.generic.base.BricksMixin').
     return mark_safe(''.join(filter(
         None,
         # (render(brick) for brick in bricks_to_render)
-        (brick.render({**context_dict}) for brick in bricks_to_render)
+        bricks_renderer.render(
+            bricks_to_render,
+            context_dict,
+            mode=context_dict.get('bricks_rendering_mode') or BricksRenderer.Mode.SEQUENTIAL,
+        )
     )))
 
 
@@ -23,6 +23,7 @@ from django.template import Library
 from django.utils.functional import partition
 
 from ..core.notification import OUTPUT_WEB
+from ..core.shared_cache import shared_cache
 from ..gui.menu import menu_registry
 from ..models import MenuConfigItem, Notification
 
@@ -33,11 +34,21 @@ register = Library()
 @register.inclusion_tag('creme_core/templatetags/menu.html', takes_context=True)
 def menu_display(context):
     user = context['user']
+    role = user.role
     regular_items, role_items = partition(
         lambda item: item.superuser or bool(item.role_id),
-        MenuConfigItem.objects.filter(
-            Q(role=user.role, superuser=user.is_superuser)
-            | Q(role=None, superuser=False)
+        shared_cache.get_or_compute(
+            key=(
+                'creme_core-menu_items-'
+                f'{"superuser" if user.is_superuser else role.id if role else ""}'
+            ),
+            models=[MenuConfigItem],
+            compute=lambda: [
+                *MenuConfigItem.objects.filter(
+                    Q(role=role, superuser=user.is_superuser)
+                    | Q(role=None, superuser=False)
+                ),
+            ],
         ),
     )
     context['entries'] = [
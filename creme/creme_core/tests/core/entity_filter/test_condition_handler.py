@@ -4264,6 +4264,35 @@ class RelationConditionHandlerTestCase(_ConditionHandlerTestCase):
         self.assertIs(handler4.accept(entity=shinji, user=user), True)
         self.assertIs(handler4.accept(entity=asuka,  user=user), False)
 
+    def test_populate(self):
+        user = self.get_root_user()
+        loves = RelationType.objects.builder(
+            id='test-subject_love', predicate='is loving',
+        ).symmetric(id='test-object_love', predicate='is loved by').get_or_create()[0]
+
+        create_contact = partial(FakeContact.objects.create, user=user)
+        shinji = create_contact(last_name='Ikari',   first_name='Shinji')
+        rei    = create_contact(last_name='Ayanami', first_name='Rei')
+        Relation.objects.create(
+            user=user, subject_entity=shinji, type=loves, object_entity=rei,
+        )
+
+        shinji = self.refresh(shinji)
+        rei = self.refresh(rei)
+
+        handler = RelationConditionHandler(
+            efilter_type=EF_REGULAR, model=FakeContact, rtype=loves.id,
+        )
+        with self.assertNumQueries(1):
+            handler.populate(entities=[shinji, rei], user=user)
+
+        with self.assertNumQueries(0):
+            accepted1 = handler.accept(entity=shinji, user=user)
+            accepted2 = handler.accept(entity=rei,    user=user)
+
+        self.assertIs(accepted1, True)
+        self.assertIs(accepted2, False)
+
     def test_description(self):
         user = self.get_root_user()
 
@@ -5433,6 +5462,31 @@ class PropertyConditionHandlerTestCase(_ConditionHandlerTestCase):
         self.assertIs(handler2.accept(entity=shinji, user=user), True)
         self.assertIs(handler2.accept(entity=misato, user=user), True)
 
+    def test_populate(self):
+        user = self.get_root_user()
+        cute = CremePropertyType.objects.create(text='Cute')
+
+        create_contact = partial(FakeContact.objects.create, user=user)
+        shinji = create_contact(last_name='Ikari',   first_name='Shinji')
+        rei    = create_contact(last_name='Ayanami', first_name='Rei')
+        CremeProperty.objects.create(creme_entity=rei, type=cute)
+
+        shinji = self.refresh(shinji)
+        rei = self.refresh(rei)
+
+        handler = PropertyConditionHandler(
+            efilter_type=EF_REGULAR, model=FakeContact, ptype=cute,
+        )
+        with self.assertNumQueries(1):
+            handler.populate(entities=[shinji, rei], user=user)
+
+        with self.assertNumQueries(0):
+            accepted1 = handler.accept(entity=rei,    user=user)
+            accepted2 = handler.accept(entity=shinji, user=user)
+
+        self.assertIs(accepted1, True)
+        self.assertIs(accepted2, False)
+
     def test_description(self):
         user = self.get_root_user()
         cute = CremePropertyType.objects.create(text='Cute')
@@ -2,6 +2,7 @@ from copy import deepcopy
 from datetime import date
 from decimal import Decimal
 from functools import partial
+from unittest.mock import patch
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
@@ -20,6 +21,7 @@ from creme.creme_core.core.entity_cell import (
     EntityCellRegistry,
     EntityCellRegularField,
     EntityCellRelation,
+    PrefetchPlan,
 )
 from creme.creme_core.core.function_field import (
     FunctionField,
@@ -1304,3 +1306,182 @@ class EntityCellTestCase(CremeTestCase):
 
         with self.assertNumQueries(0):
             contacts[0].get_relations(loves.id,  real_obj_entities=True)
+
+    def test_prefetch_plan(self):
+        user = self.get_root_user()
+
+        loves = RelationType.objects.builder(
+            id='test-subject_love', predicate='Is loving',
+        ).symmetric(id='test-object_love', predicate='Is loved by').get_or_create()[0]
+        hates = RelationType.objects.builder(
+            id='test-subject_hate', predicate='Is hating',
+        ).symmetric(id='test-object_hate', predicate='Is hated by').get_or_create()[0]
+        cfield = CustomField.objects.create(
+            name='Number of kills', field_type=CustomField.INT, content_type=FakeContact,
+        )
+
+        class LovedFunctionField(FunctionField):
+            name = 'test_loved'
+            verbose_name = 'Loved'
+            prefetch_fields = ('position', 'user')
+            prefetch_relation_types = (loves.id,)
+            per_entity_queries = False
+
+        build_rfield = partial(EntityCellRegularField.build, model=FakeContact)
+        cells = [
+            build_rfield(name='last_name'),
+            build_rfield(name='position'),
+            build_rfield(name='languages'),
+            EntityCellRelation(model=FakeContact, rtype=loves),
+            EntityCellRelation(model=FakeContact, rtype=hates),
+            EntityCellCustomField(cfield),
+            EntityCellFunctionField.build(FakeContact, 'get_pretty_properties'),
+            EntityCellFunctionField(model=FakeContact, func_field=LovedFunctionField()),
+        ]
+
+        plan = PrefetchPlan.build(cells)
+        self.assertIsInstance(plan, PrefetchPlan)
+        self.assertListEqual(
+            ['last_name', 'position', 'languages', 'user'], [*plan.field_names],
+        )
+        self.assertListEqual([loves.id, hates.id], [*plan.relation_type_ids])
+        self.assertDictEqual({cfield.id: cfield}, plan.custom_fields)
+        self.assertIs(plan.properties, True)
+        self.assertFalse(plan.function_fields)
+        self.assertFalse(plan.cell_groups)
+        self.assertFalse(plan.per_row_cells)
+
+        # ---
+        pos = FakePosition.objects.all()[0]
+        create_contact = partial(FakeContact.objects.create, user=user, position=pos)
+        contacts = [
+            create_contact(first_name='Nagate',  last_name='Tanikaze'),
+            create_contact(first_name='Shizuka', last_name='Hoshijiro'),
+        ]
+        Relation.objects.create(
+            user=user, subject_entity=contacts[0], type=loves, object_entity=contacts[1],
+        )
+
+        ContentType.objects.get_for_model(CremeEntity)
+        contacts = [self.refresh(c) for c in contacts]
+
+        # NB: 1 query per related model (position, user), M2M, relations (+ real
+        #     entities), custom-values, properties.
+        with self.assertNumQueries(7):
+            plan.execute(contacts, user)
+
+        with self.assertNumQueries(0):
+            for contact in contacts:
+                contact.position  # NOQA
+                contact.user  # NOQA
+                [*contact.languages.all()]
+                contact.get_relations(loves.id, real_obj_entities=True)
+                contact.get_relations(hates.id, real_obj_entities=True)
+                contact.get_custom_value(cfield)
+                contact.get_properties()
+
+        self.assertListEqual(
+            [contacts[1].id],
+            [e.id for e in contacts[0].get_related_entities(loves.id)],
+        )
+
+    def test_prefetch_plan__populate_entities(self):
+        "Function fields & cells with their own method populate_entities()."
+        class PopulatedFunctionField(FunctionField):
+            name = 'test_populated'
+            verbose_name = 'Populated'
+
+            populated = 0
+
+            def populate_entities(self, entities, user):
+                type(self).populated += 1
+
+        class PopulatedCell(EntityCell):
+            type_id = 'test_populated'
+            populated = []
+
+            @staticmethod
+            def populate_entities(cells, entities, user):
+                PopulatedCell.populated.append([cell.value for cell in cells])
+
+        func_field = PopulatedFunctionField()
+        cells = [
+            EntityCellFunctionField(model=FakeContact, func_field=func_field),
+            EntityCellFunctionField(model=FakeContact, func_field=func_field),
+            PopulatedCell(model=FakeContact, value='foo'),
+            PopulatedCell(model=FakeContact, value='bar'),
+        ]
+
+        plan = PrefetchPlan.build(cells)
+        self.assertListEqual([func_field], plan.function_fields)
+        self.assertListEqual([cells[2], cells[3]], plan.cell_groups[PopulatedCell])
+        self.assertFalse(plan.per_row_cells)
+
+        user = self.get_root_user()
+        contact = FakeContact.objects.create(
+            user=user, first_name='Nagate', last_name='Tanikaze',
+        )
+        plan.execute([contact], user)
+        self.assertEqual(1, PopulatedFunctionField.populated)
+        self.assertListEqual([['foo', 'bar']], PopulatedCell.populated)
+
+        # No entity => nothing is done
+        plan.execute([], user)
+        self.assertEqual(1, PopulatedFunctionField.populated)
+
+    def test_prefetch_plan__per_row_cells(self):
+        class PerRowFunctionField(FunctionField):
+            name = 'test_per_row'
+            verbose_name = 'Per row'
+
+        cell1 = EntityCellFunctionField(model=FakeContact, func_field=PerRowFunctionField())
+        cell2 = EntityCellRegularField.build(model=FakeContact, name='image__categories')
+
+        with self.assertLogs(level='WARNING') as logs_manager:
+            plan = PrefetchPlan.build([cell1, cell2])
+
+        self.assertListEqual([cell1, cell2], plan.per_row_cells)
+        self.assertListEqual(['image__categories'], [*plan.field_names])
+        self.assertEqual(2, len(logs_manager.output))
+        self.assertIn(cell1.key, logs_manager.output[0])
+        self.assertIn(cell2.key, logs_manager.output[1])
+
+        # Logged once
+        with self.assertNoLogs(level='WARNING'):
+            plan = PrefetchPlan.build([cell1, cell2])
+
+        self.assertListEqual([cell1, cell2], plan.per_row_cells)
+
+    def test_prefetch_plan__deep_m2m(self):
+        "The ForeignKey of a deep ManyToManyField is retrieved."
+        user = self.get_root_user()
+        cell = EntityCellRegularField.build(model=FakeContact, name='image__categories')
+
+        # NB: the per-row cells are logged once per process
+        with patch.object(PrefetchPlan, '_logged_per_row_cells', set()):
+            with self.assertLogs(level='WARNING'):
+                plan = PrefetchPlan.build([cell])
+
+        create_image = partial(FakeImage.objects.create, user=user)
+        create_contact = partial(FakeContact.objects.create, user=user)
+        contacts = [
+            create_contact(
+                first_name='Nagate', last_name='Tanikaze',
+                image=create_image(name='Nagate selfie'),
+            ),
+            create_contact(
+                first_name='Shizuka', last_name='Hoshijiro',
+                image=create_image(name='Shizuka selfie'),
+            ),
+            create_contact(
+                first_name='Izana', last_name='Shinatose',
+                image=create_image(name='Izana selfie'),
+            ),
+        ]
+        contacts = [self.refresh(c) for c in contacts]
+
+        plan.execute(contacts, user)
+
+        with self.assertNumQueries(0):
+            for contact in contacts:
+                contact.image  # NOQA
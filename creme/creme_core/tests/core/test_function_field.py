@@ -1,7 +1,9 @@
 from decimal import Decimal
 from functools import partial
 
+from django.core.cache import caches
 from django.db.models import Q
+from django.test.utils import override_settings
 from django.urls import reverse
 from django.utils.formats import number_format
 from django.utils.translation import gettext as _
@@ -17,6 +19,7 @@ from creme.creme_core.core.function_field import (
     FunctionFieldResult,
     FunctionFieldResultsList,
 )
+from creme.creme_core.core.shared_cache import shared_cache
 from creme.creme_core.forms.listview import SelectLVSWidget
 from creme.creme_core.function_fields import PropertiesField
 from creme.creme_core.gui.view_tag import ViewTag
@@ -309,6 +312,81 @@ class FunctionFieldsTestCase(CremeTestCase):
         self.assertIsInstance(result, FunctionFieldResult)
         self.assertEqual(entity.get_delete_absolute_url(), result.render(ViewTag.TEXT_PLAIN))
 
+    def test_field__bulk_evaluator(self):
+        calls = []
+
+        class TestFunctionField(FunctionField):
+            name = 'test_bulk'
+            verbose_name = 'Bulk'
+
+            def bulk_evaluate(self, entities, user):
+                calls.append([e.id for e in entities])
+                return {e.id: FunctionFieldResult(f'#{e.id}') for e in entities}
+
+        self.assertFalse(FunctionField().has_bulk_evaluator)
+
+        ffield = TestFunctionField()
+        self.assertTrue(ffield.has_bulk_evaluator)
+
+        user = self.get_root_user()
+        create_orga = partial(FakeOrganisation.objects.create, user=user)
+        orga1 = create_orga(name='Bebop')
+        orga2 = create_orga(name='Swordfish')
+        orga3 = create_orga(name='Red tail')
+
+        self.assertEqual(f'#{orga1.id}', ffield(orga1, user).render(ViewTag.TEXT_PLAIN))
+        self.assertListEqual([[orga1.id]], calls)
+
+        ffield.populate_entities([orga1, orga2], user)
+        self.assertListEqual([[orga1.id], [orga2.id]], calls)
+
+        results = ffield.evaluate_entities([orga1, orga2, orga3], user)
+        self.assertListEqual([orga1.id, orga2.id, orga3.id], [*results.keys()])
+        self.assertEqual(f'#{orga3.id}', results[orga3.id].render(ViewTag.TEXT_PLAIN))
+        self.assertListEqual([[orga1.id], [orga2.id], [orga3.id]], calls)
+
+        # Per-user cache
+        ffield(orga1, self.create_user())
+        self.assertEqual(4, len(calls))
+
+        # Per-instance cache
+        TestFunctionField()(orga1, user)
+        self.assertEqual(5, len(calls))
+
+    @override_settings(SHARED_CACHE_ALIAS='default', SHARED_CACHE_TIMEOUT=60)
+    def test_field__bulk_evaluator__shared_cache(self):
+        caches['default'].clear()
+        calls = []
+
+        class TestFunctionField(FunctionField):
+            name = 'test_bulk_shared'
+            verbose_name = 'Bulk'
+            results_cache_ttl = 30
+            results_cache_models = [FakeOrganisation]
+
+            def bulk_evaluate(self, entities, user):
+                calls.append([e.id for e in entities])
+                return {e.id: FunctionFieldResult(f'#{e.id}') for e in entities}
+
+        FunctionFieldRegistry().register(FakeOrganisation, TestFunctionField)
+        self.assertIn(FakeOrganisation, shared_cache)
+
+        user = self.get_root_user()
+        orga = FakeOrganisation.objects.create(user=user, name='Bebop')
+        self.assertEqual(f'#{orga.id}', TestFunctionField()(orga, user).render(ViewTag.TEXT_PLAIN))
+        self.assertEqual(1, len(calls))
+
+        self.clear_global_info()
+        TestFunctionField()(orga, user)
+        self.assertEqual(1, len(calls))
+
+        # Invalidation
+        orga.name = 'Bebop II'
+        orga.save()
+        self.clear_global_info()
+        TestFunctionField()(orga, user)
+        self.assertEqual(2, len(calls))
+
     def test_properties_field(self):
         user = self.get_root_user()
 
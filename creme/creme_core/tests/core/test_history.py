@@ -1,8 +1,35 @@
+from datetime import timedelta
 from functools import partial
+from unittest import skipUnless
 
-from creme.creme_core.core.history import do_toggle_history, toggle_history
-from creme.creme_core.models import FakeContact, HistoryLine, Language
-from creme.creme_core.models.history import TYPE_CREATION, is_history_enabled
+from django.db import connection
+from django.db.transaction import atomic
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import now
+from django.utils.translation import gettext as _
+
+from creme.creme_core.core.history import (
+    buffered_history,
+    do_toggle_history,
+    toggle_history,
+)
+from creme.creme_core.core.workflow import WorkflowEngine
+from creme.creme_core.creme_jobs import history_archiver_type
+from creme.creme_core.models import (
+    ArchivedHistoryLine,
+    FakeContact,
+    HistoryLine,
+    Job,
+    JobResult,
+    Language,
+)
+from creme.creme_core.models.history import (
+    TYPE_CREATION,
+    TYPE_EDITION,
+    get_history_buffer,
+    is_history_enabled,
+)
+from creme.creme_core.utils.date_period import date_period_registry
 
 from ..base import CremeTestCase
 
@@ -109,3 +136,194 @@ class HistoryTestCase(CremeTestCase):
         hline = HistoryLine.objects.order_by('-id').first()
         self.assertEqual(TYPE_CREATION, hline.type)
         self.assertEqual(fry.id, hline.entity.id)
+
+
+@skipUnless(
+    connection.features.can_return_rows_from_bulk_insert,
+    'The DB backend cannot retrieve the IDs of bulk-created instances',
+)
+class BufferedHistoryTestCase(CremeTestCase):
+    def test_context(self):
+        user = self.get_root_user()
+        create_contact = partial(FakeContact.objects.create, user=user)
+        count = HistoryLine.objects.count()
+
+        with atomic(), buffered_history():
+            self.assertIsNotNone(get_history_buffer())
+
+            fry = create_contact(first_name='Phillip', last_name='Fry')
+            amy = create_contact(first_name='Amy', last_name='Wong')
+            self.assertEqual(count, HistoryLine.objects.count())
+
+        self.assertIsNone(get_history_buffer())
+
+        hlines = [*HistoryLine.objects.order_by('-id')[:2]]
+        self.assertEqual(count + 2, HistoryLine.objects.count())
+        self.assertListEqual([amy.id, fry.id], [hline.entity_id for hline in hlines])
+        self.assertListEqual([TYPE_CREATION] * 2, [hline.type for hline in hlines])
+
+    def test_queries(self):
+        user = self.get_root_user()
+        contacts = [
+            FakeContact.objects.create(user=user, first_name=f'Name #{i}', last_name='Fry')
+            for i in range(5)
+        ]
+
+        def edit_all():
+            for contact in contacts:
+                contact.phone = f'{contact.phone or 0}1'
+                contact.save()
+
+        def new_request():
+            # NB: the entities created/edited in the current request get no
+            #     new line of edition; so we simulate a new request.
+            self.clear_global_info()
+            return [self.refresh(contact) for contact in contacts]
+
+        contacts = new_request()
+        count = HistoryLine.objects.count()
+
+        with CaptureQueriesContext(connection) as ctxt1:
+            edit_all()
+
+        self.assertEqual(count + 5, HistoryLine.objects.count())
+        count += 5
+
+        contacts = new_request()
+        with CaptureQueriesContext(connection) as ctxt2:
+            with buffered_history():
+                edit_all()
+
+        self.assertEqual(count + 5, HistoryLine.objects.count())
+        # NB: 1 query instead of 5 to insert the lines
+        self.assertEqual(len(ctxt1.captured_queries) - 4, len(ctxt2.captured_queries))
+        self.assertEqual(
+            TYPE_EDITION, HistoryLine.objects.order_by('-id').first().type,
+        )
+
+    def test_exception(self):
+        user = self.get_root_user()
+        count = HistoryLine.objects.count()
+
+        with self.assertRaises(ValueError):
+            with buffered_history():
+                FakeContact.objects.create(user=user, first_name='Amy', last_name='Wong')
+                raise ValueError('I should not be captured by context manager')
+
+        self.assertEqual(count, HistoryLine.objects.count())
+        self.assertIsNone(get_history_buffer())
+
+    def test_buffer_size(self):
+        user = self.get_root_user()
+        count = HistoryLine.objects.count()
+
+        with buffered_history():
+            buffer = get_history_buffer()
+            buffer.size = 2
+
+            create_contact = partial(FakeContact.objects.create, user=user)
+            create_contact(first_name='Amy', last_name='Wong')
+            self.assertEqual(count, HistoryLine.objects.count())
+
+            create_contact(first_name='Phillip', last_name='Fry')
+            self.assertEqual(count + 2, HistoryLine.objects.count())
+            self.assertFalse(len(buffer))
+
+            create_contact(first_name='Leela', last_name='Turanga')
+            self.assertEqual(1, len(buffer))
+
+        self.assertEqual(count + 3, HistoryLine.objects.count())
+
+    def test_nested(self):
+        user = self.get_root_user()
+        count = HistoryLine.objects.count()
+
+        with buffered_history():
+            buffer = get_history_buffer()
+
+            with buffered_history():
+                self.assertIs(buffer, get_history_buffer())
+                FakeContact.objects.create(user=user, first_name='Amy', last_name='Wong')
+
+            self.assertEqual(count, HistoryLine.objects.count())
+
+        self.assertEqual(count + 1, HistoryLine.objects.count())
+
+    def test_deleted_entity(self):
+        user = self.get_root_user()
+
+        with atomic(), buffered_history():
+            amy = FakeContact.objects.create(user=user, first_name='Amy', last_name='Wong')
+            amy_id = amy.id
+            amy.delete()
+
+        self.assertFalse(HistoryLine.objects.filter(entity=amy_id))
+        self.assertTrue(HistoryLine.objects.filter(
+            entity=None, entity_ctype=amy.entity_type, type=TYPE_CREATION,
+        ))
+
+
+class HistoryArchivingTestCase(CremeTestCase):
+    def _oldify_lines(self, entity, days):
+        HistoryLine.objects.filter(entity=entity.id).update(
+            date=now() - timedelta(days=days),
+        )
+
+    def test_archive_lines(self):
+        user = self.get_root_user()
+        create_contact = partial(FakeContact.objects.create, user=user)
+        fry = create_contact(first_name='Phillip', last_name='Fry')
+        amy = create_contact(first_name='Amy', last_name='Wong')
+
+        fry_line = self.get_object_or_fail(HistoryLine, entity=fry.id)
+
+        self.assertEqual(
+            1,
+            HistoryLine.archive_lines(HistoryLine.objects.filter(entity=fry.id), chunk_size=1),
+        )
+        self.assertFalse(HistoryLine.objects.filter(entity=fry.id))
+        self.assertTrue(HistoryLine.objects.filter(entity=amy.id))
+
+        archived_line = self.get_object_or_fail(ArchivedHistoryLine, id=fry_line.id)
+        self.assertEqual(fry.id,              archived_line.entity_id)
+        self.assertEqual(fry.entity_type,     archived_line.entity_ctype)
+        self.assertEqual(fry_line.username,   archived_line.username)
+        self.assertEqual(fry_line.date,       archived_line.date)
+        self.assertEqual(fry_line.type,       archived_line.type)
+        self.assertEqual(fry_line.value,      archived_line.value)
+
+    def test_job(self):
+        user = self.get_root_user()
+        create_contact = partial(FakeContact.objects.create, user=user)
+        fry = create_contact(first_name='Phillip', last_name='Fry')
+        amy = create_contact(first_name='Amy', last_name='Wong')
+
+        job = self.get_object_or_fail(Job, type_id=history_archiver_type.id)
+        self.assertFalse(job.enabled)
+
+        job.data = {'delay': date_period_registry.get_period('days', 30).as_dict()}
+        job.save()
+
+        self._oldify_lines(fry, days=31)
+        self._oldify_lines(amy, days=29)
+
+        WorkflowEngine.get_current()._queue.pickup()
+        history_archiver_type.execute(job)
+        self.assertFalse(HistoryLine.objects.filter(entity=fry.id))
+        self.assertTrue(ArchivedHistoryLine.objects.filter(entity=fry.id))
+        self.assertTrue(HistoryLine.objects.filter(entity=amy.id))
+        self.assertFalse(ArchivedHistoryLine.objects.filter(entity=amy.id))
+
+    def test_job__invalid_delay(self):
+        job = self.get_object_or_fail(Job, type_id=history_archiver_type.id)
+        job.data = {'delay': 'invalid'}
+        job.save()
+
+        WorkflowEngine.get_current()._queue.pickup()
+        history_archiver_type.execute(job)
+
+        jresult = self.get_object_or_fail(JobResult, job=job)
+        self.assertListEqual(
+            [_("The configured delay is invalid. Edit the job's configuration to fix it.")],
+            jresult.messages,
+        )
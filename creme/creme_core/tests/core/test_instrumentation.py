@@ -0,0 +1,174 @@
+from django.db import connection
+
+from creme.creme_core.core.instrumentation import (
+    Metric,
+    MetricsRegistry,
+    Recorder,
+    measure,
+)
+from creme.creme_core.core.workflow import WorkflowEngine
+from creme.creme_core.models import (
+    CremePropertyType,
+    EntityFilter,
+    FakeContact,
+    FakeOrganisation,
+    Workflow,
+)
+from creme.creme_core.workflows import (
+    CreatedEntitySource,
+    EntityCreationTrigger,
+    PropertyAddingAction,
+)
+
+from ..base import CremeTestCase
+
+
+class InstrumentationTestCase(CremeTestCase):
+    def test_metric(self):
+        metric = Metric()
+        self.assertEqual(0, metric.count)
+        self.assertEqual(0, metric.duration)
+        self.assertEqual(0, metric.queries)
+        self.assertEqual(0, metric.queries_duration)
+
+        metric.add(duration=0.5, queries=2, queries_duration=0.1)
+        other = Metric()
+        other.add(count=2, duration=1.0, queries=3, queries_duration=0.2)
+        metric.merge(other)
+        self.assertEqual(3, metric.count)
+        self.assertEqual(1.5, metric.duration)
+        self.assertEqual(5, metric.queries)
+        self.assertAlmostEqual(0.3, metric.queries_duration)
+
+    def test_measure__no_recorder(self):
+        self.assertIsNone(Recorder.get_current())
+
+        with measure('brick', 'foobar'):
+            pass
+
+        self.assertIsNone(Recorder.get_current())
+
+    def test_measure(self):
+        recorder = Recorder().install()
+        self.assertIs(recorder, Recorder.get_current())
+
+        with measure('brick', 'foobar'):
+            pass
+
+        with measure('brick', 'foobar'):
+            recorder.queries += 2
+
+        with measure('function_field', 12):
+            pass
+
+        self.assertCountEqual(
+            [('brick', 'foobar'), ('function_field', '12')], [*recorder.metrics.keys()],
+        )
+
+        metric = recorder.metrics[('brick', 'foobar')]
+        self.assertEqual(2, metric.count)
+        self.assertEqual(2, metric.queries)
+        self.assertGreater(metric.duration, 0)
+
+    def test_measure__exception(self):
+        recorder = Recorder().install()
+
+        with self.assertRaises(ValueError):
+            with measure('brick', 'foobar'):
+                raise ValueError('Invalid')
+
+        self.assertEqual(1, recorder.metrics[('brick', 'foobar')].count)
+
+    def test_query_wrapper(self):
+        user = self.get_root_user()
+        recorder = Recorder().install()
+
+        with connection.execute_wrapper(recorder.query_wrapper):
+            with measure('test', 'contacts'):
+                [*FakeContact.objects.filter(user=user)]
+                [*FakeOrganisation.objects.filter(user=user)]
+
+            [*FakeContact.objects.filter(user=user)]
+
+        self.assertEqual(3, recorder.queries)
+        self.assertEqual(2, recorder.metrics[('test', 'contacts')].queries)
+
+    def test_entity_filter(self):
+        recorder = Recorder().install()
+        efilter = EntityFilter.objects.smart_update_or_create(
+            'test-filter01', 'Spiegel', FakeContact, is_custom=True,
+        )
+        efilter.get_q(user=self.get_root_user())
+        self.assertEqual(1, recorder.metrics[('entity_filter', efilter.id)].count)
+
+    def test_workflow(self):
+        user = self.get_root_user()
+        ptype = CremePropertyType.objects.create(text='Is cool')
+        workflow = Workflow.objects.create(
+            title='Created Organisations are cool',
+            content_type=FakeOrganisation,
+            trigger=EntityCreationTrigger(model=FakeOrganisation),
+            actions=[PropertyAddingAction(
+                entity_source=CreatedEntitySource(model=FakeOrganisation),
+                ptype=ptype,
+            )],
+        )
+
+        recorder = Recorder().install()
+
+        with WorkflowEngine.get_current().run(user=None):
+            FakeOrganisation.objects.create(user=user, name='NERV')
+
+        self.assertEqual(1, recorder.metrics[('workflow', str(workflow.id))].count)
+
+    def test_registry(self):
+        recorder = Recorder()
+        recorder.add('brick', 'regular-creme_core-foo', duration=0.5, queries=3)
+        recorder.add('function_field', 'get_pretty_"name"', duration=0.25)
+        recorder.queries = 5
+        recorder.queries_duration = 0.1
+
+        registry = MetricsRegistry()
+        registry.add_recorder(recorder, view_name='creme_core__home', duration=1.0)
+        registry.add_recorder(recorder, view_name='creme_core__home', duration=2.0)
+
+        items = registry.items()
+        self.assertListEqual(
+            [
+                ('brick', 'regular-creme_core-foo'),
+                ('function_field', 'get_pretty_"name"'),
+                ('view', 'creme_core__home'),
+            ],
+            [key for key, __ in items],
+        )
+
+        view_metric = items[2][1]
+        self.assertEqual(2, view_metric.count)
+        self.assertEqual(3.0, view_metric.duration)
+        self.assertEqual(10, view_metric.queries)
+
+        self.assertListEqual(
+            [('view', 'creme_core__home'), ('brick', 'regular-creme_core-foo')],
+            [key for key, __ in registry.slowest(2)],
+        )
+
+        prometheus = registry.to_prometheus()
+        self.assertIn('# TYPE creme_operation_calls_total counter\n', prometheus)
+        self.assertIn(
+            'creme_operation_calls_total'
+            '{category="brick",name="regular-creme_core-foo"} 2\n',
+            prometheus,
+        )
+        self.assertIn(
+            'creme_operation_duration_seconds_total'
+            '{category="view",name="creme_core__home"} 3.0\n',
+            prometheus,
+        )
+        self.assertIn(
+            'creme_operation_queries_total'
+            '{category="function_field",name="get_pretty_\\"name\\""} 0\n',
+            prometheus,
+        )
+
+        registry.clear()
+        self.assertFalse(registry.items())
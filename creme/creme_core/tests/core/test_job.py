@@ -1,21 +1,29 @@
 import os
+import signal
 from datetime import timedelta
+from functools import partial
+from queue import SimpleQueue
 from shutil import rmtree
 from tempfile import mkdtemp
+from types import SimpleNamespace
 from unittest import skipIf
+from unittest.mock import patch
 
 from django.core.exceptions import ImproperlyConfigured
 from django.test.utils import override_settings
 from django.utils.timezone import now
+from django.utils.translation import gettext as _
 
 from creme.creme_core.core.job import JobScheduler, _JobTypeRegistry
 from creme.creme_core.core.job.queue.unix_socket import UnixSocketQueue
+from creme.creme_core.core.job.scheduler import _run_worker
 from creme.creme_core.core.reminder import Reminder, reminder_registry
 from creme.creme_core.creme_jobs import reminder_type
 from creme.creme_core.creme_jobs.base import JobType
-from creme.creme_core.models import Job
+from creme.creme_core.models import Job, JobResult
 from creme.creme_core.utils.date_period import HoursPeriod
 from creme.creme_core.utils.dates import round_hour
+from creme.creme_core.utils.system import enable_exit_handler
 
 from ..base import CremeTestCase
 
@@ -150,6 +158,20 @@ class JobTypeRegistryTestCase(CremeTestCase):
         )
 
 
+class FakeWorker:
+    "Replaces JobScheduler._Worker (no process is forked)."
+    def __init__(self, job_id=None, exitcode=None):
+        self.job_id = job_id
+        self.job_ids = SimpleQueue()
+        self.process = SimpleNamespace(
+            pid=12, exitcode=exitcode, is_alive=lambda: exitcode is None,
+        )
+
+    def run(self, job_id):
+        self.job_id = job_id
+        self.job_ids.put(job_id)
+
+
 class JobSchedulerTestCase(CremeTestCase):
     def setUp(self):
         super().setUp()
@@ -225,3 +247,117 @@ class JobSchedulerTestCase(CremeTestCase):
             rounded_hour + timedelta(hours=1),
             JobScheduler()._next_wakeup(job),
         )
+
+    @override_settings(MAX_USER_JOBS=3, JOB_MANAGER_WORKERS=2)
+    def test_workers_count(self):
+        self.assertEqual(2, JobScheduler()._workers_count)
+        self.assertEqual(0, JobScheduler(workers=0)._workers_count)
+        self.assertEqual(3, JobScheduler(workers=10)._workers_count)
+        self.assertEqual(0, JobScheduler(workers=-1)._workers_count)
+
+    @override_settings(JOB_MANAGER_WORKERS=0)
+    def test_start_workers__disabled(self):
+        scheduler = JobScheduler()
+        scheduler._start_workers()
+        self.assertListEqual([], scheduler._workers)
+        self.assertIsNone(scheduler._workers_context)
+
+    def test_start_job__workers(self):
+        user = self.get_root_user()
+        create_job = partial(Job.objects.create, type_id=reminder_type.id, user=user)
+        job1 = create_job()
+        job2 = create_job()
+
+        worker = FakeWorker()
+        scheduler = JobScheduler()
+        scheduler._workers = [worker]
+        scheduler._start_job(job1)
+        self.assertEqual(job1.id, worker.job_id)
+        self.assertEqual(job1.id, worker.job_ids.get_nowait())
+        self.assertNotIn(job1.id, scheduler._procs)
+
+        # The worker is busy => own process
+        with patch('creme.creme_core.core.job.scheduler.python_subprocess') as subprocess_mock:
+            scheduler._start_job(job2)
+        subprocess_mock.assert_called_once()
+        self.assertEqual(job1.id, worker.job_id)
+        self.assertIn(job2.id, scheduler._procs)
+
+        scheduler._end_job(job1)
+        self.assertIsNone(worker.job_id)
+
+    def test_check_workers(self):
+        user = self.get_root_user()
+        create_job = partial(Job.objects.create, type_id=reminder_type.id, user=user)
+        job1 = create_job()
+        job2 = create_job()
+
+        alive_worker = FakeWorker(job_id=job1.id)
+        new_worker1 = FakeWorker()
+        new_worker2 = FakeWorker()
+
+        scheduler = JobScheduler()
+        scheduler._workers = [
+            alive_worker,
+            FakeWorker(job_id=job2.id, exitcode=-9),
+            FakeWorker(exitcode=1),  # No running job
+        ]
+        scheduler._running_userjob_ids.update([job1.id, job2.id])
+
+        with patch.object(scheduler, '_Worker', side_effect=[new_worker1, new_worker2]):
+            scheduler._check_workers()
+
+        self.assertListEqual([alive_worker, new_worker1, new_worker2], scheduler._workers)
+        self.assertSetEqual({job1.id}, scheduler._running_userjob_ids)
+        self.assertEqual(Job.STATUS_WAIT, self.refresh(job1).status)
+
+        job2 = self.refresh(job2)
+        self.assertEqual(Job.STATUS_ERROR, job2.status)
+        self.assertEqual(
+            _('The process running the job has died (exit code: {code}).').format(code=-9),
+            job2.error,
+        )
+
+    @skipIf(os.name != 'posix', 'Your OS is not POSIX, so there are no signals.')
+    def test_run_worker__exit_handler(self):
+        "The worker does not run the exit handler of the scheduler (inherited by fork)."
+        handlers = {sig: signal.getsignal(sig) for sig in (signal.SIGINT, signal.SIGTERM)}
+        job_ids = SimpleQueue()
+        job_ids.put(None)  # The worker stops immediately
+
+        try:
+            # NB: like JobScheduler.start() before a worker is replaced
+            enable_exit_handler(JobScheduler()._handle_kill)
+
+            with patch('creme.creme_core.core.job.scheduler.reset_queue'):
+                _run_worker(job_ids)
+
+            self.assertIs(signal.SIG_DFL, signal.getsignal(signal.SIGINT))
+            self.assertIs(signal.SIG_DFL, signal.getsignal(signal.SIGTERM))
+        finally:
+            for sig, handler in handlers.items():
+                signal.signal(sig, handler)
+
+
+class JobTypeTestCase(CremeTestCase):
+    def test_execute__metrics(self):
+        class TestJobType(JobType):
+            id = JobType.generate_id('creme_core', 'test_metrics')
+            verbose_name = 'Test'
+
+            def _execute(this, job):
+                JobResult.objects.create(job=job, messages=['Done'])
+
+        job = Job.objects.create(type_id=TestJobType.id, user=self.get_root_user())
+        self.assertIsNone(job.last_duration)
+        self.assertIsNone(job.last_max_rss)
+
+        TestJobType().execute(job)
+
+        job = self.refresh(job)
+        self.assertEqual(Job.STATUS_OK, job.status)
+        self.assertIsInstance(job.last_duration, timedelta)
+        self.assertGreaterEqual(job.last_duration, timedelta(0))
+
+        if os.name == 'posix':
+            self.assertGreater(job.last_max_rss, 0)
@@ -8,10 +8,13 @@ from django.db.models.functions import Concat, ExtractYear, Length
 from parameterized import parameterized
 
 from creme.creme_core.core.paginator import (
+    EstimatedCountPaginator,
     FirstPage,
     FlowPaginator,
     InvalidPage,
     LastPage,
+    count_objects,
+    decode_page_info,
 )
 from creme.creme_core.models import (
     FakeAddress,
@@ -1938,3 +1941,89 @@ class FlowPaginatorTestCase(CremeTestCase):
         )
         self.assertFalse(page.has_next())
         self.assertTrue(page.has_previous())
+
+    def test_first_last_page_info(self):
+        self._build_contacts()
+        paginator = FlowPaginator(FakeContact.objects.all(), per_page=3, count=7)
+        page = paginator.page(paginator.page().next_page_info())
+        self.assertDictEqual({'type': 'first'}, page.first_page_info())
+
+        last_info = page.last_page_info()
+        self.assertDictEqual({'type': 'last', 'key': 'last_name'}, last_info)
+        self.assertFalse(paginator.page(last_info).has_next())
+
+    def test_estimated_count(self):
+        "The count is lower than the page size, but it is only a lower bound."
+        self._build_contacts()
+        paginator = FlowPaginator(
+            FakeContact.objects.all(), per_page=3, count=2, count_is_estimated=True,
+        )
+        self.assertTrue(paginator.count_is_estimated)
+
+        page1 = paginator.page()
+        self.assertTrue(page1.has_next())
+
+        page2 = paginator.page(page1.next_page_info())
+        self.assertTrue(page2.has_previous())
+        self.assertEqual(3, len(page2))
+
+    def test_decode_page_info(self):
+        self.assertIsNone(decode_page_info(None))
+        self.assertIsNone(decode_page_info(''))
+        self.assertIsNone(decode_page_info('{'))
+        self.assertIsNone(decode_page_info('2'))
+        self.assertDictEqual(
+            {'type': 'last', 'key': 'last_name'},
+            decode_page_info('{"type": "last", "key": "last_name"}'),
+        )
+
+
+class EstimatedCountPaginatorTestCase(CremeTestCase):
+    def test_count_objects(self):
+        create_sector = FakeSector.objects.create
+        for i in range(3):
+            create_sector(title=f'Sector #{i}')
+
+        sectors = FakeSector.objects.all()
+        count = sectors.count()
+        self.assertTupleEqual((count, False), count_objects(sectors))
+        self.assertTupleEqual((count, False), count_objects(sectors, max_count=count))
+        self.assertTupleEqual((count - 1, True), count_objects(sectors, max_count=count - 1))
+
+        with self.assertNumQueries(1):
+            self.assertTupleEqual(
+                (0, False),
+                count_objects(sectors.filter(title='Invalid'), max_count=10),
+            )
+
+        with self.assertNumQueries(0):
+            self.assertTupleEqual((3, True), count_objects([*range(5)], max_count=3))
+            self.assertTupleEqual((5, False), count_objects([*range(5)]))
+
+    def test_paginator(self):
+        paginator = EstimatedCountPaginator([*range(20)], per_page=3, max_count=10)
+        self.assertEqual(10, paginator.count)
+        self.assertTrue(paginator.count_is_estimated)
+        self.assertEqual(4, paginator.num_pages)
+        self.assertListEqual([9, 10, 11], [*paginator.page(4)])
+
+        paginator = EstimatedCountPaginator([*range(8)], per_page=3, max_count=10)
+        self.assertEqual(8, paginator.count)
+        self.assertFalse(paginator.count_is_estimated)
+        self.assertEqual(3, paginator.num_pages)
+        self.assertListEqual([6, 7], [*paginator.page(3)])
+
+    def test_paginator__queryset(self):
+        for i in range(4):
+            FakeSector.objects.create(title=f'Sector #{i}')
+
+        sectors = FakeSector.objects.order_by('id')
+        paginator = EstimatedCountPaginator(sectors, per_page=2, max_count=3)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(3, paginator.count)
+
+        self.assertTrue(paginator.count_is_estimated)
+        self.assertEqual(2, paginator.num_pages)
+        self.assertListEqual([*sectors[:2]], [*paginator.page(1)])
+        self.assertListEqual([*sectors[2:4]], [*paginator.page(2)])
@@ -0,0 +1,222 @@
+from functools import partial
+
+from django.test.utils import override_settings
+from django.utils.timezone import now
+
+from creme.creme_core.core.entity_cell import (
+    EntityCellCustomField,
+    EntityCellRegularField,
+)
+from creme.creme_core.core.search import Searcher, SearchIndexer, tokenize
+from creme.creme_core.core.workflow import WorkflowEngine
+from creme.creme_core.creme_jobs import search_index_rebuilder_type
+from creme.creme_core.models import (
+    CustomField,
+    FakeContact,
+    FakeOrganisation,
+    FakeSector,
+    Job,
+    SearchConfigItem,
+    SearchToken,
+)
+
+from ..base import CremeTestCase
+
+
+class SearchIndexTestCase(CremeTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls._sci_backup = [*SearchConfigItem.objects.all()]
+        SearchConfigItem.objects.all().delete()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+
+        SearchConfigItem.objects.all().delete()
+        SearchConfigItem.objects.bulk_create(cls._sci_backup)
+
+    def _get_tokens(self, entity, cell_key=None):
+        qs = SearchToken.objects.filter(entity=entity.id)
+        if cell_key:
+            qs = qs.filter(cell_key=cell_key)
+
+        return {*qs.values_list('token', flat=True)}
+
+    def test_tokenize(self):
+        self.assertListEqual([], tokenize(''))
+        self.assertListEqual([], tokenize(' - '))
+        self.assertListEqual(['linus'], tokenize('Linus'))
+        self.assertListEqual(
+            ['linus', 'torvalds', 'linux', 'dev'],
+            tokenize('Linus Torvalds (linux-dev)'),
+        )
+        self.assertListEqual(['é', 'àbc'], tokenize('É  Àbc'))
+
+        length = SearchIndexer.token_max_length
+        self.assertListEqual(['a' * length], tokenize('a' * (length + 10)))
+
+    def test_indexer_get_cells(self):
+        SearchConfigItem.objects.builder(
+            model=FakeContact, fields=['first_name', 'last_name'],
+        ).get_or_create()
+        SearchConfigItem.objects.builder(
+            model=FakeContact, fields=['last_name', 'sector__title'], role='superuser',
+        ).get_or_create()
+
+        self.assertListEqual(
+            [
+                EntityCellRegularField.build(FakeContact, 'first_name'),
+                EntityCellRegularField.build(FakeContact, 'last_name'),
+                EntityCellRegularField.build(FakeContact, 'sector__title'),
+            ],
+            SearchIndexer().get_cells(FakeContact),
+        )
+        self.assertListEqual([], SearchIndexer().get_cells(FakeOrganisation))
+
+    def test_indexer_index(self):
+        user = self.get_root_user()
+        SearchConfigItem.objects.builder(
+            model=FakeContact, fields=['last_name', 'sector__title'],
+        ).get_or_create()
+
+        sector = FakeSector.objects.create(title='Linux dev')
+        linus = FakeContact.objects.create(
+            user=user, first_name='Linus', last_name='Torvalds', sector=sector,
+        )
+        self.assertFalse(self._get_tokens(linus))
+
+        SearchIndexer().index([linus])
+        self.assertSetEqual(
+            {'torvalds'}, self._get_tokens(linus, cell_key='regular_field-last_name'),
+        )
+        self.assertSetEqual(
+            {'linux', 'dev'}, self._get_tokens(linus, cell_key='regular_field-sector__title'),
+        )
+
+        # Update
+        linus.last_name = 'Torvalds-Penguin'
+        SearchIndexer().index([linus])
+        self.assertSetEqual({'torvalds', 'penguin', 'linux', 'dev'}, self._get_tokens(linus))
+
+    def test_indexer_index_custom_field(self):
+        user = self.get_root_user()
+        cfield = CustomField.objects.create(
+            name='Hobbies', field_type=CustomField.STR, content_type=FakeContact,
+        )
+        sci = SearchConfigItem.objects.builder(
+            model=FakeContact, fields=['last_name'],
+        ).get_or_create()[0]
+        sci.cells = [
+            *sci.cells,
+            EntityCellCustomField(cfield),
+        ]
+        sci.save()
+
+        alan = FakeContact.objects.create(user=user, first_name='Alan', last_name='Cox')
+        cfield.value_class.objects.create(custom_field=cfield, entity=alan, value='Beard care')
+
+        SearchIndexer().index([alan])
+        self.assertSetEqual(
+            {'beard', 'care'},
+            self._get_tokens(alan, cell_key=f'custom_field-{cfield.id}'),
+        )
+
+    def test_indexer_rebuild(self):
+        user = self.get_root_user()
+        create_contact = partial(FakeContact.objects.create, user=user)
+        linus = create_contact(first_name='Linus', last_name='Torvalds')
+        alan = create_contact(first_name='Alan', last_name='Cox')
+
+        indexer = SearchIndexer()
+        indexer.chunk_size = 1
+        self.assertEqual(0, indexer.rebuild(FakeContact))
+
+        SearchConfigItem.objects.builder(
+            model=FakeContact, fields=['first_name'],
+        ).get_or_create()
+        self.assertEqual(
+            FakeContact.objects.count(), indexer.rebuild(FakeContact),
+        )
+        self.assertSetEqual({'linus'}, self._get_tokens(linus))
+        self.assertSetEqual({'alan'},  self._get_tokens(alan))
+
+    @override_settings(SEARCH_INDEX_ENABLED=True)
+    def test_signals(self):
+        user = self.get_root_user()
+        SearchConfigItem.objects.builder(
+            model=FakeContact, fields=['first_name'],
+        ).get_or_create()
+
+        linus = FakeContact.objects.create(user=user, first_name='Linus', last_name='Torvalds')
+        self.assertSetEqual({'linus'}, self._get_tokens(linus))
+
+        linus.first_name = 'Linus Benedict'
+        linus.save()
+        self.assertSetEqual({'linus', 'benedict'}, self._get_tokens(linus))
+
+        # New cell in configuration => the index is rebuilt by the job
+        job = self.get_object_or_fail(Job, type_id=search_index_rebuilder_type.id)
+        self.assertIsNone(search_index_rebuilder_type.next_wakeup(job, now()))
+
+        sci = self.get_object_or_fail(SearchConfigItem, role=None, superuser=False)
+        sci.cells = [
+            *sci.cells,
+            EntityCellRegularField.build(FakeContact, 'last_name'),
+        ]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            sci.save()
+        self.assertFalse(self._get_tokens(linus, cell_key='regular_field-last_name'))
+
+        job = self.refresh(job)
+        now_value = now()
+        self.assertEqual(now_value, search_index_rebuilder_type.next_wakeup(job, now_value))
+
+        WorkflowEngine.get_current()._queue.pickup()
+        search_index_rebuilder_type.execute(job)
+        self.assertSetEqual(
+            {'torvalds'}, self._get_tokens(linus, cell_key='regular_field-last_name'),
+        )
+        self.assertIsNone(
+            search_index_rebuilder_type.next_wakeup(self.refresh(job), now()),
+        )
+
+        linus.delete()
+        self.assertFalse(SearchToken.objects.filter(entity=linus.id))
+
+    def test_searcher(self):
+        user = self.get_root_user()
+        SearchConfigItem.objects.builder(
+            model=FakeContact, fields=['first_name', 'last_name', 'sector__title'],
+        ).get_or_create()
+
+        sector = FakeSector.objects.create(title='Linux dev')
+        create_contact = partial(FakeContact.objects.create, user=user)
+        linus  = create_contact(first_name='Linus',  last_name='Torvalds')
+        alan   = create_contact(first_name='Alan',   last_name='Cox')
+        andrew = create_contact(first_name='Andrew', last_name='Morton', sector=sector)
+        SearchIndexer().rebuild(FakeContact)
+
+        searcher = Searcher([FakeContact], user, use_index=True)
+        self.assertTrue(searcher.use_index)
+
+        def search(searched):
+            return {*searcher.search(FakeContact, searched).values_list('id', flat=True)}
+
+        self.assertSetEqual({linus.id, andrew.id}, search('linu'))
+        self.assertSetEqual({linus.id}, search('linus torv'))
+        self.assertSetEqual({alan.id}, search('COX'))
+        self.assertSetEqual({andrew.id}, search('"linux dev"'))
+        self.assertFalse(search('orvalds'))  # Only the beginning of words
+        self.assertFalse(search('linus cox'))
+
+    @override_settings(SEARCH_INDEX_ENABLED=False)
+    def test_searcher_setting01(self):
+        self.assertFalse(Searcher([FakeContact], self.get_root_user()).use_index)
+
+    @override_settings(SEARCH_INDEX_ENABLED=True)
+    def test_searcher_setting02(self):
+        self.assertTrue(Searcher([FakeContact], self.get_root_user()).use_index)
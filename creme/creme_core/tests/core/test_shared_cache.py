@@ -0,0 +1,331 @@
+from django.core.cache import caches
+from django.db import connection
+from django.template import Context, Template
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from creme.creme_core.auth import EntityCredentials
+from creme.creme_core.core.shared_cache import (
+    SharedCache,
+    cached_shared,
+    shared_cache,
+)
+from creme.creme_core.global_info import set_global_info
+from creme.creme_core.models import (
+    BrickDetailviewLocation,
+    CustomField,
+    FakeContact,
+    FakeOrganisation,
+    FakeSector,
+    FieldsConfig,
+    MenuConfigItem,
+    SearchConfigItem,
+    SetCredentials,
+)
+from creme.creme_core.views.generic.detailview import detailview_bricks
+
+from ..base import CremeTestCase
+
+
+@override_settings(SHARED_CACHE_ALIAS='default', SHARED_CACHE_TIMEOUT=60)
+class SharedCacheTestCase(CremeTestCase):
+    def setUp(self):
+        super().setUp()
+        caches['default'].clear()
+
+    @override_settings(SHARED_CACHE_ALIAS='')
+    def test_disabled(self):
+        cache = SharedCache().register(FakeSector)
+        self.assertFalse(cache.enabled)
+        self.assertIsNone(cache.cache)
+
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return 'foobar'
+
+        def get_value():
+            return cache.get_or_compute(key='test', models=[FakeSector], compute=compute)
+
+        self.assertEqual('foobar', get_value())
+        self.assertEqual('foobar', get_value())
+        self.assertEqual(2, len(calls))
+        self.assertDictEqual({'hits': 0, 'misses': 0}, cache.stats)
+
+    def test_register(self):
+        cache = SharedCache()
+        self.assertNotIn(FakeSector, cache)
+
+        cache.register(FakeSector, 'creme_core.FakeContact')
+        self.assertIn(FakeSector, cache)
+        self.assertIn(FakeContact, cache)
+        self.assertIn('creme_core.fakecontact', cache)
+        self.assertNotIn(FakeOrganisation, cache)
+
+    def test_get_or_compute(self):
+        cache = SharedCache().register(FakeSector)
+        self.assertTrue(cache.enabled)
+
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return [*FakeSector.objects.order_by('id').values_list('title', flat=True)]
+
+        titles = cache.get_or_compute(key='sectors', models=[FakeSector], compute=compute)
+        self.assertTrue(titles)
+        self.assertEqual(1, len(calls))
+        self.assertDictEqual({'hits': 0, 'misses': 1}, cache.stats)
+
+        self.clear_global_info()
+        self.assertListEqual(
+            titles,
+            cache.get_or_compute(key='sectors', models=[FakeSector], compute=compute),
+        )
+        self.assertEqual(1, len(calls))
+        self.assertDictEqual({'hits': 1, 'misses': 1}, cache.stats)
+
+    def test_get_or_compute__not_registered(self):
+        with self.assertRaises(AssertionError):
+            SharedCache().get_or_compute(key='sectors', models=[FakeSector], compute=list)
+
+    def test_get_many_or_compute(self):
+        cache = SharedCache().register(FakeSector)
+        calls = []
+
+        def compute(keys):
+            calls.append(keys)
+            return {key: key.upper() for key in keys}
+
+        self.assertDictEqual(
+            {'foo': 'FOO', 'bar': 'BAR'},
+            cache.get_many_or_compute(
+                keys=['foo', 'bar'], models=[FakeSector], compute=compute,
+            ),
+        )
+        self.assertListEqual([['foo', 'bar']], calls)
+        self.assertDictEqual({'hits': 0, 'misses': 2}, cache.stats)
+
+        self.clear_global_info()
+        self.assertDictEqual(
+            {'foo': 'FOO', 'baz': 'BAZ'},
+            cache.get_many_or_compute(
+                keys=['foo', 'baz'], models=[FakeSector], compute=compute,
+            ),
+        )
+        self.assertListEqual([['foo', 'bar'], ['baz']], calls)
+        self.assertDictEqual({'hits': 1, 'misses': 3}, cache.stats)
+
+    @override_settings(SHARED_CACHE_ALIAS='')
+    def test_get_many_or_compute__disabled(self):
+        cache = SharedCache().register(FakeSector)
+        calls = []
+
+        def compute(keys):
+            calls.append(keys)
+            return {key: key.upper() for key in keys}
+
+        for __ in range(2):
+            self.assertDictEqual(
+                {'foo': 'FOO'},
+                cache.get_many_or_compute(keys=['foo'], models=[FakeSector], compute=compute),
+            )
+
+        self.assertEqual(2, len(calls))
+
+    def test_invalidation(self):
+        shared_cache.register(FakeSector)
+
+        def compute():
+            return [*FakeSector.objects.order_by('id').values_list('title', flat=True)]
+
+        def get_titles():
+            self.clear_global_info()
+            return shared_cache.get_or_compute(
+                key='test_sectors', models=[FakeSector], compute=compute,
+            )
+
+        titles = get_titles()
+        sector = FakeSector.objects.create(title='Alchemy')
+        self.assertListEqual([*titles, 'Alchemy'], get_titles())
+
+        sector.title = 'Chemistry'
+        sector.save()
+        self.assertListEqual([*titles, 'Chemistry'], get_titles())
+
+        sector.delete()
+        self.assertListEqual(titles, get_titles())
+
+    def test_generations__outside_request(self):
+        "The generations are re-read, because the per-request cache is never reset."
+        cache = SharedCache().register(FakeSector)
+        calls = []
+
+        def get_value():
+            return cache.get_or_compute(
+                key='test', models=[FakeSector], compute=lambda: calls.append(1),
+            )
+
+        get_value()
+        get_value()
+        self.assertEqual(1, len(calls))
+
+        # Another process modifies a sector
+        caches['default'].set(cache.generation_key_fmt('creme_core.fakesector'), 12)
+        get_value()
+        self.assertEqual(2, len(calls))
+
+    def test_generations__in_request(self):
+        "The generations are read once per request."
+        cache = SharedCache().register(FakeSector)
+        set_global_info(in_request=True)
+        calls = []
+
+        def get_value():
+            return cache.get_or_compute(
+                key='test', models=[FakeSector], compute=lambda: calls.append(1),
+            )
+
+        get_value()
+        caches['default'].set(cache.generation_key_fmt('creme_core.fakesector'), 12)
+        get_value()
+        self.assertEqual(1, len(calls))
+
+        # Modification in the current process
+        cache.invalidate(FakeSector)
+        get_value()
+        self.assertEqual(2, len(calls))
+
+    def test_decorator(self):
+        calls = []
+
+        @cached_shared('creme_core-test_sectors_count', models=['creme_core.FakeSector'])
+        def count_sectors():
+            calls.append(1)
+            return FakeSector.objects.count()
+
+        self.assertIn(FakeSector, shared_cache)
+
+        count = count_sectors()
+        self.assertEqual(count, count_sectors())
+        self.assertEqual(1, len(calls))
+
+        self.clear_global_info()
+        self.assertEqual(count, count_sectors())
+        self.assertEqual(1, len(calls))
+
+        FakeSector.objects.create(title='Alchemy')
+        self.clear_global_info()
+        self.assertEqual(count + 1, count_sectors())
+        self.assertEqual(2, len(calls))
+
+    def test_fields_config(self):
+        FieldsConfig.objects.create(
+            content_type=FakeContact,
+            descriptions=[('phone', {FieldsConfig.HIDDEN: True})],
+        )
+        self.assertTrue(
+            FieldsConfig.objects.get_for_model(FakeContact).is_fieldname_hidden('phone')
+        )
+
+        self.clear_global_info()
+        with self.assertNumQueries(0):
+            fconf = FieldsConfig.objects.get_for_model(FakeContact)
+        self.assertTrue(fconf.is_fieldname_hidden('phone'))
+
+    def test_custom_fields(self):
+        cfield = CustomField.objects.create(
+            name='Hobbies', field_type=CustomField.STR, content_type=FakeContact,
+        )
+        self.assertListEqual(
+            [cfield.id], [*CustomField.objects.get_for_model(FakeContact).keys()],
+        )
+
+        self.clear_global_info()
+        with self.assertNumQueries(0):
+            cfields = CustomField.objects.get_for_model(FakeContact)
+        self.assertListEqual([cfield.id], [*cfields.keys()])
+
+    def test_search_config(self):
+        user = self.get_root_user()
+        SearchConfigItem.objects.builder(
+            model=FakeContact, fields=['last_name'],
+        ).get_or_create()
+
+        sci = self.get_alone_element(SearchConfigItem.objects.iter_for_models([FakeContact], user))
+
+        self.clear_global_info()
+        with self.assertNumQueries(0):
+            cached_sci = self.get_alone_element(
+                SearchConfigItem.objects.iter_for_models([FakeContact], user)
+            )
+        self.assertEqual(sci.id, cached_sci.id)
+
+    def test_detailview_locations(self):
+        user = self.get_root_user()
+        entity = FakeContact.objects.create(user=user, first_name='Spike', last_name='Spiegel')
+        bricks = detailview_bricks(user, entity)
+
+        self.clear_global_info()
+        with self.assertNumQueries(0):
+            cached_bricks = detailview_bricks(user, entity)
+        self.assertListEqual(
+            [brick.id for brick in bricks['left']],
+            [brick.id for brick in cached_bricks['left']],
+        )
+
+        # The configuration of the model replaces the default one
+        BrickDetailviewLocation.objects.create_for_model_brick(
+            order=1, zone=BrickDetailviewLocation.RIGHT, model=FakeContact,
+        )
+        self.clear_global_info()
+        new_bricks = detailview_bricks(user, entity)
+        self.assertFalse(new_bricks['left'])
+        self.assertEqual(1, len(new_bricks['right']))
+
+    def test_menu(self):
+        user = self.get_root_user()
+        template = Template(r'{% load creme_menu %}{% menu_display %}')
+
+        def render():
+            self.clear_global_info()
+
+            with CaptureQueriesContext(connection) as ctxt:
+                rendered = template.render(Context({
+                    'request': self.build_request(user=user),
+                    'user': user,
+                    'TIME_ZONE': 'Europe/Paris',
+                }))
+
+            return rendered, [
+                query['sql']
+                for query in ctxt.captured_queries
+                if MenuConfigItem._meta.db_table in query['sql']
+            ]
+
+        rendered, queries = render()
+        self.assertTrue(queries)
+
+        cached_rendered, cached_queries = render()
+        self.assertFalse(cached_queries)
+        self.assertEqual(rendered, cached_rendered)
+
+    def test_credentials(self):
+        role = self.create_role(allowed_apps=['creme_core'])
+        self.add_credentials(role, own=['VIEW'])
+        user = self.create_user(role=role)
+
+        self.assertTrue(user.role.can_do_on_model(user, FakeContact, None, EntityCredentials.VIEW))
+
+        self.clear_global_info()
+        role = self.refresh(role)
+        with self.assertNumQueries(0):
+            creds = role._get_setcredentials()
+        self.assertListEqual(
+            [*SetCredentials.objects.filter(role=role).values_list('id', flat=True)],
+            [sc.id for sc in creds],
+        )
+
+        self.add_credentials(role, all=['CHANGE'])
+        self.clear_global_info()
+        self.assertEqual(2, len(self.refresh(role)._get_setcredentials()))
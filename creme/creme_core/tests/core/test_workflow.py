@@ -1041,6 +1041,82 @@ class WorkflowEngineTestCase(CremeTestCase):
         self.assertHasProperty(entity=orga1, ptype=ptype)
         self.assertEqual(0, len(engine._queue))  # Meh
 
+    def test_index(self):
+        user = self.get_root_user()
+        ptype = CremePropertyType.objects.create(text='Is cool')
+
+        create_wf = partial(Workflow.objects.create, content_type=FakeOrganisation)
+        wf1 = create_wf(
+            title='Created Organisations are cool',
+            trigger=EntityCreationTrigger(model=FakeOrganisation),
+        )
+        wf2 = create_wf(
+            title='Edited Organisations are cool',
+            trigger=EntityEditionTrigger(model=FakeOrganisation),
+        )
+        create_wf(
+            title='Created Contacts are cool',
+            content_type=FakeContact,
+            trigger=EntityCreationTrigger(model=FakeContact),
+        )
+        create_wf(
+            title='Disabled', disabled=now(),
+            trigger=EntityCreationTrigger(model=FakeOrganisation),
+        )
+        wf5 = create_wf(
+            title='Cool Organisations',
+            trigger=PropertyAddingTrigger(entity_model=FakeOrganisation, ptype=ptype),
+        )
+
+        orga = FakeOrganisation.objects.create(user=user, name='NERV')
+
+        self.clear_global_info()
+        engine = WorkflowEngine.get_current()
+        self.assertListEqual([wf1], engine._get_workflows(EntityCreated(entity=orga)))
+        self.assertListEqual([wf2], engine._get_workflows(EntityEdited(entity=orga)))
+
+        prop = CremeProperty(creme_entity=orga, type=ptype)
+        self.assertListEqual([wf5], engine._get_workflows(PropertyAdded(creme_property=prop)))
+
+        # The index is built once
+        with self.assertNumQueries(0):
+            engine._get_workflows(EntityCreated(entity=orga))
+
+    def test_stats(self):
+        user = self.get_root_user()
+
+        ptype = CremePropertyType.objects.create(text='Is cool')
+        source = CreatedEntitySource(model=FakeOrganisation)
+        workflow = Workflow.objects.create(
+            title='Created Corporations are cool',
+            content_type=FakeOrganisation,
+            trigger=EntityCreationTrigger(model=FakeOrganisation),
+            conditions=WorkflowConditions().add(
+                source=source,
+                conditions=[condition_handler.RegularFieldConditionHandler.build_condition(
+                    model=FakeOrganisation,
+                    operator=EndsWithOperator, field_name='name', values=[' Corp'],
+                )],
+            ),
+            actions=[PropertyAddingAction(entity_source=source, ptype=ptype)],
+        )
+
+        self.clear_global_info()
+        engine = WorkflowEngine.get_current()
+        self.assertDictEqual({}, engine.stats)
+
+        create_orga = partial(FakeOrganisation.objects.create, user=user)
+
+        with engine.run(user=None):
+            create_orga(name='NERV')
+            create_orga(name='Seele Corp')
+
+        stats = engine.stats.get(workflow.id)
+        self.assertIsDict(stats, length=3)
+        self.assertEqual(2, stats.get('activations'))
+        self.assertEqual(1, stats.get('executions'))
+        self.assertGreater(stats.get('duration'), 0)
+
 
 class WorkflowEngineRollbackTestCase(CremeTransactionTestCase):
     def test_creation(self):
@@ -133,6 +133,39 @@ class ExtractorTestCase(CremeTestCase):
             err_msg4,
         )
 
+    def test_extract__sub_field__prefetch(self):
+        user = self.user
+        extractor = RegularFieldExtractor(
+            column_index=3,
+            default_value=None,
+            value_castor=int,
+        )
+        extractor.set_subfield_search(
+            subfield_search='title',
+            subfield_model=FakeSector,
+            multiple=False,
+            creation_form_class=None,
+        )
+
+        sector1, sector2 = FakeSector.objects.all()[:2]
+        line1 = ['Claus', 'Valca', sector1.title]
+        line2 = ['Lavie', 'Head', sector2.title]
+
+        with self.assertNumQueries(1):
+            extractor.prefetch([line1, line2, ['Alvis', 'Hamilton', '']], user)
+
+        with self.assertNumQueries(0):
+            value1 = extractor.extract_value(line1, user)
+            value2 = extractor.extract_value(line2, user)
+
+        self.assertEqual((sector1, None), value1)
+        self.assertEqual((sector2, None), value2)
+
+        # Not prefetched => regular query
+        value3, err_msg3 = extractor.extract_value(['Alex', 'Row', 'Unknown sector'], user)
+        self.assertIsNone(value3)
+        self.assertTrue(err_msg3)
+
     def test_extract__sub_field__creation_form(self):
         "Sub-field search + creation form class."
         class FakeSectorForm(CremeModelForm):
@@ -0,0 +1,146 @@
+from django.core.cache import caches
+from django.test.utils import override_settings
+
+from creme.creme_core.bricks import PropertiesBrick
+from creme.creme_core.core.shared_cache import shared_cache
+from creme.creme_core.gui.brick_cache import BrickHTMLCache, brick_html_cache
+from creme.creme_core.gui.bricks import Brick
+from creme.creme_core.models import (
+    CremeProperty,
+    CremePropertyType,
+    FakeContact,
+    FakeSector,
+)
+
+from ..base import CremeTestCase
+
+
+class _CountingBrick(Brick):
+    id = Brick.generate_id('creme_core', 'test_brick_cache')
+    dependencies = (FakeContact,)
+    cache_html = True
+    cache_dependencies = (FakeSector,)
+
+    renders_count = 0
+
+    def render(self, context):
+        type(self).renders_count += 1
+        return f'<div>{context["object"]}</div>'
+
+
+@override_settings(SHARED_CACHE_ALIAS='default', SHARED_CACHE_TIMEOUT=60)
+class BrickHTMLCacheTestCase(CremeTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        brick_html_cache.register(_CountingBrick)
+
+    def setUp(self):
+        super().setUp()
+        caches['default'].clear()
+        _CountingBrick.renders_count = 0
+
+    def _render(self, brick, user, instance):
+        self.clear_global_info()
+        return brick_html_cache.render(brick, self.build_context(user=user, instance=instance))
+
+    def test_is_cacheable(self):
+        self.assertIn(FakeContact, shared_cache)
+        self.assertIn(FakeSector, shared_cache)
+
+        cache = BrickHTMLCache()
+        self.assertTrue(cache.is_cacheable(_CountingBrick()))
+        self.assertTrue(cache.is_cacheable(PropertiesBrick()))
+
+        class NotCachedBrick(_CountingBrick):
+            cache_html = False
+
+        self.assertFalse(cache.is_cacheable(NotCachedBrick()))
+
+        class WildcardBrick(_CountingBrick):
+            dependencies = '*'
+
+        self.assertFalse(cache.is_cacheable(WildcardBrick()))
+
+        with override_settings(SHARED_CACHE_ALIAS=''):
+            self.assertFalse(cache.is_cacheable(_CountingBrick()))
+
+    def test_render(self):
+        user = self.get_root_user()
+        contact = FakeContact.objects.create(user=user, first_name='Spike', last_name='Spiegel')
+
+        html = self._render(_CountingBrick(), user=user, instance=contact)
+        self.assertEqual(f'<div>{contact}</div>', html)
+        self.assertEqual(1, _CountingBrick.renders_count)
+
+        self.assertEqual(html, self._render(_CountingBrick(), user=user, instance=contact))
+        self.assertEqual(1, _CountingBrick.renders_count)
+
+        # Another entity
+        other = FakeContact.objects.create(user=user, first_name='Jet', last_name='Black')
+        self.assertEqual(
+            f'<div>{other}</div>', self._render(_CountingBrick(), user=user, instance=other),
+        )
+        self.assertEqual(2, _CountingBrick.renders_count)
+
+    def test_render__other_user(self):
+        user1 = self.get_root_user()
+        user2 = self.create_user()
+        contact = FakeContact.objects.create(user=user1, first_name='Spike', last_name='Spiegel')
+
+        self._render(_CountingBrick(), user=user1, instance=contact)
+        self._render(_CountingBrick(), user=user2, instance=contact)
+        self.assertEqual(2, _CountingBrick.renders_count)
+
+    def test_invalidation__entity(self):
+        user = self.get_root_user()
+        contact = FakeContact.objects.create(user=user, first_name='Spike', last_name='Spiegel')
+        other = FakeContact.objects.create(user=user, first_name='Jet', last_name='Black')
+
+        self._render(_CountingBrick(), user=user, instance=contact)
+        self._render(_CountingBrick(), user=user, instance=other)
+        self.assertEqual(2, _CountingBrick.renders_count)
+
+        contact.last_name = 'Spiegel-Swordfish'
+        contact.save()
+        self.assertEqual(
+            '<div>Spike Spiegel-Swordfish</div>',
+            self._render(_CountingBrick(), user=user, instance=contact),
+        )
+        self.assertEqual(3, _CountingBrick.renders_count)
+
+    def test_invalidation__dependencies(self):
+        user = self.get_root_user()
+        contact = FakeContact.objects.create(user=user, first_name='Spike', last_name='Spiegel')
+
+        self._render(_CountingBrick(), user=user, instance=contact)
+        self.assertEqual(1, _CountingBrick.renders_count)
+
+        FakeSector.objects.create(title='Bounty hunting')
+        self._render(_CountingBrick(), user=user, instance=contact)
+        self.assertEqual(2, _CountingBrick.renders_count)
+
+    @override_settings(SHARED_CACHE_ALIAS='')
+    def test_disabled(self):
+        user = self.get_root_user()
+        contact = FakeContact.objects.create(user=user, first_name='Spike', last_name='Spiegel')
+
+        self._render(_CountingBrick(), user=user, instance=contact)
+        self._render(_CountingBrick(), user=user, instance=contact)
+        self.assertEqual(2, _CountingBrick.renders_count)
+
+    def test_properties_brick(self):
+        user = self.get_root_user()
+        contact = FakeContact.objects.create(user=user, first_name='Spike', last_name='Spiegel')
+        ptype1 = CremePropertyType.objects.create(text='Is a bounty hunter')
+        CremeProperty.objects.create(creme_entity=contact, type=ptype1)
+
+        html1 = self._render(PropertiesBrick(), user=user, instance=contact)
+        self.assertIn(ptype1.text, html1)
+
+        ptype2 = CremePropertyType.objects.create(text='Is a cowboy')
+        CremeProperty.objects.create(creme_entity=contact, type=ptype2)
+
+        html2 = self._render(PropertiesBrick(), user=user, instance=contact)
+        self.assertIn(ptype1.text, html2)
+        self.assertIn(ptype2.text, html2)
@@ -0,0 +1,147 @@
+from threading import current_thread
+
+from django.test.utils import override_settings
+from django.utils.translation import get_language
+
+from creme.creme_core.bricks import PropertiesBrick
+from creme.creme_core.gui.brick_rendering import BricksRenderer
+from creme.creme_core.gui.bricks import Brick
+from creme.creme_core.models import FakeContact
+
+from ..base import CremeTestCase
+from ..views.base import BrickTestCaseMixin
+
+
+class _ThreadBrick(Brick):
+    dependencies = (FakeContact,)
+
+    def __init__(self, brick_id, independent=False):
+        super().__init__()
+        self.id = brick_id
+        self.independent = independent
+
+    def render(self, context):
+        return f'{self.id}|{current_thread().name}|{get_language()}|'
+
+
+class BricksRendererTestCase(BrickTestCaseMixin, CremeTestCase):
+    def _build_bricks(self):
+        return [
+            _ThreadBrick(Brick.generate_id('creme_core', 'test_rendering1'), independent=True),
+            _ThreadBrick(Brick.generate_id('creme_core', 'test_rendering2')),
+            _ThreadBrick(Brick.generate_id('creme_core', 'test_rendering3'), independent=True),
+        ]
+
+    def test_sequential(self):
+        bricks = self._build_bricks()
+        renders = BricksRenderer().render(
+            bricks, self.build_context(user=self.get_root_user()),
+        )
+        thread_name = current_thread().name
+        language = get_language()
+        self.assertListEqual(
+            [f'{brick.id}|{thread_name}|{language}|' for brick in bricks], renders,
+        )
+
+    @override_settings(BRICKS_RENDERING_WORKERS=2)
+    def test_concurrent(self):
+        renderer = BricksRenderer()
+        bricks = self._build_bricks()
+        renders = renderer.render(
+            bricks,
+            self.build_context(user=self.get_root_user()),
+            mode=BricksRenderer.Mode.CONCURRENT,
+        )
+        self.assertEqual(3, len(renders))
+
+        language = get_language()
+        brick_id1, thread_name1, language1, __ = renders[0].split('|')
+        self.assertEqual(bricks[0].id, brick_id1)
+        self.assertStartsWith(thread_name1, renderer.thread_name_prefix)
+        self.assertEqual(language, language1)
+
+        self.assertEqual(f'{bricks[1].id}|{current_thread().name}|{language}|', renders[1])
+
+        brick_id3, thread_name3, language3, __ = renders[2].split('|')
+        self.assertEqual(bricks[2].id, brick_id3)
+        self.assertStartsWith(thread_name3, renderer.thread_name_prefix)
+        self.assertEqual(language, language3)
+
+    @override_settings(BRICKS_RENDERING_WORKERS=1)
+    def test_concurrent__one_worker(self):
+        bricks = self._build_bricks()
+        renders = BricksRenderer().render(
+            bricks,
+            self.build_context(user=self.get_root_user()),
+            mode=BricksRenderer.Mode.CONCURRENT,
+        )
+        thread_name = current_thread().name
+        language = get_language()
+        self.assertListEqual(
+            [f'{brick.id}|{thread_name}|{language}|' for brick in bricks], renders,
+        )
+
+    def test_deferred(self):
+        bricks = self._build_bricks()
+        context = self.build_context(user=self.get_root_user())
+        context['bricks_reload_url'] = '/creme_core/bricks/reload/'
+
+        renders = BricksRenderer().render(
+            bricks, context, mode=BricksRenderer.Mode.DEFERRED,
+        )
+        self.assertEqual(3, len(renders))
+        self.assertEqual(f'{bricks[1].id}|{current_thread().name}|{get_language()}|', renders[1])
+
+        for brick, render in ((bricks[0], renders[0]), (bricks[2], renders[2])):
+            brick_node = self.get_brick_node(self.get_html_tree(render), brick=brick.id)
+            self.assertEqual('true', brick_node.attrib.get('data-brick-deferred'))
+            self.assertEqual('[]', brick_node.attrib.get('data-brick-deps'))
+
+    def test_deferred__no_reload_url(self):
+        bricks = self._build_bricks()
+
+        with self.assertLogs(level='WARNING'):
+            renders = BricksRenderer().render(
+                bricks,
+                self.build_context(user=self.get_root_user()),
+                mode=BricksRenderer.Mode.DEFERRED,
+            )
+
+        thread_name = current_thread().name
+        language = get_language()
+        self.assertListEqual(
+            [f'{brick.id}|{thread_name}|{language}|' for brick in bricks], renders,
+        )
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            BricksRenderer().render(
+                self._build_bricks(),
+                self.build_context(user=self.get_root_user()),
+                mode='invalid',
+            )
+
+    @override_settings(BRICKS_RENDERING_MODE='deferred')
+    def test_detailview(self):
+        user = self.login_as_root_and_get()
+        contact = FakeContact.objects.create(user=user, first_name='Spike', last_name='Spiegel')
+
+        response = self.assertGET200(contact.get_absolute_url())
+        self.assertEqual('deferred', response.context.get('bricks_rendering_mode'))
+
+        brick_node = self.get_brick_node(
+            self.get_html_tree(response.content), brick=PropertiesBrick,
+        )
+        self.assertEqual('true', brick_node.attrib.get('data-brick-deferred'))
+
+    def test_detailview__default_mode(self):
+        user = self.login_as_root_and_get()
+        contact = FakeContact.objects.create(user=user, first_name='Spike', last_name='Spiegel')
+
+        response = self.assertGET200(contact.get_absolute_url())
+        self.assertEqual('sequential', response.context.get('bricks_rendering_mode'))
+
+        brick_node = self.get_brick_node(
+            self.get_html_tree(response.content), brick=PropertiesBrick,
+        )
+        self.assertIsNone(brick_node.attrib.get('data-brick-deferred'))
@@ -1,5 +1,6 @@
 from copy import deepcopy
 from functools import partial
+from json import dumps as json_dump
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import PermissionDenied
@@ -11,6 +12,7 @@ from creme.creme_core.core.entity_cell import (
     EntityCellRegularField,
     EntityCellRelation,
 )
+from creme.creme_core.core.paginator import EstimatedCountPaginator, FlowPage
 from creme.creme_core.gui.bricks import (  # SimpleBrick
     Brick,
     BrickManager,
@@ -2467,6 +2469,90 @@ class BrickTestCase(BrickTestCaseMixin, CremeTestCase):
         page = template_context['page']
         self.assertEqual(2, page.number)
 
+    def test_paginated_brick__max_count(self):
+        user = self.get_root_user()
+
+        description = 'Dungeon explorer'
+        create_contact = partial(FakeContact.objects.create, user=user, description=description)
+        create_contact(first_name='Aiz',  last_name='Wallenstein')
+        create_contact(first_name='Bell', last_name='Cranel')
+        create_contact(first_name='Welf', last_name='Crozzo')
+
+        brick = self.OrderedBrick()
+        brick.page_size = 2
+        brick.max_count = 2
+        template_context = brick.get_template_context(
+            self.build_context(user=user, url=f'/?{brick.id}_page=3'),
+            FakeContact.objects.filter(description=description),
+        )
+
+        paginator = template_context['page'].paginator
+        self.assertIsInstance(paginator, EstimatedCountPaginator)
+        self.assertEqual(2, paginator.count)
+        self.assertTrue(paginator.count_is_estimated)
+        self.assertEqual(1, template_context['page'].number)
+
+    def test_queryset_brick__seek_pagination(self):
+        user = self.get_root_user()
+
+        description = 'Dungeon explorer'
+        create_contact = partial(FakeContact.objects.create, user=user, description=description)
+        wallen = create_contact(first_name='Aiz',  last_name='Wallenstein')
+        cranel = create_contact(first_name='Bell', last_name='Cranel')
+        crozzo = create_contact(first_name='Welf', last_name='Crozzo')
+
+        class SeekBrick(self.OrderedBrick):
+            page_size = 2
+            seek_pagination = True
+
+        brick = SeekBrick()
+        qs = FakeContact.objects.filter(description=description)
+        page1 = brick.get_template_context(self.build_context(user=user), qs)['page']
+        self.assertIsInstance(page1, FlowPage)
+        self.assertEqual(3, page1.paginator.count)
+        self.assertListEqual([cranel, crozzo], page1.object_list)
+
+        page2 = brick.get_template_context(
+            self.build_context(
+                user=user,
+                request_data={f'{brick.id}_page': json_dump(page1.next_page_info())},
+            ),
+            qs,
+        )['page']
+        self.assertListEqual([wallen], page2.object_list)
+        self.assertTrue(page2.has_previous())
+        self.assertFalse(page2.has_next())
+
+        # Invalid information => first page
+        page3 = brick.get_template_context(
+            self.build_context(user=user, request_data={f'{brick.id}_page': '2'}),
+            qs,
+        )['page']
+        self.assertListEqual([cranel, crozzo], page3.object_list)
+
+    def test_queryset_brick__seek_pagination__max_count(self):
+        user = self.get_root_user()
+
+        description = 'Dungeon explorer'
+        create_contact = partial(FakeContact.objects.create, user=user, description=description)
+        create_contact(first_name='Aiz',  last_name='Wallenstein')
+        create_contact(first_name='Bell', last_name='Cranel')
+        create_contact(first_name='Welf', last_name='Crozzo')
+
+        class SeekBrick(self.OrderedBrick):
+            page_size = 2
+            seek_pagination = True
+            max_count = 2
+
+        brick = SeekBrick()
+        page = brick.get_template_context(
+            self.build_context(user=user),
+            FakeContact.objects.filter(description=description),
+        )['page']
+        self.assertEqual(2, page.paginator.count)
+        self.assertTrue(page.paginator.count_is_estimated)
+        self.assertTrue(page.has_next())
+
     def test_queryset_brick__order__not_in_request(self):
         "No order in request."
         user = self.get_root_user()
@@ -0,0 +1,49 @@
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from creme.creme_core.management.commands.creme_search_index import (
+    Command as SearchIndexCommand,
+)
+from creme.creme_core.models import (
+    FakeContact,
+    FakeOrganisation,
+    SearchConfigItem,
+    SearchToken,
+)
+
+from .. import base
+
+
+class SearchIndexCommandTestCase(base.CremeTestCase):
+    @staticmethod
+    def call_command(*args, **kwargs):
+        call_command(SearchIndexCommand(), *args, verbosity=0, **kwargs)
+
+    def test_ok(self):
+        user = self.get_root_user()
+        SearchConfigItem.objects.builder(
+            model=FakeContact, fields=['last_name'],
+        ).get_or_create()
+        SearchConfigItem.objects.builder(
+            model=FakeOrganisation, fields=['name'],
+        ).get_or_create()
+
+        contact = FakeContact.objects.create(user=user, first_name='Linus', last_name='Torvalds')
+        orga = FakeOrganisation.objects.create(user=user, name='Linux Foundation')
+
+        self.call_command('creme_core.FakeContact')
+        self.assertListEqual(
+            ['torvalds'],
+            [*SearchToken.objects.filter(entity=contact.id).values_list('token', flat=True)],
+        )
+        self.assertFalse(SearchToken.objects.filter(entity=orga.id))
+
+        self.call_command()
+        self.assertSetEqual(
+            {'linux', 'foundation'},
+            {*SearchToken.objects.filter(entity=orga.id).values_list('token', flat=True)},
+        )
+
+    def test_invalid_model(self):
+        with self.assertRaises(CommandError):
+            self.call_command('creme_core.FakeSector')
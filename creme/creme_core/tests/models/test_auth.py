@@ -4526,3 +4526,99 @@ class PermissionsTestCase(BaseAuthTestCase):
         self.assertFalse(EntityCredentials.filter(
             user=user, queryset=FakeContact.objects.all(),
         ))
+
+    def test_get_perms_map__superuser(self):
+        self._create_users_n_contacts()
+        user = self.user
+        user.is_superuser = True
+
+        contact1 = self.contact1
+        contact2 = self.contact2
+
+        with self.assertNumQueries(0):
+            perms_map = user.get_perms_map([contact1, contact2])
+
+        self.assertSetEqual({contact1.id, contact2.id}, {*perms_map.keys()})
+        self.assertTrue(perms_map[contact1.id].can_view())
+        self.assertTrue(perms_map[contact2.id].can_delete())
+
+    def test_get_perms_map(self):
+        self._create_users_n_contacts()
+        user = self.user
+        other_user = self.other_user
+        VIEW = EntityCredentials.VIEW
+        CHANGE = EntityCredentials.CHANGE
+
+        efilter = EntityFilter.objects.create(
+            id='creme_core-test_auth_perms_map',
+            entity_type=FakeContact,
+            filter_type=EF_CREDENTIALS,
+        ).set_conditions(
+            [
+                condition_handler.RegularFieldConditionHandler.build_condition(
+                    model=FakeContact,
+                    operator=operators.IEQUALS,
+                    field_name='last_name', values=['Sasaki'],
+                    filter_type=EF_CREDENTIALS,
+                ),
+            ],
+            check_cycles=False, check_privacy=False,
+        )
+        self._create_role(
+            'Coder', ['creme_core'], users=[user],
+            set_creds=[
+                SetCredentials(value=VIEW | CHANGE, set_type=SetCredentials.ESET_OWN),
+                SetCredentials(
+                    value=VIEW,
+                    set_type=SetCredentials.ESET_FILTER,
+                    ctype=FakeContact,
+                    efilter=efilter,
+                ),
+            ],
+        )
+
+        create_contact = partial(FakeContact.objects.create, user=other_user)
+        contact1 = self.contact1  # Own
+        contact2 = self.contact2  # Accepted by the filter
+        contact3 = create_contact(first_name='Ganryu', last_name='Kojiro')
+        contact4 = create_contact(
+            first_name='Tsubame', last_name='Sasaki', sandbox=Sandbox.objects.create(),
+        )
+        orga = FakeOrganisation.objects.create(user=other_user, name='Sasaki')
+        entities = [contact1, contact2, contact3, contact4, orga]
+
+        user = self.refresh(user)
+        self.clear_global_info()
+
+        # Same results than the not-batched way
+        expected = [
+            user.has_perm_to_view(CremeEntity.objects.get(id=e.id).get_real_entity())
+            for e in entities
+        ]
+        self.assertListEqual([True, True, False, False, False], expected)
+
+        perms_map = user.get_perms_map(entities)
+        self.assertSetEqual({e.id for e in entities}, {*perms_map.keys()})
+        self.assertListEqual(expected, [perms_map[e.id].can_view() for e in entities])
+        self.assertTrue(perms_map[contact1.id].can_change())
+        self.assertFalse(perms_map[contact2.id].can_change())
+
+        # Credentials are stored in the instances
+        with self.assertNumQueries(0):
+            self.assertTrue(user.has_perm_to_view(contact2))
+            self.assertFalse(user.has_perm_to_view(contact3))
+
+        # Per-request cache
+        contact2_copy = FakeContact.objects.get(id=contact2.id)
+        with self.assertNumQueries(0):
+            self.assertTrue(user.get_perms_map([contact2_copy])[contact2.id].can_view())
+            self.assertTrue(user.has_perm_to_view(contact2_copy))
+
+        # Modification => cache is cleared
+        contact3.last_name = 'Sasaki'
+        contact3.save()
+        self.assertTrue(
+            user.get_perms_map(
+                [FakeContact.objects.get(id=contact3.id)]
+            )[contact3.id].can_view()
+        )
@@ -5,6 +5,7 @@ from logging import info
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import PermissionDenied
 from django.db.models.query import QuerySet
+from django.test.utils import override_settings
 from django.urls import reverse
 from django.utils.timezone import now
 from django.utils.translation import gettext as _
@@ -31,7 +32,7 @@ from creme.creme_core.core.entity_filter.condition_handler import (
     SubFilterConditionHandler,
 )
 from creme.creme_core.core.exceptions import ConflictError
-from creme.creme_core.global_info import set_global_info
+from creme.creme_core.global_info import get_per_request_cache, set_global_info
 from creme.creme_core.models import (
     CremeEntity,
     CremeProperty,
@@ -4162,6 +4163,147 @@ class EntityFilterFilteringTestCase(CremeTestCase):
         conditions = efilter.get_conditions()
         self.assertEqual(1, len(conditions))
 
+    def test_get_q__cache(self):
+        efilter = EntityFilter.objects.smart_update_or_create(
+            pk='test-filter01', name='Ikari', model=FakeContact, is_custom=True,
+            conditions=[
+                RegularFieldConditionHandler.build_condition(
+                    model=FakeContact, field_name='last_name',
+                    operator=operators.IEQUALS, values=['Ikari'],
+                ),
+            ],
+        )
+        q = efilter.get_q(self.user)
+
+        efilter = self.refresh(efilter)
+        with self.assertNumQueries(0):
+            self.assertIs(q, efilter.get_q(self.user))
+
+        # Other user => other cached value
+        other_q = efilter.get_q(self.create_user())
+        self.assertIsNot(q, other_q)
+        self.assertEqual(q, other_q)
+
+        # Conditions are changed => cache is cleared
+        efilter.set_conditions([
+            RegularFieldConditionHandler.build_condition(
+                model=FakeContact, field_name='first_name',
+                operator=operators.EQUALS, values=['Rei'],
+            ),
+        ])
+        efilter = self.refresh(efilter)
+        self.assertIsNot(q, efilter.get_q(self.user))
+        self.assertExpectedFiltered(efilter, FakeContact, [self.contacts['rei'].id])
+
+    def test_get_q__cache__subfilter(self):
+        build_4_field = partial(
+            RegularFieldConditionHandler.build_condition,
+            model=FakeContact, operator=operators.EQUALS,
+        )
+        sub_efilter = EntityFilter.objects.smart_update_or_create(
+            pk='test-filter01', name='Filter01', model=FakeContact, is_custom=True,
+            conditions=[build_4_field(field_name='last_name', values=['Ikari'])],
+        )
+        efilter = EntityFilter.objects.smart_update_or_create(
+            pk='test-filter02', name='Filter02', model=FakeContact, is_custom=True,
+            conditions=[SubFilterConditionHandler.build_condition(sub_efilter)],
+        )
+        self.assertExpectedFiltered(efilter, FakeContact, self._get_ikari_case_sensitive())
+
+        # The cache of the parent filter is cleared too
+        sub_efilter.set_conditions([build_4_field(field_name='first_name', values=['Rei'])])
+        self.assertExpectedFiltered(
+            self.refresh(efilter), FakeContact, [self.contacts['rei'].id],
+        )
+
+    def test_get_q__not_saved(self):
+        efilter = EntityFilter(
+            id='test-filter01', name='Not saved', entity_type=FakeContact,
+        )
+        efilter._build_conditions_cache([
+            RegularFieldConditionHandler.build_condition(
+                model=FakeContact, field_name='first_name',
+                operator=operators.EQUALS, values=['Rei'],
+            ),
+        ])
+        self.assertIsNot(efilter.get_q(self.user), efilter.get_q(self.user))
+        self.assertNotIn(EntityFilter.compiled_q_cache_key, get_per_request_cache())
+
+    @override_settings(FILTERS_MATERIALIZED_IDS_MAX=10)
+    def test_materialized_ids(self):
+        loves = self._aux_test_relations()
+        sub_efilter = EntityFilter.objects.smart_update_or_create(
+            pk='test-filter01', name='Filter Rei', model=FakeContact, is_custom=True,
+            conditions=[
+                RegularFieldConditionHandler.build_condition(
+                    model=FakeContact, field_name='first_name',
+                    operator=operators.EQUALS, values=['Rei'],
+                ),
+            ],
+        )
+        efilter = EntityFilter.objects.smart_update_or_create(
+            pk='test-filter02', name='Filter Rei lovers', model=FakeContact, is_custom=True,
+            conditions=[
+                RelationSubFilterConditionHandler.build_condition(
+                    model=FakeContact, rtype=loves, has=True, subfilter=sub_efilter,
+                ),
+            ],
+        )
+
+        lookup, value = self.get_alone_element(efilter.get_q(self.user).children)
+        self.assertEqual('pk__in', lookup)
+        self.assertCountEqual(self._list_contact_ids('shinji', 'gendou'), value)
+        self.assertExpectedFiltered(
+            efilter, FakeContact, self._list_contact_ids('shinji', 'gendou'),
+        )
+
+    @override_settings(FILTERS_MATERIALIZED_IDS_MAX=1)
+    def test_materialized_ids__too_many(self):
+        loves = self._aux_test_relations()
+        sub_efilter = EntityFilter.objects.smart_update_or_create(
+            pk='test-filter01', name='Filter Rei', model=FakeContact, is_custom=True,
+            conditions=[
+                RegularFieldConditionHandler.build_condition(
+                    model=FakeContact, field_name='first_name',
+                    operator=operators.EQUALS, values=['Rei'],
+                ),
+            ],
+        )
+        efilter = EntityFilter.objects.smart_update_or_create(
+            pk='test-filter02', name='Filter Rei lovers', model=FakeContact, is_custom=True,
+            conditions=[
+                RelationSubFilterConditionHandler.build_condition(
+                    model=FakeContact, rtype=loves, has=True, subfilter=sub_efilter,
+                ),
+            ],
+        )
+
+        lookup, value = self.get_alone_element(efilter.get_q(self.user).children)
+        self.assertIsInstance(value, QuerySet)
+        self.assertExpectedFiltered(
+            efilter, FakeContact, self._list_contact_ids('shinji', 'gendou'),
+        )
+
+    def test_explain(self):
+        efilter = EntityFilter.objects.smart_update_or_create(
+            pk='test-filter01', name='Filter Rei', model=FakeContact, is_custom=True,
+            conditions=[
+                RegularFieldConditionHandler.build_condition(
+                    model=FakeContact, field_name='first_name',
+                    operator=operators.EQUALS, values=['Rei'],
+                ),
+            ],
+        )
+
+        explanation = efilter.explain(self.user)
+        self.assertIsInstance(explanation, dict)
+        self.assertEqual(1, explanation.get('conditions'))
+        self.assertIsInstance(explanation.get('compile_time'), float)
+
+        sql = explanation.get('sql')
+        self.assertIn('SELECT', sql)
+        self.assertIn('first_name', sql)
+
 
 class EntityFilterListTestCase(CremeTestCase):
     @classmethod
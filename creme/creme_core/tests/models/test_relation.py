@@ -1,7 +1,9 @@
 from functools import partial
+from unittest import skipUnless
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.db.models import prefetch_related_objects
 from django.utils.translation import gettext as _
 
@@ -13,9 +15,11 @@ from creme.creme_core.models import (
     FakeContact,
     FakeDocument,
     FakeOrganisation,
+    HistoryLine,
     Relation,
     RelationType,
 )
+from creme.creme_core.models.history import TYPE_RELATION, TYPE_SYM_RELATION
 from creme.creme_core.utils.profiling import CaptureQueriesContext
 
 from ..base import CremeTestCase
@@ -1274,6 +1278,178 @@ class RelationManagerTestCase(CremeTestCase):
         self.assertEqual(len(ctxt1), len(ctxt2) + 1)
 
 
+@skipUnless(
+    connection.features.can_return_rows_from_bulk_insert,
+    'The DB backend cannot retrieve the IDs of bulk-created instances',
+)
+class RelationManagerBulkTestCase(CremeTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.user = cls.get_root_user()
+
+    def _create_rtype(self):
+        return RelationType.objects.builder(
+            id='test-subject_challenge', predicate='challenges',
+        ).symmetric(id='test-object_challenge', predicate='is challenged by').get_or_create()[0]
+
+    def test_safe_bulk_create(self):
+        rtype = self._create_rtype()
+
+        user = self.user
+        create_contact = partial(FakeContact.objects.create, user=user)
+        ryuko   = create_contact(first_name='Ryuko',   last_name='Matoi')
+        satsuki = create_contact(first_name='Satsuki', last_name='Kiryuin')
+        mako    = create_contact(first_name='Mako',    last_name='Mankanshoku')
+
+        count = Relation.objects.safe_bulk_create([
+            Relation(user=user, subject_entity=ryuko, type=rtype, object_entity=satsuki),
+            Relation(user=user, subject_entity=mako,  type=rtype, real_object=satsuki),
+        ])
+        self.assertEqual(2, count)
+
+        rel1 = self.get_object_or_fail(Relation, type=rtype, subject_entity=ryuko.id)
+        self.assertEqual(satsuki.id,          rel1.object_entity_id)
+        self.assertEqual(satsuki.entity_type, rel1.object_ctype)
+        self.assertEqual(user.id,             rel1.user_id)
+
+        sym1 = rel1.symmetric_relation
+        self.assertEqual(rtype.symmetric_type_id, sym1.type_id)
+        self.assertEqual(satsuki.id,              sym1.subject_entity_id)
+        self.assertEqual(ryuko.id,                sym1.object_entity_id)
+        self.assertEqual(ryuko.entity_type,       sym1.object_ctype)
+        self.assertEqual(rel1.id,                 sym1.symmetric_relation_id)
+
+        rel2 = self.get_object_or_fail(Relation, type=rtype, subject_entity=mako.id)
+        self.assertEqual(satsuki.id, rel2.object_entity_id)
+        self.assertEqual(rel2.id,    rel2.symmetric_relation.symmetric_relation_id)
+
+        # History
+        hline = self.get_object_or_fail(HistoryLine, entity=ryuko.id, type=TYPE_RELATION)
+        self.assertListEqual([rtype.id], hline.modifications)
+        self.assertEqual(rel1.created, hline.date)
+
+        hline_sym = hline.related_line
+        self.assertIsNotNone(hline_sym)
+        self.assertEqual(satsuki.id,                   hline_sym.entity_id)
+        self.assertEqual(TYPE_SYM_RELATION,            hline_sym.type)
+        self.assertListEqual([rtype.symmetric_type_id], hline_sym.modifications)
+        self.assertEqual(hline.id,                     hline_sym.related_line.id)
+
+        self.assertEqual(
+            1, HistoryLine.objects.filter(entity=mako.id, type=TYPE_RELATION).count(),
+        )
+        self.assertEqual(
+            2, HistoryLine.objects.filter(entity=satsuki.id, type=TYPE_SYM_RELATION).count(),
+        )
+
+    def test_safe_bulk_create__symmetric_type(self):
+        "The relationships are created with the 'object' type."
+        rtype = self._create_rtype()
+        sym_rtype = rtype.symmetric_type
+
+        user = self.user
+        create_contact = partial(FakeContact.objects.create, user=user)
+        ryuko   = create_contact(first_name='Ryuko',   last_name='Matoi')
+        satsuki = create_contact(first_name='Satsuki', last_name='Kiryuin')
+
+        Relation.objects.safe_bulk_create([
+            Relation(user=user, subject_entity=satsuki, type=sym_rtype, object_entity=ryuko),
+        ])
+        self.assertHaveRelation(subject=ryuko, type=rtype, object=satsuki)
+
+        # The main line is related to the 'subject' type
+        hline = self.get_object_or_fail(HistoryLine, entity=ryuko.id, type=TYPE_RELATION)
+        self.assertListEqual([rtype.id], hline.modifications)
+        self.assertEqual(satsuki.id, hline.related_line.entity_id)
+
+    def test_safe_bulk_create__duplicates_n_existing(self):
+        rtype = self._create_rtype()
+
+        user = self.user
+        create_contact = partial(FakeContact.objects.create, user=user)
+        ryuko   = create_contact(first_name='Ryuko',   last_name='Matoi')
+        satsuki = create_contact(first_name='Satsuki', last_name='Kiryuin')
+        mako    = create_contact(first_name='Mako',    last_name='Mankanshoku')
+
+        rel1 = Relation.objects.create(
+            user=user, subject_entity=ryuko, type=rtype, object_entity=satsuki,
+        )
+
+        build_rel = partial(Relation, user=user, type=rtype, object_entity=satsuki)
+
+        with self.assertNoException():
+            count = Relation.objects.safe_bulk_create([
+                build_rel(subject_entity=ryuko),
+                build_rel(subject_entity=mako),
+                build_rel(subject_entity=mako),
+            ])
+
+        self.assertEqual(1, count)
+        self.assertStillExists(rel1)
+        self.assertEqual(1, Relation.objects.filter(type=rtype, subject_entity=mako.id).count())
+
+    def test_safe_bulk_create__empty(self):
+        with self.assertNumQueries(0):
+            count = Relation.objects.safe_bulk_create([])
+
+        self.assertEqual(0, count)
+
+    def test_safe_bulk_create__queries(self):
+        "The number of queries does not depend on the number of relationships."
+        rtype = self._create_rtype()
+
+        user = self.user
+        create_orga = partial(FakeOrganisation.objects.create, user=user)
+        honnouji = create_orga(name='Honnouji')
+        nudist   = create_orga(name='Nudist Beach')
+
+        create_contact = partial(FakeContact.objects.create, user=user)
+        contacts = [
+            create_contact(first_name=f'Student #{i}', last_name='Honnouji')
+            for i in range(6)
+        ]
+
+        with CaptureQueriesContext() as ctxt1:
+            Relation.objects.safe_bulk_create(
+                Relation(user=user, subject_entity=contact, type=rtype, object_entity=honnouji)
+                for contact in contacts[:2]
+            )
+
+        with CaptureQueriesContext() as ctxt2:
+            Relation.objects.safe_bulk_create(
+                Relation(user=user, subject_entity=contact, type=rtype, object_entity=nudist)
+                for contact in contacts
+            )
+
+        self.assertEqual(len(ctxt1), len(ctxt2))
+        self.assertEqual(6, Relation.objects.filter(type=rtype, object_entity=nudist.id).count())
+
+    def test_safe_bulk_create__batch_size(self):
+        rtype = self._create_rtype()
+
+        user = self.user
+        nudist = FakeOrganisation.objects.create(user=user, name='Nudist Beach')
+        create_contact = partial(FakeContact.objects.create, user=user)
+        contacts = [
+            create_contact(first_name=f'Member #{i}', last_name='Nudist')
+            for i in range(5)
+        ]
+
+        count = Relation.objects.safe_bulk_create(
+            [
+                Relation(user=user, subject_entity=contact, type=rtype, object_entity=nudist)
+                for contact in contacts
+            ],
+            batch_size=2,
+        )
+        self.assertEqual(5, count)
+
+        for contact in contacts:
+            self.assertHaveRelation(subject=contact, type=rtype, object=nudist)
+            self.assertHaveRelation(subject=nudist, type=rtype.symmetric_type, object=contact)
+
+
 class RelationTestCase(CremeTestCase):
     @classmethod
     def setUpClass(cls):
@@ -1629,3 +1805,123 @@ class RelationTestCase(CremeTestCase):
             rel2.clean_subject_entity()
 
         self.assertValidationError(cm2.exception, messages=message)
+
+    def test_clean_subject_entities(self):
+        ptype = CremePropertyType.objects.create(text='Is strong')
+        rtype1 = RelationType.objects.builder(
+            id='test-subject_loves', predicate='loves', models=[FakeContact],
+        ).symmetric(id='test-object_loves', predicate='is loved by').get_or_create()[0]
+        rtype2 = RelationType.objects.builder(
+            id='test-subject_fights', predicate='fights', properties=[ptype],
+        ).symmetric(id='test-object_fights', predicate='is fought by').get_or_create()[0]
+
+        user = self.user
+        create_contact = partial(FakeContact.objects.create, user=user)
+        ryuko   = create_contact(first_name='Ryuko',   last_name='Matoi')
+        satsuki = create_contact(first_name='Satsuki', last_name='Kiryuin')
+
+        create_prop = partial(CremeProperty.objects.create, type=ptype)
+        create_prop(creme_entity=ryuko)
+        create_prop(creme_entity=satsuki)
+
+        with self.assertNoException():
+            Relation.clean_subject_entities(
+                rtypes=[rtype1, rtype2], entities=[ryuko, satsuki],
+            )
+
+        # ---
+        mako = self.refresh(create_contact(first_name='Mako', last_name='Mankanshoku'))
+        with self.assertRaises(ValidationError) as cm1:
+            Relation.clean_subject_entities(
+                rtypes=[rtype1, rtype2], entities=[self.refresh(ryuko), mako],
+            )
+
+        self.assertValidationError(
+            cm1.exception,
+            messages=Relation.error_messages['missing_subject_property'] % {
+                'entity': mako,
+                'property': ptype.text,
+                'predicate': rtype2.predicate,
+            },
+        )
+
+        # ---
+        orga = FakeOrganisation.objects.create(user=user, name='Honnouji')
+        with self.assertRaises(ValidationError) as cm2:
+            Relation.clean_subject_entities(rtypes=[rtype1], entities=[orga])
+
+        self.assertValidationError(
+            cm2.exception,
+            messages=Relation.error_messages['forbidden_subject_ctype'] % {
+                'entity': orga,
+                'model': orga.entity_type,
+                'predicate': rtype1.predicate,
+            },
+        )
+
+    def test_clean_subject_entities__queries(self):
+        "The number of queries does not depend on the number of entities."
+        ptype = CremePropertyType.objects.create(text='Is strong')
+        rtype = RelationType.objects.builder(
+            id='test-subject_fights', predicate='fights',
+            models=[FakeContact], forbidden_properties=[ptype],
+        ).symmetric(id='test-object_fights', predicate='is fought by').get_or_create()[0]
+
+        create_contact = partial(FakeContact.objects.create, user=self.user)
+        contacts = [
+            self.refresh(create_contact(first_name=f'Student #{i}', last_name='Honnouji'))
+            for i in range(6)
+        ]
+
+        with CaptureQueriesContext() as ctxt1:
+            Relation.clean_subject_entities(rtypes=[rtype], entities=contacts[:2])
+
+        with CaptureQueriesContext() as ctxt2:
+            Relation.clean_subject_entities(rtypes=[rtype], entities=contacts[2:])
+
+        self.assertEqual(len(ctxt1), len(ctxt2))
+
+    def test_clean_relations(self):
+        create_ptype = CremePropertyType.objects.create
+        ptype1 = create_ptype(text='Is strong')
+        ptype2 = create_ptype(text='Is not cute')
+        rtype = RelationType.objects.builder(
+            id='test-subject_loves', predicate='loves',
+            models=[FakeContact], properties=[ptype1],
+        ).symmetric(
+            id='test-object_loves', predicate='is loved by',
+            models=[FakeContact], forbidden_properties=[ptype2],
+        ).get_or_create()[0]
+
+        user = self.user
+        create_contact = partial(FakeContact.objects.create, user=user)
+        ryuko   = create_contact(first_name='Ryuko',   last_name='Matoi')
+        satsuki = create_contact(first_name='Satsuki', last_name='Kiryuin')
+        mako    = create_contact(first_name='Mako',    last_name='Mankanshoku')
+
+        create_prop = CremeProperty.objects.create
+        create_prop(creme_entity=ryuko, type=ptype1)
+        create_prop(creme_entity=mako,  type=ptype2)
+
+        build_rel = partial(Relation, user=user, type=rtype, subject_entity=ryuko)
+
+        with self.assertNoException():
+            Relation.clean_relations([build_rel(object_entity=satsuki)])
+
+        with self.assertRaises(ValidationError) as cm:
+            Relation.clean_relations([
+                build_rel(object_entity=satsuki), build_rel(object_entity=mako),
+            ])
+
+        self.assertValidationError(
+            cm.exception,
+            messages=Relation.error_messages['refused_subject_property'] % {
+                'entity': mako,
+                'property': ptype2.text,
+                'predicate': rtype.symmetric_type.predicate,
+            },
+        )
+
+    def test_clean_relations__empty(self):
+        with self.assertNumQueries(0):
+            Relation.clean_relations([])
@@ -1,5 +1,7 @@
+from django.test.utils import override_settings
 from django.urls import reverse
 
+from creme.creme_core.core.instrumentation import metrics_registry
 from creme.creme_core.models import (
     CremePropertyType,
     FakeOrganisation,
@@ -75,3 +77,36 @@ class WorkflowMiddlewareTestCase(CremeTestCase):
             f'or the view decorator <creme.creme_core.views.decorators.workflow_engine>',
             str(warn_manager.warning),
         )
+
+
+class InstrumentationMiddlewareTestCase(CremeTestCase):
+    def setUp(self):
+        super().setUp()
+        metrics_registry.clear()
+
+    def tearDown(self):
+        super().tearDown()
+        metrics_registry.clear()
+
+    @override_settings(INSTRUMENTATION_ENABLED=True)
+    def test_enabled(self):
+        self.login_as_root()
+
+        response = self.assertGET200(reverse('creme_core__home'))
+        server_timing = response.get('Server-Timing')
+        self.assertIsNotNone(server_timing)
+
+        entries = server_timing.split(', ')
+        self.assertStartsWith(entries[0], 'total;dur=')
+        self.assertStartsWith(entries[1], 'db;desc="')
+        self.assertIn('brick-', server_timing)
+
+        self.assertIn(('view', 'creme_core__home'), dict(metrics_registry.items()))
+
+    @override_settings(INSTRUMENTATION_ENABLED=False)
+    def test_disabled(self):
+        self.login_as_root()
+
+        response = self.assertGET200(reverse('creme_core__home'))
+        self.assertIsNone(response.get('Server-Timing'))
+        self.assertFalse(metrics_registry.items())
@@ -1,5 +1,6 @@
 from functools import partial
 from json import dumps as json_dump
+from unittest.mock import patch
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
@@ -24,9 +25,11 @@ from creme.creme_core.models import (
     EntityJobResult,
     FakeContact,
     FakeOrganisation,
+    HistoryLine,
     Job,
     Workflow,
 )
+from creme.creme_core.models.history import TYPE_EDITION
 
 from ..base import CremeTestCase
 
@@ -236,6 +239,69 @@ class BatchProcessViewsTestCase(CremeTestCase):
         self.assertEqual('Saki-adorée',   self.refresh(contact01).first_name)
         self.assertEqual('Kanako-adorée', self.refresh(contact02).first_name)
 
+    def test_batching__bulk(self):
+        "Set-based mode: history & fields computed by save()."
+        self.assertTrue(batch_process_type._bulk_updatable(FakeContact))
+
+        user = self.login_as_root_and_get()
+        create_contact = partial(FakeContact.objects.create, user=user)
+        contact1 = create_contact(first_name='Saki',     last_name='Kasukabe')
+        contact2 = create_contact(first_name='Harunobu', last_name='Madarame')
+        old_modified = contact1.modified
+
+        response = self.client.post(
+            self._build_add_url(FakeContact), follow=True,
+            data={
+                'actions': self.build_formfield_value(
+                    name='last_name', operator='upper', value='',
+                ),
+            },
+        )
+        self.assertNoFormError(response)
+
+        job = self._get_job(response)
+        batch_process_type.execute(job)
+
+        contact1 = self.refresh(contact1)
+        self.assertEqual('KASUKABE', contact1.last_name)
+        self.assertEqual('Saki KASUKABE', contact1.header_filter_search_field)
+        self.assertGreater(contact1.modified, old_modified)
+        self.assertEqual('MADARAME', self.refresh(contact2).last_name)
+
+        hline = HistoryLine.objects.filter(entity=contact1.id).order_by('-id').first()
+        self.assertEqual(TYPE_EDITION, hline.type)
+        self.assertListEqual(
+            [['last_name', 'Kasukabe', 'KASUKABE']], hline.modifications,
+        )
+
+        self.assertEqual(2, EntityJobResult.objects.filter(job=job).count())
+
+    def test_batching__entity_by_entity(self):
+        "The entities are saved one by one if the model cannot be bulk-updated."
+        user = self.login_as_root_and_get()
+        create_contact = partial(FakeContact.objects.create, user=user)
+        contact1 = create_contact(first_name='Saki',     last_name='Kasukabe')
+        contact2 = create_contact(first_name='Harunobu', last_name='Madarame')
+
+        response = self.client.post(
+            self._build_add_url(FakeContact), follow=True,
+            data={
+                'actions': self.build_formfield_value(
+                    name='first_name', operator='upper', value='',
+                ),
+            },
+        )
+        self.assertNoFormError(response)
+
+        job = self._get_job(response)
+
+        with patch.object(batch_process_type, '_bulk_updatable', return_value=False):
+            batch_process_type.execute(job)
+
+        self.assertEqual('SAKI',     self.refresh(contact1).first_name)
+        self.assertEqual('HARUNOBU', self.refresh(contact2).first_name)
+        self.assertEqual(2, EntityJobResult.objects.filter(job=job).count())
+
     def test_validation_error(self):
         "Invalid field."
         self.login_as_root()
@@ -177,6 +177,53 @@ class EntityFilterDetailTestCase(BrickTestCaseMixin,
             msg_node.text.strip(),
         )
 
+    def test_sql_brick(self):
+        self.login_as_super(is_staff=True)
+        efilter = EntityFilter.objects.smart_update_or_create(
+            pk='test-filter_detailview__sql', name='My Filter',
+            model=FakeContact, is_custom=True,
+            conditions=[
+                RegularFieldConditionHandler.build_condition(
+                    model=FakeContact, field_name='last_name',
+                    operator=operators.EQUALS, values=['Ikari'],
+                ),
+            ],
+        )
+
+        response = self.assertGET200(efilter.get_absolute_url())
+        brick_node = self.get_brick_node(
+            self.get_html_tree(response.content), efilter_views.EntityFilterSQLBrick,
+        )
+        self.assertEqual(_('SQL query (debug)'), self.get_brick_title(brick_node))
+
+        sql_node = self.get_html_node_or_fail(brick_node, './/pre')
+        self.assertIn('last_name', sql_node.text)
+
+        # Reloading ---
+        response = self.assertGET200(
+            reverse('creme_core__reload_efilter_bricks', args=(efilter.id,)),
+            data={'brick_id': efilter_views.EntityFilterSQLBrick.id},
+        )
+        self.assertEqual(
+            efilter_views.EntityFilterSQLBrick.id, response.json()[0][0],
+        )
+
+    def test_sql_brick__not_staff(self):
+        self.login_as_root()
+        efilter = EntityFilter.objects.smart_update_or_create(
+            pk='test-filter_detailview__sql', name='My Filter',
+            model=FakeContact, is_custom=True,
+        )
+
+        response = self.assertGET200(efilter.get_absolute_url())
+        self.assertNoBrick(
+            self.get_html_tree(response.content), efilter_views.EntityFilterSQLBrick.id,
+        )
+        self.assertGET404(
+            reverse('creme_core__reload_efilter_bricks', args=(efilter.id,)),
+            data={'brick_id': efilter_views.EntityFilterSQLBrick.id},
+        )
+
     def test_credentials(self):
         self.login_as_root()
         efilter = EntityFilter.objects.create(
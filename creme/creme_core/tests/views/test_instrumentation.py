@@ -0,0 +1,78 @@
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from creme.creme_core.bricks import InstrumentationBrick
+from creme.creme_core.core.instrumentation import Recorder, metrics_registry
+
+from ..base import CremeTestCase
+from .base import BrickTestCaseMixin
+
+
+@override_settings(INSTRUMENTATION_ENABLED=True, INSTRUMENTATION_METRICS_TOKEN='')
+class InstrumentationViewsTestCase(BrickTestCaseMixin, CremeTestCase):
+    METRICS_URL = reverse('creme_core__instrumentation_metrics')
+
+    def setUp(self):
+        super().setUp()
+        metrics_registry.clear()
+
+        recorder = Recorder()
+        recorder.add('brick', 'regular-creme_core-test', duration=0.5, queries=3)
+        metrics_registry.add_recorder(recorder, view_name='creme_core__home', duration=1.0)
+
+    def tearDown(self):
+        super().tearDown()
+        metrics_registry.clear()
+
+    def test_metrics__staff(self):
+        self.login_as_super(is_staff=True)
+
+        response = self.assertGET200(self.METRICS_URL)
+        self.assertStartsWith(response['Content-Type'], 'text/plain; version=0.0.4')
+
+        content = response.content.decode()
+        self.assertIn(
+            'creme_operation_calls_total'
+            '{category="brick",name="regular-creme_core-test"} 1\n',
+            content,
+        )
+
+    def test_metrics__not_staff(self):
+        self.login_as_root()
+        self.assertGET403(self.METRICS_URL)
+
+    def test_metrics__not_logged(self):
+        self.assertGET403(self.METRICS_URL)
+
+    @override_settings(INSTRUMENTATION_METRICS_TOKEN='s3cr3t')
+    def test_metrics__token(self):
+        response = self.client.get(self.METRICS_URL, headers={'Authorization': 'Bearer s3cr3t'})
+        self.assertEqual(200, response.status_code)
+        self.assertIn(b'creme_operation_calls_total', response.content)
+
+        self.assertEqual(
+            403,
+            self.client.get(
+                self.METRICS_URL, headers={'Authorization': 'Bearer invalid'},
+            ).status_code,
+        )
+
+    @override_settings(INSTRUMENTATION_ENABLED=False)
+    def test_metrics__disabled(self):
+        self.login_as_super(is_staff=True)
+        self.assertGET404(self.METRICS_URL)
+
+    def test_brick__staff(self):
+        user = self.login_as_super(is_staff=True)
+
+        render = InstrumentationBrick().render(self.build_context(user=user))
+        brick_node = self.get_brick_node(self.get_html_tree(render), brick=InstrumentationBrick)
+        self.assertIn('regular-creme_core-test', [*brick_node.itertext()])
+
+    def test_brick__not_staff(self):
+        user = self.login_as_root_and_get()
+
+        render = InstrumentationBrick().render(self.build_context(user=user))
+        brick_node = self.get_brick_node(self.get_html_tree(render), brick=InstrumentationBrick)
+        self.assertNotIn('regular-creme_core-test', [*brick_node.itertext()])
+        self.assertIn('is-empty', brick_node.attrib.get('class'))
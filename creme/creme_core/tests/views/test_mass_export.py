@@ -7,6 +7,7 @@ from urllib.parse import urlencode
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.db.models import Q
+from django.http import QueryDict, StreamingHttpResponse
 from django.test.utils import override_settings
 from django.urls import reverse
 from django.utils.encoding import force_str
@@ -16,6 +17,7 @@ from django.utils.translation import gettext as _
 from django.utils.translation import pgettext
 from openpyxl import load_workbook
 
+from creme.creme_core.constants import UUID_CHANNEL_JOBS
 from creme.creme_core.core.entity_cell import (
     EntityCellFunctionField,
     EntityCellRegularField,
@@ -25,6 +27,7 @@ from creme.creme_core.core.entity_filter.condition_handler import (
     RegularFieldConditionHandler,
 )
 from creme.creme_core.core.entity_filter.operators import ISTARTSWITH
+from creme.creme_core.creme_jobs import mass_export_type
 from creme.creme_core.gui.history import html_history_registry
 from creme.creme_core.models import (
     CremeProperty,
@@ -40,11 +43,14 @@ from creme.creme_core.models import (
     FieldsConfig,
     FileRef,
     HeaderFilter,
+    Job,
     Language,
+    Notification,
     Relation,
     RelationType,
 )
 from creme.creme_core.models.history import TYPE_EXPORT, HistoryLine
+from creme.creme_core.notification import MassExportDoneContent
 from creme.creme_core.utils.content_type import as_ctype
 from creme.creme_core.utils.queries import QSerializer
 from creme.creme_core.utils.xlrd_utils import XlrdReader
@@ -246,7 +252,7 @@ class MassExportViewsTestCase(CremeTestCase):
 
         self.assertListEqual(
             [','.join(f'"{hfi.title}"' for hfi in cells)],
-            [force_str(line) for line in response.content.splitlines()],
+            [force_str(line) for line in response.getvalue().splitlines()],
         )
         self.assertFalse(HistoryLine.objects.exclude(id__in=existing_hline_ids))
 
@@ -272,7 +278,7 @@ class MassExportViewsTestCase(CremeTestCase):
         response = self.assertGET200(self._build_contact_dl_url())
 
         # TODO: sort the relations by their verbose_name ??
-        result = response.content.splitlines()
+        result = response.getvalue().splitlines()
         it = (force_str(line) for line in result)
         self.assertEqual(next(it), ','.join(f'"{hfi.title}"' for hfi in hf.cells))
         self.assertEqual(next(it), '"","Black","Jet","Bebop",""')
@@ -309,6 +315,103 @@ class MassExportViewsTestCase(CremeTestCase):
             html_history_registry.line_explainers([hline], user)[0].render(),
         )
 
+    def test_csv__streaming(self):
+        user = self.login_as_root_and_get()
+        hf = self._build_hf_n_contacts(user=user)
+
+        response = self.assertGET200(self._build_contact_dl_url(hfilter_id=hf.id))
+        self.assertIsInstance(response, StreamingHttpResponse)
+        self.assertEqual('text/csv', response['Content-Type'])
+        self.assertEqual(
+            'attachment; filename="fakecontact.csv"', response['Content-Disposition'],
+        )
+
+        lines = response.getvalue().splitlines()
+        self.assertEqual(5, len(lines))
+        self.assertEqual('"","Black","Jet","Bebop",""', force_str(lines[1]))
+
+    def test_csv__streaming__history(self):
+        "The line is created even if the streamed content is not consumed."
+        user = self.login_as_root_and_get()
+        hf = self._build_hf_n_contacts(user=user)
+        existing_hline_ids = [*HistoryLine.objects.values_list('id', flat=True)]
+
+        response = self.assertGET200(self._build_contact_dl_url(hfilter_id=hf.id))
+        self.assertIsInstance(response, StreamingHttpResponse)
+        response.close()
+
+        hline = self.get_alone_element(HistoryLine.objects.exclude(id__in=existing_hline_ids))
+        self.assertEqual(TYPE_EXPORT,   hline.type)
+        self.assertEqual(user,          hline.entity_owner)
+        self.assertEqual(user.username, hline.username)
+        self.assertListEqual([4, hf.name], hline.modifications)
+
+    @override_settings(MASS_EXPORT_JOB_THRESHOLD=3)
+    def test_job(self):
+        user = self.login_as_root_and_get()
+        hf = self._build_hf_n_contacts(user=user)
+        existing_fileref_ids = [*FileRef.objects.values_list('id', flat=True)]
+        existing_hline_ids = [*HistoryLine.objects.values_list('id', flat=True)]
+
+        url = self._build_contact_dl_url(hfilter_id=hf.id)
+        response = self.assertGET200(url, follow=True)
+
+        job = self.get_alone_element(Job.objects.filter(user=user, type_id=mass_export_type.id))
+        self.assertRedirects(response, job.get_absolute_url())
+        job_data = job.data
+        self.assertEqual(self.ct.id, job_data.get('ctype'))
+        self.assertEqual(QueryDict(url.split('?', 1)[1]), QueryDict(job_data.get('GET')))
+        self.assertListEqual(
+            [_('Export «{model}»').format(model='Test Contacts')],
+            mass_export_type.get_description(job),
+        )
+        self.assertFalse(FileRef.objects.exclude(id__in=existing_fileref_ids))
+
+        mass_export_type.execute(job)
+        job = self.refresh(job)
+        self.assertEqual(Job.STATUS_OK, job.status)
+
+        fileref = self.get_alone_element(FileRef.objects.exclude(id__in=existing_fileref_ids))
+        self.assertEqual('fakecontact.csv', fileref.basename)
+        self.assertEqual(user, fileref.user)
+
+        fullpath = Path(fileref.filedata.path)
+        self.assertEqual(Path(settings.MEDIA_ROOT, 'csv'), fullpath.parent)
+
+        with open(fullpath, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        self.assertEqual(5, len(lines))
+        self.assertEqual('"","Black","Jet","Bebop",""', lines[1])
+
+        hline = self.get_alone_element(HistoryLine.objects.exclude(id__in=existing_hline_ids))
+        self.assertEqual(TYPE_EXPORT, hline.type)
+
+        notif = self.get_alone_element(
+            Notification.objects.filter(user=user, channel__uuid=UUID_CHANNEL_JOBS)
+        )
+        self.assertEqual(MassExportDoneContent.id, notif.content_id)
+        self.assertDictEqual({'instance': fileref.id}, notif.content_data)
+
+    @override_settings(MASS_EXPORT_JOB_THRESHOLD=10)
+    def test_job__under_threshold(self):
+        user = self.login_as_root_and_get()
+        hf = self._build_hf_n_contacts(user=user)
+
+        response = self.assertGET200(self._build_contact_dl_url(hfilter_id=hf.id))
+        self.assertIsInstance(response, StreamingHttpResponse)
+        self.assertFalse(Job.objects.filter(type_id=mass_export_type.id))
+
+    @override_settings(MASS_EXPORT_JOB_THRESHOLD=3, MAX_JOBS_PER_USER=1)
+    def test_job__too_many_jobs(self):
+        user = self.login_as_root_and_get()
+        hf = self._build_hf_n_contacts(user=user)
+        Job.objects.create(user=user, type_id=mass_export_type.id)
+
+        self.assertRedirects(
+            self.client.get(self._build_contact_dl_url(hfilter_id=hf.id)),
+            reverse('creme_core__my_jobs'),
+        )
+
     def test_scsv(self):
         user = self.login_as_root_and_get()
         cells = self._build_hf_n_contacts(user=user).cells
@@ -316,7 +419,7 @@ class MassExportViewsTestCase(CremeTestCase):
         response = self.assertGET200(self._build_contact_dl_url(doc_type='scsv'))
 
         # TODO: sort the relations by their verbose_name ??
-        it = (force_str(line) for line in response.content.splitlines())
+        it = (force_str(line) for line in response.getvalue().splitlines())
         self.assertEqual(next(it), ';'.join(f'"{hfi.title}"' for hfi in cells))
         self.assertEqual(next(it), '"";"Black";"Jet";"Bebop";""')
         self.assertEqual(next(it), '"";"Spiegel";"Spike";"Bebop/Swordfish";""')
@@ -359,7 +462,7 @@ class MassExportViewsTestCase(CremeTestCase):
         self.assertTrue(user.has_perm_to_view(organisations['Swordfish']))
 
         response = self.assertGET200(self._build_contact_dl_url())
-        result = [*map(force_str, response.content.splitlines())]
+        result = [*map(force_str, response.getvalue().splitlines())]
         self.assertEqual(result[1], '"","Black","Jet","",""')
         self.assertEqual(result[2], '"","Spiegel","Spike","Swordfish",""')
         self.assertEqual(result[3], '"","Wong","Edward","","is a girl"')
@@ -380,7 +483,7 @@ class MassExportViewsTestCase(CremeTestCase):
 
         response = self.assertGET200(self._build_contact_dl_url(hfilter_id=hf.id))
 
-        result = [force_str(line) for line in response.content.splitlines()]
+        result = [force_str(line) for line in response.getvalue().splitlines()]
         self.assertEqual(2, len(result))
         self.assertEqual(
             '"{}","{}"'.format(
@@ -422,7 +525,7 @@ class MassExportViewsTestCase(CremeTestCase):
 
         response = self.assertGET200(self._build_contact_dl_url(hfilter_id=hf.id))
 
-        it = (force_str(line) for line in response.content.splitlines())
+        it = (force_str(line) for line in response.getvalue().splitlines())
         next(it)
 
         self.assertEqual(next(it), '"Black","Jet face","Jet\'s selfie"')
@@ -457,7 +560,7 @@ class MassExportViewsTestCase(CremeTestCase):
             list_url=FakeEmailCampaign.get_lv_absolute_url(),
             hfilter_id=hf.id,
         ))
-        result = [force_str(line) for line in response.content.splitlines()]
+        result = [force_str(line) for line in response.getvalue().splitlines()]
         self.assertEqual(4, len(result))
 
         self.assertEqual(result[1], '"Camp#1","ML#1/ML#2"')
@@ -475,7 +578,7 @@ class MassExportViewsTestCase(CremeTestCase):
 
         response = self.assertGET200(self._build_contact_dl_url())
 
-        it = (force_str(line) for line in response.content.splitlines())
+        it = (force_str(line) for line in response.getvalue().splitlines())
         self.assertEqual(
             next(it),
             ','.join(
@@ -493,7 +596,7 @@ class MassExportViewsTestCase(CremeTestCase):
             self._build_contact_dl_url(extra_q=QSerializer().dumps(Q(last_name='Wong'))),
         )
 
-        result = [force_str(line) for line in response.content.splitlines()]
+        result = [force_str(line) for line in response.getvalue().splitlines()]
         self.assertEqual(2, len(result))
         self.assertEqual('"","Wong","Edward","","is a girl"', result[1])
 
@@ -520,7 +623,7 @@ class MassExportViewsTestCase(CremeTestCase):
             list_url=FakeContact.get_lv_absolute_url(),
             efilter_id=efilter.id
         ))
-        result = [force_str(line) for line in response.content.splitlines()]
+        result = [force_str(line) for line in response.getvalue().splitlines()]
         self.assertEqual(2, len(result))
 
         self.assertEqual('"","Wong","Edward","","is a girl"', result[1])
@@ -673,7 +776,7 @@ class MassExportViewsTestCase(CremeTestCase):
             follow=True,
         )
 
-        lines = {force_str(line) for line in response.content.splitlines()}
+        lines = {force_str(line) for line in response.getvalue().splitlines()}
         self.assertIn('"Bebop","1000"', lines)
         self.assertIn('"Swordfish","20000"', lines)
         self.assertIn('"Redtail",""', lines)
@@ -708,7 +811,7 @@ class MassExportViewsTestCase(CremeTestCase):
             follow=True,
         )
 
-        lines = {force_str(line) for line in response.content.splitlines()}
+        lines = {force_str(line) for line in response.getvalue().splitlines()}
         self.assertIn(f'''"Bebop","{_('Percent')}"''',    lines)
         self.assertIn(f'''"Swordfish","{_('Amount')}"''', lines)
 
@@ -741,7 +844,7 @@ class MassExportViewsTestCase(CremeTestCase):
                 '"123233","Spiegel","Spike"',
             ],
             # NB: slice to remove the header
-            [force_str(line) for line in response.content.splitlines()[1:]],
+            [force_str(line) for line in response.getvalue().splitlines()[1:]],
         )
 
     @override_settings(PAGE_SIZES=[10], DEFAULT_PAGE_SIZE_IDX=0)
@@ -775,7 +878,7 @@ class MassExportViewsTestCase(CremeTestCase):
                 '"123455","Black","Jet"',
             ],
             # NB: slice to remove the header
-            [force_str(line) for line in response.content.splitlines()[1:]],
+            [force_str(line) for line in response.getvalue().splitlines()[1:]],
         )
 
     def test_distinct(self):
@@ -814,7 +917,7 @@ class MassExportViewsTestCase(CremeTestCase):
                 f'"{camp2.name}","{ml1.name}"',
             ],
             # NB: slice to remove the header
-            [force_str(line) for line in response.content.splitlines()[1:]],
+            [force_str(line) for line in response.getvalue().splitlines()[1:]],
         )
 
     def test_no_order(self):
@@ -843,5 +946,5 @@ class MassExportViewsTestCase(CremeTestCase):
         ))
         self.assertListEqual(
             [f'"{l1.name}"', f'"{l2.name}"'],
-            [force_str(line) for line in response.content.splitlines()[1:]],
+            [force_str(line) for line in response.getvalue().splitlines()[1:]],
         )
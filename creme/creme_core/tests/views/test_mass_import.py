@@ -1,6 +1,7 @@
 from decimal import Decimal
 from functools import partial
 from json import dumps as json_dump
+from unittest.mock import patch
 
 from django.contrib.contenttypes.models import ContentType
 from django.template.defaultfilters import slugify
@@ -22,6 +23,7 @@ from creme.creme_core.creme_jobs.mass_import import (
     MassImportJobErrorsBrick,
     mass_import_type,
 )
+from creme.creme_core.forms.mass_import import ImportForm
 from creme.creme_core.gui.job import JobErrorsBrick
 from creme.creme_core.models import (
     CremeProperty,
@@ -39,6 +41,7 @@ from creme.creme_core.models import (
     FakeTicketPriority,
     FakeTicketStatus,
     FieldsConfig,
+    HistoryLine,
     Job,
     Language,
     MassImportJobResult,
@@ -2644,6 +2647,126 @@ class MassImportViewsTestCase(MassImportBaseTestCaseMixin,
         asuka_line = lines[1]
         self.get_object_or_fail(FakeContact, first_name=asuka_line[0], last_name=asuka_line[1])
 
+    def test_chunks(self):
+        user = self.login_as_root_and_get()
+        sector = FakeSector.objects.create(title='Army')
+        lines = [
+            ('Rei',    'Ayanami', sector.title),
+            ('Asuka',  'Langley', sector.title),
+            ('Misato', '',        sector.title),  # Error
+            ('Ritsuko', 'Akagi',  sector.title),
+            ('Gendo',   'Ikari',  'Unknown'),  # Error on sector (entity is created)
+        ]
+
+        count = FakeContact.objects.count()
+        doc = self._build_csv_doc(lines, user=user)
+        hlines_count = HistoryLine.objects.count()
+        response = self.client.post(
+            self._build_import_url(FakeContact), follow=True,
+            data={
+                **self.lv_import_data,
+                'document': doc.id,
+                'user': user.id,
+
+                'sector_colselect': 3,
+                'sector_subfield': 'title',
+                'sector_defval': '',
+            },
+        )
+        self.assertNoFormError(response)
+
+        with patch.object(ImportForm, 'chunk_size', 2):
+            job = self._execute_job(response)
+
+        self.assertEqual(count + 4, FakeContact.objects.count())
+        self.assertEqual(hlines_count + 4, HistoryLine.objects.count())
+
+        for first_name, last_name, __ in [*lines[:2], lines[3]]:
+            contact = self.get_object_or_fail(
+                FakeContact, first_name=first_name, last_name=last_name,
+            )
+            self.assertEqual(sector, contact.sector)
+
+        self.assertFalse(FakeContact.objects.filter(first_name='Misato'))
+        self.assertIsNone(self.get_object_or_fail(FakeContact, first_name='Gendo').sector)
+
+        results = [*self._get_job_results(job).order_by('id')]
+        self.assertEqual(len(lines), len(results))
+        self.assertListEqual(
+            [list(line) for line in lines], [result.line for result in results],
+        )
+        self.assertIsNone(results[2].entity)
+        self.assertTrue(results[2].messages)
+        self.assertIsNotNone(results[4].entity)
+        self.assertTrue(results[4].messages)
+
+        self.assertIsNotNone(self.refresh(job).data.get('throughput'))
+
+    def test_chunks__short_line(self):
+        "A line which is too short generates an error for this line only."
+        user = self.login_as_root_and_get()
+        sector = FakeSector.objects.create(title='Army')
+        lines = [
+            ('Rei',    'Ayanami', sector.title),
+            ('Shinji', 'Ikari'),  # Error (no sector column)
+            ('Asuka',  'Langley', sector.title),
+        ]
+
+        count = FakeContact.objects.count()
+        doc = self._build_csv_doc(lines, user=user)
+        response = self.client.post(
+            self._build_import_url(FakeContact), follow=True,
+            data={
+                **self.lv_import_data,
+                'document': doc.id,
+                'user': user.id,
+
+                'sector_colselect': 3,
+                'sector_subfield': 'title',
+                'sector_defval': '',
+            },
+        )
+        self.assertNoFormError(response)
+
+        job = self._execute_job(response)
+        self.assertEqual(count + 2, FakeContact.objects.count())
+        self.assertEqual(
+            sector, self.get_object_or_fail(FakeContact, first_name='Asuka').sector,
+        )
+
+        results = [*self._get_job_results(job).order_by('id')]
+        self.assertEqual(len(lines), len(results))
+        self.assertIsNone(results[1].entity)
+        self.assertTrue(results[1].messages)
+
+    def test_progress__throughput(self):
+        user = self.login_as_root_and_get()
+        doc = self._build_csv_doc([('Rei', 'Ayanami')], user=user)
+        response = self.client.post(
+            self._build_import_url(FakeContact), follow=True,
+            data={**self.lv_import_data, 'document': doc.id, 'user': user.id},
+        )
+        self.assertNoFormError(response)
+
+        job = self._get_job(response)
+        job.status = Job.STATUS_WAIT
+        job.data['throughput'] = 12.5
+
+        label = ngettext(
+            '{count} line has been processed.',
+            '{count} lines have been processed.',
+            0,
+        ).format(count=0)
+        self.assertEqual(
+            _('{processed} ({throughput} lines/s)').format(
+                processed=label, throughput=12.5,
+            ),
+            mass_import_type.progress(job).label,
+        )
+
+        job.status = Job.STATUS_OK
+        self.assertEqual(label, mass_import_type.progress(job).label)
+
     def _aux_test_dl_errors(self, doc_builder, result_builder, ext, header=False):
         "CSV, no header."
         user = self.login_as_root_and_get()
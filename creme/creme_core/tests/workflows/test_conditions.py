@@ -431,3 +431,40 @@ class WorkflowConditionsTestCase(CremeTestCase):
         ctxt[source.type_id] = self.refresh(orga)
         self.assertTrue(accept(detect_change=False))
         self.assertFalse(accept(detect_change=True))
+
+    def test_populate(self):
+        user = self.get_root_user()
+
+        model = FakeOrganisation
+        cfield = CustomField.objects.create(
+            name='Building(s)', field_type=CustomField.INT, content_type=model,
+        )
+        source = CreatedEntitySource(model=model)
+        conditions = WorkflowConditions().add(
+            source=source,
+            conditions=[
+                condition_handler.CustomFieldConditionHandler.build_condition(
+                    custom_field=cfield, operator=operators.GTE, values=[3],
+                ),
+            ],
+        )
+
+        create_orga = partial(FakeOrganisation.objects.create, user=user)
+        orga1 = create_orga(name='Acme')
+        orga2 = create_orga(name='Seele')
+        cfield.value_class.objects.create(custom_field=cfield, entity=orga1, value=5)
+
+        contexts = [
+            {source.type_id: self.refresh(orga1)},
+            {source.type_id: self.refresh(orga2)},
+        ]
+        conditions.populate(user=user, contexts=contexts)
+
+        accept = partial(conditions.accept, user=user, detect_change=False, use_or=False)
+
+        with self.assertNumQueries(0):
+            accepted1 = accept(context=contexts[0])
+            accepted2 = accept(context=contexts[1])
+
+        self.assertIs(accepted1, True)
+        self.assertIs(accepted2, False)
@@ -12,6 +12,7 @@ from .views import (
     file_handling,
     header_filter,
     index,
+    instrumentation,
     job,
     mass_export,
     mass_import,
@@ -567,6 +568,12 @@ creme_core_patterns = [
         file_handling.RegisteredFileFieldDownloadView.as_view(),
         name='creme_core__download',
     ),
+
+    re_path(
+        r'^instrumentation/metrics[/]?$',
+        instrumentation.Metrics.as_view(),
+        name='creme_core__instrumentation_metrics',
+    ),
 ]
 
 urlpatterns = [
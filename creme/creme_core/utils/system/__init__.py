@@ -39,6 +39,7 @@ def python_subprocess(script, python=PYTHON_BIN, start_new_session=False, **kwar
 # - enable_exit_handler
 # - disable_exit_handler
 # - is_exit_handler_enabled
+# - max_rss
 
 if os_name == 'nt':
     from .nt import *  # NOQA
@@ -62,3 +63,6 @@ else:  # 'os2', 'ce', 'java', 'riscos', other ?
 
     def is_exit_handler_enabled():
         return False
+
+    def max_rss():
+        return None
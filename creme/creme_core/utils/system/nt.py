@@ -60,3 +60,8 @@ except ImportError:
 
     version = '.'.join(map(str, version_info[:2]))
     logger.critical('pywin32 not installed for Python %s', version)
+
+
+def max_rss() -> int | None:
+    # TODO: use GetProcessMemoryInfo() (pywin32)?
+    return None
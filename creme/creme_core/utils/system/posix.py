@@ -24,8 +24,9 @@
 # SOFTWARE.
 ################################################################################
 
+import resource
 import signal
-from sys import exit
+from sys import exit, platform
 
 
 def enable_exit_handler(on_exit=lambda *args: exit()):
@@ -43,3 +44,13 @@ def is_exit_handler_enabled():
         signal.getsignal(signal.SIGINT) not in (signal.SIG_DFL, None)
         and signal.getsignal(signal.SIGTERM) not in (signal.SIG_DFL, None)
     )
+
+
+def max_rss() -> int | None:
+    """Peak resident set size of the current process, in bytes.
+    It's a high-water mark since the start of the process (it's never reset).
+    """
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # NB: the value is in kilobytes on Linux, but in bytes on macOS.
+    return rss if platform == 'darwin' else rss * 1024
@@ -26,6 +26,7 @@ from django.template.context import make_context
 from django.template.engine import Engine
 
 from .. import utils
+from ..gui.brick_cache import brick_html_cache
 from ..gui.bricks import Brick, BrickManager, BrickRegistry, VoidBrick
 from ..gui.bricks import brick_registry as global_brick_registry
 from ..http import CremeJsonResponse
@@ -114,7 +115,7 @@ class BricksReloading(generic.CheckedView):
             # brick, & so avoid annoying side effects.
             # Notice that build_context() creates a shared dictionary with
             # the "shared" key in order to explicitly share data between 2+ bricks.
-            brick_renders.append((brick.id, brick.render({**context})))
+            brick_renders.append((brick.id, brick_html_cache.render(brick, {**context})))
 
         return brick_renders
 
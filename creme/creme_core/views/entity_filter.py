@@ -205,6 +205,20 @@ class EntityFilterParentsBrick(bricks.PaginatedBrick):
         ))
 
 
+class EntityFilterSQLBrick(bricks.Brick):
+    """Display the SQL query generated by the filter ; it's only displayed to
+    the staff users (debugging purpose).
+    """
+    id = 'efilter_sql'
+    read_only = True
+    template_name = 'creme_core/bricks/efilter-sql.html'
+
+    def render(self, context):
+        return self._render(self.get_template_context(
+            context, explanation=context['object'].explain(user=context['user']),
+        ))
+
+
 class EntityFilterLinkedEntitiesBrick(bricks.QuerysetBrick):
     read_only = True
     template_name = 'creme_core/bricks/efilter-linked-entities.html'
@@ -309,6 +323,9 @@ class EntityFilterDetail(EntityFilterMixin, generic.CremeModelDetail):
         main_bricks = [EntityFilterInfoBrick(), EntityFilterParentsBrick()]
         efilter = self.object
 
+        if self.request.user.is_staff:
+            main_bricks.append(EntityFilterSQLBrick())
+
         # TODO: regroup fields from the same model?
         #   => how to indicate PROTECT FKs which will stop deletion
         #   => what about non-viewable fields?
@@ -363,6 +380,8 @@ class EntityFilterBricksReloading(BricksReloading):
 
             if brick_id == EntityFilterParentsBrick.id:
                 brick = EntityFilterParentsBrick()
+            elif brick_id == EntityFilterSQLBrick.id and self.request.user.is_staff:
+                brick = EntityFilterSQLBrick()
             else:
                 model_n_field = EntityFilterLinkedEntitiesBrick.parse_brick_id(brick_id)
                 if model_n_field is None:
@@ -42,6 +42,7 @@ from django.views import generic as django_generic
 from creme.creme_core.core.exceptions import ConflictError
 from creme.creme_core.core.workflow import run_workflow_engine
 from creme.creme_core.forms import CremeForm
+from creme.creme_core.gui.brick_rendering import BricksRenderer
 from creme.creme_core.gui.bricks import Brick, brick_registry
 from creme.creme_core.gui.custom_form import CustomFormDescriptor
 from creme.creme_core.http import is_ajax
@@ -439,11 +440,15 @@ class BricksMixin:
             - It can also be a dictionary: keys are zone, values the
               corresponding Brick classes.
     brick_tag: tag used to register the bricks (see BrickRegistry.Tag).
+    bricks_fast_rendering: <True> means that the "independent" bricks are
+                           rendered with the mode set in the setting
+                           "BRICKS_RENDERING_MODE" (see get_bricks_rendering_mode()).
     """
     brick_registry = brick_registry
     bricks_reload_url_name: str = 'creme_core__reload_bricks'
     brick_classes: list[type[Brick]] | dict[str, list[type[Brick]]] | None = None
     brick_tag = brick_registry.Tag.STATIC
+    bricks_fast_rendering: bool = False
 
     # NB: for linters only
     request: HttpRequest
@@ -486,12 +491,21 @@ class BricksMixin:
         name = self.bricks_reload_url_name
         return reverse(name) if name else ''
 
+    def get_bricks_rendering_mode(self) -> str:
+        "See 'creme_core.gui.brick_rendering.BricksRenderer.Mode'."
+        return (
+            settings.BRICKS_RENDERING_MODE
+            if self.bricks_fast_rendering else
+            BricksRenderer.Mode.SEQUENTIAL
+        )
+
 
 class BricksView(BricksMixin, CheckedTemplateView):
     """Base view which uses Bricks for its display."""
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['bricks_reload_url'] = self.get_bricks_reload_url()
+        context['bricks_rendering_mode'] = self.get_bricks_rendering_mode()
         context['bricks'] = self.get_bricks()
 
         return context
@@ -26,6 +26,7 @@ from django.views.generic import DetailView
 
 from creme.creme_core.bricks import ButtonsBrick
 from creme.creme_core.core import imprint
+from creme.creme_core.core.shared_cache import shared_cache
 from creme.creme_core.gui.bricks import Brick, brick_registry
 from creme.creme_core.gui.view_tag import ViewTag
 from creme.creme_core.gui.visit import EntityVisitor
@@ -45,19 +46,35 @@ def detailview_bricks(user, entity, registry=brick_registry) -> dict[str, list[B
     is_superuser = user.is_superuser
     role = user.role
 
-    role_q = Q(role=None, superuser=True) if is_superuser else Q(role=role, superuser=False)
-    locs = BrickDetailviewLocation.objects.filter(
-        Q(content_type=None) | Q(content_type=entity.entity_type)
-    ).filter(
-        role_q | Q(role=None, superuser=False)
-    ).order_by('order')
+    role_id = role.id if role else None
+    ctype_id = entity.entity_type_id
+
+    def compute():
+        role_q = Q(role=None, superuser=True) if is_superuser else Q(role=role, superuser=False)
+
+        return [
+            *BrickDetailviewLocation.objects.filter(
+                Q(content_type=None) | Q(content_type=ctype_id)
+            ).filter(
+                role_q | Q(role=None, superuser=False)
+            ).order_by('order'),
+        ]
+
+    locs = shared_cache.get_or_compute(
+        key=(
+            f'creme_core-detailview_locations-{ctype_id}-'
+            f'{"superuser" if is_superuser else role_id}'
+        ),
+        models=[BrickDetailviewLocation],
+        compute=compute,
+    )
 
     # We fall back to the default config is there is no config for this content type.
     locs = [
         loc
         for loc in locs
         # NB: useless as long as default conf cannot have a related role
-        if loc.superuser == is_superuser and loc.role == role
+        if loc.superuser == is_superuser and loc.role_id == role_id
     ] or [
         loc for loc in locs if loc.content_type_id is not None
     ] or locs
@@ -136,6 +153,7 @@ class CremeModelDetail(base.PermissionsMixin, base.BricksMixin, DetailView):
 
         context['bricks'] = self.get_bricks()
         context['bricks_reload_url'] = self.get_bricks_reload_url()
+        context['bricks_rendering_mode'] = self.get_bricks_rendering_mode()
 
         return context
 
@@ -169,6 +187,7 @@ class EntityDetail(base.EntityModelMixin, CremeModelDetail):
     pk_url_kwarg = 'entity_id'
     bricks_reload_url_name = 'creme_core__reload_detailview_bricks'
     brick_tag = brick_registry.Tag.DETAIL
+    bricks_fast_rendering = True
 
     visitor_mode_arg = 'visitor'
     visitor_cls = EntityVisitor
@@ -21,7 +21,6 @@ import logging
 from enum import StrEnum
 from functools import partial
 from json import JSONDecodeError
-from json import loads as json_load
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
@@ -38,7 +37,7 @@ import creme.creme_core.gui.listview as lv_gui
 from creme.creme_core.auth.entity_credentials import EntityCredentials
 from creme.creme_core.core import sorter
 from creme.creme_core.core.entity_cell import EntityCell, EntityCellActions
-from creme.creme_core.core.paginator import FlowPaginator
+from creme.creme_core.core.paginator import FlowPaginator, decode_page_info
 from creme.creme_core.forms.listview import ListViewSearchForm
 from creme.creme_core.gui import actions
 from creme.creme_core.gui.view_tag import ViewTag
@@ -636,17 +635,9 @@ class EntitiesList(base.PermissionsMixin, base.TitleMixin, ListView):
 
     def page_builder_for_flowpaginator(self, paginator):
         state = self.state
-        page_str = self.arguments.get(self.page_arg) or str(state.page)
-
-        try:
-            page_info = json_load(page_str)
-        except ValueError:
-            page_info = None
-        else:
-            if not isinstance(page_info, dict):
-                page_info = None
-
-        page_obj = paginator.get_page(page_info)
+        page_obj = paginator.get_page(decode_page_info(
+            self.arguments.get(self.page_arg) or str(state.page)
+        ))
         state.page = json_encode(page_obj.info())
 
         return page_obj
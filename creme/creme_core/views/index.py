@@ -29,6 +29,7 @@ class BaseHome(BricksView):
 class Home(BaseHome):
     template_name = 'creme_core/home.html'
     brick_tag = BaseHome.brick_registry.Tag.HOME
+    bricks_fast_rendering = True
 
     def get_brick_ids(self):
         user = self.request.user
@@ -0,0 +1,55 @@
+################################################################################
+#    Creme is a free/open-source Customer Relationship Management software
+#    Copyright (C) 2026  Hybird
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+
+from django.conf import settings
+from django.core.exceptions import PermissionDenied
+from django.http import Http404, HttpResponse
+from django.utils.crypto import constant_time_compare
+from django.utils.translation import gettext as _
+from django.views import generic as django_generic
+
+from ..core.instrumentation import metrics_registry
+
+
+class Metrics(django_generic.View):
+    """Export the metrics of the instrumentation (see
+    'creme_core.core.instrumentation') in the text format of Prometheus.
+    The staff users can access it; the scrapers have to use the token set in
+    the setting "INSTRUMENTATION_METRICS_TOKEN".
+    """
+    registry = metrics_registry
+    content_type = 'text/plain; version=0.0.4; charset=utf-8'
+
+    def check_access(self, request) -> None:
+        if not settings.INSTRUMENTATION_ENABLED:
+            raise Http404(_('The instrumentation is disabled.'))
+
+        token = settings.INSTRUMENTATION_METRICS_TOKEN
+        if token and constant_time_compare(
+            request.headers.get('Authorization', ''), f'Bearer {token}',
+        ):
+            return
+
+        user = request.user
+        if not (user.is_authenticated and user.is_staff):
+            raise PermissionDenied(_('Only staff users can retrieve the metrics.'))
+
+    def get(self, request, *args, **kwargs):
+        self.check_access(request)
+
+        return HttpResponse(self.registry.to_prometheus(), content_type=self.content_type)
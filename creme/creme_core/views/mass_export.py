@@ -18,18 +18,21 @@
 
 import logging
 
+from django.conf import settings
 from django.core.exceptions import BadRequest
-from django.http import Http404
-from django.shortcuts import get_object_or_404
+from django.http import Http404, HttpResponseRedirect
+from django.shortcuts import get_object_or_404, redirect
+from django.urls import reverse
 from django.utils.encoding import smart_str
 
 from ..backends import export_backend_registry
 from ..core import sorter
-from ..core.paginator import FlowPaginator
+from ..core.paginator import FlowPaginator, count_objects
+from ..creme_jobs import mass_export_type
 from ..forms.listview import ListViewSearchForm
 from ..gui.listview import search_field_registry
 from ..gui.view_tag import ViewTag
-from ..models import EntityCredentials, EntityFilter, HeaderFilter
+from ..models import EntityCredentials, EntityFilter, HeaderFilter, Job
 from ..models.history import _HLTEntityExport
 from ..utils import bool_from_str_extended, get_from_GET_or_404
 from ..utils.meta import Order
@@ -39,7 +42,6 @@ from .generic import base
 logger = logging.getLogger(__name__)
 
 
-# TODO: stream response ??
 # TODO: factorise with generic.listview.EntitiesList ?
 class MassExport(base.EntityCTypeRelatedMixin, base.CheckedView):
     ct_id_arg = 'ct_id'
@@ -160,93 +162,197 @@ class MassExport(base.EntityCTypeRelatedMixin, base.CheckedView):
 
         return sort_info.field_names
 
-    def get(self, request, *args, **kwargs):
-        user = request.user
+    def get_entities_queryset(self, *, model, cells, efilter):
+        request = self.request
+        entities_qs = model.objects.filter(is_deleted=False)
+        use_distinct = False
+
+        # ----
+        if efilter is not None:
+            entities_qs = efilter.filter(entities_qs)
+
+        # ----
+        serialized_extra_q = request.GET.get(self.extra_q_arg)
+        if serialized_extra_q is not None:
+            try:
+                extra_q = QSerializer().loads(serialized_extra_q)
+            except Exception as e:
+                raise BadRequest(f'Invalid extra Q: {e}')
+
+            entities_qs = entities_qs.filter(extra_q)
+            use_distinct = True  # TODO: test + only if needed
+
+        # ----
+        search_form = self.get_search_form(cells=cells)
+        search_q = search_form.search_q
+        if search_q:
+            try:
+                entities_qs = entities_qs.filter(search_q)
+            except Exception as e:
+                logger.exception(
+                    'Error when building the search queryset with Q=%s (%s).',
+                    search_q, e,
+                )
+            else:
+                use_distinct = True  # TODO: test + only if needed
 
-        header_only = self.get_header_only()
-        backend_cls = self.get_backend_class()
-        ct = self.get_ctype()
-        model = ct.model_class()
-        hf = self.get_header_filter()
+        # ----
+        entities_qs = EntityCredentials.filter(request.user, entities_qs)
 
-        cells = self.get_cells(header_filter=hf)
+        if use_distinct:
+            entities_qs = entities_qs.distinct()
 
-        writer = backend_cls()
-        writerow = writer.writerow
+        return entities_qs
+
+    def get_job_threshold(self) -> int:
+        return settings.MASS_EXPORT_JOB_THRESHOLD
+
+    def iter_rows(self, *, ctype, header_filter, cells, efilter, queryset):
+        """Generator of the rows to write (lists of strings).
+        The entities are retrieved page by page, so the memory usage does not
+        depend on the number of entities.
+        @param queryset: Entities to export ; <None> means that only the header
+               is exported.
+
+        Notice that the line of history is not created here (the rows can be
+        consumed after the end of the request when they are streamed) ; see
+        create_history_line().
+        """
         # Doesn't accept generator expression... ;(
-        writerow([smart_str(cell.title) for cell in cells])
+        yield [smart_str(cell.title) for cell in cells]
 
-        if not header_only:
-            ordering = self.get_ordering(model=model, cells=cells)
+        if queryset is None:
+            return
 
-            entities_qs = model.objects.filter(is_deleted=False)
-            use_distinct = False
+        user = self.request.user
+        model = ctype.model_class()
+        ordering = self.get_ordering(model=model, cells=cells)
+        paginator = self.get_paginator(queryset=queryset, ordering=ordering)
 
-            # ----
-            efilter = self.get_entity_filter()
-            if efilter is not None:
-                entities_qs = efilter.filter(entities_qs)
-
-            # ----
-            serialized_extra_q = request.GET.get(self.extra_q_arg)
-            if serialized_extra_q is not None:
-                try:
-                    extra_q = QSerializer().loads(serialized_extra_q)
-                except Exception as e:
-                    raise BadRequest(f'Invalid extra Q: {e}')
-
-                entities_qs = entities_qs.filter(extra_q)
-                use_distinct = True  # TODO: test + only if needed
+        tag = ViewTag.TEXT_PLAIN
 
-            # ----
-            search_form = self.get_search_form(cells=cells)
-            search_q = search_form.search_q
-            if search_q:
-                try:
-                    entities_qs = entities_qs.filter(search_q)
-                except Exception as e:
-                    logger.exception(
-                        'Error when building the search queryset with Q=%s (%s).',
-                        search_q, e,
-                    )
-                else:
-                    use_distinct = True  # TODO: test + only if needed
+        for entities_page in paginator.pages():
+            entities = entities_page.object_list
 
-            # ----
-            entities_qs = EntityCredentials.filter(user, entities_qs)
+            # NB: the FK, relationships, custom-fields... of the whole page are
+            #     retrieved in bulk.
+            header_filter.populate_entities(entities, user)  # Optimisation time !!!
 
-            if use_distinct:
-                entities_qs = entities_qs.distinct()
+            for entity in entities:
+                line = []
 
-            paginator = self.get_paginator(queryset=entities_qs, ordering=ordering)
+                for cell in cells:
+                    try:
+                        res = cell.render(entity, user, tag=tag)
+                    except Exception as e:
+                        logger.debug('Exception in CSV export: %s', e)
+                        res = ''
 
-            total_count = 0
-            tag = ViewTag.TEXT_PLAIN
+                    line.append(smart_str(res) if res else '')
 
-            for entities_page in paginator.pages():
-                entities = entities_page.object_list
+                yield line
 
-                hf.populate_entities(entities, user)  # Optimisation time !!!
+    def create_history_line(self, *, ctype, header_filter, efilter, count):
+        _HLTEntityExport.create_line(
+            ctype=ctype, user=self.request.user, count=count,
+            hfilter=header_filter, efilter=efilter,
+        )
 
-                for entity in entities:
-                    total_count += 1
-                    line = []
+    def _get_export_data(self):
+        ct = self.get_ctype()
+        hf = self.get_header_filter()
+        cells = self.get_cells(header_filter=hf)
 
-                    for cell in cells:
-                        try:
-                            res = cell.render(entity, user, tag=tag)
-                        except Exception as e:
-                            logger.debug('Exception in CSV export: %s', e)
-                            res = ''
+        if self.get_header_only():
+            efilter = queryset = None
+        else:
+            efilter = self.get_entity_filter()
+            queryset = self.get_entities_queryset(
+                model=ct.model_class(), cells=cells, efilter=efilter,
+            )
 
-                        line.append(smart_str(res) if res else '')
+        return {
+            'ctype': ct,
+            'header_filter': hf,
+            'cells': cells,
+            'efilter': efilter,
+            'queryset': queryset,
+        }
+
+    def export_in_job(self):
+        user = self.request.user
+
+        if Job.objects.not_finished(user).count() >= settings.MAX_JOBS_PER_USER:
+            return HttpResponseRedirect(reverse('creme_core__my_jobs'))
+
+        job = Job.objects.create(
+            user=user,
+            type=mass_export_type,
+            data={
+                'ctype': self.get_ctype().id,
+                'GET': self.request.GET.urlencode(),
+            },
+        )
 
-                    writerow(line)
+        return redirect(job)
+
+    def write_file(self):
+        """Export the entities in a file of the MEDIA directory (see the job
+        'creme_core.creme_jobs.mass_export').
+        @return: An instance of <creme_core.models.FileRef>.
+        """
+        export_data = self._get_export_data()
+
+        queryset = export_data['queryset']
+        if queryset is not None:
+            self.create_history_line(
+                ctype=export_data['ctype'],
+                header_filter=export_data['header_filter'],
+                efilter=export_data['efilter'],
+                count=count_objects(queryset)[0],
+            )
 
-            _HLTEntityExport.create_line(
-                ctype=ct, user=user, count=total_count, hfilter=hf, efilter=efilter,
+        return self.get_backend_class()().write_file(
+            rows=self.iter_rows(**export_data),
+            filename=export_data['ctype'].model,
+            user=self.request.user,
+        )
+
+    def get(self, request, *args, **kwargs):
+        backend_cls = self.get_backend_class()
+        export_data = self._get_export_data()
+
+        queryset = export_data['queryset']
+        if queryset is not None:
+            count, estimated = count_objects(
+                queryset, max_count=self.get_job_threshold() or None,
+            )
+            if estimated:
+                return self.export_in_job()
+
+            # NB: the line is created before the rows are built, because the
+            #     streamed rows are consumed after the end of the request (so
+            #     the context of the history, like the user, is not available
+            #     anymore), & the client can abort the download.
+            self.create_history_line(
+                ctype=export_data['ctype'],
+                header_filter=export_data['header_filter'],
+                efilter=export_data['efilter'],
+                count=count,
             )
 
-        writer.save(ct.model, user)
+        user = request.user
+        filename = export_data['ctype'].model
+        rows = self.iter_rows(**export_data)
+        writer = backend_cls()
+
+        if writer.streamable:
+            return writer.build_streaming_response(rows=rows, filename=filename, user=user)
+
+        writerow = writer.writerow
+        for row in rows:
+            writerow(row)
+
+        writer.save(filename, user)
 
         return writer.response
@@ -103,6 +103,10 @@ class _EntityTrigger(WorkflowTrigger):
     def description(self):
         return self.description_format.format(model=self._model._meta.verbose_name)
 
+    @property
+    def event_model(self):
+        return self._model
+
     @property
     def model(self):
         return self._model
@@ -236,6 +240,10 @@ class PropertyAddingTrigger(WorkflowTrigger):
     def entity_model(self) -> type[CremeEntity]:
         return self._entity_model
 
+    @property
+    def event_model(self):
+        return self._entity_model
+
     # TODO: factorise
     @property
     def property_type(self) -> CremePropertyType:
@@ -362,6 +370,10 @@ class RelationAddingTrigger(WorkflowTrigger):
                 error=str(e),
             )
 
+    @property
+    def event_model(self):
+        return self._subject_model
+
     @property
     def object_model(self) -> type[CremeEntity]:
         return self._object_model
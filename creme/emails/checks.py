@@ -63,4 +63,18 @@ def check_sending_settings(**kwargs):
             id='creme.emails.E001',
         ))
 
+    # EMAILS_CAMPAIGN_CONNECTIONS & EMAILS_CAMPAIGN_COMMIT_SIZE ---
+    for setting_name, example in [
+        ('EMAILS_CAMPAIGN_CONNECTIONS', 4),
+        ('EMAILS_CAMPAIGN_COMMIT_SIZE', 100),
+    ]:
+        value = getattr(settings, setting_name)
+        if not isinstance(value, int) or value < 1:
+            errors.append(Error(
+                f'The settings {setting_name} must be a strictly positive integer',
+                hint=f'Set a correct value, like <{setting_name} = {example}>',
+                obj='emails',
+                id='creme.emails.E001',
+            ))
+
     return errors
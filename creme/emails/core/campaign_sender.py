@@ -0,0 +1,351 @@
+################################################################################
+#    Creme is a free/open-source Customer Relationship Management software
+#    Copyright (C) 2026  Hybird
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+
+"""Sending of the emails of campaigns.
+
+The emails of several sendings are sent together:
+  - the messages are built by the current thread (it's the only one which uses
+    the DataBase), & sent by a pool of threads ; each sending has its own pool
+    of SMTP connections, which are kept open during the whole sending.
+  - the sendings are served in turn (one chunk of emails per sending & per
+    round), so a big campaign does not block the other ones.
+  - the global rate is limited by a token bucket (see the settings
+    "EMAILS_CAMPAIGN_SIZE" & "EMAILS_CAMPAIGN_SLEEP_TIME").
+  - the statuses of the emails are committed by chunk.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from queue import Empty, SimpleQueue
+from threading import Lock
+
+from django.conf import settings
+from django.db.transaction import atomic
+from django.utils.timezone import now
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Thread-safe rate limiter.
+    The bucket contains "capacity" tokens at most, & is refilled with "rate"
+    tokens per second ; a token is consumed for each operation.
+    """
+    def __init__(self, *,
+                 rate: float,
+                 capacity: int,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep,
+                 ):
+        """Constructor.
+        @param rate: Number of tokens added per second.
+        @param capacity: Maximum number of tokens (i.e. size of the bursts).
+        @param clock: Function returning a time in seconds (for testing purposes).
+        @param sleep: Function used to wait (for testing purposes).
+        """
+        if rate <= 0 or capacity < 1:
+            raise ValueError(f'TokenBucket: invalid rate/capacity ({rate}/{capacity})')
+
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(capacity)
+        self._last = clock()
+        self._lock = Lock()
+
+    def acquire(self, tokens: int = 1) -> float:
+        """Consume some tokens ; wait for them if needed.
+        @return: The waiting time, in seconds.
+        """
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                current = self._clock()
+                self._tokens = min(
+                    self.capacity, self._tokens + (current - self._last) * self.rate,
+                )
+                self._last = current
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+
+                delay = (tokens - self._tokens) / self.rate
+
+            self._sleep(delay)
+            waited += delay
+
+
+class ConnectionPool:
+    """Pool of connections (mail backends) for one sending ; the connections
+    are opened when they are created, & kept open until close() is called.
+    """
+    def __init__(self, factory: Callable, size: int):
+        """Constructor.
+        @param factory: Function which creates a connection.
+        @param size: Maximum number of connections.
+        """
+        self._factory = factory
+        self._size = size
+        self._idle = SimpleQueue()
+        self._connections = []
+        self._lock = Lock()
+
+    def acquire(self):
+        "Get a connection ; the caller must release (or discard) it."
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except Empty:
+                with self._lock:
+                    if len(self._connections) < self._size:
+                        connection = self._factory()
+                        connection.open()
+                        self._connections.append(connection)
+
+                        return connection
+
+                connection = self._idle.get()
+
+            # NB: <None> is put by discard() to wake up a waiting thread
+            #     (a new connection can be created).
+            if connection is not None:
+                return connection
+
+    def release(self, connection) -> None:
+        self._idle.put(connection)
+
+    def discard(self, connection) -> None:
+        """Close a connection which is broken (e.g. the server has closed it
+        after an error, or because of its limit of messages per connection)
+        instead of releasing it ; a new connection will be created if needed.
+        """
+        try:
+            connection.close()
+        except Exception as e:
+            logger.warning('ConnectionPool: error when closing a connection: %s', e)
+
+        with self._lock:
+            try:
+                self._connections.remove(connection)
+            except ValueError:  # The pool has been closed
+                pass
+
+        self._idle.put(None)
+
+    def close(self) -> None:
+        with self._lock:
+            for connection in self._connections:
+                try:
+                    connection.close()
+                except Exception as e:
+                    logger.warning('ConnectionPool: error when closing a connection: %s', e)
+
+            self._connections.clear()
+
+
+class _SendingTask:
+    "State of a sending during the run of a CampaignSender."
+    def __init__(self, sending, pool_size: int):
+        self.sending = sending
+        self.status = None  # <None> means "no error"
+        self.finished = False
+        self.sent_count = 0
+        self.errors_count = 0
+        self.last_mail_id = ''
+        self.email_sender = None
+        self.pool = None
+
+        if sending.config_item is None:
+            logger.warning(
+                'It seems the config of an active EmailSending has been removed.'
+            )
+            self.status = sending.State.ERROR
+            self.finished = True
+            return
+
+        self.email_sender = sending.get_email_sender()
+        if self.email_sender is None:
+            self.status = sending.State.ERROR
+            self.finished = True
+            return
+
+        self.pool = ConnectionPool(factory=sending.get_connection, size=pool_size)
+
+    def next_mails(self, size: int) -> list:
+        "Next chunk of emails which have not been sent (keyset pagination)."
+        Status = self.sending.mails_set.model.Status
+        mails = [
+            *self.sending.mails_set
+                         .filter(id__gt=self.last_mail_id)
+                         .exclude(status=Status.SENT)
+                         .order_by('id')[:size]
+        ]
+
+        if mails:
+            self.last_mail_id = mails[-1].id
+        else:
+            self.finished = True
+
+        return mails
+
+
+class CampaignSender:
+    """Send the emails of several instances of EmailSending.
+
+    Usage:
+        statuses = CampaignSender(sendings).run()
+    """
+    thread_name_prefix = 'creme_emails'
+
+    def __init__(self,
+                 sendings: Iterable,
+                 *,
+                 workers: int | None = None,
+                 rate_limiter: TokenBucket | None = None,
+                 chunk_size: int | None = None,
+                 ):
+        """Constructor.
+        @param sendings: Instances of EmailSending.
+        @param workers: Number of threads which send the messages (it's also
+               the maximum number of SMTP connections per sending) ; the
+               setting "EMAILS_CAMPAIGN_CONNECTIONS" by default.
+        @param rate_limiter: Limits the global rate ; by default a TokenBucket
+               is built from the settings "EMAILS_CAMPAIGN_SIZE" (burst) &
+               "EMAILS_CAMPAIGN_SLEEP_TIME" (i.e. "EMAILS_CAMPAIGN_SIZE"
+               emails each "EMAILS_CAMPAIGN_SLEEP_TIME" seconds).
+        @param chunk_size: Number of emails of a sending per round ; the
+               statuses are committed after each round. The setting
+               "EMAILS_CAMPAIGN_COMMIT_SIZE" by default.
+        """
+        self.sendings = [*sendings]
+        self.workers = workers or settings.EMAILS_CAMPAIGN_CONNECTIONS
+        self.chunk_size = chunk_size or settings.EMAILS_CAMPAIGN_COMMIT_SIZE
+
+        if rate_limiter is None:
+            size = settings.EMAILS_CAMPAIGN_SIZE
+            rate_limiter = TokenBucket(
+                rate=size / settings.EMAILS_CAMPAIGN_SLEEP_TIME, capacity=size,
+            )
+
+        self.rate_limiter = rate_limiter
+
+    def _send_message(self, pool: ConnectionPool, message) -> None:
+        # NB: executed by the threads of the pool (no query here).
+        self.rate_limiter.acquire()
+        connection = pool.acquire()
+
+        try:
+            connection.send_messages([message])
+        except Exception:
+            # NB: the backend could stay in a broken state (e.g. the SMTP
+            #     backend does not re-open a disconnected socket).
+            pool.discard(connection)
+            raise
+
+        pool.release(connection)
+
+    def _run_round(self, executor: ThreadPoolExecutor, tasks: list[_SendingTask]) -> None:
+        submitted = []
+
+        for task in tasks:
+            for mail in task.next_mails(self.chunk_size):
+                try:
+                    message = task.email_sender.build_message(mail)
+                except Exception:
+                    logger.exception('CampaignSender: error when building a message.')
+                    future = None
+                else:
+                    future = executor.submit(self._send_message, task.pool, message)
+
+                submitted.append((task, mail, future))
+
+        mails = []
+        for task, mail, future in submitted:
+            try:
+                if future is None:
+                    raise ValueError('The message could not be built')
+
+                future.result()
+            except Exception as e:
+                logger.warning('CampaignSender: error when sending to "%s": %s', mail.recipient, e)
+                mail.status = mail.Status.SENDING_ERROR
+                task.errors_count += 1
+            else:
+                logger.debug('Mail sent to %s', mail.recipient)
+                mail.status = mail.Status.SENT
+                mail.sending_date = now()
+                task.sent_count += 1
+
+            mails.append(mail)
+
+        if mails:
+            with atomic():
+                type(mails[0]).objects.bulk_update(mails, ['status', 'sending_date'])
+
+    def _save_metrics(self, task: _SendingTask, duration: timedelta) -> None:
+        sending = task.sending
+        sending.sent_count += task.sent_count
+        sending.errors_count += task.errors_count
+        sending.sending_duration = (sending.sending_duration or timedelta()) + duration
+        sending.save(update_fields=['sent_count', 'errors_count', 'sending_duration'])
+
+    def run(self) -> dict:
+        """Send the emails which have not been sent yet.
+        @return: A dictionary {sending_id: status} ; the status is <State.ERROR>
+                 when no email of the sending has been sent, <None> otherwise.
+        """
+        start = now()
+        tasks = [_SendingTask(sending, pool_size=self.workers) for sending in self.sendings]
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix=self.thread_name_prefix,
+            ) as executor:
+                active_tasks = [task for task in tasks if not task.finished]
+
+                while active_tasks:
+                    self._run_round(executor, active_tasks)
+                    active_tasks = [task for task in active_tasks if not task.finished]
+        finally:
+            for task in tasks:
+                if task.pool is not None:
+                    task.pool.close()
+
+        duration = now() - start
+        statuses = {}
+
+        for task in tasks:
+            sending = task.sending
+
+            if task.pool is not None:
+                self._save_metrics(task, duration)
+
+            if task.status is None and not task.sent_count:
+                task.status = sending.State.ERROR
+
+            statuses[sending.id] = task.status
+
+        return statuses
@@ -24,6 +24,7 @@ from creme.creme_core.constants import UUID_CHANNEL_JOBS
 from creme.creme_core.creme_jobs.base import JobType
 from creme.creme_core.models import Notification
 
+from ..core.campaign_sender import CampaignSender
 from ..models import EmailSending
 from ..notification import CampaignSentContent
 
@@ -35,20 +36,28 @@ class _CampaignEmailsSendType(JobType):
 
     def _execute(self, job):
         # TODO: exclude config_item=None ?
-        for sending in EmailSending.objects.exclude(
-            campaign__is_deleted=True,
-        ).exclude(
-            state=EmailSending.State.DONE,
-        ).filter(
-            Q(type=EmailSending.Type.IMMEDIATE) | Q(sending_date__lte=now())
-        ).select_related('campaign'):
+        sendings = [
+            *EmailSending.objects.exclude(
+                campaign__is_deleted=True,
+            ).exclude(
+                state=EmailSending.State.DONE,
+            ).filter(
+                Q(type=EmailSending.Type.IMMEDIATE) | Q(sending_date__lte=now())
+            ).select_related('campaign', 'config_item')
+        ]
+        if not sendings:
+            return
+
+        for sending in sendings:
             sending.state = EmailSending.State.IN_PROGRESS
             sending.save()
 
-            status = sending.send_mails()
+        # NB: the sendings are sent together, so a big campaign does not block the other ones.
+        statuses = CampaignSender(sendings).run()
 
+        for sending in sendings:
             # TODO: move in send_mails() ???
-            sending.state = status or EmailSending.State.DONE
+            sending.state = statuses[sending.id] or EmailSending.State.DONE
             sending.save()
 
             if sending.type != EmailSending.Type.IMMEDIATE:
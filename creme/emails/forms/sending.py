@@ -326,8 +326,8 @@ class SendingCreationForm(core_forms.CremeModelForm):
             *self._get_variables(template.body_html),
         ]
 
-        with toggle_history(enabled=False):
-            for address, recipient_entity in instance.campaign.all_recipients():
+        def build_mails():
+            for address, recipient_entity in instance.campaign.iter_recipients():
                 mail = LightWeightEmail(
                     sending=instance,
                     sender=instance.sender,
@@ -347,7 +347,10 @@ class SendingCreationForm(core_forms.CremeModelForm):
                     if context:
                         mail.body = json_dump(context, separators=(',', ':'))
 
-                mail.genid_n_save()
+                yield mail
+
+        with toggle_history(enabled=False):
+            LightWeightEmail.bulk_genid_n_create(build_mails())
 
         return instance
 
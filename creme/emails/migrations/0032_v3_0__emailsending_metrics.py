@@ -0,0 +1,32 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('emails', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emailsending',
+            name='sent_count',
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name='Number of sent emails',
+            ),
+        ),
+        migrations.AddField(
+            model_name='emailsending',
+            name='errors_count',
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name='Number of emails in error',
+                help_text='Emails refused by the SMTP server, or which could not be sent',
+            ),
+        ),
+        migrations.AddField(
+            model_name='emailsending',
+            name='sending_duration',
+            field=models.DurationField(
+                editable=False, null=True, verbose_name='Duration of the sending',
+            ),
+        ),
+    ]
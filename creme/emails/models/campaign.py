@@ -16,6 +16,10 @@
 #    along with this program.  If not, see <http://www.gnu.org/licenses/>.
 ################################################################################
 
+from __future__ import annotations
+
+from collections.abc import Iterator
+
 from django.conf import settings
 from django.db import models
 from django.urls import reverse
@@ -61,34 +65,60 @@ class AbstractEmailCampaign(CremeEntity):
         return reverse('emails__list_campaigns')
 
     def all_recipients(self):
-        # Merge all the mailing_lists and their children
-        lists = {
-            pk: ml
-            for ml in self.mailing_lists.filter(is_deleted=False)
-            for pk, ml in ml.get_family().items()
-        }.values()
-
-        # Manual recipients
-        recipients = {
-            addr: None
-            for addr in EmailRecipient.objects
-                                      .filter(ml__in=[ml.id for ml in lists])
-                                      .values_list('address', flat=True)
-        }
-
-        # Contacts & organisations recipients
-        def update(get_persons):
-            recipients.update(
-                (p.email, p)
-                for ml in lists
-                for p in get_persons(ml).filter(is_deleted=False)
-                if p.email
-            )
-
-        update(lambda ml: ml.contacts)
-        update(lambda ml: ml.organisations)
-
-        return recipients.items()
+        "See iter_recipients()."
+        return dict(self.iter_recipients()).items()
+
+    def iter_recipients(self,
+                        chunk_size: int = 2000,
+                        ) -> Iterator[tuple[str, CremeEntity | None]]:
+        """Generate the recipients of the campaign, i.e. the organisations,
+        the contacts & the manual recipients of the related mailing lists &
+        of all their children (deleted lists & persons are ignored).
+        Each address is generated once ; organisations take precedence over
+        contacts, which take precedence over manual recipients.
+        The persons are retrieved by chunks, with sub-queries on the mailing
+        lists, so the whole set of recipients is never built in memory.
+        @param chunk_size: Number of persons/addresses retrieved per query.
+        @return: Iterator on tuples (address, entity) ; the entity is <None>
+                 for the manual recipients.
+        """
+        ml_model = self._meta.get_field('mailing_lists').related_model
+        ml_ids = ml_model.get_family_ids(
+            self.mailing_lists.filter(is_deleted=False).values_list('id', flat=True)
+        )
+        if not ml_ids:
+            return
+
+        def persons(field_name):
+            m2m_field = ml_model._meta.get_field(field_name)
+
+            return m2m_field.related_model._default_manager.filter(
+                is_deleted=False,
+                id__in=m2m_field.remote_field.through._default_manager.filter(
+                    **{f'{m2m_field.m2m_field_name()}__in': ml_ids}
+                ).values(f'{m2m_field.m2m_reverse_field_name()}_id'),
+            ).exclude(email__isnull=True).exclude(email='').order_by('id')
+
+        seen = set()
+
+        # NB: "civility" can be used by the templates
+        for entities in (
+            persons('organisations'),
+            persons('contacts').select_related('civility'),
+        ):
+            for entity in entities.iterator(chunk_size=chunk_size):
+                address = entity.email
+
+                if address not in seen:
+                    seen.add(address)
+                    yield address, entity
+
+        for address in EmailRecipient.objects.filter(
+            ml__in=ml_ids,
+        ).values_list('address', flat=True).distinct().iterator(chunk_size=chunk_size):
+            if address not in seen:
+                seen.add(address)
+                yield address, None
 
     def restore(self):
         super().restore()
@@ -16,6 +16,9 @@
 #    along with this program.  If not, see <http://www.gnu.org/licenses/>.
 ################################################################################
 
+from collections.abc import Iterable
+from itertools import batched
+
 from django.conf import settings
 from django.db import models
 from django.urls import reverse
@@ -100,16 +103,49 @@ class AbstractMailingList(CremeEntity):
         """Return a dictionary<pk: MailingList> with self and all children,
          small children etc...
          """
-        family = {}
-        self.get_family_aux(family)
+        family = {
+            ml.id: ml
+            for ml in type(self)._default_manager.filter(id__in=self.get_family_ids([self.id]))
+        }
+        family[self.id] = self
 
         return family
 
-    def get_family_aux(self, dic):
-        dic[self.id] = self
+    @classmethod
+    def get_family_ids(cls, ml_ids: Iterable[int], batch_size: int = 500) -> set[int]:
+        """Get the IDs of some mailing lists & of all their descendants which
+        are not deleted (children, small children etc...).
+        The tree is walked level by level, with one query per level (& per
+        batch of IDs) ; the cycles are ignored.
+        NB: the given IDs are always in the result, even if the related lists
+            are deleted.
+        @param ml_ids: IDs of the root mailing lists.
+        @param batch_size: Maximum number of IDs per query.
+        @return: A set of IDs.
+        """
+        children_field = cls._meta.get_field('children')
+        parent_name = children_field.m2m_field_name()
+        child_name = children_field.m2m_reverse_field_name()
+        children = children_field.remote_field.through._default_manager.filter(
+            **{f'{child_name}__is_deleted': False}
+        )
+
+        family = {*ml_ids}
+        level = family
+
+        while level:
+            next_level = set()
+
+            for ids in batched(level, batch_size):
+                next_level.update(
+                    children.filter(**{f'{parent_name}__in': ids})
+                            .values_list(f'{child_name}_id', flat=True)
+                )
+
+            level = next_level - family
+            family |= level
 
-        for child in self.children.filter(is_deleted=False):
-            child.get_family_aux(dic)
+        return family
 
 
 class MailingList(AbstractMailingList):
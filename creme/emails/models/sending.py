@@ -19,8 +19,9 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
+from itertools import batched
 from json import loads as json_load
-from time import sleep
 
 from django.conf import settings
 # from django.core.mail import get_connection, send_mail
@@ -201,6 +202,18 @@ class EmailSending(CremeModel):
         verbose_name=_('Attachments'), editable=False,
     )
 
+    # Metrics (see 'emails.core.campaign_sender.CampaignSender')
+    sent_count = models.PositiveIntegerField(
+        _('Number of sent emails'), default=0, editable=False,
+    )
+    errors_count = models.PositiveIntegerField(
+        _('Number of emails in error'), default=0, editable=False,
+        help_text=_('Emails refused by the SMTP server, or which could not be sent'),
+    )
+    sending_duration = models.DurationField(
+        _('Duration of the sending'), null=True, editable=False,
+    ).set_tags(viewable=False)
+
     creation_label = pgettext_lazy('emails', 'Create a sending')
     save_label     = pgettext_lazy('emails', 'Save the sending')
 
@@ -228,36 +241,18 @@ class EmailSending(CremeModel):
     def get_related_entity(self):  # For generic views
         return self.campaign
 
-    def send_mails(self):
-        config_item = self.config_item
-        if config_item is None:
-            logger.warning(
-                'It seems the config of an active EmailSending has been removed.'
-            )
-            return self.State.ERROR
+    @property
+    def throughput(self) -> float | None:
+        "Number of emails sent per second (None if the sending has not been performed)."
+        duration = self.sending_duration
+        if not duration:
+            return None
 
-        try:
-            sender_obj = self.email_sender_cls(sending=self)
-        except ImageFromHTMLError as e:
-            send_mail(
-                subject=gettext(
-                    '[{software}] Campaign email sending error.'
-                ).format(software=settings.SOFTWARE_LABEL),
-                message=gettext(
-                    "Emails in the sending of the campaign «{campaign}» on "
-                    "{date} weren't sent because the image «{image}» is no "
-                    "longer available in the template."
-                ).format(
-                    campaign=self.campaign,
-                    date=self.sending_date,
-                    image=e.filename,
-                ),
-                from_email=settings.EMAIL_HOST_USER,
-                recipient_list=[self.campaign.user.email or settings.DEFAULT_USER_EMAIL],
-                # fail_silently=False,
-            )
+        return self.sent_count / duration.total_seconds()
 
-            return self.State.ERROR
+    def get_connection(self):
+        "Get a new instance of mail backend, with the configuration of the sending."
+        config_item = self.config_item
 
         # connection = get_connection(
         #     host=config_item.host,
@@ -270,7 +265,8 @@ class EmailSending(CremeModel):
         #       seems to dynamically modify settings.MAILERS (seems prone to race
         #       conditions, need cleaning after...); or to duplicate the Django's code...
         backend_class = import_string(self.BACKEND)
-        connection = backend_class(
+
+        return backend_class(
             # HACK: avoid having deprecation warning (direct instantiation of backend)
             alias=f'emails-campaign-{self.id}',
 
@@ -281,32 +277,44 @@ class EmailSending(CremeModel):
             use_tls=config_item.use_tls,
         )
 
-        mails_count = 0
-        one_mail_sent = False
-        # SENDING_SIZE = getattr(settings, 'EMAILCAMPAIGN_SIZE', 40)
-        sending_size = settings.EMAILS_CAMPAIGN_SIZE
-        # SLEEP_TIME = getattr(settings, 'EMAILCAMPAIGN_SLEEP_TIME', 2)
-        sleep_time = settings.EMAILS_CAMPAIGN_SLEEP_TIME
-
-        for mail in LightWeightEmail.objects.filter(sending=self):
-            if sender_obj.send(mail, connection=connection):
-                mails_count += 1
-                one_mail_sent = True
-                logger.debug('Mail sent to %s', mail.recipient)
-
-            # if mails_count > SENDING_SIZE:
-            if mails_count > sending_size:
-                logger.debug('Sending: waiting timeout')
+    def get_email_sender(self) -> LightWeightEmailSender | None:
+        """Build the object which builds the messages of the sending.
+        @return: An instance of "email_sender_cls", or None if an image of the
+                 template is not available anymore (the owner of the campaign
+                 is warned by email).
+        """
+        try:
+            return self.email_sender_cls(sending=self)
+        except ImageFromHTMLError as e:
+            send_mail(
+                subject=gettext(
+                    '[{software}] Campaign email sending error.'
+                ).format(software=settings.SOFTWARE_LABEL),
+                message=gettext(
+                    "Emails in the sending of the campaign «{campaign}» on "
+                    "{date} weren't sent because the image «{image}» is no "
+                    "longer available in the template."
+                ).format(
+                    campaign=self.campaign,
+                    date=self.sending_date,
+                    image=e.filename,
+                ),
+                from_email=settings.EMAIL_HOST_USER,
+                recipient_list=[self.campaign.user.email or settings.DEFAULT_USER_EMAIL],
+                # fail_silently=False,
+            )
 
-                mails_count = 0
-                # sleep(SLEEP_TIME)
-                sleep(sleep_time)  # Avoiding the mail to be classed as spam
+            return None
 
-        if not one_mail_sent:
-            return self.State.ERROR
+    def send_mails(self):
+        """Send the emails which have not been sent yet.
+        See 'emails.core.campaign_sender.CampaignSender' to send the emails of
+        several sendings together.
+        @return: <State.ERROR> if no email has been sent, <None> otherwise.
+        """
+        from ..core.campaign_sender import CampaignSender
 
-        # TODO: close the connection?
-        return None
+        return CampaignSender([self]).run()[self.id]
 
     send_mails.alters_data = True
 
@@ -378,3 +386,58 @@ class LightWeightEmail(_Email):
                 return
 
     genid_n_save.alters_data = True
+
+    @classmethod
+    def bulk_genid_n_create(cls,
+                            mails: Iterable[LightWeightEmail],
+                            batch_size: int = 500,
+                            ) -> int:
+        """Create some new emails by chunks (see bulk_create()), with
+        generated IDs (see genid_n_save()).
+        The emails are consumed lazily, so a generator can be used to avoid
+        building all the instances in memory.
+        NB: the signals "pre_save" & "post_save" are not sent.
+        @param mails: Instances of LightWeightEmail which are not saved yet.
+        @param batch_size: Number of emails per query.
+        @return: The number of created emails.
+        """
+        manager = cls._default_manager
+        count = 0
+
+        for chunk in batched(mails, batch_size):
+            ids = set()
+
+            def set_new_id(mail):
+                while True:
+                    mail.id = mail_id = generate_id()
+
+                    if mail_id not in ids:
+                        ids.add(mail_id)
+                        return
+
+            for mail in chunk:
+                set_new_id(mail)
+
+            while True:
+                try:
+                    with atomic():
+                        manager.bulk_create(chunk)
+                except IntegrityError:
+                    existing_ids = {
+                        *manager.filter(id__in=ids).values_list('id', flat=True)
+                    }
+                    if not existing_ids:  # Not a collision of IDs
+                        raise
+
+                    logger.debug('Mail IDs already exist: %s', existing_ids)
+
+                    for mail in chunk:
+                        if mail.id in existing_ids:
+                            ids.discard(mail.id)
+                            set_new_id(mail)
+                else:
+                    break
+
+            count += len(chunk)
+
+        return count
@@ -1,8 +1,12 @@
 from functools import partial
 
+from creme.emails.models import EmailRecipient
+
 from ..base import (
+    Contact,
     EmailCampaign,
     MailingList,
+    Organisation,
     _EmailsTestCase,
     skipIfCustomEmailCampaign,
 )
@@ -24,3 +28,55 @@ class CampaignTestCase(_EmailsTestCase):
         self.assertNotEqual(camp.pk, cloned_camp.pk)
         self.assertEqual(camp.name, cloned_camp.name)
         self.assertCountEqual([ml1, ml2], cloned_camp.mailing_lists.all())
+
+    def test_recipients(self):
+        user = self.get_root_user()
+        camp = EmailCampaign.objects.create(user=user, name='My campaign')
+
+        create_ml = partial(MailingList.objects.create, user=user)
+        ml1 = create_ml(name='List 01')
+        ml2 = create_ml(name='List 02')
+        ml3 = create_ml(name='List 03', is_deleted=True)
+        ml4 = create_ml(name='List 04')
+        ml1.children.set([ml2])
+        camp.mailing_lists.set([ml1, ml3])
+
+        create_contact = partial(Contact.objects.create, user=user)
+        contact1 = create_contact(first_name='Spike', last_name='Spiegel', email='spike@bebop.mrs')
+        contact2 = create_contact(first_name='Jet', last_name='Black', email='jet@bebop.mrs')
+        contact3 = create_contact(first_name='Faye', last_name='Valentine')
+        contact4 = create_contact(
+            first_name='Ed', last_name='Wong', email='ed@bebop.mrs', is_deleted=True,
+        )
+        contact5 = create_contact(first_name='Vicious', last_name='?', email='v@reddragons.mrs')
+
+        orga = Organisation.objects.create(user=user, name='Bebop', email='jet@bebop.mrs')
+
+        ml1.contacts.set([contact1, contact3, contact4])
+        ml2.contacts.set([contact1, contact2])
+        ml2.organisations.set([orga])
+        ml3.contacts.set([contact5])
+        ml4.contacts.set([contact5])
+
+        create_recipient = EmailRecipient.objects.create
+        create_recipient(ml=ml1, address='spike@bebop.mrs')
+        create_recipient(ml=ml2, address='faye@bebop.mrs')
+        create_recipient(ml=ml1, address='faye@bebop.mrs')
+        create_recipient(ml=ml3, address='julia@reddragons.mrs')
+
+        recipients = [*camp.iter_recipients(chunk_size=1)]
+        self.assertCountEqual(
+            [
+                ('jet@bebop.mrs',   orga),
+                ('spike@bebop.mrs', contact1),
+                ('faye@bebop.mrs',  None),
+            ],
+            recipients,
+        )
+        self.assertCountEqual(recipients, camp.all_recipients())
+
+    def test_recipients__empty(self):
+        camp = EmailCampaign.objects.create(user=self.get_root_user(), name='My campaign')
+
+        with self.assertNumQueries(1):
+            self.assertListEqual([], [*camp.iter_recipients()])
@@ -42,3 +42,46 @@ class MailingListTestCase(_EmailsTestCase):
         self.assertCountEqual(
             [email], cloned_mlist.emailrecipient_set.values_list('address', flat=True),
         )
+
+    def test_get_family(self):
+        user = self.get_root_user()
+        create_ml = partial(MailingList.objects.create, user=user)
+        ml1 = create_ml(name='ml01')
+        ml2 = create_ml(name='ml02')
+        ml3 = create_ml(name='ml03')
+        ml4 = create_ml(name='ml04', is_deleted=True)
+        ml5 = create_ml(name='ml05')
+        ml6 = create_ml(name='ml06')
+
+        ml1.children.set([ml2, ml4])
+        ml2.children.set([ml3])
+        ml4.children.set([ml5])
+        ml6.children.set([ml1])
+
+        with self.assertNumQueries(3):  # 2 levels + the last (empty) one
+            ids = MailingList.get_family_ids([ml1.id])
+        self.assertSetEqual({ml1.id, ml2.id, ml3.id}, ids)
+
+        self.assertSetEqual(
+            {ml1.id, ml2.id, ml3.id, ml6.id}, MailingList.get_family_ids([ml6.id, ml2.id]),
+        )
+        self.assertSetEqual({ml4.id, ml5.id}, MailingList.get_family_ids([ml4.id]))
+        self.assertSetEqual(set(), MailingList.get_family_ids([]))
+
+        family = ml1.get_family()
+        self.assertIsInstance(family, dict)
+        self.assertCountEqual([ml1.id, ml2.id, ml3.id], family.keys())
+        self.assertIs(ml1, family[ml1.id])
+        self.assertEqual(ml3, family[ml3.id])
+
+    def test_get_family__cycle(self):
+        user = self.get_root_user()
+        create_ml = partial(MailingList.objects.create, user=user)
+        ml1 = create_ml(name='ml01')
+        ml2 = create_ml(name='ml02')
+
+        # NB: the forms forbid the cycles
+        ml1.children.set([ml2])
+        ml2.children.set([ml1])
+
+        self.assertSetEqual({ml1.id, ml2.id}, MailingList.get_family_ids([ml1.id]))
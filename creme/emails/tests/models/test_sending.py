@@ -1,4 +1,5 @@
 from datetime import timedelta
+from unittest.mock import patch
 
 from django.utils.timezone import now
 
@@ -6,7 +7,11 @@ from django.utils.timezone import now
 from creme.creme_core.core.job import get_queue
 from creme.creme_core.models import Job
 from creme.emails.creme_jobs import campaign_emails_send_type
-from creme.emails.models import EmailSending, EmailSendingConfigItem
+from creme.emails.models import (
+    EmailSending,
+    EmailSendingConfigItem,
+    LightWeightEmail,
+)
 from creme.emails.tests.base import EmailCampaign, _EmailsTestCase
 
 
@@ -95,3 +100,38 @@ class EmailSendingTestCase(_EmailsTestCase):
 
         camp.restore()
         self.assertFalse(queue.refreshed_jobs)
+
+
+class LightWeightEmailTestCase(_EmailsTestCase):
+    def test_bulk_genid_n_create(self):
+        user = self.get_root_user()
+        camp = EmailCampaign.objects.create(user=user, name='camp01')
+        sending = EmailSending.objects.create(
+            campaign=camp,
+            type=EmailSending.Type.IMMEDIATE, sending_date=now(),
+        )
+        LightWeightEmail.objects.create(
+            id='existing', sending=sending, recipient='spike@bebop.mrs',
+        )
+
+        def build_mails():
+            for recipient in ('jet@bebop.mrs', 'faye@bebop.mrs', 'ed@bebop.mrs'):
+                yield LightWeightEmail(
+                    sending=sending, sender='vicious@reddragons.mrs', recipient=recipient,
+                )
+
+        # Collisions with an existing email, & inside a chunk
+        ids = iter(['existing', 'id1', 'id1', 'id2', 'id3'])
+        with patch('creme.emails.models.sending.generate_id', side_effect=lambda: next(ids)):
+            count = LightWeightEmail.bulk_genid_n_create(build_mails(), batch_size=2)
+
+        self.assertEqual(3, count)
+        self.assertDictEqual(
+            {
+                'existing': 'spike@bebop.mrs',
+                'id1': 'faye@bebop.mrs',
+                'id2': 'jet@bebop.mrs',
+                'id3': 'ed@bebop.mrs',
+            },
+            dict(sending.mails_set.values_list('id', 'recipient')),
+        )
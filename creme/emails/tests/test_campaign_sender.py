@@ -0,0 +1,270 @@
+from smtplib import SMTPRecipientsRefused, SMTPServerDisconnected
+
+from django.core import mail as django_mail
+from django.utils.timezone import now
+
+from creme.creme_core.utils.test import EmailBackend
+
+from ..core.campaign_sender import CampaignSender, ConnectionPool, TokenBucket
+from ..models import EmailSending, EmailSendingConfigItem, LightWeightEmail
+from .base import EmailCampaign, _EmailsTestCase
+
+
+class RefusingEmailBackend(EmailBackend):
+    "The addresses starting by 'invalid' are refused."
+    def send_messages(self, messages):
+        for message in messages:
+            if message.to[0].startswith('invalid'):
+                raise SMTPRecipientsRefused({message.to[0]: (550, b'No such user')})
+
+        return super().send_messages(messages)
+
+
+class DisconnectingEmailBackend(EmailBackend):
+    """The first connection is closed by the server after its first message,
+    & stays broken (like the SMTP backend, which does not re-open the socket).
+    """
+    disconnections = 1
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.broken = False
+
+    def send_messages(self, messages):
+        cls = type(self)
+
+        if cls.disconnections:
+            cls.disconnections -= 1
+            self.broken = True
+
+        if self.broken:
+            raise SMTPServerDisconnected('Connection unexpectedly closed')
+
+        return super().send_messages(messages)
+
+
+class _FakeConnection:
+    def __init__(self):
+        self.opened = False
+        self.closed = False
+
+    def open(self):
+        self.opened = True
+
+    def close(self):
+        self.closed = True
+
+
+class TokenBucketTestCase(_EmailsTestCase):
+    def test_acquire(self):
+        clock = [100.0]
+        sleeps = []
+
+        def sleep(delay):
+            sleeps.append(delay)
+            clock[0] += delay
+
+        bucket = TokenBucket(rate=2, capacity=3, clock=lambda: clock[0], sleep=sleep)
+        self.assertEqual(0, bucket.acquire())
+        self.assertEqual(0, bucket.acquire())
+        self.assertEqual(0, bucket.acquire())
+        self.assertListEqual([], sleeps)
+
+        self.assertEqual(0.5, bucket.acquire())
+        self.assertListEqual([0.5], sleeps)
+
+        # Refill (limited by the capacity)
+        clock[0] += 10
+        for __ in range(3):
+            bucket.acquire()
+        self.assertListEqual([0.5], sleeps)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0, capacity=3)
+
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=1, capacity=0)
+
+
+class ConnectionPoolTestCase(_EmailsTestCase):
+    def test_pool(self):
+        pool = ConnectionPool(factory=_FakeConnection, size=2)
+
+        connection1 = pool.acquire()
+        self.assertIsInstance(connection1, _FakeConnection)
+        self.assertTrue(connection1.opened)
+
+        connection2 = pool.acquire()
+        self.assertIsNot(connection1, connection2)
+
+        pool.release(connection1)
+        self.assertIs(connection1, pool.acquire())
+
+        pool.release(connection1)
+        pool.release(connection2)
+        pool.close()
+        self.assertTrue(connection1.closed)
+        self.assertTrue(connection2.closed)
+
+    def test_discard(self):
+        pool = ConnectionPool(factory=_FakeConnection, size=1)
+
+        connection1 = pool.acquire()
+        pool.discard(connection1)
+        self.assertTrue(connection1.closed)
+
+        connection2 = pool.acquire()
+        self.assertIsNot(connection1, connection2)
+        self.assertTrue(connection2.opened)
+        self.assertFalse(connection2.closed)
+
+        pool.release(connection2)
+        self.assertIs(connection2, pool.acquire())
+
+    def test_discard__close_error(self):
+        class BrokenConnection(_FakeConnection):
+            def close(self):
+                raise OSError('Broken pipe')
+
+        pool = ConnectionPool(factory=BrokenConnection, size=1)
+        connection = pool.acquire()
+
+        with self.assertLogs(level='WARNING'):
+            pool.discard(connection)
+
+        self.assertIsNot(connection, pool.acquire())
+
+
+class CampaignSenderTestCase(_EmailsTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._original_backend = EmailSending.BACKEND
+        EmailSending.BACKEND = 'creme.emails.tests.test_campaign_sender.RefusingEmailBackend'
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        EmailSending.BACKEND = cls._original_backend
+
+    def _create_sending(self, campaign_name, recipients, config_item=None):
+        user = self.get_root_user()
+        sending = EmailSending.objects.create(
+            config_item=config_item or EmailSendingConfigItem.objects.get_or_create(
+                name='Config #1', defaults={'host': 'smtp.mydomain.org'},
+            )[0],
+            sender='vicious@reddragons.mrs',
+            campaign=EmailCampaign.objects.create(user=user, name=campaign_name),
+            type=EmailSending.Type.IMMEDIATE,
+            sending_date=now(),
+            subject='Subject',
+            body='My body is ready!',
+        )
+
+        for recipient in recipients:
+            LightWeightEmail(
+                sending=sending,
+                sender=sending.sender,
+                recipient=recipient,
+                sending_date=sending.sending_date,
+            ).genid_n_save()
+
+        return sending
+
+    def test_run(self):
+        sending1 = self._create_sending(
+            'Camp #1', ['spike@bebop.mrs', 'jet@bebop.mrs', 'faye@bebop.mrs'],
+        )
+        sending2 = self._create_sending('Camp #2', ['vicious@reddragons.mrs'])
+
+        # NB: one worker => the messages are sent in order
+        statuses = CampaignSender([sending1, sending2], workers=1, chunk_size=2).run()
+        self.assertDictEqual({sending1.id: None, sending2.id: None}, statuses)
+
+        # The sendings are served in turn
+        recipients = [message.to[0] for message in django_mail.outbox]
+        self.assertEqual(4, len(recipients))
+        self.assertEqual('vicious@reddragons.mrs', recipients[2])
+
+        self.assertFalse(LightWeightEmail.objects.exclude(status=LightWeightEmail.Status.SENT))
+
+        sending1 = self.refresh(sending1)
+        self.assertEqual(3, sending1.sent_count)
+        self.assertEqual(0, sending1.errors_count)
+        self.assertIsNotNone(sending1.sending_duration)
+        self.assertEqual(1, self.refresh(sending2).sent_count)
+
+    def test_run__errors(self):
+        sending = self._create_sending(
+            'Camp #1', ['spike@bebop.mrs', 'invalid@bebop.mrs'],
+        )
+
+        with self.assertLogs(level='WARNING'):
+            statuses = CampaignSender([sending], workers=2).run()
+        self.assertDictEqual({sending.id: None}, statuses)
+        self.assertEqual(1, len(django_mail.outbox))
+
+        mail = self.get_object_or_fail(LightWeightEmail, recipient='invalid@bebop.mrs')
+        self.assertEqual(LightWeightEmail.Status.SENDING_ERROR, mail.status)
+
+        sending = self.refresh(sending)
+        self.assertEqual(1, sending.sent_count)
+        self.assertEqual(1, sending.errors_count)
+
+        # The emails in error are sent again
+        django_mail.outbox.clear()
+        mail.recipient = 'ed@bebop.mrs'
+        mail.save()
+        self.assertIsNone(sending.send_mails())
+        self.assertListEqual(['ed@bebop.mrs'], [m.to[0] for m in django_mail.outbox])
+        self.assertEqual(2, self.refresh(sending).sent_count)
+
+    def test_run__disconnection(self):
+        "A broken connection is replaced."
+        sending = self._create_sending(
+            'Camp #1', ['spike@bebop.mrs', 'jet@bebop.mrs', 'faye@bebop.mrs'],
+        )
+
+        EmailSending.BACKEND = (
+            'creme.emails.tests.test_campaign_sender.DisconnectingEmailBackend'
+        )
+        DisconnectingEmailBackend.disconnections = 1
+
+        try:
+            with self.assertLogs(level='WARNING'):
+                statuses = CampaignSender([sending], workers=1).run()
+        finally:
+            EmailSending.BACKEND = (
+                'creme.emails.tests.test_campaign_sender.RefusingEmailBackend'
+            )
+
+        self.assertDictEqual({sending.id: None}, statuses)
+        self.assertEqual(2, len(django_mail.outbox))
+
+        mail = self.get_alone_element(
+            LightWeightEmail.objects.filter(status=LightWeightEmail.Status.SENDING_ERROR)
+        )
+        self.assertNotIn(mail.recipient, [message.to[0] for message in django_mail.outbox])
+
+        sending = self.refresh(sending)
+        self.assertEqual(2, sending.sent_count)
+        self.assertEqual(1, sending.errors_count)
+
+    def test_run__no_mail_sent(self):
+        sending = self._create_sending('Camp #1', ['invalid@bebop.mrs'])
+
+        with self.assertLogs(level='WARNING'):
+            status = sending.send_mails()
+
+        self.assertEqual(EmailSending.State.ERROR, status)
+
+    def test_run__no_config(self):
+        sending = self._create_sending('Camp #1', ['spike@bebop.mrs'])
+        sending.config_item.delete()
+
+        with self.assertLogs(level='WARNING'):
+            statuses = CampaignSender([self.refresh(sending)]).run()
+
+        self.assertDictEqual({sending.id: EmailSending.State.ERROR}, statuses)
+        self.assertFalse(django_mail.outbox)
@@ -1,5 +1,6 @@
 from datetime import timedelta
 from functools import partial
+from unittest.mock import patch
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
@@ -839,7 +840,19 @@ class EmailSendingCreationTestCase(BrickTestCaseMixin, _EmailsTestCase):
         self.assertEqual(job, jobs[0][0])
 
         queue.clear()
-        self._send_mails(job)
+
+        # NB: the connections are not attached to the messages
+        connections = []
+        get_connection = EmailSending.get_connection
+
+        def spy_get_connection(this):
+            connection = get_connection(this)
+            connections.append(connection)
+
+            return connection
+
+        with patch.object(EmailSending, 'get_connection', spy_get_connection):
+            self._send_mails(job)
 
         with self.assertNoException():
             sending = camp.sendings_set.all()[0]
@@ -857,7 +870,7 @@ class EmailSendingCreationTestCase(BrickTestCaseMixin, _EmailsTestCase):
         self.assertFalse(message.attachments)
 
         # See 'creme.creme_core.utils.test.EmailBackend'
-        connection = message.connection  # DEPRECATED
+        connection = connections[0]
         self.assertHasAttr(connection, 'kwargs')
         self.assertFalse(connection.args)
         self.assertDictEqual(
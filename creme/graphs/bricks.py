@@ -17,6 +17,7 @@
 ################################################################################
 
 import logging
+from collections import defaultdict
 
 from django.utils.functional import partition
 from django.utils.translation import gettext
@@ -27,6 +28,7 @@ from creme.sketch.bricks import ChartBrick
 
 from . import get_graph_model
 from .models import RootNode
+from .traversal import GraphTraversal
 
 logger = logging.getLogger(__name__)
 Graph = get_graph_model()
@@ -57,57 +59,57 @@ class RelationsChartBrickMixin:
             "edgeColors": self.edge_color_range,
         }
 
-    def get_relations_chart_data(self, graph, user):
-        root_nodes = graph.get_root_nodes(user)
-        orbital_entities = {}
-
-        for node in root_nodes:
-            root_entity = node.real_entity
-            relations = sorted(
-                graph.get_root_node_relations(node, user),
-                key=lambda r: r.type.id
-            )
-
-            yield {
-                'id': root_entity.pk,
-                'label': str(root_entity),
-                'url': root_entity.get_absolute_url()
-            }
-
-            for relation in relations:
-                entity = orbital_entities.get(relation.object_entity_id)
+    # Limits of the traversal (see 'creme.graphs.traversal.GraphTraversal')
+    max_depth = 1
+    max_fanout = 0
+    max_nodes = GraphTraversal.max_nodes
 
-                if entity is None:
-                    entity = relation.real_object
-                    orbital_entities[relation.object_entity_id] = entity
-
-                yield {
-                    'id': entity.pk,
-                    'parent': root_entity.pk,
-                    'label': str(entity),
-                    'relation': {
-                        'label': str(relation.type.predicate),
-                        'id': relation.type.id,
-                    },
-                    'url': entity.get_absolute_url(),
-                }
+    def get_graph_traversal(self):
+        return GraphTraversal(
+            max_depth=self.max_depth,
+            max_fanout=self.max_fanout,
+            max_nodes=self.max_nodes,
+        )
 
-        orbital_relations = graph.get_orbital_relations(limit_to=orbital_entities.keys())
+    def get_relations_chart_data(self, graph, user):
+        data = self.get_graph_traversal().get_data(graph=graph, user=user)
+        nodes = {node['id']: node for node in data['nodes']}
+        root_edges = defaultdict(list)
+        orbital_edges = []
+
+        for edge in data['edges']:
+            if edge['orbital']:
+                orbital_edges.append(edge)
+            else:
+                root_edges[edge['source']].append(edge)
+
+        def edge_item(edge):
+            node = nodes[edge['target']]
+
+            return {
+                'id': node['id'],
+                'parent': edge['source'],
+                'label': node['label'],
+                'relation': edge['relation'],
+                'url': node['url'],
+            }
 
-        for relation in orbital_relations:
-            entity = orbital_entities[relation.object_entity_id]
+        for node in data['nodes']:
+            if not node['root']:
+                continue
 
             yield {
-                'id': relation.object_entity_id,
-                'parent': relation.subject_entity_id,
-                'label': str(entity),
-                'relation': {
-                    'label': str(relation.type.predicate),
-                    'id': relation.type.id,
-                },
-                'url': entity.get_absolute_url(),
+                'id': node['id'],
+                'label': node['label'],
+                'url': node['url'],
             }
 
+            for edge in sorted(root_edges[node['id']], key=lambda e: e['relation']['id']):
+                yield edge_item(edge)
+
+        for edge in orbital_edges:
+            yield edge_item(edge)
+
 
 # class RelationChartBrick(ChartBrick):
 class RelationChartBrick(RelationsChartBrickMixin, ChartBrick):
@@ -0,0 +1,214 @@
+from functools import partial
+
+from django.core.cache import caches
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from creme.creme_core.models import (
+    FakeContact,
+    FakeOrganisation,
+    Relation,
+    RelationType,
+)
+from creme.creme_core.tests.base import CremeTestCase
+from creme.graphs.models import RootNode
+from creme.graphs.traversal import GraphTraversal, radial_layout
+
+from .test_main import Graph, skipIfCustomGraph
+
+
+@skipIfCustomGraph
+class GraphTraversalTestCase(CremeTestCase):
+    def _build_graph(self, user):
+        self.is_employee = is_employee = RelationType.objects.builder(
+            id='test-subject_employee', predicate='is employed by',
+        ).symmetric(id='test-object_employee', predicate='has employee').get_or_create()[0]
+        self.has_employee = has_employee = is_employee.symmetric_type
+
+        self.is_managed = is_managed = RelationType.objects.builder(
+            id='test-subject_manager', predicate='is managed by',
+        ).symmetric(id='test-object_manager', predicate='manages').get_or_create()[0]
+
+        self.orga = orga = FakeOrganisation.objects.create(user=user, name='NERV')
+
+        create_contact = partial(FakeContact.objects.create, user=user)
+        self.contact1 = contact1 = create_contact(first_name='Rei',    last_name='Ayanami')
+        self.contact2 = contact2 = create_contact(first_name='Asuka',  last_name='Langley')
+        self.contact3 = contact3 = create_contact(first_name='Misato', last_name='Katsuragi')
+        self.contact4 = contact4 = create_contact(first_name='Gendo',  last_name='Ikari')
+
+        create_rel = partial(Relation.objects.create, user=user)
+        for contact in (contact1, contact2, contact3):
+            create_rel(subject_entity=contact, type=is_employee, object_entity=orga)
+
+        create_rel(subject_entity=contact1, type=is_managed, object_entity=contact3)
+        create_rel(subject_entity=contact2, type=is_managed, object_entity=contact3)
+        create_rel(subject_entity=contact3, type=is_managed, object_entity=contact4)
+
+        graph = Graph.objects.create(user=user, name='Managers')
+        graph.orbital_relation_types.set([is_managed])
+
+        node = RootNode.objects.create(graph=graph, real_entity=orga)
+        node.relation_types.set([has_employee])
+
+        return graph
+
+    def test_traverse(self):
+        graph = self._build_graph(self.get_root_user())
+        orga = self.orga
+        contact1 = self.contact1
+        contact2 = self.contact2
+        contact3 = self.contact3
+
+        subgraph = GraphTraversal().traverse(graph)
+        self.assertListEqual([orga.id], subgraph.root_ids)
+        self.assertDictEqual(
+            {orga.id: 0, contact1.id: 1, contact2.id: 1, contact3.id: 1},
+            subgraph.depths,
+        )
+        self.assertCountEqual(
+            [
+                (orga.id, contact1.id, self.has_employee.id, False),
+                (orga.id, contact2.id, self.has_employee.id, False),
+                (orga.id, contact3.id, self.has_employee.id, False),
+                (contact1.id, contact3.id, self.is_managed.id, True),
+                (contact2.id, contact3.id, self.is_managed.id, True),
+            ],
+            subgraph.edges,
+        )
+        self.assertFalse(subgraph.truncated)
+
+    def test_traverse__depth(self):
+        graph = self._build_graph(self.get_root_user())
+        contact3 = self.contact3
+        contact4 = self.contact4
+
+        subgraph = GraphTraversal(max_depth=3).traverse(graph)
+        self.assertEqual(2, subgraph.depths.get(contact4.id))
+        self.assertIn((contact3.id, contact4.id, self.is_managed.id, True), subgraph.edges)
+        self.assertEqual(6, len(subgraph.edges))
+
+        with self.assertRaises(ValueError):
+            GraphTraversal(max_depth=0)
+
+    def test_traverse__limits(self):
+        graph = self._build_graph(self.get_root_user())
+
+        subgraph1 = GraphTraversal(max_fanout=1).traverse(graph)
+        self.assertTrue(subgraph1.truncated)
+        self.assertDictEqual({self.orga.id: 0, self.contact1.id: 1}, subgraph1.depths)
+
+        subgraph2 = GraphTraversal(max_nodes=3).traverse(graph)
+        self.assertTrue(subgraph2.truncated)
+        self.assertEqual(3, len(subgraph2.depths))
+
+    def test_get_data(self):
+        user = self.get_root_user()
+        graph = self._build_graph(user)
+        orga = self.orga
+        contact1 = self.contact1
+
+        data = GraphTraversal().get_data(graph=graph, user=user, layout='radial')
+        self.assertFalse(data['truncated'])
+
+        nodes = data['nodes']
+        self.assertEqual(4, len(nodes))
+        self.assertDictEqual(
+            {
+                'id': orga.id,
+                'label': str(orga),
+                'url': orga.get_absolute_url(),
+                'depth': 0,
+                'root': True,
+            },
+            nodes[0],
+        )
+        self.assertIn(
+            {
+                'source': orga.id,
+                'target': contact1.id,
+                'relation': {
+                    'id': self.has_employee.id,
+                    'label': str(self.has_employee.predicate),
+                },
+                'orbital': False,
+            },
+            data['edges'],
+        )
+        self.assertEqual((0.0, 0.0), data['layout'][orga.id])
+        self.assertEqual(4, len(data['layout']))
+
+    def test_get_data__credentials(self):
+        user = self.create_user(
+            role=self.create_role(allowed_apps=['creme_core', 'graphs']),
+        )
+        self.add_credentials(user.role, own='*')
+
+        graph = self._build_graph(user)
+        other_user = self.get_root_user()
+        self.contact3.user = other_user
+        self.contact3.save()
+
+        data = GraphTraversal().get_data(graph=graph, user=user)
+        self.assertCountEqual(
+            [self.orga.id, self.contact1.id, self.contact2.id],
+            [node['id'] for node in data['nodes']],
+        )
+        self.assertEqual(2, len(data['edges']))
+
+        # Deleted root
+        self.orga.trash()
+        data = GraphTraversal().get_data(graph=graph, user=user)
+        self.assertListEqual([], data['nodes'])
+        self.assertListEqual([], data['edges'])
+
+    def test_radial_layout(self):
+        graph = self._build_graph(self.get_root_user())
+        positions = radial_layout(GraphTraversal().traverse(graph), ring_step=10)
+        self.assertEqual((0.0, 0.0), positions[self.orga.id])
+
+        for contact in (self.contact1, self.contact2, self.contact3):
+            x, y = positions[contact.id]
+            self.assertAlmostEqual(10, (x ** 2 + y ** 2) ** 0.5, places=1)
+
+    @override_settings(SHARED_CACHE_ALIAS='default', SHARED_CACHE_TIMEOUT=60)
+    def test_shared_cache(self):
+        caches['default'].clear()
+        graph = self._build_graph(self.get_root_user())
+
+        traversal = GraphTraversal()
+        subgraph1 = traversal.get_subgraph(graph)
+        self.assertEqual(4, len(subgraph1.depths))
+
+        self.clear_global_info()
+        with self.assertNumQueries(0):
+            subgraph2 = traversal.get_subgraph(graph)
+        self.assertDictEqual(subgraph1.depths, subgraph2.depths)
+
+        Relation.objects.create(
+            user=self.get_root_user(),
+            subject_entity=self.contact4, type=self.is_employee, object_entity=self.orga,
+        )
+        self.clear_global_info()
+        self.assertEqual(5, len(traversal.get_subgraph(graph).depths))
+
+    def test_view(self):
+        user = self.login_as_root_and_get()
+        graph = self._build_graph(user)
+
+        url = reverse('graphs__graph_data', args=(graph.id,))
+        data = self.assertGET200(url, data={'depth': 2, 'layout': 'radial'}).json()
+        self.assertEqual(5, len(data['nodes']))
+        self.assertEqual(6, len(data['edges']))
+        self.assertIn(str(self.contact4.id), data['layout'])
+
+        self.assertGET404(url, data={'depth': 0})
+        self.assertGET404(url, data={'depth': 'nan'})
+        self.assertGET404(url, data={'layout': 'invalid'})
+
+    def test_view__forbidden(self):
+        user = self.login_as_standard(allowed_apps=['graphs'])
+        self.add_credentials(user.role, own='*')
+
+        graph = Graph.objects.create(user=self.get_root_user(), name='Managers')
+        self.assertGET403(reverse('graphs__graph_data', args=(graph.id,)))
@@ -0,0 +1,403 @@
+################################################################################
+#    Creme is a free/open-source Customer Relationship Management software
+#    Copyright (C) 2026  Hybird
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+
+"""Traversal of the relationships of a Graph.
+
+The traversal is a breadth-first search, performed level by level:
+  - level 1: the relationships of the root nodes (with the types of each root).
+  - level 2 & more (see "max_depth"): the relationships of the entities found
+    at the previous level, with the peripheral types of the Graph.
+Each level is retrieved with a few queries (by batches of entities) ; the
+number of relationships per entity & the total number of nodes can be limited.
+
+The resulting structure (IDs only) is independent of the user; it's stored in
+the shared cache (see 'creme_core.core.shared_cache'), as the optional layout.
+The credentials & the labels are applied when the data are built, so they are
+always up-to-date.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from itertools import batched
+
+from django.conf import settings
+from django.db.models import F, Value, Window
+from django.db.models.functions import RowNumber
+
+from creme.creme_core.core.shared_cache import shared_cache
+from creme.creme_core.models import CremeEntity, Relation, RelationType
+
+from .models import AbstractGraph, RootNode
+
+
+class Subgraph:
+    """Structure of a Graph: IDs of the nodes & edges (no instance of entity).
+    It's picklable, in order to be stored in the shared cache.
+    """
+    def __init__(self, root_ids: Iterable[int] = ()):
+        self.root_ids: list[int] = [*root_ids]
+        # Depth of each node (0 for the roots), in the order of discovery
+        self.depths: dict[int, int] = dict.fromkeys(self.root_ids, 0)
+        # Tuples (subject_id, object_id, relation_type_id, is_orbital)
+        self.edges: list[tuple[int, int, str, bool]] = []
+        # IDs of the entities which are objects of an edge
+        self.reached: set[int] = set()
+        # <True> means that some relationships have been ignored (limits)
+        self.truncated: bool = False
+
+    def __repr__(self):
+        return (
+            f'Subgraph(roots={self.root_ids}, nodes={len(self.depths)}, '
+            f'edges={len(self.edges)}, truncated={self.truncated})'
+        )
+
+
+def radial_layout(subgraph: Subgraph, ring_step: float = 100.0) -> dict[int, tuple[float, float]]:
+    """Place the nodes on concentric circles (one circle per depth) ; the nodes
+    are sorted by the angle of their parent, to limit the crossings of edges.
+    @return: A dictionary {node_id: (x, y)}.
+    """
+    parents = {}
+    for subject_id, object_id, __, __ in subgraph.edges:
+        parents.setdefault(object_id, subject_id)
+
+    rings = defaultdict(list)
+    for node_id, depth in subgraph.depths.items():
+        rings[depth].append(node_id)
+
+    angles = {}
+    positions = {}
+
+    for depth, node_ids in sorted(rings.items()):
+        if depth:
+            node_ids.sort(key=lambda n_id: (angles.get(parents.get(n_id), 0.0), n_id))
+            radius = ring_step * depth
+        else:
+            radius = 0.0 if len(node_ids) == 1 else ring_step / 2
+
+        step = 2 * math.pi / len(node_ids)
+
+        for index, node_id in enumerate(node_ids):
+            angles[node_id] = angle = index * step
+            positions[node_id] = (
+                round(radius * math.cos(angle), 2),
+                round(radius * math.sin(angle), 2),
+            )
+
+    return positions
+
+
+class GraphTraversal:
+    """Retrieve the nodes & the edges of a Graph with bounded breadth-first search.
+
+    Usage:
+        traversal = GraphTraversal(max_depth=2)
+        data = traversal.get_data(graph=graph, user=user, layout='radial')
+    """
+    # Number of levels of relationships (1 => the relationships of the root nodes,
+    # & the peripheral relationships between the entities found).
+    max_depth: int = 1
+    # Maximum number of relationships followed per entity & per level (0 => no limit).
+    max_fanout: int = 0
+    # Maximum number of nodes (0 => no limit).
+    max_nodes: int = 2000
+
+    # Size of the batches of entities' IDs in the queries
+    batch_size: int = 500
+    # Duration (in seconds) of the structures in the shared cache (None => default timeout)
+    cache_timeout: int | None = None
+    cache_models = (
+        Relation, RelationType, 'graphs.RootNode', settings.GRAPHS_GRAPH_MODEL,
+    )
+
+    layouts: dict[str, Callable[[Subgraph], dict[int, tuple[float, float]]]] = {
+        'radial': radial_layout,
+    }
+
+    def __init__(self, *,
+                 max_depth: int | None = None,
+                 max_fanout: int | None = None,
+                 max_nodes: int | None = None,
+                 ):
+        """Constructor.
+        @param max_depth: See the attribute "max_depth" (the class' value by default).
+        @param max_fanout: See the attribute "max_fanout" (the class' value by default).
+        @param max_nodes: See the attribute "max_nodes" (the class' value by default).
+        """
+        if max_depth is not None:
+            self.max_depth = max_depth
+
+        if max_fanout is not None:
+            self.max_fanout = max_fanout
+
+        if max_nodes is not None:
+            self.max_nodes = max_nodes
+
+        if self.max_depth < 1:
+            raise ValueError(f'GraphTraversal: invalid depth: {self.max_depth}')
+
+    @property
+    def cache_key(self) -> str:
+        return f'graphs-subgraph-{self.max_depth}-{self.max_fanout}-{self.max_nodes}'
+
+    def _relations_rows(self,
+                        subject_ids: Iterable[int],
+                        rtype_ids: Iterable[str],
+                        limited: bool = True,
+                        ) -> Iterator[tuple[int, int, str, int]]:
+        "Yield tuples (subject_id, object_id, relation_type_id, rank)."
+        rtype_ids = [*rtype_ids]
+        fanout = self.max_fanout if limited else 0
+
+        for ids_batch in batched(subject_ids, self.batch_size):
+            qs = Relation.objects.filter(subject_entity__in=ids_batch, type__in=rtype_ids)
+
+            if fanout:
+                # NB: we retrieve one additional relationship per entity, in
+                #     order to know if the result is truncated.
+                qs = qs.annotate(
+                    rank=Window(
+                        RowNumber(),
+                        partition_by=F('subject_entity'),
+                        order_by=F('id').asc(),
+                    ),
+                ).filter(rank__lte=fanout + 1)
+            else:
+                qs = qs.annotate(rank=Value(1))
+
+            yield from qs.order_by('id').values_list(
+                'subject_entity_id', 'object_entity_id', 'type_id', 'rank',
+            )
+
+    def _add_level(self,
+                   subgraph: Subgraph,
+                   criteria: Iterable[tuple[Iterable[int], Iterable[str]]],
+                   depth: int,
+                   orbital: bool,
+                   ) -> set[int]:
+        """Retrieve the relationships of some entities & add them in the subgraph.
+        @param criteria: Pairs (subject_ids, relation_type_ids).
+        @return: The IDs of the entities which have been reached for the first time.
+        """
+        depths = subgraph.depths
+        reached = subgraph.reached
+        edges = subgraph.edges
+        fanout = self.max_fanout
+        max_nodes = self.max_nodes
+        new_ids = set()
+
+        for subject_ids, rtype_ids in criteria:
+            for subject_id, object_id, rtype_id, rank in self._relations_rows(
+                subject_ids, rtype_ids,
+            ):
+                if fanout and rank > fanout:
+                    subgraph.truncated = True
+                    continue
+
+                if object_id not in depths:
+                    if max_nodes and len(depths) >= max_nodes:
+                        subgraph.truncated = True
+                        continue
+
+                    depths[object_id] = depth
+
+                edges.append((subject_id, object_id, rtype_id, orbital))
+
+                if object_id not in reached:
+                    reached.add(object_id)
+                    new_ids.add(object_id)
+
+        return new_ids
+
+    def traverse(self, graph: AbstractGraph) -> Subgraph:
+        """Compute the structure of a Graph (no credentials are checked).
+        @param graph: Instance of Graph.
+        @return: An instance of Subgraph.
+        """
+        roots = [
+            *RootNode.objects.filter(graph=graph.id)
+                             .order_by('id')
+                             .prefetch_related('relation_types')
+        ]
+        subgraph = Subgraph(root_ids=[root.entity_id for root in roots])
+
+        # NB: the roots are grouped by types of relationship, to reduce the
+        #     number of queries.
+        roots_per_rtypes = defaultdict(list)
+        for root in roots:
+            rtype_ids = frozenset(rtype.id for rtype in root.relation_types.all())
+            if rtype_ids:
+                roots_per_rtypes[rtype_ids].append(root.entity_id)
+
+        frontier = self._add_level(
+            subgraph,
+            criteria=[(ids, rtype_ids) for rtype_ids, ids in roots_per_rtypes.items()],
+            depth=1, orbital=False,
+        )
+
+        orbital_rtype_ids = [*graph.orbital_relation_types.values_list('id', flat=True)]
+        if not orbital_rtype_ids:
+            return subgraph
+
+        expanded = set()
+        for depth in range(2, self.max_depth + 1):
+            if not frontier:
+                break
+
+            expanded.update(frontier)
+            frontier = self._add_level(
+                subgraph,
+                criteria=[(sorted(frontier), orbital_rtype_ids)],
+                depth=depth, orbital=True,
+            )
+
+        # Peripheral relationships between the entities which have not been expanded
+        reached = subgraph.reached
+        edges = subgraph.edges
+        edges.extend(
+            (subject_id, object_id, rtype_id, True)
+            for subject_id, object_id, rtype_id, __ in self._relations_rows(
+                sorted(reached - expanded), orbital_rtype_ids, limited=False,
+            ) if object_id in reached
+        )
+
+        return subgraph
+
+    def get_subgraph(self, graph: AbstractGraph) -> Subgraph:
+        "Version of traverse() which uses the shared cache."
+        return shared_cache.get_or_compute(
+            key=f'{self.cache_key}-{graph.id}',
+            models=self.cache_models,
+            compute=lambda: self.traverse(graph),
+            timeout=self.cache_timeout,
+        )
+
+    def get_layout(self, graph: AbstractGraph, subgraph: Subgraph, name: str,
+                   ) -> dict[int, tuple[float, float]]:
+        """Compute the positions of the nodes (the result is cached).
+        @param name: Name of a layout ; see the attribute "layouts".
+        @raise KeyError: Unknown layout.
+        """
+        layout = self.layouts[name]
+
+        return shared_cache.get_or_compute(
+            key=f'{self.cache_key}-{graph.id}-layout-{name}',
+            models=self.cache_models,
+            compute=lambda: layout(subgraph),
+            timeout=self.cache_timeout,
+        )
+
+    @staticmethod
+    def _get_entities(node_ids: Iterable[int], batch_size: int) -> dict[int, CremeEntity]:
+        entities = {}
+        for ids_batch in batched(node_ids, batch_size):
+            entities.update(CremeEntity.objects.in_bulk(ids_batch))
+
+        CremeEntity.populate_real_entities([*entities.values()])
+
+        return {e_id: entity.get_real_entity() for e_id, entity in entities.items()}
+
+    def get_data(self, graph: AbstractGraph, user, layout: str = '') -> dict:
+        """Get the "JSONifiable" data of a Graph, for the given user.
+        The entities which cannot be viewed by the user (& the deleted roots)
+        are removed, like the entities which are only reachable through them.
+        @param graph: Instance of Graph.
+        @param user: Instance of <contrib.auth.get_user_model()>.
+        @param layout: Name of a layout (see the attribute "layouts") ; empty
+               string means no layout.
+        @return: A dictionary with the keys "nodes", "edges", "truncated" &
+                 "layout" (if a layout is requested).
+        """
+        subgraph = self.get_subgraph(graph)
+        entities = self._get_entities(subgraph.depths.keys(), self.batch_size)
+
+        has_perm_to_view = user.has_perm_to_view
+        visible_ids = {
+            e_id for e_id, entity in entities.items() if has_perm_to_view(entity)
+        }
+        root_ids = [
+            root_id for root_id in subgraph.root_ids
+            if root_id in visible_ids and not entities[root_id].is_deleted
+        ]
+
+        adjacency = defaultdict(list)
+        for edge in subgraph.edges:
+            if edge[0] in visible_ids and edge[1] in visible_ids:
+                adjacency[edge[0]].append(edge)
+
+        # Breadth-first search in memory, to remove the unreachable nodes
+        kept_ids = set(root_ids)
+        kept_edges = []
+        frontier = root_ids
+        while frontier:
+            next_frontier = []
+
+            for node_id in frontier:
+                for edge in adjacency[node_id]:
+                    kept_edges.append(edge)
+                    object_id = edge[1]
+
+                    if object_id not in kept_ids:
+                        kept_ids.add(object_id)
+                        next_frontier.append(object_id)
+
+            frontier = next_frontier
+
+        rtypes = RelationType.objects.in_bulk({edge[2] for edge in kept_edges})
+        depths = subgraph.depths
+
+        def node_data(node_id):
+            entity = entities[node_id]
+            return {
+                'id': node_id,
+                'label': str(entity),
+                'url': entity.get_absolute_url(),
+                'depth': depths[node_id],
+                'root': depths[node_id] == 0,
+            }
+
+        data = {
+            'nodes': [node_data(node_id) for node_id in depths if node_id in kept_ids],
+            'edges': [
+                {
+                    'source': subject_id,
+                    'target': object_id,
+                    'relation': {
+                        'id': rtype_id,
+                        'label': str(rtypes[rtype_id].predicate),
+                    },
+                    'orbital': orbital,
+                } for subject_id, object_id, rtype_id, orbital in kept_edges
+            ],
+            'truncated': subgraph.truncated,
+        }
+
+        if layout:
+            positions = self.get_layout(graph, subgraph, layout)
+            data['layout'] = {
+                node_id: positions[node_id]
+                for node_id in depths if node_id in kept_ids
+            }
+
+        return data
+
+
+shared_cache.register(*GraphTraversal.cache_models)
@@ -16,6 +16,11 @@ urlpatterns = [
         graph.RelationTypeRemoving.as_view(),
         name='graphs__remove_rtype',
     ),
+    re_path(
+        r'^graph/(?P<graph_id>\d+)/data[/]?$',
+        graph.GraphData.as_view(),
+        name='graphs__graph_data',
+    ),
 
     re_path(
         r'^graph/(?P<graph_id>\d+)/roots/add[/]?$',
@@ -17,15 +17,18 @@
 ################################################################################
 
 from django.db.transaction import atomic
+from django.http import Http404
 from django.utils.translation import gettext_lazy as _
 
 from creme.creme_core.core.workflow import run_workflow_engine
-from creme.creme_core.utils import get_from_POST_or_404
+from creme.creme_core.http import CremeJsonResponse
+from creme.creme_core.utils import get_from_GET_or_404, get_from_POST_or_404
 from creme.creme_core.views import generic
 
 from .. import custom_forms, get_graph_model
 from ..constants import DEFAULT_HFILTER_GRAPH
 from ..forms.graph import AddRelationTypesForm
+from ..traversal import GraphTraversal
 
 Graph = get_graph_model()
 
@@ -55,6 +58,49 @@ class GraphDetail(generic.EntityDetail):
     pk_url_kwarg = 'graph_id'
 
 
+class GraphData(generic.base.EntityRelatedMixin, generic.CheckedView):
+    """Nodes & edges of a Graph, in JSON (for the rendering by the browser).
+    GET arguments:
+      - "depth": number of levels of relationships (1 by default, see "max_depth").
+      - "layout": name of a layout computed by the server (optional ; see
+        'creme.graphs.traversal.GraphTraversal.layouts').
+    """
+    response_class = CremeJsonResponse
+    permissions = 'graphs'
+    entity_classes = Graph
+    entity_id_url_kwarg = 'graph_id'
+
+    depth_arg = 'depth'
+    layout_arg = 'layout'
+    max_depth = 5
+
+    traversal_class = GraphTraversal
+
+    def check_related_entity_permissions(self, entity, user):
+        user.has_perm_to_view_or_die(entity)
+
+    def get_traversal(self):
+        depth = get_from_GET_or_404(
+            self.request.GET, key=self.depth_arg, cast=int, default=1,
+        )
+        if not 1 <= depth <= self.max_depth:
+            raise Http404(f'The depth must be between 1 & {self.max_depth}')
+
+        return self.traversal_class(max_depth=depth)
+
+    def get(self, request, *args, **kwargs):
+        traversal = self.get_traversal()
+        layout = request.GET.get(self.layout_arg, '')
+        if layout and layout not in traversal.layouts:
+            raise Http404(f'Unknown layout: {layout}')
+
+        return self.response_class(
+            traversal.get_data(
+                graph=self.get_related_entity(), user=request.user, layout=layout,
+            ),
+        )
+
+
 class GraphEdition(generic.EntityEdition):
     model = Graph
     form_class = custom_forms.GRAPH_EDITION_CFORM
@@ -0,0 +1,4 @@
+var LANGUAGE_CODE="fr";var LANGUAGE_BIDI=false;'use strict';{const globals=this;const django=globals.django||(globals.django={});django.pluralidx=function(n){const v=(n>1);if(typeof v==='boolean'){return v?1:0;}else{return v;}};django.catalog=django.catalog||{};const newcatalog={" %d entity cannot be deleted.":["%d entit\u00e9 n'a pu \u00eatre supprim\u00e9e.","%d entit\u00e9s n'ont pu \u00eatre supprim\u00e9es."],"%0$d address from":["%0$d adresse de","%0$d adresses de"],"%0$d of":["%0$d adresse de","%0$d adresses de"],"%d email cannot be deleted.":["%d e-mail ne peut pas \u00eatre supprim\u00e9.","%d e-mails ne peuvent pas \u00eatre supprim\u00e9s."],"%d email cannot be synchronised.":["%d e-mail ne peut pas \u00eatre synchronis\u00e9.","%d e-mails ne peuvent pas \u00eatre synchronis\u00e9s."],"%d email has been deleted":["%d e-mail a \u00e9t\u00e9 supprim\u00e9","%d e-mails ont \u00e9t\u00e9 supprim\u00e9s"],"%d email has been synchronised":["%d e-mail a \u00e9t\u00e9 synchronis\u00e9","%d e-mails ont \u00e9t\u00e9 synchronis\u00e9s"],"%d entity has been deleted.":["%d entit\u00e9 a \u00e9t\u00e9 supprim\u00e9e.","%d entit\u00e9s ont \u00e9t\u00e9 supprim\u00e9es."],"%d hidden item":["%d \u00e9l\u00e9ment masqu\u00e9","%d \u00e9l\u00e9ments masqu\u00e9s"],"%d minute ago":["Il y %d minute","Il y %d minutes"],"%d result of %d":["%d r\u00e9sultat sur %d","%d r\u00e9sultats sur %d"],"%d selection":["%d s\u00e9lection","%d s\u00e9lections"],"%s result(s) on %s":"%s r\u00e9sultat(s) sur %s","(with %d selection)":["(dont %d s\u00e9lection)","(dont %d s\u00e9lections)"],"A few moments ago":"Il y a quelques instants","Action":"Action","Add":"Ajouter","Add entries":"Ajouter des entr\u00e9es","Advanced search":"Recherche avanc\u00e9e","Alert":"Alerte","All":"Tout","All day":"Toute la journ\u00e9e","All menu entries are already used.":"Toutes les entr\u00e9es de menu sont d\u00e9j\u00e0 utilis\u00e9es.","All results (%s)":"Tous les r\u00e9sultats (%s)","An error happened when retrieving notifications (%s)":"Une erreur est survenue lors de la r\u00e9cup\u00e9ration des notifications (%s)","Are you sure?":"\u00cates-vous s\u00fbr\u00a0?","Bad Request":"Requ\u00eate invalide","Best result":"Meilleur r\u00e9sultat","Calendar":"Calendrier","Cancel":"Annuler","Chose the type of entity to create":"Choisir le type de fiche \u00e0 cr\u00e9er","Close":"Fermer","Close (process in background)":"Fermer (laisser en t\u00e2che de fond)","Collapse %d item":["Masquer %d \u00e9l\u00e9ment","Masquer %d \u00e9l\u00e9ments"],"Communication error with the job manager (last changes have not been taken into consideration)":"Erreur de communication avec le gestionnaire de job (les derniers changements n'ont pas \u00e9t\u00e9 pris en compte)","Completed successfully":"Termin\u00e9 avec succ\u00e8s","Confirm":"Confirmation","Conflict":"Conflit","Connection Refused":"Connexion refus\u00e9e","Create new item \u00ab%s\u00bb":"Cr\u00e9er un \u00e9l\u00e9ment \u00ab%s\u00bb","Current year":"Ann\u00e9e courante","Day":"Jour","Delete":"Supprimer","Deselect":"D\u00e9-s\u00e9lectionner","Do you really want to clone this entity?":"Voulez-vous vraiment cloner cette fiche\u00a0?","Do you really want to close this project?":"Voulez vous vraiment fermer ce projet\u00a0?","Do you really want to restore initial values of this line?":"Voulez vous vraiment r\u00e9initialiser les valeurs de cette ligne\u00a0?","Drag and drop the columns to order them.":"Glissez-d\u00e9posez les colonnes pour les ordonner.","Entity #%s (not viewable)":"Fiche #%s (non visible)","Error":"Erreur","Error!":"Erreur\u00a0!","Error, please reload the page.":"Erreur, veuillez recharger la page.","Errors report":"Rapport d'erreurs","Export":"Export","Forbidden Access":"Interdit","HTTP server error":"Erreur du serveur HTTP","Hold down \u201cControl\u201d, or \u201cCommand\u201d on a Mac, to select more than one.":"Maintenez appuy\u00e9 \u00ab\u00a0Ctrl\u00a0\u00bb, ou \u00ab\u00a0Commande (touche pomme)\u00a0\u00bb sur un Mac, pour en s\u00e9lectionner plusieurs.","Internal Error":"Erreur interne","Loading more results\u2026":"Chargement de r\u00e9sultats suppl\u00e9mentaires\u2026","Loading\u2026":"Chargement\u2026","Manual location":"Localisation manuelle","Map":"Carte","Month":"Mois","More":"Plus","More than %d day ago":["Il y a plus de %d jour","Il y a plus de %d jours"],"More than %d hour ago":["Il y a plus de %d heure","Il y a plus de %d heures"],"New entries":"Nouvelles entr\u00e9es","No address from":"Aucune adresse de","No email is selected.":"Aucun e-mail n'est s\u00e9lectionn\u00e9.","No event to display":"Aucun \u00e9v\u00e8nement \u00e0 afficher","No matching location":"Non localis\u00e9","No result":"Aucun r\u00e9sultat","No selected view":"Aucune vue s\u00e9lectionn\u00e9e","None available":"Aucun disponible","None of":"Aucune adresse de","Not Acceptable":"Invalide","Not Found":"Non trouv\u00e9","Not localized":"Non localis\u00e9","Ok":"Ok","Organisation":"Soci\u00e9t\u00e9","Partially matching location":"Localisation incompl\u00e8te","Please delete %d character":["Supprimez %d caract\u00e8re","Supprimez %d caract\u00e8res"],"Please enter %d or more character":["Saisissez au moins %d caract\u00e8re","Saisissez au moins %d caract\u00e8res"],"Please select 2 entities.":"Veuillez s\u00e9lectionner 2 fiches.","Please select at least a line in order to export.":"Veuillez s\u00e9lectionner au moins une ligne pour pouvoir exporter.","Please select at least one email.":"Veuillez s\u00e9lectionner au moins un e-mail.","Please select at least one entity.":"Veuillez s\u00e9lectionner au moins une fiche.","Please select only one entity.":"Veuillez s\u00e9lectionner une seule fiche.","Preview":"Aper\u00e7u","Preview and order of the %s columns":"Aper\u00e7u et ordre des %s colonnes","Preview of the column":"Aper\u00e7u de la colonne","Reload the page or click here. If the problem persists, please contact your administrator.":"Rechargez la page ou cliquez ici. Si le probl\u00e8me persiste, veuillez contacter votre administrateur.","Remove all items":"Supprimer tous les s\u00e9lections","Remove item":"Supprimer l'\u00e9l\u00e9ment s\u00e9lectionn\u00e9","Remove the column '%s'":"Enlever la colonne '%s'","Save":"Enregistrer","Search":"Rechercher","Searching\u2026":"Recherche en cours\u2026","Select":"S\u00e9lectionner","Select %d row":["S\u00e9lectionnez %d ligne","S\u00e9lectionnez %d lignes"],"Select at least %d row":["S\u00e9lectionnez au moins %d ligne","S\u00e9lectionnez au moins %d lignes"],"Select no more than %d row":["Ne s\u00e9lectionnez pas plus de %d ligne","Ne s\u00e9lectionnez pas plus de %d lignes"],"Select the concerned organisation.":"S\u00e9lectionnez la soci\u00e9t\u00e9 concern\u00e9e.","Select the export format":"S\u00e9lectionnez le format d'export","Selection":"S\u00e9lection","Show more results":"Afficher plus de r\u00e9sultats","Some errors occurred.":"Des erreurs ont survenu.","The page will be reloaded!":"La page va \u00eatre recharg\u00e9e\u00a0!","The preview is empty. Select some fields and relationships to add some columns.":"L'aper\u00e7u est vide. S\u00e9lectionnez des champs et des relations pour y ajouter des colonnes.","The results could not be loaded.":"Les r\u00e9sultats ne peuvent pas \u00eatre charg\u00e9s.","There are some errors in your lines.":"Il y a des erreurs dans vos lignes.","Today":"Aujourd'hui","Unauthorized":"Non authentifi\u00e9","Validate":"Valider","Validate the selection":"Valider la s\u00e9lection","Warning":"Attention","Week":"Semaine","Year":"Ann\u00e9e","You can only select %d item":["Vous ne pouvez s\u00e9lectionner qu'un \u00e9l\u00e9ment","Vous ne pouvez s\u00e9lectionner que %d \u00e9l\u00e9ments"],"You do not have permission, the change will not be saved.":"Vous n'avez pas la permission, les changements ne seront pas sauv\u00e9s.","You modified your lines.":"Vous avez modifi\u00e9 vos lignes.","\u26a0":"\u26a0"};for(const key in newcatalog){django.catalog[key]=newcatalog[key];}
+if(!django.jsi18n_initialized){django.gettext=function(msgid){const value=django.catalog[msgid];if(typeof value==='undefined'){return msgid;}else{return(typeof value==='string')?value:value[0];}};django.ngettext=function(singular,plural,count){const value=django.catalog[singular];if(typeof value==='undefined'){return(count==1)?singular:plural;}else{return value.constructor===Array?value[django.pluralidx(count)]:value;}};django.gettext_noop=function(msgid){return msgid;};django.pgettext=function(context,msgid){let value=django.gettext(context+'\x04'+msgid);if(value.includes('\x04')){value=msgid;}
+return value;};django.npgettext=function(context,singular,plural,count){let value=django.ngettext(context+'\x04'+singular,context+'\x04'+plural,count);if(value.includes('\x04')){value=django.ngettext(singular,plural,count);}
+return value;};django.interpolate=function(fmt,obj,named){if(named){return fmt.replace(/%\(\w+\)s/g,function(match){return String(obj[match.slice(2,-2)])});}else{return fmt.replace(/%s/g,function(match){return String(obj.shift())});}};django.formats={"DATETIME_FORMAT":"j F Y H:i","DATETIME_INPUT_FORMATS":["%d/%m/%Y %H:%M:%S","%d/%m/%Y %H:%M:%S.%f","%d/%m/%Y %H:%M","%Y-%m-%d %H:%M:%S","%Y-%m-%d %H:%M:%S.%f","%Y-%m-%d %H:%M","%Y-%m-%d"],"DATE_FORMAT":"j F Y","DATE_INPUT_FORMATS":["%d/%m/%Y","%d/%m/%y","%Y-%m-%d"],"DECIMAL_SEPARATOR":",","FIRST_DAY_OF_WEEK":1,"MONTH_DAY_FORMAT":"j F","NUMBER_GROUPING":3,"SHORT_DATETIME_FORMAT":"d/m/Y H:i","SHORT_DATE_FORMAT":"d/m/Y","THOUSAND_SEPARATOR":"\u00a0","TIME_FORMAT":"H:i","TIME_INPUT_FORMATS":["%H:%M:%S","%H:%M:%S.%f","%H:%M"],"YEAR_MONTH_FORMAT":"F Y"};django.get_format=function(format_type){const value=django.formats[format_type];if(typeof value==='undefined'){return format_type;}else{return value;}};globals.pluralidx=django.pluralidx;globals.gettext=django.gettext;globals.ngettext=django.ngettext;globals.gettext_noop=django.gettext_noop;globals.pgettext=django.pgettext;globals.npgettext=django.npgettext;globals.interpolate=django.interpolate;globals.get_format=django.get_format;django.jsi18n_initialized=true;}};window.hgettext=function(text){return gettext(text);};window.hngettext=function(singular,plural,count){return ngettext(singular,plural,count);};
\ No newline at end of file
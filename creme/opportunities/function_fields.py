@@ -53,6 +53,7 @@ class TurnoverField(FunctionField):
     verbose_name = _('Weighted sales')
     result_type  = FunctionFieldDecimal
     sorter_class = TurnoverSorter
+    per_entity_queries = False
 
     @override
     def __call__(self, entity, user):
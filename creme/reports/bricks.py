@@ -261,11 +261,18 @@ class ReportChartInstanceBrick(ReportChartMixin, core_bricks.InstanceBrick):
             entity = context.get('object')
 
             if entity is None:  # HOME
-                x, y = fetcher.fetch(user=user, order=order)
+                if chart.materialized:
+                    chart_result = chart.get_result(user=user, order=order)
+                    x, y = chart_result.x, chart_result.y
+                else:
+                    chart_result = None
+                    x, y = fetcher.fetch(user=user, order=order)
+
                 btc = self._get_chart_context(
                     context,
                     chart=chart,
                     data=self.merge_chart_data(x, y, colors=chart.fetch_colormap(user)),
+                    chart_result=chart_result,
                 )
             else:  # DETAIL
                 data = []
@@ -306,17 +313,21 @@ class ReportChartBrick(ReportChartMixin, core_bricks.Brick):
     def get_template_context(self, context, **extra_kwargs):
         chart = context['object']
         user = context['user']
-        order = 'ASC' if chart.asc else 'DESC'
+        order = context['request'].GET.get('order', 'ASC' if chart.asc else 'DESC')
+
+        if chart.materialized:
+            chart_result = chart.get_result(user=user, order=order)
+            x, y = chart_result.x, chart_result.y
+        else:
+            chart_result = None
+            x, y = chart.fetch(user=user, order=order)
 
-        x, y = chart.fetch(
-            user=user,
-            order=context['request'].GET.get('order', order),
-        )
         data = self.merge_chart_data(x, y, colors=chart.fetch_colormap(user))
 
         return super().get_template_context(
             context,
             chart=chart,
+            chart_result=chart_result,
             data=data,
             settings_update_url=reverse(
                 'reports__update_chart_fetch_settings', args=(chart.id,),
@@ -19,14 +19,19 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterable, Iterator
+from collections.abc import Iterable, Iterator, Sequence
 from typing import TYPE_CHECKING
 from uuid import UUID
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist
-from django.db.models import ForeignKey, ManyToManyField
+from django.db.models import (
+    ForeignKey,
+    ManyToManyField,
+    Prefetch,
+    prefetch_related_objects,
+)
 from django.utils.formats import number_format
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
@@ -61,6 +66,11 @@ class ReportHand:
     class ValueError(Exception):
         pass
 
+    # Name of the attribute used to store (in the entities) the related
+    # instances retrieved by _prefetch_related_instances() ; <None> means
+    # the related instances are retrieved for each entity.
+    _prefetch_attr: str | None = None
+
     def __init__(self,
                  report_field: ReportField,
                  title: str = '??',
@@ -156,13 +166,17 @@ class ReportHand:
         """Used as _get_value() method by subclasses which manage
         sub-reports (no sub-report case).
         """
-        qs = self._get_related_instances(entity, user)
         extract = self._related_model_value_extractor
+        prefetch_attr = self._prefetch_attr
+        instances = None if prefetch_attr is None else getattr(entity, prefetch_attr, None)
+
+        if instances is None:
+            instances = self._get_related_instances(entity, user)
 
-        if issubclass(qs.model, CremeEntity):
-            qs = EntityCredentials.filter(user, qs)
+            if issubclass(instances.model, CremeEntity):
+                instances = EntityCredentials.filter(user, instances)
 
-        return ', '.join(str(extract(instance)) for instance in qs)
+        return ', '.join(str(extract(instance)) for instance in instances)
 
     def _get_value_single(self,
                           entity: CremeEntity,
@@ -197,6 +211,41 @@ class ReportHand:
             for rfield in self._report_field.sub_report.columns
         ]
 
+    def _prefetch(self, entities: Sequence[CremeEntity], user) -> None:
+        """Retrieve the data needed to compute the values of several entities
+        with a few queries (see get_values()).
+        Overload this in child classes ; the values must be stored in order
+        to be used by the get_value() of each entity.
+        """
+        pass
+
+    def _prefetch_related_instances(self,
+                                    entities: Sequence[CremeEntity],
+                                    user,
+                                    accessor: str,
+                                    queryset: QuerySet,
+                                    ) -> None:
+        """Helper for _prefetch() ; retrieve the related instances of several
+        entities which are used by _get_value_no_subreport().
+        @param accessor: Name of the related manager (M2M, reverse ForeignKey...).
+        @param queryset: Instances which can be related.
+        """
+        if issubclass(queryset.model, CremeEntity):
+            queryset = EntityCredentials.filter(user, queryset)
+
+        prefetch_attr = self._prefetch_attr = f'_reports_prefetched_{accessor}'
+        prefetch_related_objects(
+            entities,
+            Prefetch(accessor, queryset=queryset, to_attr=prefetch_attr),
+        )
+
+    def _prefetch_subreport(self, instances: Sequence[CremeEntity], user) -> None:
+        "Helper for _prefetch() ; prefetch the values of the sub-report's columns."
+        for rfield in self._report_field.sub_report.columns:
+            hand = rfield.hand
+            if hand:
+                hand._prefetch(instances, user)
+
     def _related_model_value_extractor(self, instance: Model):
         return instance
 
@@ -229,6 +278,25 @@ class ReportHand:
 
         return '' if value is None else value
 
+    def get_values(self,
+                   entities: Sequence[CremeEntity | None],
+                   user,
+                   scope: QuerySet,
+                   ) -> list[str | list]:
+        """Extract the values from several entities for a Report column.
+        It's faster than calling get_value() for each entity, because the
+        related instances (ForeignKeys, ManyToManyFields, relationships,
+        custom-fields...) are retrieved for all the entities at once.
+        @param entities: Sequence of CremeEntity instances (or None).
+        @param user: User instance ; used to compute credentials.
+        @param scope: 'QuerySet' where 'entities' are coming from ; used by aggregates.
+        @return: A list of values (see get_value()), in the same order as 'entities'.
+        """
+        self._prefetch([entity for entity in entities if entity is not None], user)
+        get_value = self.get_value
+
+        return [get_value(entity, user, scope) for entity in entities]
+
     @property
     def hidden(self) -> bool:
         "Is the hand hidden ? (see FieldsConfig or deleted CustomFields)."
@@ -368,6 +436,9 @@ class RHForeignKey(RHRegularField):
                 self._value_extractor = lambda fk_instance, user: str(fk_instance)
 
         self._qs = qs
+        # Instances retrieved by _prefetch() (None means "not found") ; the
+        # keys are the values of the ForeignKey.
+        self._fk_instances: dict[int, Model | None] = {}
         super().__init__(
             report_field,
             support_subreport=True,
@@ -377,13 +448,39 @@ class RHForeignKey(RHRegularField):
     # NB: cannot rename to _get_related_instances() because forbidden entities
     #     are filtered instead of outputting '??'
     def _get_fk_instance(self, entity: CremeEntity) -> CremeEntity | None:
+        fk_id = getattr(entity, self._fk_attr_name)
+        if fk_id is None:
+            return None
+
         try:
-            rel_entity = self._qs.get(pk=getattr(entity, self._fk_attr_name))
+            return self._fk_instances[fk_id]
+        except KeyError:
+            pass
+
+        try:
+            rel_entity = self._qs.get(pk=fk_id)
         except ObjectDoesNotExist:
             rel_entity = None
 
         return rel_entity
 
+    def _prefetch(self, entities, user):
+        attr_name = self._fk_attr_name
+        fk_ids = {getattr(entity, attr_name) for entity in entities}
+        fk_ids.discard(None)
+
+        instances = self._qs.in_bulk(fk_ids) if fk_ids else {}
+        self._fk_instances = {fk_id: instances.get(fk_id) for fk_id in fk_ids}
+
+        if instances:
+            found = [*instances.values()]
+
+            if self._linked2entity:
+                user.get_perms_map(found)
+
+            if self._report_field.sub_report:
+                self._prefetch_subreport(found, user)
+
     def _get_value_flattened_subreport(self, entity, user, scope):
         fk_entity = self._get_fk_instance(entity)
 
@@ -429,6 +526,16 @@ class RHManyToManyField(RHRegularField):
     def _get_related_instances(self, entity, user):
         return getattr(entity, self._field_info[0].name).all()
 
+    def _prefetch(self, entities, user):
+        # NB: with a sub-report, the related instances are filtered for each entity.
+        if not self._report_field.sub_report:
+            m2m_field = self._field_info[0]
+            self._prefetch_related_instances(
+                entities, user,
+                accessor=m2m_field.name,
+                queryset=m2m_field.remote_field.model._default_manager.all(),
+            )
+
     def get_linkable_ctypes(self):
         m2m_model = self._field_info[0].remote_field.model
 
@@ -451,6 +558,9 @@ class RHCustomField(ReportHand):
 
         super().__init__(report_field, title=cf.name)
 
+    def _prefetch(self, entities, user):
+        CremeEntity.populate_custom_values(entities, [self._cfield])
+
     def _get_value_single_on_allowed(self, entity, user, scope):
         cvalue = entity.get_custom_value(self._cfield)
         # TODO: use a EntityCellCustomField & remove __str__ methods of CustomFieldValue models ?
@@ -490,16 +600,26 @@ class RHRelation(ReportHand):
             relations__object_entity=entity.id,
         )
 
+    def _prefetch(self, entities, user):
+        # NB: with a sub-report, the related entities are filtered for each entity.
+        if not self._report_field.sub_report:
+            rtype_id = self._rtype.id
+            CremeEntity.populate_relations(entities, [rtype_id])
+            user.get_perms_map([
+                relation.real_object
+                for entity in entities
+                for relation in entity.get_relations(rtype_id)
+            ])
+
     # TODO: add a feature in base class to retrieved efficiently real entities ??
     # TODO: extract algorithm that retrieve efficiently real entity from
     #       CremeEntity.get_related_entities()
     def _get_value_no_subreport(self, entity, user, scope):
+        related_entities = entity.get_related_entities(self._rtype.id, True)
+        user.get_perms_map(related_entities)  # NB: credentials are cached in the entities
         has_perm = user.has_perm_to_view
-        return ', '.join(
-            str(e)
-            for e in entity.get_related_entities(self._rtype.id, True)
-            if has_perm(e)
-        )
+
+        return ', '.join(str(e) for e in related_entities if has_perm(e))
 
     def get_linkable_ctypes(self):
         return self._rtype.object_ctypes.all()
@@ -529,6 +649,9 @@ class RHFunctionField(ReportHand):
 
         super().__init__(report_field, title=str(funcfield.verbose_name))
 
+    def _prefetch(self, entities, user):
+        self._funcfield.populate_entities(entities, user)
+
     def _get_value_single_on_allowed(self, entity, user, scope):
         return self._funcfield(entity, user).render(tag=ViewTag.TEXT_PLAIN)
 
@@ -702,6 +825,17 @@ class RHRelated(ReportHand):
     def _get_related_instances(self, entity, user):
         return getattr(entity, self._attr_name).filter(is_deleted=False)
 
+    def _prefetch(self, entities, user):
+        # NB: with a sub-report, the related entities are filtered for each entity.
+        if not self._report_field.sub_report:
+            self._prefetch_related_instances(
+                entities, user,
+                accessor=self._attr_name,
+                queryset=self._related_field.related_model._default_manager.filter(
+                    is_deleted=False,
+                ),
+            )
+
     def get_linkable_ctypes(self):
         return (
             ContentType.objects.get_for_model(self._related_field.related_model),
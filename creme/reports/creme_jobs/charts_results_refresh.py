@@ -0,0 +1,69 @@
+################################################################################
+#    Creme is a free/open-source Customer Relationship Management software
+#    Copyright (C) 2026  Hybird
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+################################################################################
+
+import logging
+
+from django.utils.translation import gettext as _
+from django.utils.translation import gettext_lazy
+
+from creme.creme_core.creme_jobs.base import JobType
+from creme.creme_core.models import JobResult
+
+from ..models import ReportChartResult
+
+logger = logging.getLogger(__name__)
+
+
+class _ChartsResultsRefreshType(JobType):
+    id           = JobType.generate_id('reports', 'charts_results_refresh')
+    verbose_name = gettext_lazy('Refresh the results of the charts')
+    periodic     = JobType.PERIODIC
+
+    def _execute(self, job):
+        # The charts are not materialized anymore => their results are useless
+        ReportChartResult.objects.filter(chart__materialized=False).delete()
+
+        for result in ReportChartResult.objects.filter(dirty=True).select_related(
+            'chart__linked_report', 'user',
+        ):
+            try:
+                result.compute()
+            except Exception as e:
+                logger.exception(
+                    'Error when computing the result of the chart id=%s', result.chart_id,
+                )
+                JobResult.objects.create(
+                    job=job,
+                    messages=[
+                        _('The result of the chart «{}» cannot be computed.').format(
+                            result.chart,
+                        ),
+                        _('Original error: {}').format(e),
+                    ],
+                )
+
+    def get_description(self, job):
+        return [
+            _(
+                'Compute again the stored results of the charts when the related '
+                'entities have been modified.'
+            ),
+        ]
+
+
+charts_results_refresh_type = _ChartsResultsRefreshType()
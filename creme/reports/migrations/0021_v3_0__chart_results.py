@@ -0,0 +1,66 @@
+from django.conf import settings
+from django.db import migrations, models
+
+from creme.creme_core.utils.serializers import CremeJSONEncoder
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('reports', '0020_v3_0__remove_graph_ctype'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reportchart',
+            name='materialized',
+            field=models.BooleanField(
+                default=False, verbose_name='Store the results',
+                help_text=(
+                    'The results are stored & refreshed regularly by a job, instead of '
+                    'being computed each time the chart is displayed on the home page '
+                    '(useful for heavy charts).'
+                ),
+            ),
+        ),
+        migrations.CreateModel(
+            name='ReportChartResult',
+            fields=[
+                (
+                    'id',
+                    models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name='ID',
+                    )
+                ),
+                (
+                    'chart',
+                    models.ForeignKey(
+                        to='reports.reportchart', related_name='results',
+                        editable=False, on_delete=models.CASCADE,
+                    )
+                ),
+                (
+                    'user',
+                    models.ForeignKey(
+                        to=settings.AUTH_USER_MODEL, related_name='+',
+                        editable=False, on_delete=models.CASCADE,
+                    )
+                ),
+                ('order', models.CharField(default='ASC', editable=False, max_length=4)),
+                ('language', models.CharField(editable=False, max_length=10)),
+                (
+                    'x',
+                    models.JSONField(default=list, editable=False, encoder=CremeJSONEncoder),
+                ),
+                (
+                    'y',
+                    models.JSONField(default=list, editable=False, encoder=CremeJSONEncoder),
+                ),
+                ('computed', models.DateTimeField(editable=False, verbose_name='Computed')),
+                ('dirty', models.BooleanField(default=False, editable=False)),
+            ],
+            options={
+                'unique_together': {('chart', 'user', 'order')},
+            },
+        ),
+    ]
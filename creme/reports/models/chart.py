@@ -24,9 +24,13 @@ from uuid import uuid4
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.db import IntegrityError, models
+from django.db.transaction import atomic
 from django.urls import reverse
+from django.utils.timezone import now
+from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
+from django.utils.translation import override
 
 import creme.creme_core.models.fields as core_fields
 from creme.creme_core.auth.entity_credentials import EntityCredentials
@@ -35,6 +39,7 @@ from creme.creme_core.models import (
     CremeModel,
     InstanceBrickConfigItem,
 )
+from creme.creme_core.utils.serializers import CremeJSONEncoder
 
 from .. import constants
 from ..core.chart import (
@@ -102,6 +107,15 @@ class ReportChart(CremeModel):
         'ASC order', default=True, editable=False,
     ).set_tags(viewable=False)
 
+    materialized = models.BooleanField(
+        _('Store the results'), default=False,
+        help_text=_(
+            'The results are stored & refreshed regularly by a job, instead of '
+            'being computed each time the chart is displayed on the home page '
+            '(useful for heavy charts).'
+        ),
+    )
+
     # Can be used by third party code to store the data they want,
     # without having to modify the code.
     # TODO: clonable=False?
@@ -229,6 +243,34 @@ class ReportChart(CremeModel):
 
         return self.hand.fetch(entities=entities, order=order, user=user, extra_q=extra_q)
 
+    def get_result(self, user, order: str = 'ASC', refresh: bool = False) -> ReportChartResult:
+        """Get the stored result of the chart for a user (see the field "materialized").
+        The result is computed (& stored) if it does not exist yet, or if it has
+        been computed with another language.
+        @param refresh: <True> means the result is computed again.
+        """
+        assert order == 'ASC' or order == 'DESC'
+
+        language = get_language()
+        result = self.results.filter(user=user, order=order).first()
+
+        if result is None:
+            result = ReportChartResult(chart=self, user=user, order=order)
+        elif not refresh and result.language == language:
+            return result
+
+        result.language = language
+
+        try:
+            result.compute()
+        except IntegrityError:
+            # NB: the result has been created by a concurrent request
+            #     (e.g. the same chart displayed in several tabs).
+            logger.debug('ReportChart.get_result(): result already created')
+            result = self.results.get(user=user, order=order)
+
+        return result
+
     def fetch_colormap(self, user):
         return self.hand.fetch_colormap(user=user)
 
@@ -265,3 +307,45 @@ class ReportChart(CremeModel):
             return f'{aggregator.cell} - {aggregator.verbose_name}'
 
         return aggregator.verbose_name
+
+
+class ReportChartResult(CremeModel):
+    """Stored result of a ReportChart for a user (the result depends on the
+    credentials), used when the chart is "materialized".
+    The results are marked as dirty when the entities of the related model are
+    modified, & the job "reports-charts_results_refresh" computes them again.
+    """
+    chart = models.ForeignKey(
+        ReportChart, related_name='results', editable=False, on_delete=models.CASCADE,
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, related_name='+', editable=False, on_delete=models.CASCADE,
+    )
+    order = models.CharField(max_length=4, editable=False, default='ASC')
+    language = models.CharField(max_length=10, editable=False)
+
+    x = models.JSONField(editable=False, default=list, encoder=CremeJSONEncoder)
+    y = models.JSONField(editable=False, default=list, encoder=CremeJSONEncoder)
+
+    computed = models.DateTimeField(_('Computed'), editable=False)
+    dirty = models.BooleanField(default=False, editable=False)
+
+    class Meta:
+        app_label = 'reports'
+        unique_together = ('chart', 'user', 'order')
+
+    def __str__(self):
+        return f'Result of the chart "{self.chart}" for "{self.user}"'
+
+    def compute(self) -> None:
+        "Compute the values of the chart & store them."
+        with override(self.language or None):
+            self.x, self.y = self.chart.fetch(user=self.user, order=self.order)
+
+        self.computed = now()
+        self.dirty = False
+
+        # NB: the savepoint allows the callers to manage an IntegrityError
+        #     (see ReportChart.get_result()).
+        with atomic():
+            self.save()
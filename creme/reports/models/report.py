@@ -20,7 +20,7 @@ from __future__ import annotations
 
 import logging
 # import warnings
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from itertools import chain
 from typing import TYPE_CHECKING, Type
 
@@ -43,6 +43,7 @@ from creme.creme_core.models import (
     FieldsConfig,
 )
 from creme.creme_core.models.fields import EntityCTypeForeignKey
+from creme.creme_core.utils.chunktools import iter_as_chunk
 
 from ..constants import EF_REPORTS
 
@@ -64,6 +65,10 @@ class AbstractReport(CremeEntity):
     creation_label = _('Create a report')
     save_label     = _('Save the report')
 
+    # Number of entities which are retrieved & computed together by _fetch()
+    # (the related instances are retrieved for the whole chunk).
+    fetch_chunk_size = 256
+
     _columns: list[Field] | None = None
 
     class Meta:
@@ -182,12 +187,18 @@ class AbstractReport(CremeEntity):
 
         fields = self.filtered_columns
 
-        for entity in entities:
-            yield [
-                field.get_value(entity, scope=entities, user=user)
+        for entities_chunk in iter_as_chunk(entities, self.fetch_chunk_size):
+            if not user.is_superuser:
+                user.get_perms_map(entities_chunk)
+
+            columns_values = [
+                field.get_values(entities_chunk, scope=entities, user=user)
                 for field in fields
             ]
 
+            for idx in range(len(entities_chunk)):
+                yield [values[idx] for values in columns_values]
+
     # TODO: transform into generator (--> StreamResponse)
     def fetch_all_lines(self,
                         limit_to: int | None = None,
@@ -315,6 +326,20 @@ class Field(CremeModel):
         hand = self.hand
         return hand.get_value(entity, user, scope) if hand else '??'
 
+    def get_values(self,
+                   entities: Sequence[CremeEntity | None],
+                   user,
+                   scope: models.QuerySet) -> list[str | list]:
+        """Return the values of the cells for several entities ; it's faster
+        than calling get_value() for each entity.
+        @param entities: Sequence of CremeEntity instances (or None).
+        @param user: User instance, used to check credentials.
+        @param scope: QuerySet of CremeEntities (used to make correct aggregate).
+        @return A list of values (see get_value()), in the same order as 'entities'.
+        """
+        hand = self.hand
+        return hand.get_values(entities, user, scope) if hand else ['??'] * len(entities)
+
     @property
     def model(self) -> Type[CremeEntity]:
         return self.report.ct.model_class()
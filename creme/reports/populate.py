@@ -29,11 +29,13 @@ from creme.creme_core.management.commands.creme_populate import BasePopulator
 from creme.creme_core.models import (
     BrickDetailviewLocation,
     HeaderFilter,
+    Job,
     MenuConfigItem,
     SearchConfigItem,
 )
+from creme.creme_core.utils.date_period import date_period_registry
 
-from . import bricks, constants, custom_forms, get_report_model
+from . import bricks, constants, creme_jobs, custom_forms, get_report_model
 from .menu import ReportsEntry
 
 logger = logging.getLogger(__name__)
@@ -62,6 +64,12 @@ class Populator(BasePopulator):
     SEARCH = [
         SearchConfigItem.objects.builder(model=Report, fields=['name']),
     ]
+    JOBS = [
+        Job(
+            type=creme_jobs.charts_results_refresh_type,
+            periodicity=date_period_registry.get_period('minutes', 30),
+        ),
+    ]
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
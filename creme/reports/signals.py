@@ -16,8 +16,12 @@
 #    along with this program.  If not, see <http://www.gnu.org/licenses/>.
 ################################################################################
 
+from django.db import transaction
+from django.db.models import signals
 from django.dispatch import receiver
 
+from creme.creme_core.global_info import get_per_request_cache
+from creme.creme_core.models import CremeEntity, Relation
 from creme.creme_core.signals import pre_uninstall_flush
 
 
@@ -52,3 +56,49 @@ def _uninstall_reports(
 
     if verbosity:
         stdout_write(' [OK]', style.SUCCESS)
+
+
+# The stored results of charts (see ReportChart.materialized) are marked as
+# dirty when the entities of the related model are modified; the job
+# "reports-charts_results_refresh" computes them again.
+# NB: the modifications of custom-fields & of the instances referenced by
+#     ForeignKeys are not tracked (the user can refresh the result manually).
+def _mark_charts_results_as_dirty(ct_id):
+    # NB: a ContentType is marked once per transaction. The list of "on_commit"
+    #     callbacks of the connection is replaced when the transaction is
+    #     committed or rolled back (savepoints included), so it identifies the
+    #     current transaction (a callback dropped by a rollback is registered
+    #     again by the next modification).
+    connection = transaction.get_connection()
+    cache = get_per_request_cache()
+    pending = cache.get('reports-dirty_charts_ctypes')
+
+    if pending is None or pending[0] is not connection.run_on_commit:
+        cache['reports-dirty_charts_ctypes'] = pending = (connection.run_on_commit, set())
+
+    ct_ids = pending[1]
+
+    if ct_id not in ct_ids:
+        def _mark():
+            from .models import ReportChartResult
+
+            ct_ids.discard(ct_id)
+            ReportChartResult.objects.filter(
+                dirty=False, chart__linked_report__ct=ct_id,
+            ).update(dirty=True)
+
+        # NB: outside an atomic block, the callback is executed immediately.
+        if connection.in_atomic_block:
+            ct_ids.add(ct_id)
+
+        transaction.on_commit(_mark)
+
+
+@receiver(signals.post_save,   dispatch_uid='reports-charts_results_dirty_save')
+@receiver(signals.post_delete, dispatch_uid='reports-charts_results_dirty_delete')
+def _set_charts_results_dirty(sender, instance, **kwargs):
+    if isinstance(instance, CremeEntity):
+        _mark_charts_results_as_dirty(instance.entity_type_id)
+    elif isinstance(instance, Relation):
+        # NB: the symmetrical relation is saved too, so both entities are managed.
+        _mark_charts_results_as_dirty(instance.object_ctype_id)
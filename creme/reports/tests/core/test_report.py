@@ -718,6 +718,130 @@ class ReportHandTestCase(CremeTestCase):
 
         self.assertEqual(f'Invalid related field: "{fname}"', str(cm.exception))
 
+    def test_get_values__fk(self):
+        user = self.get_root_user()
+        hand = RHRegularField(
+            Field(report=Report(user=user, ct=FakeContact), type=RFT_FIELD, name='sector'),
+        )
+
+        sector1, sector2 = FakeSector.objects.all()[:2]
+        create_contact = partial(FakeContact.objects.create, user=user, last_name='Stark')
+        aria = create_contact(first_name='Aria', sector=sector1)
+        sansa = create_contact(first_name='Sansa', sector=sector2)
+        bran = create_contact(first_name='Bran')
+
+        scope = FakeContact.objects.all()
+        with self.assertNumQueries(1):
+            values = hand.get_values([aria, sansa, bran, None], user=user, scope=scope)
+        self.assertListEqual([str(sector1), str(sector2), '', ''], values)
+
+        with self.assertNumQueries(0):
+            value = hand.get_value(entity=sansa, user=user, scope=scope)
+        self.assertEqual(str(sector2), value)
+
+    def test_get_values__m2m(self):
+        user = self.get_root_user()
+        hand = RHRegularField(
+            Field(report=Report(user=user, ct=FakeContact), type=RFT_FIELD, name='languages'),
+        )
+
+        language1, language2 = Language.objects.all()[:2]
+        create_contact = partial(FakeContact.objects.create, user=user, last_name='Stark')
+        aria = create_contact(first_name='Aria')
+        aria.languages.set([language1, language2])
+        sansa = create_contact(first_name='Sansa')
+        sansa.languages.set([language2])
+        bran = create_contact(first_name='Bran')
+
+        scope = FakeContact.objects.all()
+        values = hand.get_values([aria, sansa, bran], user=user, scope=scope)
+        self.assertListEqual(
+            [f'{language1}, {language2}', str(language2), ''], values,
+        )
+
+        with self.assertNumQueries(0):
+            value = hand.get_value(entity=aria, user=user, scope=scope)
+        self.assertEqual(f'{language1}, {language2}', value)
+
+    def test_get_values__custom_field(self):
+        user = self.get_root_user()
+        cfield = CustomField.objects.create(
+            name='Size (cm)', field_type=CustomField.INT, content_type=FakeContact,
+        )
+        hand = RHCustomField(
+            Field(
+                report=Report(user=user, ct=FakeContact),
+                type=RFT_CUSTOM, name=str(cfield.uuid),
+            ),
+        )
+
+        create_contact = partial(FakeContact.objects.create, user=user, last_name='Stark')
+        aria = create_contact(first_name='Aria')
+        sansa = create_contact(first_name='Sansa')
+        cfield.value_class.objects.create(custom_field=cfield, entity=aria, value=162)
+
+        scope = FakeContact.objects.all()
+        with self.assertNumQueries(1):
+            values = hand.get_values([aria, sansa], user=user, scope=scope)
+        self.assertListEqual(['162', ''], values)
+
+    def test_get_values__relation(self):
+        user = self.get_root_user()
+        rtype = RelationType.objects.get(id=FAKE_REL_SUB_EMPLOYED_BY)
+        hand = RHRelation(
+            Field(
+                report=Report(user=user, ct=FakeContact),
+                type=RFT_RELATION, name=rtype.id,
+            ),
+        )
+
+        create_contact = partial(FakeContact.objects.create, user=user, last_name='Stark')
+        aria = create_contact(first_name='Aria')
+        sansa = create_contact(first_name='Sansa')
+
+        create_orga = partial(FakeOrganisation.objects.create, user=user)
+        starks    = create_orga(name='Starks')
+        assassins = create_orga(name='Assassins')
+
+        create_relation = partial(Relation.objects.create, user=user, type=rtype)
+        create_relation(subject_entity=aria, object_entity=starks)
+        create_relation(subject_entity=aria, object_entity=assassins)
+        create_relation(subject_entity=sansa, object_entity=starks)
+
+        scope = FakeContact.objects.all()
+        values = hand.get_values([aria, sansa], user=user, scope=scope)
+        self.assertListEqual([f'{starks}, {assassins}', str(starks)], values)
+
+        with self.assertNumQueries(0):
+            value = hand.get_value(entity=sansa, user=user, scope=scope)
+        self.assertEqual(str(starks), value)
+
+    def test_get_values__related(self):
+        user = self.get_root_user()
+        hand = RHRelated(
+            Field(
+                report=Report(user=user, ct=FakeReportsFolder),
+                type=RFT_RELATED, name='fakereportsdocument',
+            ),
+        )
+
+        create_folder = partial(FakeReportsFolder.objects.create, user=user)
+        folder1 = create_folder(title='Archives')
+        folder2 = create_folder(title='Empty')
+
+        create_doc = partial(FakeReportsDocument.objects.create, user=user, linked_folder=folder1)
+        doc1 = create_doc(title='Map of Essos')
+        doc2 = create_doc(title='Map of Westeros')
+        create_doc(title='Deleted map', is_deleted=True)
+
+        scope = FakeReportsFolder.objects.all()
+        values = hand.get_values([folder1, folder2], user=user, scope=scope)
+        self.assertListEqual([f'{doc1}, {doc2}', ''], values)
+
+        with self.assertNumQueries(0):
+            value = hand.get_value(entity=folder1, user=user, scope=scope)
+        self.assertEqual(f'{doc1}, {doc2}', value)
+
 
 class ReportHandRegistryTestCase(CremeTestCase):
     def test_empty(self):
@@ -1,12 +1,15 @@
 from datetime import date
 from decimal import Decimal
 from functools import partial
+from unittest.mock import patch
 from uuid import uuid4
 
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.db.models import ProtectedError
 from django.db.models.query_utils import Q
+from django.db.transaction import atomic
+from django.utils.timezone import now
 from django.utils.translation import gettext as _
 from django.utils.translation import override as override_language
 
@@ -15,6 +18,7 @@ from creme.creme_core.core.entity_cell import (
     EntityCellRegularField,
 )
 from creme.creme_core.core.entity_filter import condition_handler, operators
+from creme.creme_core.core.workflow import WorkflowEngine
 from creme.creme_core.models import (
     BrickDetailviewLocation,
     BrickHomeLocation,
@@ -29,6 +33,8 @@ from creme.creme_core.models import (
     FakePosition,
     FakeSector,
     FieldsConfig,
+    Job,
+    JobResult,
     Relation,
     RelationType,
 )
@@ -36,7 +42,8 @@ from creme.creme_core.tests import fake_constants
 from creme.creme_core.utils.queries import QSerializer
 from creme.reports.core.chart import AbscissaInfo, OrdinateInfo
 from creme.reports.core.chart.fetcher import SimpleChartFetcher
-from creme.reports.models import ReportChart
+from creme.reports.creme_jobs import charts_results_refresh_type
+from creme.reports.models import ReportChart, ReportChartResult
 
 from ..base import AxisFieldsMixin, BaseReportsTestCase, Report
 from ..fake_models import FakeReportsColorCategory
@@ -2199,6 +2206,153 @@ class ChartTestCase(AxisFieldsMixin, BaseReportsTestCase):
         self.assertEqual(200, y_data[get_user_index(user.id)][0])
         self.assertEqual(0,   y_data[get_user_index(other_user.id)][0])  # Not 300
 
+    def test_get_result(self):
+        user = self.login_as_root_and_get()
+        chart = self._create_documents_chart(user=user)
+        chart.materialized = True
+        chart.save()
+
+        x_asc, y_asc = chart.fetch(user=user)
+
+        result1 = chart.get_result(user=user)
+        self.assertIsInstance(result1, ReportChartResult)
+        self.assertIsNotNone(result1.pk)
+        self.assertEqual(chart.id, result1.chart_id)
+        self.assertEqual(user.id,  result1.user_id)
+        self.assertEqual('ASC',    result1.order)
+        self.assertListEqual(x_asc, result1.x)
+        self.assertListEqual(y_asc, result1.y)
+        self.assertFalse(result1.dirty)
+        self.assertDatetimesAlmostEqual(now(), result1.computed)
+
+        # Stored result
+        ReportChartResult.objects.filter(id=result1.id).update(x=['Stored'])
+        result2 = chart.get_result(user=user)
+        self.assertEqual(result1.id, result2.id)
+        self.assertListEqual(['Stored'], result2.x)
+
+        # Refresh
+        result3 = chart.get_result(user=user, refresh=True)
+        self.assertEqual(result1.id, result3.id)
+        self.assertListEqual(x_asc, result3.x)
+
+        # Other order
+        result4 = chart.get_result(user=user, order='DESC')
+        self.assertNotEqual(result1.id, result4.id)
+        self.assertListEqual([*reversed(x_asc)], result4.x)
+
+    def test_get_result__concurrent_creation(self):
+        user = self.login_as_root_and_get()
+        chart = self._create_documents_chart(user=user)
+        chart.materialized = True
+        chart.save()
+
+        concurrent_results = []
+
+        def fetch(user, order):
+            # Another request creates the result while we are computing it
+            concurrent_results.append(ReportChartResult.objects.create(
+                chart=chart, user=user, order=order, language='en',
+                x=['Concurrent'], y=[1], computed=now(),
+            ))
+            return ['Mine'], [2]
+
+        with patch.object(chart, 'fetch', side_effect=fetch):
+            result = chart.get_result(user=user)
+
+        concurrent_result = self.get_alone_element(concurrent_results)
+        self.assertEqual(concurrent_result.id, result.id)
+        self.assertListEqual(['Concurrent'], result.x)
+
+    def _create_materialized_contacts_chart(self, user):
+        return ReportChart.objects.create(
+            linked_report=self._create_simple_contacts_report(user=user),
+            name='Contacts by position',
+            abscissa_cell_value='position', abscissa_type=ReportChart.Group.FK,
+            ordinate_type=ReportChart.Aggregator.COUNT,
+            materialized=True,
+        )
+
+    def test_get_result__dirty(self):
+        user = self.login_as_root_and_get()
+        chart = self._create_materialized_contacts_chart(user=user)
+        lord = FakePosition.objects.create(title='Lord')
+
+        # NB: the chart is empty when there is no entity
+        create_contact = partial(FakeContact.objects.create, user=user)
+        create_contact(first_name='Jon', last_name='Snow')
+        self.clear_global_info()  # The dirty ContentTypes are stored per request
+
+        result = chart.get_result(user=user)
+        self.assertEqual(0, result.y[result.x.index(lord.title)][0])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            FakeOrganisation.objects.create(user=user, name='Winterfell')
+        self.assertFalse(self.refresh(result).dirty)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            create_contact(first_name='Robb', last_name='Stark', position=lord)
+        self.assertTrue(self.refresh(result).dirty)
+
+        # Job ---
+        job = self.get_object_or_fail(Job, type_id=charts_results_refresh_type.id)
+
+        WorkflowEngine.get_current()._queue.pickup()
+        charts_results_refresh_type.execute(job)
+        result = self.refresh(result)
+        self.assertFalse(result.dirty)
+        self.assertEqual(1, result.y[result.x.index(lord.title)][0])
+        self.assertFalse(JobResult.objects.filter(job=job))
+
+        # Not materialized anymore => results are removed
+        chart.materialized = False
+        chart.save()
+        charts_results_refresh_type.execute(job)
+        self.assertDoesNotExist(result)
+
+    def test_get_result__dirty__transactions(self):
+        "Successive transactions in the same context (job, command...)."
+        user = self.login_as_root_and_get()
+        chart = self._create_materialized_contacts_chart(user=user)
+        create_contact = partial(FakeContact.objects.create, user=user)
+        create_contact(first_name='Jon', last_name='Snow')
+        self.clear_global_info()
+
+        result = chart.get_result(user=user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with atomic():
+                create_contact(first_name='Robb', last_name='Stark')
+        self.assertTrue(self.refresh(result).dirty)
+
+        result = chart.get_result(user=user, refresh=True)
+        self.assertFalse(result.dirty)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with atomic():
+                create_contact(first_name='Sansa', last_name='Stark')
+        self.assertTrue(self.refresh(result).dirty)
+
+    def test_get_result__dirty__rollback(self):
+        user = self.login_as_root_and_get()
+        chart = self._create_materialized_contacts_chart(user=user)
+        create_contact = partial(FakeContact.objects.create, user=user)
+        create_contact(first_name='Jon', last_name='Snow')
+        self.clear_global_info()
+
+        result = chart.get_result(user=user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(ValueError):
+                with atomic():
+                    create_contact(first_name='Robb', last_name='Stark')
+                    raise ValueError('Rollback')
+
+            with atomic():
+                create_contact(first_name='Sansa', last_name='Stark')
+
+        self.assertTrue(self.refresh(result).dirty)
+
     def bench_big_fetch_using_count(self):  # pragma: no cover
         """
         Little benchmark to see how the 'group by' report queries behave with
@@ -27,7 +27,7 @@ from creme.reports.core.chart.fetcher import (
 )
 from creme.reports.core.chart.lv_url import ListViewURLBuilder
 from creme.reports.core.chart.plot import Pie, plot_registry
-from creme.reports.models import ReportChart
+from creme.reports.models import ReportChart, ReportChartResult
 from creme.reports.views import chart as chart_views
 
 from ..base import (
@@ -982,6 +982,43 @@ class ReportChartViewsTestCase(BrickTestCaseMixin,
         self.assertPOST403(chart.get_delete_absolute_url(), follow=True)
         self.assertStillExists(chart)
 
+    def test_detailview__materialized(self):
+        user = self.login_as_root_and_get()
+        chart = self._create_documents_chart(user=user)
+        chart.materialized = True
+        chart.save()
+
+        response = self.assertGET200(chart.get_absolute_url())
+        self.get_brick_node(
+            self.get_html_tree(response.content), brick=ReportChartBrick,
+        )
+
+        result = self.get_object_or_fail(ReportChartResult, chart=chart, user=user)
+        self.assertEqual('ASC', result.order)
+
+    def test_refresh_result(self):
+        user = self.login_as_root_and_get()
+        chart = self._create_documents_chart(user=user)
+        url = reverse('reports__refresh_chart_result', args=(chart.id,))
+        self.assertGET405(url)
+        self.assertPOST409(url, data={'order': 'ASC'})
+
+        chart.materialized = True
+        chart.save()
+
+        result = chart.get_result(user=user)
+        ReportChartResult.objects.filter(id=result.id).update(x=['Stored'], dirty=True)
+
+        self.assertPOST200(url, data={'order': 'ASC'})
+        result = self.refresh(result)
+        self.assertFalse(result.dirty)
+        self.assertListEqual(chart.fetch(user=user)[0], result.x)
+
+        self.assertPOST(400, url, data={'order': 'invalid'})
+        self.assertPOST404(
+            reverse('reports__refresh_chart_result', args=(self.UNUSED_PK,)),
+        )
+
     # TODO?
     # def test_inneredit(self):
     #     user = self.login()
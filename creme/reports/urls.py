@@ -119,6 +119,11 @@ urlpatterns = [
         chart.ChartFetchSettingsUpdate.as_view(),
         name='reports__update_chart_fetch_settings',
     ),
+    re_path(
+        r'^chart/(?P<chart_id>\d+)/refresh_result[/]?$',
+        chart.ChartResultRefreshing.as_view(),
+        name='reports__refresh_chart_result',
+    ),
 
     re_path(
         r'^chart/(?P<chart_id>\d+)/instance_brick/add[/]?$',
@@ -26,6 +26,7 @@ from django.utils.translation import gettext_lazy as _
 
 from creme import reports
 # from creme.creme_core.gui.bricks import Brick
+from creme.creme_core.core.exceptions import ConflictError
 from creme.creme_core.http import CremeJsonResponse
 from creme.creme_core.utils.meta import Order
 from creme.creme_core.views import generic
@@ -178,3 +179,28 @@ class ChartFetchSettingsUpdate(generic.base.CheckedView):
 
         # TODO: send error too ?
         return self.response_class({'sort': str(order), 'plot': plot_name})
+
+
+class ChartResultRefreshing(generic.base.CheckedView):
+    "Compute again the stored result of a (materialized) chart for the current user."
+    # NB: no permission on the ReportChart, like ChartFetchSettingsUpdate
+    #     (the result is computed with the user's credentials).
+    chart_id_url_kwarg = 'chart_id'
+
+    def clean_order(self, request) -> str:
+        return str(Order.from_string(request.POST.get('order', 'ASC')))
+
+    def post(self, request, *args, **kwargs) -> HttpResponse:
+        try:
+            order = self.clean_order(request)
+        except ValueError as e:
+            return HttpResponseBadRequest(e)
+
+        chart = get_object_or_404(ReportChart, id=self.kwargs[self.chart_id_url_kwarg])
+
+        if not chart.materialized:
+            raise ConflictError('The results of this chart are not stored.')
+
+        chart.get_result(user=request.user, order=order, refresh=True)
+
+        return HttpResponse()
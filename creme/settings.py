@@ -75,6 +75,34 @@ DEFAULT_AUTO_FIELD = 'django.db.models.AutoField'
 # - the paginator only allows to go to the next & the previous pages (& the main query is faster).
 FAST_QUERY_MODE_THRESHOLD = 100000
 
+# Use a search index (i.e. a table of words, kept up to date when entities are
+# saved) for the global search, instead of searching in all the configured
+# fields with "LIKE" queries. It's faster with big databases, but notice that
+# the searched words are only found at the beginning of the indexed words
+# (i.e. "linu" finds "Linus", but "inus" does not).
+# When you enable it on an existing installation, build the index with the
+# command "creme_search_index".
+SEARCH_INDEX_ENABLED = False
+
+# Alias (i.e. a key of the setting "CACHES") of the cache used to store some
+# configuration instances (fields configuration, custom-fields, search
+# configuration...) between the requests. It's invalidated when these
+# instances are modified.
+# BEWARE: the cache must be shared by all the processes running Creme (web
+# servers & job manager), so do not use a "local-memory" cache with several
+# processes (use redis, memcached, database...).
+# Empty string means <no shared cache>.
+SHARED_CACHE_ALIAS = ''
+# Duration (in seconds) of the cached values (None means <no expiration>).
+SHARED_CACHE_TIMEOUT = 3600
+
+# Some conditions of filters (on custom-fields, on relationships with a
+# sub-filter) use sub-queries retrieving IDs of entities. When this value is not
+# 0, these sub-queries are performed once per request, & their results are
+# injected in the final query if they do not contain more IDs than this value;
+# it can help some DB engines which do not optimise well these sub-queries.
+FILTERS_MATERIALIZED_IDS_MAX = 0
+
 # JOBS #########################################################################
 # Maximum number of not finished jobs each user can have at the same time.
 #  When this number is reached for a user, he must wait one of his
@@ -94,6 +122,16 @@ MAX_JOBS_PER_USER = 2
 # periodicity can be precisely managed).
 MAX_USER_JOBS = 5
 
+# Size of the pool of worker processes used by the job manager to run the user
+# jobs. These processes are forked when the job manager starts & are re-used
+# from a job to another one, so Django is not set up for each job (it's faster,
+# notably for small jobs). The size is bounded by MAX_USER_JOBS.
+# 0 means that each job is run in a new process.
+# Notice that the pool needs the start method "fork" (i.e. it's not available
+# on Windows), and that it can be overridden with the option "--workers" of
+# the command "creme_job_manager".
+JOB_MANAGER_WORKERS = 0
+
 # 'security' period for pseudo-periodic jobs : they will be run at least with
 # this periodicity, even if they do not receive a new request (in order to reduce
 # the effects of a hypothetical redis problem).
@@ -302,6 +340,8 @@ MIDDLEWARE = [
     # After AuthenticationMiddleware:
     'creme.creme_core.middleware.locale.LocaleMiddleware',
     'creme.creme_core.middleware.global_info.GlobalInfoMiddleware',
+    # After GlobalInfoMiddleware (not used if INSTRUMENTATION_ENABLED is False):
+    'creme.creme_core.middleware.instrumentation.InstrumentationMiddleware',
     'creme.creme_core.middleware.timezone.TimezoneMiddleware',
     'creme.creme_core.middleware.workflow.WorkflowMiddleware',
 ]
@@ -517,6 +557,14 @@ EXPORT_BACKENDS = [
     'creme.creme_core.backends.xlsx_export.XLSXExportBackend',
 ]
 
+# When the number of entities to export (see list-views) is greater than this
+# value, the export is performed by a job (the user is redirected to the page
+# of the job, & gets a notification with the link to download the file when
+# the job is finished). It avoids long requests which can reach the timeout of
+# the web server.
+# <0> means that the export is always performed by the request.
+MASS_EXPORT_JOB_THRESHOLD = 50_000
+
 # EMAILS [internal] ############################################################
 
 # Emails sent to the users of Creme
@@ -736,6 +784,31 @@ MENU_ICON_MAX_SIZE = 3145728  # 3 Mega bytes
 # Lines number in common blocks
 BLOCK_SIZE = 10
 
+# Rendering of the "independent" bricks (see the attribute 'independent' of
+# 'creme_core.gui.bricks.Brick') on the detailed views of entities & on the home page:
+#  - "sequential": the bricks are rendered one after the other.
+#  - "concurrent": the bricks are rendered by a pool of threads (each thread uses
+#    its own connection to the DataBase, so check the maximum number of connections
+#    of your DataBase server).
+#  - "deferred": the page contains placeholders, & the bricks are retrieved by the
+#    browser with the reloading views.
+BRICKS_RENDERING_MODE = 'sequential'
+# Maximum number of threads used by the mode "concurrent".
+BRICKS_RENDERING_WORKERS = 4
+
+# Instrumentation: the rendering of the bricks, the evaluation of the function
+# fields, the compilation of the filters & the execution of the Workflows are
+# measured (duration, number of SQL queries) for each request.
+# The metrics are sent in the HTTP header "Server-Timing", & are aggregated for
+# each process ; they are displayed in a block (staff users only) & exposed in
+# the text format of Prometheus by the URL "/creme_core/instrumentation/metrics".
+# Notice that each process of your web server has its own metrics.
+INSTRUMENTATION_ENABLED = False
+# Token which allows a scraper (like Prometheus) to retrieve the metrics with
+# the HTTP header "Authorization: Bearer <token>" (staff users can always
+# retrieve them). An empty string means "no token".
+INSTRUMENTATION_METRICS_TOKEN = ''
+
 # Some list-views cells display sub-lists, like cells corresponding to the
 # entities linked by a Relation. These sub-lists can be huge (e.g. there is no limit
 # to the number of Relations an entity can have) & then cause issues (performance
@@ -1426,11 +1499,18 @@ EMAILS_TEMPLATE_FORCE_NOT_CUSTOM = False
 EMAILS_EMAIL_FORCE_NOT_CUSTOM    = False
 EMAILS_MLIST_FORCE_NOT_CUSTOM    = False
 
-# Emails are sent by chunks, and sleep between 2 chunks.
+# The rate of the emails of campaigns is limited: EMAILS_CAMPAIGN_SIZE emails
+# (at most) each EMAILS_CAMPAIGN_SLEEP_TIME seconds (token bucket).
 # EMAILCAMPAIGN_SIZE = 40
 # EMAILCAMPAIGN_SLEEP_TIME = 2
 EMAILS_CAMPAIGN_SIZE = 40
 EMAILS_CAMPAIGN_SLEEP_TIME = 2  # In seconds
+# Number of threads which send the emails of campaigns (each sending uses
+# at most this number of SMTP connections).
+EMAILS_CAMPAIGN_CONNECTIONS = 4
+# The statuses of the emails of campaigns are saved by chunks of this size ;
+# the sendings which are performed at the same time send a chunk in turn.
+EMAILS_CAMPAIGN_COMMIT_SIZE = 100
 
 # Sketch -----------------------------------------------------------------------
 SKETCH_ENABLE_DEMO_BRICKS = False
@@ -42,6 +42,8 @@ class ResolvingDurationField(FunctionField):
     verbose_name = _('Resolving duration')
     # search_field_builder = TODO: filter min < duration < max
     sorter_class = ResolvingDurationSorter
+    prefetch_fields = ('status',)
+    per_entity_queries = False
 
     @override
     def __call__(self, entity, user):